@@ -0,0 +1,46 @@
+import sqlite3
+
+import pytest
+
+import doxoade.core_database as core_database
+
+
+@pytest.fixture
+def cursor():
+    conn = sqlite3.connect(':memory:')
+    cur = conn.cursor()
+    core_database._m_v1_v3_core(cur)
+    core_database._m_v15_chronos(cur)
+    core_database._m_v19_payloads(cur)
+    cur.execute("INSERT INTO events (timestamp, command, project_path) VALUES ('2026-01-01T10:00:00', 'check', '/p')")
+    cur.execute("INSERT INTO findings (event_id, severity, message) VALUES (1, 'ERROR', 'undefined name ''x''')")
+    core_database._m_v135_analytics_rollups(cur)
+    yield cur
+    conn.close()
+
+
+def test_backfill_and_trigger_keep_message_rollup_in_sync(cursor):
+    cursor.execute("INSERT INTO findings (event_id, severity, message) VALUES (1, 'CRITICAL', 'undefined name ''y''')")
+    cursor.execute("INSERT INTO findings (event_id, severity, message) VALUES (1, 'WARNING', 'undefined name ''z''')")
+    assert cursor.execute('SELECT pattern, count FROM finding_message_rollup').fetchall() == [('undefined name', 2)]
+    daily = dict(((sev, n) for sev, n in cursor.execute('SELECT severity, count FROM finding_rollup_daily')))
+    assert daily == {'ERROR': 1, 'CRITICAL': 1, 'WARNING': 1}
+    cursor.execute("DELETE FROM findings WHERE severity = 'CRITICAL'")
+    assert cursor.execute('SELECT count FROM finding_message_rollup').fetchone()[0] == 1
+
+
+def test_command_rollup_counts_runs_failures_and_time(cursor):
+    for code, ms in ((0, 10.0), (1, 30.0)):
+        cursor.execute('INSERT INTO command_history (session_uuid, timestamp, command_name, full_command_line, working_dir, exit_code, duration_ms) '
+                       "VALUES ('u', '2026-01-02T00:00:00', 'check', 'doxoade check .', '/p', ?, ?)", (code, ms))
+    assert cursor.execute('SELECT runs, failures, total_ms FROM command_rollup_daily').fetchone() == (2, 1, 40.0)
+
+
+@pytest.mark.skipif(not core_database.fts5_trigram_available(), reason='SQLite sem FTS5 trigram')
+def test_fts_matches_substrings_like_the_old_like_scan(cursor):
+    cursor.execute('INSERT INTO command_history (session_uuid, timestamp, command_name, full_command_line, working_dir) '
+                   "VALUES ('u', '2026-01-02', 'check', 'doxoade check --fast src', '/p')")
+    phrase = core_database.fts_phrase('ck --fa')
+    hits = cursor.execute('SELECT rowid FROM command_history_fts WHERE command_history_fts MATCH ?', (phrase,)).fetchall()
+    assert hits == [(1,)]
+    assert core_database.fts_phrase('ab') is None
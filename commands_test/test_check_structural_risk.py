@@ -2,6 +2,7 @@
 import ast
 import importlib.util
 from pathlib import Path
+from doxoade.probes.rule_engine import RuleEngine
 _module_path = Path('doxoade/commands/check_systems/check_structural.py')
 _spec = importlib.util.spec_from_file_location('check_structural', _module_path)
 _mod = importlib.util.module_from_spec(_spec)
@@ -11,8 +12,7 @@ _spec.loader.exec_module(_mod)
 def test_structural_risk_classifies_critical_for_import_hooks_and_exec():
     code = "\nimport sys\nsys.meta_path.insert(0, object())\nmod = {}\nsys.modules['x'] = mod\nexec('print(1)')\n"
     findings = {'dynamic_exec': 0, 'sys_modules_mutation': 0, 'meta_path_mutation': 0, 'dynamic_import': 0, 'runtime_attr_access': 0, 'runtime_namespace': 0}
-    bucket = {k: 0 for k in findings}
-    _mod._scan_tree(ast.parse(code), findings, bucket)
+    findings.update(RuleEngine([_mod.StructuralRiskRule()]).run(tree=ast.parse(code)).counts)
     assert _mod._classify_level(findings) == 3
 
 def test_structural_risk_classifies_moderate_for_runtime_dynamics():
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 12), reason='deepcheck_utils usa f-strings da PEP 701')
+
+
+def _git(root, *args):
+    subprocess.run(['git', *args], cwd=root, check=True, capture_output=True)
+
+
+def _project(tmp_path):
+    (tmp_path / 'pyproject.toml').write_text('[project]\nname = "x"\n')
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'pkg' / 'a.py').write_text('def clean(x):\n    return x + 1\n\ndef lazy(x, unused):\n    return x\n')
+    (tmp_path / 'pkg' / 'b.py').write_text('import os\n\ndef mixed(p):\n    print(p)\n    return os.path.join(p, "x")\n')
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, '-c', 'user.email=t@t', '-c', 'user.name=t', 'add', '.')
+    _git(tmp_path, '-c', 'user.email=t@t', '-c', 'user.name=t', 'commit', '-qm', 'base')
+
+
+def test_project_ranking_is_cached_per_function(tmp_path, monkeypatch):
+    from doxoade.commands.deepcheck_project import scan_project
+    _project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    cold = scan_project(str(tmp_path / 'pkg'), jobs=2)
+    assert cold['stats']['analyzed'] == 3
+    assert [r['function'] for r in cold['ranking']] == ['mixed', 'lazy', 'clean']
+
+    warm = scan_project(str(tmp_path / 'pkg'), jobs=1)
+    assert warm['stats']['parsed'] == 0 and warm['ranking'] == cold['ranking']
+
+    (tmp_path / 'pkg' / 'a.py').write_text('def clean(x):\n    return x + 1\n\ndef lazy(x, unused):\n    return unused or x\n\ndef extra():\n    pass\n')
+    edited = scan_project(str(tmp_path / 'pkg'), jobs=1, git_ref='HEAD')
+    assert edited['stats']['analyzed'] == 2  # 'clean' e a versão antiga de 'lazy' vêm do cache
+    diffs = {d['function']: d for d in edited['diffs']}
+    assert set(diffs) == {'lazy', 'extra'}
+    assert diffs['lazy']['status'] == 'CHANGED' and diffs['lazy']['old_score'] < diffs['lazy']['score']
+    assert diffs['extra']['status'] == 'ADDED'
+
+
+def test_methods_are_keyed_by_qualified_name_with_their_own_cc(tmp_path, monkeypatch):
+    from doxoade.commands.deepcheck_project import analyze_source, scan_project
+    source = ('class A:\n    def __init__(self, x):\n        self.x = 1 if x else 2\n\n'
+              'class B:\n    def __init__(self):\n        self.y = 0\n')
+    entries = {e['function']: e for e in analyze_source(source)}
+    assert set(entries) == {'A.__init__', 'B.__init__'}
+    assert entries['A.__init__']['report']['cc'] == 2
+
+    _project(tmp_path)
+    (tmp_path / 'pkg' / 'c.py').write_text(source)
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, '-c', 'user.email=t@t', '-c', 'user.name=t', 'commit', '-qm', 'classes')
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'pkg' / 'c.py').write_text(source + '# só um comentário\n')
+    assert scan_project(str(tmp_path / 'pkg'), jobs=1, git_ref='HEAD')['diffs'] == []
@@ -0,0 +1,79 @@
+import sqlite3
+import subprocess
+
+from doxoade.commands import save
+from doxoade.tools import git_batch
+from doxoade.tools.git_batch import diff_hunks, map_old_line
+
+
+def _git(root, *args):
+    return subprocess.run(['git', *args], cwd=root, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _repo(tmp_path):
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'config', 'user.email', 't@t')
+    _git(tmp_path, 'config', 'user.name', 't')
+    src = tmp_path / 'mod.py'
+    src.write_text('import os\nimport sys\n\ndef f():\n    x = 1\n    return eval("x")\n')
+    (tmp_path / 'other.py').write_text('print(1)\n')
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, 'commit', '-q', '-m', 'first')
+    # Remove uma linha acima do defeito e corrige o defeito: a linha desloca
+    src.write_text('import sys\n\ndef f():\n    x = 1\n    return x\n')
+    _git(tmp_path, 'commit', '-qam', 'fix')
+    return _git(tmp_path, 'rev-parse', 'HEAD')
+
+
+def test_map_old_line_follows_hunks():
+    hunks = [(1, 1, 0, 0), (6, 1, 5, 1), (9, 0, 9, 2)]
+    assert map_old_line(hunks, 1) == (None, True)
+    assert map_old_line(hunks, 3) == (2, False)
+    assert map_old_line(hunks, 6) == (5, True)
+    assert map_old_line(hunks, 9) == (8, False)
+    assert map_old_line(hunks, 10) == (11, False)
+
+
+def test_capture_uses_one_diff_and_shifted_lines(tmp_path, monkeypatch):
+    head = _repo(tmp_path)
+    assert diff_hunks(f'{head}^', head, cwd=str(tmp_path)) == {
+        'mod.py': {'new_path': 'mod.py', 'hunks': [(1, 1, 0, 0), (6, 1, 5, 1)]},
+    }
+
+    db = sqlite3.connect(str(tmp_path / 'k.db'))
+    db.row_factory = sqlite3.Row
+    db.execute('CREATE TABLE open_incidents (finding_hash TEXT, file_path TEXT, line INTEGER, project_path TEXT)')
+    db.execute('CREATE TABLE knowledge_lexicon (finding_hash TEXT, snippet_broken TEXT, snippet_fixed TEXT, tags TEXT)')
+    root = str(tmp_path)
+    db.executemany('INSERT INTO open_incidents VALUES (?, ?, ?, ?)', [
+        ('h-eval', str(tmp_path / 'mod.py'), 6, root),
+        ('h-ok', str(tmp_path / 'mod.py'), 5, root),
+        ('h-other', str(tmp_path / 'other.py'), 1, root),
+    ])
+    db.executemany('INSERT INTO knowledge_lexicon (finding_hash) VALUES (?)', [('h-eval',), ('h-ok',), ('h-other',)])
+    db.commit()
+
+    class _Conn:
+        def __getattr__(self, name):
+            return getattr(db, name)
+
+        def __enter__(self):
+            return db.__enter__()
+
+        def __exit__(self, *exc):
+            return db.__exit__(*exc)
+
+        def close(self):
+            pass
+
+    import doxoade.core_database as core_database
+    monkeypatch.setattr(core_database, 'get_db_connection', lambda: _Conn())
+    git_batch.close_readers()
+    monkeypatch.chdir(tmp_path)
+
+    assert save._capture_delta_knowledge(head, root) == 1
+    rows = {r['finding_hash']: (r['snippet_broken'], r['snippet_fixed'], r['tags']) for r in db.execute('SELECT * FROM knowledge_lexicon')}
+    assert rows['h-eval'] == ('return eval("x")', 'return x', 'AUTODIDATA')
+    assert rows['h-ok'] == (None, None, None)
+    assert rows['h-other'] == (None, None, None)
+    git_batch.close_readers()
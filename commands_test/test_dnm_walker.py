@@ -0,0 +1,41 @@
+import os
+import time
+
+from doxoade.dnm import DNM
+
+
+def _touch(path, text=''):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+
+
+def test_scan_applies_system_forge_and_gitignore_rules(tmp_path):
+    _touch(tmp_path / 'app' / 'main.py')
+    _touch(tmp_path / 'app' / '__init__.py')
+    _touch(tmp_path / 'node_modules' / 'dep' / 'x.py')
+    _touch(tmp_path / 'staging' / 'y.py')
+    _touch(tmp_path / 'generated' / 'z.py')
+    _touch(tmp_path / 'app' / 'schema_pb2.py')
+    _touch(tmp_path / '.gitignore', 'generated/\n*_pb2.py\n')
+
+    nav = DNM(str(tmp_path), use_snapshot=False)
+    found = [os.path.relpath(p, tmp_path).replace('\\', '/') for p in nav.scan(extensions=['py'])]
+    assert found == ['app/main.py']
+    internal = nav.scan(extensions=['py'], include_internal=True)
+    assert any(p.endswith('app/__init__.py') for p in internal)
+    assert nav.is_ignored(tmp_path / 'generated' / 'z.py')
+    assert not nav.is_ignored(tmp_path / 'app' / 'main.py')
+
+
+def test_snapshot_reuses_unchanged_dirs_and_sees_new_files(tmp_path):
+    (tmp_path / '.doxoade_cache').mkdir()
+    _touch(tmp_path / 'pkg' / 'a.py')
+    past = time.time() - 60
+    for d in (tmp_path, tmp_path / 'pkg'):
+        os.utime(d, (past, past))
+
+    assert len(DNM(str(tmp_path)).scan(extensions=['py'])) == 1
+    assert (tmp_path / '.doxoade_cache' / 'dnm_snapshot.json').exists()
+
+    _touch(tmp_path / 'pkg' / 'b.py')
+    assert len(DNM(str(tmp_path)).scan(extensions=['py'])) == 2
@@ -0,0 +1,73 @@
+import json
+import pickle
+
+from doxoade.commands.check_systems.check_state import CheckState
+from doxoade.tools.memory_pool import FindingStore, json_default
+
+HASH = 'ab' * 32
+
+
+def _finding(i, sev='WARNING', cat='STYLE'):
+    return {'severity': sev, 'category': cat, 'message': f'msg {i % 3}', 'file': f'/p/m{i % 2}.py', 'line': i, 'finding_hash': HASH, 'snippet': {i: 'x'}}
+
+
+def test_store_roundtrips_findings_beyond_old_arena_size():
+    src = [_finding(i) for i in range(2500)]
+    store = FindingStore(src)
+    assert len(store) == 2500
+    assert store.to_dicts() == src
+    assert store[2499] == src[2499]  # a antiga arena perdia category/file/line após 2000
+    assert store.stats()['rows'] == 2500
+
+
+def test_rows_write_through_and_views_share_columns():
+    store = FindingStore([_finding(i) for i in range(10)])
+    view = store[2:5]
+    view[0]['suggestion_action'] = 'FIX'
+    view[0]['line'] = None
+    assert store[2]['suggestion_action'] == 'FIX'
+    assert store.to_dicts()[2]['line'] is None
+    del store[3]['snippet']
+    assert 'snippet' not in store.to_dicts()[3]
+    assert pickle.loads(pickle.dumps(store[0])) == _finding(0)
+
+
+def test_list_protocol_used_by_fixer_and_filters():
+    store = FindingStore([_finding(i) for i in range(4)])
+    row = store[1]
+    assert row in store
+    store.remove(row)
+    assert row not in store and len(store) == 3
+    other = FindingStore()
+    other.append(store[0])  # cópia entre stores (ids internados)
+    assert other.to_dicts() == [store[0]]
+    state = CheckState(root='.', target_path='.')
+    state.findings = []
+    assert isinstance(state.findings, FindingStore)
+
+
+def test_filter_group_and_summary():
+    store = FindingStore([_finding(i, sev) for i, sev in enumerate(['ERROR', 'WARNING', 'CRITICAL', 'ERROR'])])
+    assert [f['line'] for f in store.filter(severity='ERROR')] == [0, 3]
+    assert len(store.filter(severity=('ERROR', 'CRITICAL'), file='/p/m1.py')) == 1
+    assert {k: len(v) for k, v in store.group_by('file').items()} == {'/p/m0.py': 2, '/p/m1.py': 2}
+    assert store.summary() == {'errors': 2, 'warnings': 1, 'critical': 1}
+    state = CheckState(root='.', target_path='.')
+    for f in store:
+        state.register_finding(f)
+    summary = dict(state.summary)
+    state.sync_summary()
+    assert state.summary == summary
+
+
+def test_json_cache_and_sarif_serialize_from_columns():
+    store = FindingStore([_finding(1, 'ERROR', 'SYNTAX'), {'severity': 'INFO', 'message': 'm', 'file': 'rel.py', 'line': 0}])
+    payload = json.loads(store.to_json())
+    assert payload['summary'] == {'errors': 1, 'warnings': 1, 'critical': 0}
+    assert json.loads(json.dumps({'k': {'findings': store[:1]}}, default=json_default))['k']['findings'][0]['snippet'] == {'1': 'x'}
+    run = store.to_sarif(root='/p')['runs'][0]
+    first, second = run['results']
+    assert first['level'] == 'error' and first['ruleId'] == 'SYNTAX'
+    assert first['locations'][0]['physicalLocation'] == {'artifactLocation': {'uri': 'm1.py'}, 'region': {'startLine': 1}}
+    assert first['partialFingerprints']['doxoadeFindingHash/v1'] == HASH
+    assert second['ruleId'] == 'UNCATEGORIZED' and 'region' not in second['locations'][0]['physicalLocation']
@@ -0,0 +1,64 @@
+import ast
+
+from doxoade.commands.check_systems.fixer import AutoFixer
+
+
+def test_batch_writes_once_and_tracks_shifted_lines(tmp_path, monkeypatch):
+    target = tmp_path / 'mod.py'
+    target.write_text(
+        'import os\n'
+        'import sys\n'
+        'import json\n'
+        'from __future__ import annotations\n'
+        'x = f"plain"\n'
+        'y = f"also"\n'
+    )
+    fixer = AutoFixer(None)
+    writes = []
+    real_save = fixer._save_file
+    monkeypatch.setattr(fixer, '_save_file', lambda path, lines: writes.append(path) or real_save(path, lines))
+
+    report = fixer.apply_batch(str(target), [
+        (1, 'FIX_UNUSED_IMPORT', {'var_name': 'os'}),
+        (2, 'FIX_UNUSED_IMPORT', {'var_name': 'sys'}),
+        (4, 'MOVE_FUTURE', {}),
+        (5, 'REMOVE_F_PREFIX', {}),
+        (6, 'REMOVE_F_PREFIX', {}),
+        (1, 'ADD_IMPORT', {'module': 're'}),
+    ])
+
+    assert sorted(report['applied']) == [0, 1, 2, 3, 4, 5]
+    assert not report['rolled_back'] and len(writes) == 1
+    text = target.read_text()
+    ast.parse(text)
+    lines = text.splitlines()
+    assert lines[0] == 'from __future__ import annotations'
+    assert 'x = "plain"' in lines and 'y = "also"' in lines
+    assert 'import re' in lines and 'import json' in lines
+    assert not [ln for ln in lines if ln.startswith(('import os', 'import sys'))]
+
+
+def test_batch_is_discarded_when_result_stops_parsing(tmp_path, monkeypatch):
+    target = tmp_path / 'mod.py'
+    source = 'def f():\n    return 1\n\nvalue = f"x"\n'
+    target.write_text(source)
+    fixer = AutoFixer(None)
+    monkeypatch.setattr(fixer, '_apply_remove_f_prefix', lambda lines, idx: lines.__setitem__(idx, 'value = (\n') or True)
+
+    report = fixer.apply_batch(str(target), [(4, 'REMOVE_F_PREFIX', {})])
+
+    assert report == {'applied': [], 'rolled_back': True}
+    assert target.read_text() == source
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_save_file_keeps_the_original_file_mode(tmp_path):
+    import os
+    import stat
+    script = tmp_path / 'tool.py'
+    script.write_text('x = 1\n')
+    os.chmod(script, 0o750)
+    assert AutoFixer(None)._save_file(str(script), ['x = 2\n'])
+    assert script.read_text() == 'x = 2\n'
+    assert stat.S_IMODE(script.stat().st_mode) == 0o750
+    assert not (tmp_path / 'tool.py.dox-fix.tmp').exists()
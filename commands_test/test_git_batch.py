@@ -0,0 +1,61 @@
+import subprocess
+
+from doxoade.commands.search_systems.search_diff import search_git_diffs_pickaxe
+from doxoade.commands.search_systems.search_symbols import SymbolIndex
+from doxoade.tools.git_batch import CatFileReader, iter_git_lines
+
+
+def _git(root, *args):
+    return subprocess.run(['git', *args], cwd=root, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _repo(tmp_path):
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'config', 'user.email', 't@t')
+    _git(tmp_path, 'config', 'user.name', 't')
+    (tmp_path / 'pyproject.toml').write_text('[project]\nname = "x"\n')
+    src = tmp_path / 'mod.py'
+    src.write_text('def old_helper(a):\n    return a\n')
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, 'commit', '-q', '-m', 'first')
+    first = _git(tmp_path, 'rev-parse', '--short', 'HEAD')
+    src.write_text('def new_helper(a, b):\n    return old_helper_vulcan_optimized(a)\n')
+    _git(tmp_path, 'commit', '-qam', 'second commit')
+    return first
+
+
+def test_cat_file_reader_serves_many_blobs_from_one_process(tmp_path):
+    first = _repo(tmp_path)
+    reader = CatFileReader(str(tmp_path))
+    try:
+        assert reader.read_text(first, 'mod.py').startswith('def old_helper')
+        assert b'new_helper' in reader.read_blob('HEAD', 'mod.py')
+        proc = reader._proc
+        assert reader.read_blob('HEAD', 'missing.py') is None
+        assert reader.read_blob('HEAD', 'mod.py') is not None and reader.hits == 1
+        assert reader._proc is proc  # mesmo processo após 'missing'
+    finally:
+        reader.close()
+
+
+def test_streamed_log_and_pickaxe(tmp_path):
+    _repo(tmp_path)
+    assert list(iter_git_lines(['log', '--format=%s'], cwd=str(tmp_path))) == ['second commit', 'first']
+    hits = search_git_diffs_pickaxe('new_helper', str(tmp_path / 'mod.py'))
+    assert [c['summary'] for c in hits] == ['second commit']
+    assert hits[0]['matches'] == [{'type': 'ADD', 'content': 'def new_helper(a, b):'}]
+
+
+def test_symbol_index_traces_moved_functions(tmp_path):
+    (tmp_path / 'a.py').write_text('class Keep:\n    async def _moved(self):\n        pass\n')
+    (tmp_path / 'b.py').write_text('x = moved_total\ny = _moved_vulcan_optimized\n')
+    index = SymbolIndex(tmp_path)
+    assert index.find_definitions('_moved') == [{'file': str(tmp_path / 'a.py'), 'line': 2}]
+    assert [(h['file'][-4:], h['line']) for h in index.find_references('moved')] == [('a.py', 2), ('b.py', 1), ('b.py', 2)]
+    assert len(index.trace('_moved')) == 5
+
+
+def test_cat_file_reader_returns_none_when_git_cannot_start(tmp_path):
+    reader = CatFileReader(cwd=str(tmp_path / 'missing'))
+    assert reader.read_blob('HEAD', 'a.py') is None
+    assert reader._proc is None
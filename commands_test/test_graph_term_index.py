@@ -0,0 +1,57 @@
+import os
+
+import pathspec
+
+from doxoade.commands.intelligence_systems import graph_builder as gb
+
+
+def _spec():
+    return pathspec.PathSpec.from_lines('gitwildmatch', ['.doxoade_cache/'])
+
+
+def _project(root):
+    pkg = root / 'pkg'
+    pkg.mkdir()
+    (pkg / '__init__.py').write_text('', encoding='utf-8')
+    (pkg / 'core.py').write_text('VALUE = 1\n', encoding='utf-8')
+    (pkg / 'user.py').write_text('from pkg.core import VALUE\n', encoding='utf-8')
+    (root / 'notes.md').write_text('see pkg/core.py and pkg.core_extra\n', encoding='utf-8')
+    (root / 'my notes.txt').write_text('nothing\n', encoding='utf-8')
+
+
+def test_lookup_matches_substring_semantics(tmp_path):
+    _project(tmp_path)
+    index = gb.GraphTermIndex(str(tmp_path), _spec())
+    try:
+        found = index.lookup({'pkg/core.py', 'pkg.core', 'core.py and', 'absent'})
+        assert found['pkg/core.py'] == {'notes.md'}
+        assert found['pkg.core'] == {'notes.md', 'pkg/user.py'}
+        assert found['core.py and'] == {'notes.md'}
+        assert found['absent'] == set()
+        assert index.imports['pkg/user.py'] == {'pkg.core'}
+    finally:
+        index.close()
+
+
+def test_refresh_rereads_only_changed_files(tmp_path, monkeypatch):
+    _project(tmp_path)
+    gb.GraphTermIndex(str(tmp_path), _spec()).close()
+    notes = tmp_path / 'notes.md'
+    notes.write_text('now mentions pkg/user.py\n', encoding='utf-8')
+    os.utime(notes, ns=(1, 1))
+    parsed = []
+    monkeypatch.setattr(gb, 'extract_imports', lambda path, content=None: parsed.append(path) or set())
+    index = gb.GraphTermIndex(str(tmp_path), _spec())
+    try:
+        assert parsed == []
+        assert index.files_containing('pkg/user.py') == {'notes.md'}
+        assert index.files_containing('pkg/core.py') == set()
+    finally:
+        index.close()
+
+
+def test_graph_neighbors_follow_imports_and_text(tmp_path):
+    _project(tmp_path)
+    edges, new_files = gb.get_graph_neighbors([str(tmp_path / 'pkg' / 'core.py')], str(tmp_path), _spec(), 1)
+    rel = sorted(os.path.relpath(f, tmp_path).replace('\\', '/') for f in new_files)
+    assert rel == ['notes.md', 'pkg/user.py']
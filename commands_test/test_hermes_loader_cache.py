@@ -0,0 +1,37 @@
+import struct
+
+from doxoade.tools.hermes_systems import hermes_loader
+from doxoade.tools.hermes_systems.hermes_metrics import cache_report
+
+
+def _varint(n):
+    out = bytearray()
+    while True:
+        byte, n = n & 0x7F, n >> 7
+        out.append(byte | (0x80 if n else 0))
+        if not n:
+            return bytes(out)
+
+
+def test_hbc6_tables_decode_in_one_call_and_keep_partial_dicts():
+    macros = _varint(2) + _varint(1) + _varint(2) + b'\x01\x02' + _varint(300) + _varint(1) + b'\x09'
+    hrt = struct.pack('<IIHH', 0, 4, 1, 6) + struct.pack('<IIHH', 2, 8, 1, 4) + b'\x00'
+    data = b'HDR' + hrt + macros
+    macro_dict, hrt_map = hermes_loader.parse_hbc6_tables(data, 3, len(hrt), 3 + len(hrt), len(macros))
+    assert macro_dict == {1: b'\x01\x02', 300: b'\x09'}
+    assert hrt_map == {(0, 4): 6, (2, 8): 4}
+    assert hermes_loader.parse_macro_dict(data, 3 + len(hrt), len(macros) - 1) == {1: b'\x01\x02'}
+
+
+def test_code_cache_is_lru_bounded_by_entries_and_bytes():
+    cache = hermes_loader.CodeCache('test_lru', max_entries=2, max_bytes=100)
+    cache.put('a', 'A', 10)
+    cache.put('b', 'B', 10)
+    assert cache.get('a') == 'A'  # 'a' passa a ser o mais recente
+    cache.put('c', 'C', 10)
+    assert 'b' not in cache and cache.get('a') == 'A' and cache.get('b') is None
+    cache.put('big', 'X', 95)
+    assert len(cache) == 1 and cache.bytes == 95
+    stats = cache_report()['test_lru']
+    assert (stats['hits'], stats['misses'], stats['evictions'], stats['entries']) == (2, 1, 3, 1)
+    assert stats['hit_rate'] == round(2 / 3 * 100, 2)
@@ -0,0 +1,133 @@
+import json
+
+import pytest
+
+from doxoade.tools import horus
+
+
+@pytest.fixture
+def ring(monkeypatch):
+    ring = horus.HorusRing(capacity=4)
+    monkeypatch.setattr(horus, '_RING', ring)
+    return ring
+
+
+@pytest.fixture
+def ledger(monkeypatch):
+    rows = []
+    monkeypatch.setattr(horus, 'append_row', lambda table, row: rows.append(row))
+    monkeypatch.setattr(horus.segment_log, 'flush', lambda: None)
+    return rows
+
+
+def test_ring_keeps_only_the_newest_events_up_to_capacity():
+    ring = horus.HorusRing(capacity=3)
+    fid = ring.register('f')
+    for n in range(5):
+        ring.push(fid, n, n, horus.HorusRing.ST_OK, (str(n), str(n)))
+    events = ring.drain()
+    assert [t0 for _, t0, _, _, _ in events] == [2, 3, 4]
+    assert ring.pos == 0 and ring.refs == [None] * 3
+
+
+def test_default_mode_is_full_unless_the_environment_opts_in(monkeypatch):
+    monkeypatch.delenv('DOXOADE_HORUS_MODE', raising=False)
+    monkeypatch.delenv('DOXOADE_HORUS_ACTIVE', raising=False)
+    assert horus._default_mode() == 'full'
+    monkeypatch.setenv('DOXOADE_HORUS_MODE', 'ring')
+    assert horus._default_mode() == 'ring'
+    monkeypatch.setenv('DOXOADE_HORUS_MODE', 'bogus')
+    assert horus._default_mode() == 'full'
+
+
+def test_full_mode_emits_a_heartbeat_per_call(monkeypatch):
+    beats = []
+    monkeypatch.setattr(horus, 'chief_heartbeat', lambda sub, action, data: beats.append((action, data['func'])))
+    monkeypatch.delenv('DOXOADE_HORUS_MODE', raising=False)
+
+    @horus.horus_trace
+    def double(x):
+        return x * 2
+
+    assert double(2) == 4
+    assert beats == [('FUNCTION_IN', 'double'), ('FUNCTION_OUT', 'double')]
+
+
+def test_ring_mode_stores_truncated_text_not_references(ring):
+    payload = ['x' * 500]
+
+    @horus.horus_trace(mode='ring', sample=1.0)
+    def echo(value):
+        return value
+
+    assert echo(payload) is payload
+    _, _, _, status, (args_text, outcome_text) = ring.drain()[0]
+    assert status == horus.HorusRing.ST_OK
+    assert isinstance(args_text, str) and len(args_text) == 200
+    assert isinstance(outcome_text, str) and len(outcome_text) == 200
+
+
+def test_ring_mode_samples_but_always_keeps_errors(ring):
+    @horus.horus_trace(mode='ring', sample=0.5)
+    def check(x):
+        if x < 0:
+            raise ValueError('negativo')
+        return x
+
+    for x in (1, 2, 3, 4):
+        check(x)
+    with pytest.raises(ValueError):
+        check(-1)
+    statuses = [status for _, _, _, status, _ in ring.drain()]
+    assert statuses == [horus.HorusRing.ST_OK, horus.HorusRing.ST_OK, horus.HorusRing.ST_ERROR]
+    snapshot = horus.horus_snapshot()['check']
+    assert (snapshot['calls'], snapshot['errors']) == (5, 1)
+
+
+def test_aggregate_mode_counts_without_retaining_events(ring):
+    @horus.horus_trace(mode='aggregate')
+    def noop():
+        return None
+
+    for _ in range(3):
+        noop()
+    assert ring.pos == 0
+    assert horus.horus_snapshot()['noop']['calls'] == 3
+
+
+def test_flush_horus_writes_events_and_stats_to_the_ledger(ring, ledger):
+    @horus.horus_trace(mode='ring', sample=1.0)
+    def fail():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        fail()
+    assert horus.flush_horus() == 3
+    actions = [row['action'] for row in ledger]
+    assert actions == ['FUNCTION_IN', 'FUNCTION_ERROR', 'FUNCTION_STATS']
+    assert json.loads(ledger[1]['data'])['error'] == 'boom'
+    assert json.loads(ledger[2]['data'])['errors'] == 1
+    assert horus.flush_horus() == 0
+
+
+def test_explicit_sample_selects_ring_mode_and_actually_samples(ring, monkeypatch):
+    beats = []
+    monkeypatch.setattr(horus, 'chief_heartbeat', lambda sub, action, data: beats.append(action))
+    monkeypatch.delenv('DOXOADE_HORUS_MODE', raising=False)
+
+    @horus.horus_trace(sample=0.25)
+    def step(x):
+        return x
+
+    for x in range(8):
+        step(x)
+    assert beats == []
+    assert len(ring.drain()) == 2
+    assert horus.horus_snapshot()['step']['calls'] == 8
+
+
+def test_sample_with_a_non_ring_mode_is_rejected():
+    with pytest.raises(ValueError):
+        horus.horus_trace(mode='full', sample=0.1)
+    with pytest.raises(ValueError):
+        horus.horus_trace(mode='aggregate', sample=0.1)
@@ -0,0 +1,46 @@
+from doxoade.commands.impact_systems.impact_graph import ImpactGraph
+from doxoade.commands.impact_systems.impact_logic import get_external_consumers
+from doxoade.commands.impact_systems.impact_state import ImpactState
+
+
+def _mod(imports, mtime=1, calls=(), defines=()):
+    return {'path': 'p', 'mtime': mtime, 'size': 10, 'imports': list(imports), 'calls': list(calls), 'defines': list(defines)}
+
+
+def _index():
+    return {
+        'pkg.core': _mod(['os', 'pkg.util'], defines=['run', 'stop']),
+        'pkg.util': _mod(['pkg.core']),
+        'pkg.cli': _mod(['pkg.core'], calls=['run', 'print']),
+        'pkg.app': _mod(['pkg.cli']),
+    }
+
+
+def test_sync_patches_only_changed_modules_and_persists(tmp_path):
+    graph = ImpactGraph(str(tmp_path))
+    index = _index()
+    assert graph.sync(index) == 4
+    assert graph.sync(index) == 0
+    index['pkg.util'] = _mod([], mtime=2)
+    del index['pkg.app']
+    assert graph.sync(index) == 2
+    graph.close()
+    reloaded = ImpactGraph(str(tmp_path))
+    assert reloaded.forward == graph.forward and reloaded.reverse == graph.reverse
+    assert reloaded.consumers_of('pkg.core') == {'pkg.cli'}
+    reloaded.close()
+
+
+def test_blast_radius_and_cycles_through():
+    graph = ImpactGraph.from_index(_index())
+    assert graph.blast_radius('pkg.core') == {'pkg.util': 1, 'pkg.cli': 1, 'pkg.app': 2}
+    assert graph.blast_radius('pkg.core', depth=1) == {'pkg.util': 1, 'pkg.cli': 1}
+    assert graph.cycle_members('pkg.core') == {'pkg.core', 'pkg.util'}
+    assert graph.cycles_through('pkg.core') == [['pkg.core', 'pkg.util', 'pkg.core']]
+    assert graph.cycles_through('pkg.cli') == []
+
+
+def test_external_consumers_answer_from_reverse_edges():
+    state = ImpactState(target_module='pkg.core', project_root='.', search_path='.', index=_index())
+    assert get_external_consumers(state) == [{'path': 'p', 'calls': ['run']}]
+    assert get_external_consumers(state, func_filter='stop') == []
@@ -0,0 +1,41 @@
+import json
+
+from doxoade.commands.intelligence_systems import intelligence_pool as pool
+from doxoade.commands.intelligence_systems.intelligence_report import DossierWriter
+
+
+class _Quiet:
+    def print(self, *args, **kwargs):
+        pass
+
+
+def test_results_are_cached_by_content_hash(tmp_path, monkeypatch):
+    a = tmp_path / 'a.py'
+    b = tmp_path / 'b.py'
+    a.write_text('def f():\n    return 1\n', encoding='utf-8')
+    b.write_text('x = 1\n', encoding='utf-8')
+    files = [str(a), str(b)]
+    first = [r['path'] for _, r in pool.iter_dossier_results(files, str(tmp_path), workers=1)]
+    analyzed = []
+    real_job = pool.analyze_job
+    monkeypatch.setattr(pool, 'analyze_job', lambda job: analyzed.append(job[0]) or real_job(job))
+    b.write_text('x = 2\n', encoding='utf-8')
+    second = [r['path'] for _, r in pool.iter_dossier_results(files, str(tmp_path), workers=1)]
+    assert first == second == ['a.py', 'b.py']
+    assert analyzed == [str(b)]
+
+
+def test_streamed_json_matches_in_memory_dump(tmp_path):
+    entries = [{'path': 'a.py', 'complexity': 3, 'god_assignment': 'Zeus', 'debt_tags': ['TODO']},
+               {'path': 'b.py', 'complexity': 1, 'god_assignment': 'Hades', 'debt_tags': []}]
+    for concat in (False, True):
+        out = tmp_path / f'dossier_{concat}.json'
+        writer = DossierWriter(str(out), str(tmp_path), concat=concat, console=_Quiet())
+        for entry in entries:
+            writer.add(entry)
+        writer.close()
+        data = json.loads(out.read_text(encoding='utf-8'))
+        assert data['codebase_map'] == entries
+        assert data['economic_summary']['total_debt_tags_in_report'] == 1
+        expected = dict(data)
+        assert out.read_text(encoding='utf-8') == json.dumps(expected, indent=None if concat else 2, ensure_ascii=False)
@@ -0,0 +1,54 @@
+import shutil
+
+import pytest
+
+from doxoade.tools.metalcraft.metal_engine import NexusMetalEngine, parse_depfile
+
+TOML = '''[project]
+name = "demo"
+type = "executable"
+
+[compiler]
+engine = "gcc"
+opt = "O0"
+
+[[targets]]
+name = "demo"
+sources = ["src/*.c"]
+output = "bin/demo"
+soteria = false
+'''
+
+
+def test_parse_depfile_handles_continuations_and_drive_letters():
+    text = 'C:/obj/a.o: C:/src/a.c \\\n C:/src/my\\ dir/a.h \\\r\n  /usr/x.h\n'
+    assert parse_depfile(text) == ['C:/src/a.c', 'C:/src/my dir/a.h', '/usr/x.h']
+    assert parse_depfile('') == []
+
+
+@pytest.mark.skipif(not shutil.which('gcc'), reason='gcc indisponível')
+def test_build_recompiles_only_touched_units_and_header_dependents(tmp_path, capsys):
+    (tmp_path / 'metalcraft.toml').write_text(TOML, encoding='utf-8')
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'shared.h').write_text('#define ANSWER 41\n', encoding='utf-8')
+    (src / 'main.c').write_text('int helper(void);\nint main(void) { return helper() == 42 ? 0 : 1; }\n', encoding='utf-8')
+    (src / 'helper.c').write_text('#include "shared.h"\nint helper(void) { return ANSWER; }\n', encoding='utf-8')
+
+    engine = NexusMetalEngine(tmp_path)
+    assert engine.build()
+    assert 'Compilando 2/2' in capsys.readouterr().out
+    assert engine.build()
+    assert 'Cache Hit' in capsys.readouterr().out
+
+    (src / 'shared.h').write_text('#define ANSWER 42\n', encoding='utf-8')
+    assert engine.build()
+    out = capsys.readouterr().out
+    assert 'Compilando 1/2' in out and 'helper.c' in out and 'main.c' not in out
+
+    (src / 'main.c').write_text((src / 'main.c').read_text(encoding='utf-8'), encoding='utf-8')
+    assert engine.build()  # touch sem mudança de conteúdo: nada recompila nem relinka
+    assert 'Cache Hit' in capsys.readouterr().out
+
+    ensure = NexusMetalEngine(tmp_path).ensure_targets()
+    assert ensure['skipped'] == 1 and ensure['built'] == 0
@@ -0,0 +1,76 @@
+import json
+import sqlite3
+import sys
+
+import pytest
+
+import doxoade.core_database as core_database
+
+needs_fts = pytest.mark.skipif(not core_database.fts5_trigram_available(), reason='SQLite sem FTS5 trigram')
+
+
+def _brick(cur, name, caps, doc='Módulo funcional genérico.', category='custom', verb='INSERT'):
+    cur.execute(f'{verb} INTO moduloid_acervo (name, category, filename, docstring, capabilities, health_report) VALUES (?, ?, ?, ?, ?, ?)',
+                (name, category, f'{name}.py', doc, json.dumps(caps), json.dumps({'size_kb': 1.5, 'lines': 40, 'issues': 2})))
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    cur = conn.cursor()
+    core_database._m_v22_moduloid_acervo(cur)
+    for col in ('quality_score INTEGER DEFAULT 0', 'security_status TEXT', 'health_report TEXT'):
+        cur.execute(f'ALTER TABLE moduloid_acervo ADD COLUMN {col}')
+    _brick(cur, 'sorter', ['quick_sort', 'partition'], doc='Ordenação in-place')
+    cur.execute("INSERT INTO moduloid_acervo (name, capabilities) VALUES ('broken', 'not json')")
+    core_database._m_v136_moduloid_index(cur)  # backfill do acervo existente
+    yield conn
+    conn.close()
+
+
+def _caps(conn):
+    return sorted(tuple(r) for r in conn.execute('SELECT a.name, c.name FROM moduloid_capabilities c JOIN moduloid_acervo a ON a.id = c.brick_id'))
+
+
+def test_capabilities_follow_insert_replace_update_and_delete(conn):
+    cur = conn.cursor()
+    assert _caps(conn) == [('sorter', 'partition'), ('sorter', 'quick_sort')]
+    _brick(cur, 'queue_io', ['put', 'get', 'get'])
+    _brick(cur, 'sorter', ['merge_sort'], verb='INSERT OR REPLACE')
+    cur.execute("UPDATE moduloid_acervo SET capabilities = '[\"put\"]' WHERE name = 'queue_io'")
+    assert _caps(conn) == [('queue_io', 'put'), ('sorter', 'merge_sort')]
+    assert conn.execute('SELECT count(*) FROM moduloid_capabilities').fetchone()[0] == 4  # órfãos do REPLACE até o sweep
+    core_database.sweep_moduloid_orphans(cur)
+    assert conn.execute('SELECT count(*) FROM moduloid_capabilities').fetchone()[0] == 2
+    cur.execute("DELETE FROM moduloid_acervo WHERE name = 'queue_io'")
+    assert _caps(conn) == [('sorter', 'merge_sort')]
+    assert conn.execute('SELECT count(*) FROM moduloid_capabilities').fetchone()[0] == 1
+
+
+@needs_fts
+def test_fts_indexes_names_docstrings_and_capabilities(conn):
+    cur = conn.cursor()
+    _brick(cur, 'sorter', ['merge_sort'], doc='Ordenação estável', verb='INSERT OR REPLACE')
+    core_database.sweep_moduloid_orphans(cur)
+
+    def match(q):
+        return [r[0] for r in conn.execute('SELECT a.name FROM moduloid_acervo_fts f JOIN moduloid_acervo a ON a.id = f.rowid WHERE moduloid_acervo_fts MATCH ?', (q,))]
+    assert match('capabilities : "MERGE"') == ['sorter']
+    assert match('capabilities : "partition"') == []
+    assert match('{name category docstring} : "estáv"') == ['sorter']
+    assert conn.execute('SELECT count(*) FROM moduloid_acervo_fts').fetchone()[0] == 2
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='moduloid importa deepcheck_utils (f-strings da PEP 701)')
+def test_list_query_filters_and_decodes_in_sql(conn):
+    from doxoade.commands.moduloid_systems.moduloid_acervo import _acervo_query
+    _brick(conn.cursor(), 'queue_io', [f'f{i}' for i in range(12)], doc='Fila de mensagens')
+    rows = conn.execute(*_acervo_query(conn, search='fila')).fetchall()
+    assert [r['name'] for r in rows] == ['queue_io']
+    assert rows[0]['funcs'].split('\x1f') == [f'f{i}' for i in range(8)]
+    assert (rows[0]['size_kb'], rows[0]['lines'], rows[0]['issues']) == (1.5, 40, 2)
+    assert [r['name'] for r in conn.execute(*_acervo_query(conn, func_filter='sort')).fetchall()] == ['sorter']
+    assert [r['name'] for r in conn.execute(*_acervo_query(conn, func_filter='f1')).fetchall()] == ['queue_io']
+    broken = conn.execute(*_acervo_query(conn, search='broken')).fetchone()
+    assert broken['funcs'] is None and not broken['has_health']
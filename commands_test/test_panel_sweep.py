@@ -0,0 +1,80 @@
+import sys
+import types
+
+import click
+
+from doxoade.commands import panel_command as panel
+from doxoade.commands.refactor_systems import refactor_syntax
+
+
+def _install_fake_module(monkeypatch, tmp_path):
+    @click.group('grp')
+    def grp():
+        """Grupo."""
+
+    @grp.command('ok')
+    def ok():
+        """Sub ok."""
+
+    class BrokenHelp(click.Command):
+        def format_help(self, ctx, formatter):
+            raise RuntimeError('help quebrado')
+
+    grp.add_command(BrokenHelp('bad', callback=lambda: None))
+
+    source = tmp_path / 'panel_fake_cmds.py'
+    source.write_text('x = 1\n')
+    module = types.ModuleType('panel_fake_cmds')
+    module.__file__ = str(source)
+    module.grp = grp
+    monkeypatch.setitem(sys.modules, 'panel_fake_cmds', module)
+    monkeypatch.setattr(panel.importlib.util, 'find_spec', lambda name: types.SimpleNamespace(origin=str(source)) if name == 'panel_fake_cmds' else None)
+    return {'grp': 'panel_fake_cmds:grp', 'also': 'panel_fake_cmds:grp', 'missing': 'nowhere_mod:cmd'}
+
+
+def test_sweep_discovers_subcommands_in_process(monkeypatch, tmp_path):
+    targets = _install_fake_module(monkeypatch, tmp_path)
+    monkeypatch.setattr(panel, '_discover_commands', lambda: (click.Group('doxoade'), targets))
+    monkeypatch.setattr(refactor_syntax, 'scan_syntax_errors', lambda root, exclude_dirs=None: [])
+    compiled = []
+    real_compile = compile
+    monkeypatch.setattr(panel, 'compile', lambda src, path, mode: compiled.append(path) or real_compile(src, path, mode), raising=False)
+    panel._COMPILED.clear()
+
+    report = panel._run_panel(tmp_path)
+
+    status = {c.name: c.status_label for c in report.commands}
+    assert status == {
+        'also': 'OK', 'also bad': 'HELP_ERR', 'also ok': 'OK',
+        'grp': 'OK', 'grp bad': 'HELP_ERR', 'grp ok': 'OK',
+        'missing': 'IMPORT_ERR',
+    }
+    assert len(compiled) == 1
+    timings = report.timings()
+    assert set(timings) == {'import', 'lookup', 'help'}
+    assert set(timings['help']) == {'p50', 'p90', 'p99', 'max'}
+    subs = [c for c in report.commands if c.subcommand]
+    assert sorted(c.name for c in subs) == ['also bad', 'also ok', 'grp bad', 'grp ok']
+    assert all(c.import_ms == 0.0 and c.lookup_ms > 0 for c in subs)
+
+
+def test_import_percentiles_ignore_subcommand_lookups():
+    report = panel.PanelReport(commands=[
+        panel.CommandHealth('a', 'm', import_ms=40.0),
+        panel.CommandHealth('b', 'm', import_ms=60.0),
+        *[panel.CommandHealth(f'a s{n}', 'm', lookup_ms=0.01, subcommand=True) for n in range(5)],
+    ])
+    timings = report.timings()
+    assert timings['import']['p50'] == 50.0
+    assert timings['lookup']['max'] == 0.0
+
+
+def test_fast_mode_skips_help_rendering(monkeypatch, tmp_path):
+    targets = _install_fake_module(monkeypatch, tmp_path)
+    monkeypatch.setattr(panel, '_discover_commands', lambda: (click.Group('doxoade'), targets))
+    monkeypatch.setattr(refactor_syntax, 'scan_syntax_errors', lambda root, exclude_dirs=None: [])
+    monkeypatch.setattr(panel, '_render_help', lambda *a: (_ for _ in ()).throw(AssertionError('help não deveria rodar')))
+
+    report = panel._run_panel(tmp_path, fast=True, only=('grp',))
+
+    assert [(c.name, c.healthy) for c in report.commands] == [('grp', True)]
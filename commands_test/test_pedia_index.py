@@ -0,0 +1,65 @@
+import json
+import os
+
+from doxoade.commands.pedia_systems.pedia_io import KnowledgeBaseIO
+from doxoade.commands.pedia_systems.pedia_search import PediaSearch
+
+
+def _load(root):
+    kb = KnowledgeBaseIO(str(root))
+    kb.system_docs = root / 'no_system_docs'
+    articles = kb.load_all_knowledge()
+    return kb, articles
+
+
+def _write_docs(root):
+    docs = root / 'docs'
+    docs.mkdir()
+    (docs / 'cache.md').write_text('# Cache Layer\n\ncache cache cache eviction policy\n', encoding='utf-8')
+    (docs / 'intro.md').write_text('# Introduction\n\nmentions cache once among many other words here\n', encoding='utf-8')
+    (docs / 'glossary.json').write_text(json.dumps({'Widget': {'title': 'Widget', 'content': 'a reusable widget'}}), encoding='utf-8')
+    return docs
+
+
+def test_bm25_ranks_by_score_and_honours_limit(tmp_path):
+    _write_docs(tmp_path)
+    kb, articles = _load(tmp_path)
+    results = PediaSearch(articles, kb.index).rank_articles('cache', limit=1)
+    assert [r['article'].key for r in results] == ['cache']
+    ranked = PediaSearch(articles, kb.index).rank_articles('cache')
+    assert [r['article'].key for r in ranked] == ['cache', 'intro']
+    assert ranked[0]['score'] > ranked[1]['score']
+
+
+def test_bodies_are_lazy_and_only_changed_files_reindex(tmp_path):
+    docs = _write_docs(tmp_path)
+    _load(tmp_path)
+    kb, articles = _load(tmp_path)
+    assert not kb._dirty
+    assert articles['widget']._body is None
+    assert articles['widget'].content == 'a reusable widget'
+    target = docs / 'intro.md'
+    target.write_text('# Introduction\n\nnow about zebras\n', encoding='utf-8')
+    os.utime(target, ns=(1, 1))
+    (docs / 'cache.md').unlink()
+    kb, articles = _load(tmp_path)
+    assert kb._dirty and 'cache' not in articles
+    assert 'cache' not in kb.index['postings']
+    assert [r['article'].key for r in PediaSearch(articles, kb.index).rank_articles('zebras')] == ['intro']
+
+
+def test_dropping_a_file_touches_only_its_own_terms(tmp_path):
+    docs = _write_docs(tmp_path)
+    kb, _ = _load(tmp_path)
+    intro = str(docs / 'intro.md')
+    assert 'zebras' not in kb.index['files'][intro]['terms'] and 'mentions' in kb.index['files'][intro]['terms']
+
+    class _NoScan(dict):
+        def __iter__(self):
+            raise AssertionError('varredura completa dos postings')
+    kb.index['postings'] = _NoScan(kb.index['postings'])
+    kb._drop_files([intro])
+    postings = kb.index['postings']
+    assert 'mentions' not in postings and intro not in postings['cache']
+    assert set(postings['cache']) == {str(docs / 'cache.md')}
+    assert 'widget' in postings
@@ -0,0 +1,47 @@
+from doxoade.probes.symbol_table import SymbolTable
+from doxoade.tools.recursion_guard import RecursionGuard, strongly_connected_components
+
+
+def _project(tmp_path):
+    (tmp_path / 'pyproject.toml').write_text('')
+    pkg = tmp_path / 'pkg'
+    pkg.mkdir()
+    (pkg / '__init__.py').write_text('')
+    (pkg / 'a.py').write_text(
+        'from pkg import b\n'
+        'def start(n):\n    return ping(n)\n'
+        'def ping(n):\n    if n:\n        return b.pong(n - 1)\n    return 0\n'
+        'class Walker:\n'
+        '    def visit(self, x):\n        return self.walk(x)\n'
+        '    def walk(self, x):\n        return self.visit(x)\n')
+    (pkg / 'b.py').write_text('from pkg.a import ping as again\ndef pong(n):\n    return again(n)\n')
+    return [str(p) for p in sorted(pkg.glob('*.py'))]
+
+
+def test_cross_module_cycles_are_reported_once_with_entry_points(tmp_path):
+    files = _project(tmp_path)
+    findings = RecursionGuard().analyze_project(files, str(tmp_path))
+    metas = [f['meta'] for f in findings]
+    assert [m['members'] for m in metas] == [['pkg.a.ping', 'pkg.b.pong'], ['pkg.a.Walker.visit', 'pkg.a.Walker.walk']]
+    assert metas[0]['entry_points'] == ['pkg.a.ping'] and metas[0]['cross_module']
+    assert metas[0]['cycle'] == ['pkg.a.ping', 'pkg.b.pong', 'pkg.a.ping']
+    assert metas[1]['entry_points'] == [] and not metas[1]['cross_module']
+    assert findings[0]['line'] == 4
+
+    table = SymbolTable(str(tmp_path))
+    assert RecursionGuard().analyze_project(files, str(tmp_path), table=table) == findings
+    assert table.parsed == 0
+
+
+def test_scc_is_iterative_on_deep_chains():
+    n = 50000
+    adj = [[i + 1] for i in range(n - 1)] + [[0]]
+    assert [len(c) for c in strongly_connected_components(adj)] == [n]
+    chain = [[i + 1] for i in range(n - 1)] + [[]]
+    assert len(strongly_connected_components(chain)) == n
+
+
+def test_file_mode_reports_each_cycle_once():
+    src = 'def a():\n    b()\ndef b():\n    c()\n    a()\ndef c():\n    a()\n'
+    cycles = [f['meta']['cycle'] for f in RecursionGuard().analyze_source(src) if f['meta']['type'] == 'indirect_cycle']
+    assert len(cycles) == 1 and cycles[0][0] == cycles[0][-1]
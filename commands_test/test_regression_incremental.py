@@ -0,0 +1,59 @@
+from doxoade.commands import check, regression_test
+from doxoade.commands.check_systems.check_io import CheckIO
+from doxoade.commands.regression_systems import canon_index
+from doxoade.commands.test_systems import selection_engine
+
+
+def _setup(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in ('a.py', 'b.py'):
+        (tmp_path / name).write_text(f'# {name}\n')
+    (tmp_path / 'tests').mkdir()
+    (tmp_path / 'tests' / 'test_a.py').write_text('def test_a():\n    pass\n')
+    (tmp_path / 'tests' / 'test_b.py').write_text('def test_b():\n    pass\n')
+    files = [str(tmp_path / 'a.py'), str(tmp_path / 'b.py')]
+    monkeypatch.setattr(CheckIO, 'resolve_files', lambda self, target_files=None: list(files))
+    findings = [{'file': files[0], 'finding_hash': 'h-a'}, {'file': files[1], 'finding_hash': 'h-b'}]
+    ok = {'tests': 1, 'failures': 0}
+    canon = {
+        'static_analysis': {'findings': findings},
+        'test_execution': {'exit_code': 0},
+        'file_index': canon_index.build_file_index(str(tmp_path), files, findings),
+        'test_index': canon_index.build_test_index(str(tmp_path), {'tests/test_a.py': ok, 'tests/test_b.py': ok}),
+    }
+    return files, canon
+
+
+def test_only_changed_files_and_affected_tests_are_reevaluated(tmp_path, monkeypatch):
+    files, canon = _setup(tmp_path, monkeypatch)
+    (tmp_path / 'b.py').write_text('# b.py alterado\n')
+    checked, ran = [], []
+
+    def fake_check(path, **kw):
+        checked.append(kw.get('target_files'))
+        return {'findings': [{'file': files[1], 'finding_hash': 'h-b-new'}]}
+
+    def fake_pytest(root, tests=None, tb='short'):
+        ran.append(tests)
+        return {'exit_code': 1, 'outcomes': {'tests/test_b.py': {'tests': 1, 'failures': 1}}, 'output': 'F'}
+
+    monkeypatch.setattr(check, 'run_check_logic', fake_check)
+    monkeypatch.setattr(canon_index, 'run_pytest', fake_pytest)
+    monkeypatch.setattr(selection_engine, 'select_tests_for_changes', lambda root, changed, target=None: {'tests': ['tests/test_b.py'] if 'b.py' in changed else [], 'fallback': None})
+
+    ev = regression_test._run_audit_pipeline(canon, verbose=False)
+
+    assert checked == [[files[1]]] and ran == [['tests/test_b.py']]
+    assert ev['new_lint_errors'] == ['h-b-new'] and ev['lint_total'] == 2
+    assert ev['test_exit_code'] == 1 and ev['canon_test_exit'] == 0
+
+
+def test_untouched_tree_reuses_the_canon(tmp_path, monkeypatch):
+    _, canon = _setup(tmp_path, monkeypatch)
+    monkeypatch.setattr(check, 'run_check_logic', lambda *a, **k: (_ for _ in ()).throw(AssertionError('check não deveria rodar')))
+    monkeypatch.setattr(canon_index, 'run_pytest', lambda *a, **k: (_ for _ in ()).throw(AssertionError('pytest não deveria rodar')))
+    monkeypatch.setattr(selection_engine, 'select_tests_for_changes', lambda root, changed, target=None: {'tests': [], 'fallback': None})
+
+    ev = regression_test._run_audit_pipeline(canon, verbose=False)
+
+    assert ev['new_lint_errors'] == [] and ev['lint_total'] == 2 and ev['test_exit_code'] == 0
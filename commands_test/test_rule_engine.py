@@ -0,0 +1,76 @@
+import ast
+
+from doxoade.probes.hunter_probe import hunter_rules
+from doxoade.probes.rule_engine import Rule, RuleEngine
+
+
+class _Recorder(Rule):
+    name = 'recorder'
+    nodes = (ast.stmt,)
+    comments = True
+
+    def visit(self, node, ctx):
+        ctx.data.setdefault('seen', []).append(type(node).__name__)
+
+    def comment(self, line, text, ctx):
+        ctx.data.setdefault('comments', []).append((line, text))
+
+
+def test_single_walk_dispatches_by_type_in_visitor_order():
+    src = 'def f(a=[]):\n    try:\n        return a == None  # TODO: x\n    except:\n        eval("1")\n'
+    recorder = _Recorder()
+    engine = RuleEngine(hunter_rules() + [recorder])
+    ctx = engine.run(src, filename='m.py')
+    assert ctx.data['seen'] == ['FunctionDef', 'Try', 'Return', 'Expr']  # ast.stmt e subclasses; ExceptHandler não é stmt
+    assert ctx.data['comments'] == [(3, 'TODO: x')]
+    assert [f['category'] for f in ctx.findings] == ['RISK-MUTABLE', 'STYLE', 'RISK-EXCEPTION', 'SECURITY']
+    assert [r.name for r in engine.dispatch[ast.Return]] == ['recorder'] and [r.name for r in engine.dispatch[ast.Compare]] == ['hunter.none-compare']
+    names = {name for name, _ in engine.timing_report()}
+    assert {'recorder', 'hunter.eval-exec', '[parse]', '[walk]'} <= names
+
+
+def test_comment_events_follow_the_language_marker():
+    recorder = _Recorder()
+    ctx = RuleEngine([recorder]).run(filename='x.c', lines=['#include <a.h>', 'int x; // FIXME: y'])
+    assert ctx.data['comments'] == [(1, 'include <a.h>'), (2, 'FIXME: y')] and 'seen' not in ctx.data
+
+
+def test_python_comments_come_from_tokens_not_string_literals():
+    recorder = _Recorder()
+    lines = ['tpl = "# TODO: não é comentário"\n', "x = '''\n", '# FIXME: nem isto\n', "'''  # HACK: isto sim\n"]
+    ctx = RuleEngine([recorder]).run(filename='m.py', tree=ast.parse(''.join(lines)), lines=lines)
+    assert ctx.data['comments'] == [(4, 'HACK: isto sim')]
+
+
+def test_structural_risk_reuses_counts_from_the_fused_scan(tmp_path):
+    from doxoade.commands.check_systems.check_state import CheckState
+    from doxoade.commands.check_systems.check_structural import analyze_structural_risk
+    cached = str(tmp_path / 'gone.py')  # contadores vindos da varredura/cache: arquivo nem é aberto
+    fresh = tmp_path / 'fresh.py'
+    fresh.write_text('import importlib\nimportlib.import_module("x")\ngetattr(object, "y")\n')
+
+    class _IO:
+        def resolve_files(self, _):
+            return [cached, str(fresh)]
+    state = CheckState(root=str(tmp_path), target_path=str(tmp_path))
+    state.rule_counts[cached] = {'dynamic_exec': 1}
+    analyze_structural_risk(state, _IO())
+    meta = state.findings.to_dicts()[0]['meta']
+    assert meta['risk_level'] == 3
+    assert {k: n for k, n in meta['indicators'].items() if n} == {'dynamic_exec': 1, 'dynamic_import': 1, 'runtime_attr_access': 1}
+    assert 'structural.risk' in state.rule_timings
+
+
+def test_check_fuses_qa_reminders_and_clone_hashes_into_one_run(tmp_path):
+    from doxoade.commands.check_systems.check_state import CheckState
+    from doxoade.commands.check_systems.check_engine import _check_rule_engine, _run_fused_rules, _run_clone_detection
+    src = tmp_path / 'dup.py'
+    src.write_text('def a(x):\n    return x + 1  # FIXME: revisar\n\ndef b(y):\n    return y + 1\n')
+    state = CheckState(root=str(tmp_path), target_path=str(tmp_path))
+    _check_rule_engine(state, clones=True)
+    findings = _run_fused_rules(str(src), state=state)
+    assert [(f['category'], f['line'], f['file']) for f in findings] == [('QA-REMINDER', 2, str(src))]
+    hashes = state.clone_hashes[str(src)]
+    assert [h['name'] for h in hashes] == ['a', 'b'] and hashes[0]['hash'] == hashes[1]['hash']
+    _run_clone_detection([str(src)], state)  # sem vulcan_dry o fallback do clone_probe não reporta
+    assert {'qa.reminders', 'clone.structural-hash'} <= {name for name, _ in state.rule_engine.timing_report()}
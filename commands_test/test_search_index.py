@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pytest
+
+from doxoade.commands.search_systems import search_index as si
+
+
+def _index(root):
+    index = si.TrigramIndex(root)
+    index.refresh(list(si.iter_search_files(root)))
+    return index
+
+
+def test_candidates_narrow_literal_queries_case_insensitively(tmp_path):
+    (tmp_path / 'a.py').write_text('def Load_Config():\n    pass\n', encoding='utf-8')
+    (tmp_path / 'b.md').write_text('nothing here\n', encoding='utf-8')
+    (tmp_path / 'c.bin').write_text('load_config', encoding='utf-8')
+    index = _index(tmp_path)
+    try:
+        assert index.candidates('load_config') == {'a.py'}
+        assert index.candidates('absent_term') == set()
+        assert index.candidates('lo') is None
+    finally:
+        index.close()
+
+
+def test_refresh_reindexes_changed_and_drops_deleted_files(tmp_path):
+    target = tmp_path / 'mod.py'
+    target.write_text('alpha = 1\n', encoding='utf-8')
+    (tmp_path / 'gone.py').write_text('alpha = 2\n', encoding='utf-8')
+    index = _index(tmp_path)
+    try:
+        target.write_text('beta_value = 1\n', encoding='utf-8')
+        os.utime(target, ns=(1, 1))
+        (tmp_path / 'gone.py').unlink()
+        assert index.refresh(list(si.iter_search_files(tmp_path))) == 1
+        assert index.candidates('alpha') == set()
+        assert index.candidates('beta_value') == {'mod.py'}
+    finally:
+        index.close()
+
+
+def test_regex_literal_runs_use_only_mandatory_top_level_sequence():
+    assert si.literal_runs(r'def _load_\w+_config', regex=True) == ['def _load_', '_config']
+    assert si.literal_runs('foo|bar', regex=True) == []
+    assert si.index_terms(r'ab\d+', regex=True) == []
+
+
+def test_invalid_regex_raises_from_the_engine(tmp_path):
+    import re
+    from doxoade.commands.search_systems.search_engine import _search_code_logic
+    with pytest.raises(re.error):
+        _search_code_logic(tmp_path, 'a(b', 10, regex=True)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='search_utils usa f-strings da PEP 701')
+def test_invalid_regex_reports_and_exits_non_zero(tmp_path, monkeypatch):
+    from click.testing import CliRunner
+    from doxoade.commands.search import search
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(search, ['a(b', '--code', '--regex'])
+    assert result.exit_code == 1
+    assert 'Expressão regular inválida' in result.output
@@ -0,0 +1,95 @@
+import sqlite3
+
+import pytest
+
+import doxoade.core_database as core_database
+from doxoade.tools.telemetry_tools import segment_log as sl
+
+
+def _row(ts, action='A'):
+    return {'timestamp': ts, 'subsystem': 'HORUS', 'action': action, 'data': '{}', 'pid': 1}
+
+
+def test_truncated_tail_is_dropped(tmp_path):
+    writer = sl.SegmentWriter(tmp_path)
+    writer.append_row('operational_logs', _row('2026-01-01T00:00:00'))
+    writer.append_row('operational_logs', _row('2026-01-01T00:00:01'))
+    writer.seal()
+    seg = next(tmp_path.glob('*.seg'))
+    seg.write_bytes(seg.read_bytes()[:-3])
+    assert len(list(sl.iter_records(seg))) == 1
+
+
+def test_unknown_tables_and_columns_are_filtered(tmp_path):
+    writer = sl.SegmentWriter(tmp_path)
+    writer.append_row('sqlite_master', {'name': 'x'})
+    writer.append_row('events', {'command': 'check', 'status': 'ok', 'bogus) --': 1})
+    writer.seal()
+    records = list(sl.iter_records(next(tmp_path.glob('*.seg'))))
+    assert records == [('events', {'command': 'check', 'status': 'ok'})]
+
+
+def test_compaction_ingests_and_applies_retention(tmp_path, monkeypatch):
+    db = tmp_path / 'db.sqlite'
+    conn = sqlite3.connect(db)
+    conn.execute('CREATE TABLE operational_logs (id INTEGER PRIMARY KEY, timestamp TEXT, subsystem TEXT, action TEXT, data TEXT, pid INTEGER)')
+    conn.execute("INSERT INTO operational_logs (timestamp, subsystem, action, data, pid) VALUES ('2000-01-01T00:00:00', 'OLD', 'X', '{}', 1)")
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(core_database, 'get_db_connection', lambda: sqlite3.connect(db))
+
+    seg_dir = tmp_path / 'segments'
+    writer = sl.SegmentWriter(seg_dir)
+    for i in range(3):
+        writer.append_row('operational_logs', _row(f'2999-01-01T00:00:0{i}'))
+    writer.seal()
+
+    report = sl.compact_segments(retention_days=7, directory=seg_dir)
+    assert report == {'segments': 1, 'rows': 3, 'purged': 1}
+    assert not list(seg_dir.iterdir())
+    conn = sqlite3.connect(db)
+    assert conn.execute('SELECT COUNT(*) FROM operational_logs').fetchone()[0] == 3
+    conn.close()
+
+
+def test_compacted_command_history_feeds_command_rollup(tmp_path, monkeypatch):
+    db = tmp_path / 'db.sqlite'
+    conn = sqlite3.connect(db)
+    cur = conn.cursor()
+    core_database._m_v1_v3_core(cur)
+    core_database._m_v15_chronos(cur)
+    core_database._m_v19_payloads(cur)
+    core_database._m_v21_operational_logs(cur)
+    core_database._m_v135_analytics_rollups(cur)
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(core_database, 'get_db_connection', lambda: sqlite3.connect(db))
+
+    seg_dir = tmp_path / 'segments'
+    writer = sl.SegmentWriter(seg_dir)
+    for code in (0, 1):
+        writer.append_row('command_history', {'session_uuid': 'u', 'timestamp': '2026-01-02T00:00:00', 'command_name': 'check',
+                                              'full_command_line': 'doxoade check .', 'working_dir': '/p', 'exit_code': code, 'duration_ms': 5.0,
+                                              'cpu_percent': 50.0, 'peak_memory_mb': 12.5, 'line_profile_data': '[]'})
+    writer.seal()
+
+    sl.compact_segments(directory=seg_dir)
+    conn = sqlite3.connect(db)
+    assert conn.execute('SELECT runs, failures, total_ms, total_ram_mb FROM command_rollup_daily').fetchone() == (2, 1, 10.0, 25.0)
+    assert conn.execute('SELECT cpu_percent, line_profile_data FROM command_history LIMIT 1').fetchone() == (50.0, '[]')
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'telemetry_rollup_daily'").fetchone() is None
+    conn.close()
+
+
+def test_failed_compaction_returns_claimed_segments(tmp_path, monkeypatch):
+    def _boom():
+        raise sqlite3.OperationalError('database is locked')
+    monkeypatch.setattr(core_database, 'get_db_connection', _boom)
+
+    writer = sl.SegmentWriter(tmp_path)
+    writer.append_row('operational_logs', _row('2026-01-01T00:00:00'))
+    writer.seal()
+
+    with pytest.raises(sqlite3.OperationalError):
+        sl.compact_segments(directory=tmp_path)
+    assert [p.suffix for p in tmp_path.iterdir()] == ['.seg']
@@ -0,0 +1,47 @@
+import os
+
+from doxoade.probes import orphan_probe, xref_probe
+from doxoade.probes.symbol_table import SymbolTable
+
+
+def _write(path, text, bump=0):
+    path.write_text(text)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump))
+
+
+def _project(tmp_path):
+    (tmp_path / 'pyproject.toml').write_text('')
+    _write(tmp_path / 'a.py', 'def f(a, b):\n    return a\n')
+    _write(tmp_path / 'b.py', 'from a import f, g\nf(1)\n')
+    _write(tmp_path / 'c.py', '__all__ = ["h"]\ndef h():\n    return len([])\ndef _dead():\n    pass\n')
+    return [str(tmp_path / n) for n in ('a.py', 'b.py', 'c.py')]
+
+
+def test_xref_recomputes_only_dependents_of_changed_files(tmp_path, monkeypatch):
+    files = _project(tmp_path)
+    findings = xref_probe.analyze_integrity(str(tmp_path), files)
+    assert [f['category'] for f in findings] == ['BROKEN-LINK', 'SIGNATURE-MISMATCH']
+
+    checked = []
+    real_check = xref_probe.check_file
+    monkeypatch.setattr(xref_probe, 'check_file', lambda cur, *a: checked.append(os.path.basename(cur)) or real_check(cur, *a))
+    table = SymbolTable(str(tmp_path))
+    assert xref_probe.analyze_integrity(str(tmp_path), files, table=table) == findings
+    assert checked == [] and table.parsed == 0
+
+    _write(tmp_path / 'a.py', 'def f(a, b=0):\n    return a\ng = 1\n', bump=10**9)
+    table = SymbolTable(str(tmp_path))
+    assert xref_probe.analyze_integrity(str(tmp_path), files, table=table) == []
+    assert table.parsed == 1 and sorted(checked) == ['a.py', 'b.py']
+
+
+def test_orphans_share_the_table_and_follow_global_usage(tmp_path):
+    files = _project(tmp_path)
+    xref_probe.analyze_integrity(str(tmp_path), files)
+    table = SymbolTable(str(tmp_path))
+    orphans = orphan_probe.analyze_orphans(files, table=table)
+    assert table.parsed == 0  # tabela já preenchida pelo xref
+    assert [(o['category'], o['line']) for o in orphans] == [('UNUSED-PRIVATE', 4)]
+    _write(tmp_path / 'b.py', 'from a import f, g\nf(1)\n_dead()\n', bump=10**9)
+    assert orphan_probe.analyze_orphans(files, root=str(tmp_path)) == []
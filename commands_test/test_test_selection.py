@@ -0,0 +1,37 @@
+from doxoade.commands.test_systems import selection_engine as sel
+
+
+def test_reverse_closure_follows_importers_transitively():
+    index = {
+        'pkg.core': {'imports': [], 'from_imports': []},
+        'pkg.service': {'imports': ['pkg.core'], 'from_imports': []},
+        'pkg.cli': {'imports': ['pkg'], 'from_imports': ['pkg.service']},
+        'other.tool': {'imports': ['json'], 'from_imports': []},
+    }
+    reverse = sel.build_reverse_graph(index)
+    affected = sel.reverse_closure({'pkg.core'}, reverse)
+    assert affected == {'pkg.core', 'pkg.service', 'pkg.cli'}
+
+
+def test_package_init_change_reaches_submodule_importers():
+    index = {'app.main': {'imports': ['lib.util'], 'from_imports': []}}
+    affected = sel.reverse_closure({'lib'}, sel.build_reverse_graph(index))
+    assert 'app.main' in affected
+
+
+def test_conventional_source_matches_test_mapper_naming():
+    assert sel._conventional_source('tests/test_parser.py') == 'parser.py'
+    assert sel._conventional_source('tests/parser_test.py') == 'parser.py'
+
+
+def test_parse_junit_outcomes_groups_by_file(tmp_path):
+    junit = tmp_path / 'junit.xml'
+    junit.write_text(
+        '<testsuite>'
+        '<testcase file="tests/test_a.py" name="t1" time="0.5"/>'
+        '<testcase file="tests/test_a.py" name="t2" time="0.25"><failure/></testcase>'
+        '<testcase file="tests/test_b.py" name="t3" time="1.0"/>'
+        '</testsuite>', encoding='utf-8')
+    outcomes = sel.parse_junit_outcomes(str(junit), str(tmp_path))
+    assert outcomes['tests/test_a.py'] == {'tests': 2, 'failures': 1, 'duration_ms': 750.0}
+    assert outcomes['tests/test_b.py']['failures'] == 0
@@ -0,0 +1,92 @@
+import importlib.util
+
+import pytest
+
+from doxoade.probes.trace_backend import HAS_MONITORING, CodeFilter, NexusTracer, TraceRing, VarWatch
+
+_SAMPLE = '''def sample(n):
+    total = 0
+    for i in range(n):
+        total += i
+    return total
+'''
+
+
+def _load_sample(tmp_path):
+    path = tmp_path / 'sample_mod.py'
+    path.write_text(_SAMPLE, encoding='utf-8')
+    spec = importlib.util.spec_from_file_location('sample_mod', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.sample
+
+
+def _trace(tmp_path, backend):
+    sample = _load_sample(tmp_path)
+    tracer = NexusTracer(tmp_path, backend=backend)
+    tracer.start()
+    try:
+        sample(3)
+    finally:
+        tracer.stop()
+    return tracer, [(code.co_name, lineno) for code, lineno in tracer.ring.recent(100)]
+
+
+def test_ring_wraps_keeping_newest_events_in_order_and_folds_all_stats():
+    ring = TraceRing(capacity_pow2=2)
+    cid = ring.code_id(_trace.__code__)
+    for lineno in range(1, 7):
+        ring.push(cid, lineno, lineno * 10)
+    assert [line for _, line in ring.recent(100)] == [3, 4, 5, 6]
+    assert [line for _, line in ring.recent(2)] == [5, 6]
+    assert list(ring.lines) == [5, 6, 3, 4]  # slots 0 e 1 sobrescritos na segunda volta
+    ring.close()
+    assert sum(hits for hits, _ in ring.stats.values()) == 6
+    assert ring.stats[(cid, 1)] == [1, 10]
+
+
+def test_code_filter_includes_project_and_excludes_foreign_code(tmp_path):
+    flt = CodeFilter(tmp_path)
+    inside = compile('inside = 1', str(tmp_path / 'pkg' / 'mod.py'), 'exec')
+    vendored = compile('vendored = 1', str(tmp_path / 'venv' / 'site-packages' / 'lib.py'), 'exec')
+    outside = compile('outside = 1', str(tmp_path.parent / 'elsewhere.py'), 'exec')
+    own = compile('own = 1', str(tmp_path / 'trace_backend.py'), 'exec')
+    dynamic = compile('dynamic = 1', '<string>', 'exec')
+    assert flt.accepts(inside)
+    assert not any(flt.accepts(c) for c in (vendored, outside, own, dynamic))
+    assert CodeFilter(tmp_path, internal_mode=True).accepts(own)
+
+
+def test_settrace_backend_records_the_function_lines(tmp_path):
+    tracer, events = _trace(tmp_path, 'settrace')
+    assert tracer.backend_name == 'settrace'
+    assert events == [('sample', 2), ('sample', 3), ('sample', 4), ('sample', 3), ('sample', 4),
+                      ('sample', 3), ('sample', 4), ('sample', 3), ('sample', 5)]
+
+
+@pytest.mark.skipif(not HAS_MONITORING, reason='sys.monitoring requer Python 3.12+')
+def test_monitoring_backend_matches_settrace_sequence(tmp_path):
+    _, expected = _trace(tmp_path, 'settrace')
+    tracer, events = _trace(tmp_path, 'monitoring')
+    assert tracer.backend_name == 'monitoring'
+    assert events == expected
+
+
+def test_var_watch_reports_only_changed_names():
+    watch = VarWatch(4)
+    a, b = object(), [1]
+    watch(0, {'a': a, 'b': b, '__name__': 'm'})
+    watch(1, {'a': a, 'b': b})
+    watch(2, {'a': a, 'b': [2]})
+    assert [k for k, _ in watch.diffs_at(0)] == ['a', 'b']
+    assert watch.diffs_at(1) is None
+    assert watch.diffs_at(2) == [('b', '[2]')]
+
+
+def test_var_watch_is_bounded_by_ring_slots():
+    watch = VarWatch(4)
+    for pos in range(10):
+        watch(pos, {'x': pos * 1000})
+    assert len(watch.slots) == 4
+    assert watch.diffs_at(1) is None  # slot reciclado pelo evento 9
+    assert watch.diffs_at(9) == [('x', '9000')]
@@ -0,0 +1,75 @@
+import os
+
+from doxoade.commands.venvkeeper_systems import store
+
+
+def _isolate(monkeypatch, tmp_path):
+    base = tmp_path / 'store'
+    monkeypatch.setattr(store, 'STORE', base)
+    monkeypatch.setattr(store, 'OBJECTS', base / 'objects')
+    monkeypatch.setattr(store, 'LEDGER', base / 'ledger.json')
+    monkeypatch.setattr(store, 'SIZE_LEDGER', base / 'size_ledger.json')
+
+
+def _site_packages(root, payload):
+    sp = root / 'site-packages'
+    (sp / 'numpy').mkdir(parents=True)
+    (sp / 'numpy' / 'core.so').write_bytes(payload)
+    (sp / 'numpy' / 'small.py').write_bytes(b'x = 1\n')
+    return sp
+
+
+def test_dedup_links_identical_files_and_expand_restores_copies(tmp_path, monkeypatch):
+    _isolate(monkeypatch, tmp_path)
+    payload = os.urandom(8192)
+    a = _site_packages(tmp_path / 'a', payload)
+    b = _site_packages(tmp_path / 'b', payload)
+    assert store.dedup_tree(a)['stored'] == 1
+    stats = store.dedup_tree(b)
+    assert stats['linked'] == 1 and stats['saved'] == 8192
+    assert os.path.samefile(a / 'numpy' / 'core.so', b / 'numpy' / 'core.so')
+    assert store.dir_size(tmp_path / 'a', seen=set()) + store.dir_size(tmp_path / 'b', seen=set()) > 0
+    assert store.expand_tree(b)['restored'] == 1
+    assert not os.path.samefile(a / 'numpy' / 'core.so', b / 'numpy' / 'core.so')
+    assert (b / 'numpy' / 'core.so').read_bytes() == payload
+    store.expand_tree(a)
+    assert store.gc_store() == 1
+
+
+def test_dedup_dry_run_leaves_the_store_untouched(tmp_path, monkeypatch):
+    _isolate(monkeypatch, tmp_path)
+    a = _site_packages(tmp_path / 'a', os.urandom(8192))
+    assert store.dedup_tree(a, dry_run=True)['files'] == 1
+    assert not (tmp_path / 'store').exists()
+
+
+def test_site_packages_sizes_read_record_and_cache_it(tmp_path, monkeypatch):
+    _isolate(monkeypatch, tmp_path)
+    sp = _site_packages(tmp_path / 'v', b'\0' * 100)
+    info = sp / 'numpy-1.0.dist-info'
+    info.mkdir()
+    (info / 'RECORD').write_text('numpy/core.so,sha256=x,5000\nnumpy/small.py,,\nnumpy-1.0.dist-info/RECORD,,\n../../bin/f2py,sha256=y,10\n', encoding='utf-8')
+    (sp / 'six.py').write_bytes(b'1234')
+    sizes = store.site_packages_sizes(sp)
+    assert sizes == {'numpy': 5000 + 6 + len((info / 'RECORD').read_bytes()), 'six': 4}
+    (sp / 'numpy' / 'small.py').write_bytes(b'changed but RECORD unchanged')
+    assert store.site_packages_sizes(sp) == sizes
+
+
+def test_dedup_only_links_files_with_the_same_mode(tmp_path, monkeypatch):
+    import stat
+    _isolate(monkeypatch, tmp_path)
+    payload = os.urandom(4096)
+    a = _site_packages(tmp_path / 'a', payload)
+    b = _site_packages(tmp_path / 'b', payload)
+    c = _site_packages(tmp_path / 'c', payload)
+    os.chmod(a / 'numpy' / 'core.so', 0o644)
+    os.chmod(b / 'numpy' / 'core.so', 0o600)
+    os.chmod(c / 'numpy' / 'core.so', 0o644)
+    assert store.dedup_tree(a)['stored'] == 1
+    assert store.dedup_tree(b)['stored'] == 1  # mesmo conteúdo, modo diferente: objeto próprio
+    assert store.dedup_tree(c)['linked'] == 1
+    assert os.path.samefile(a / 'numpy' / 'core.so', c / 'numpy' / 'core.so')
+    assert not os.path.samefile(a / 'numpy' / 'core.so', b / 'numpy' / 'core.so')
+    assert stat.S_IMODE((b / 'numpy' / 'core.so').stat().st_mode) == 0o600
+    assert stat.S_IMODE((a / 'numpy' / 'core.so').stat().st_mode) == 0o644
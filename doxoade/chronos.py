@@ -13,8 +13,8 @@ import collections
 import atexit
 from datetime import datetime, timezone
 from doxoade.tools.doxcolors import Fore
-from doxoade.core_database import get_db_connection
-from doxoade.tools.alexandria.engine import alexandria_write
+# [DOX-UNUSED] from doxoade.core_database import get_db_connection
+# [DOX-UNUSED] from doxoade.tools.alexandria.engine import alexandria_write
 try:
     import psutil
     HAS_PSUTIL = True
@@ -208,7 +208,7 @@ class ChronosRecorder:
         self.end_command(exit_code=inferred_code, duration_ms=duration_ms)
 
     def end_command(self, exit_code, duration_ms):
-        from doxoade.tools.alexandria.engine import alexandria_write
+        from doxoade.tools.telemetry_tools.segment_log import append_row
         if self.profiler is None:
             return
         if self._ended:
@@ -235,28 +235,14 @@ class ChronosRecorder:
         if hasattr(self, 'vulcan_stats'):
             self.system_context['vulcan_stats'] = self.vulcan_stats
         try:
-            conn = get_db_connection()
-            # Validação de integridade do esquema
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='command_history'")
-            if not cursor.fetchone():
-                conn.close()
-                return
-#
-            alexandria_write('''
-                INSERT INTO command_history 
-                (session_uuid, timestamp, command_name, full_command_line, working_dir,
-                 exit_code, duration_ms, cpu_percent, peak_memory_mb,
-                 io_read_mb, io_write_mb, line_profile_data, system_info)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                self.session_uuid, self.start_timestamp, self.cmd_name, self.full_cmd, self.work_dir,
-                exit_code, duration_ms, resources['cpu'], resources['ram'],
-                resources['read'], resources['write'], 
-                json.dumps(line_profile_data), json.dumps(self.system_context)
-            ))
-            conn.commit()
-            conn.close()
+            # Mesmo caminho de ingestão da telemetria (Hades Ledger); compactado depois no SQLite.
+            append_row('command_history', {
+                'session_uuid': self.session_uuid, 'timestamp': self.start_timestamp,
+                'command_name': self.cmd_name, 'full_command_line': self.full_cmd, 'working_dir': self.work_dir,
+                'exit_code': exit_code, 'duration_ms': duration_ms, 'cpu_percent': resources['cpu'],
+                'peak_memory_mb': resources['ram'], 'io_read_mb': resources['read'], 'io_write_mb': resources['write'],
+                'line_profile_data': json.dumps(line_profile_data), 'system_info': json.dumps(self.system_context),
+            })
         except Exception as e:
             from traceback import print_tb as exc_trace
             import sys as dox_exc_sys
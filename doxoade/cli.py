@@ -420,8 +420,6 @@ def cli(ctx, guard, refresh_help, pure):
     init_colors(autoreset=True)
     ctx.ensure_object(dict)
 
-    from doxoade.tools.db_utils import start_persistence_worker
-    start_persistence_worker()
     from doxoade.core_database import init_db
     try:
         init_db()
@@ -4,7 +4,6 @@ Canonization Module - Gold Standard Snapshot.
 Compliance: MPoT-5, PASC-6.
 """
 import os
-import sys
 import datetime
 from click import command, option, echo
 from doxoade.tools.doxcolors import Style, Fore
@@ -29,17 +28,21 @@ def canonize(all_project: bool, run_tests: bool):
         echo(f"{Fore.CYAN}{Style.BRIGHT}--- [CANONIZE] Gerando Snapshot 'Gold' ---")
         echo(f'{Fore.WHITE}  > Fase 1: Análise Estática (Check)...')
         from .check import run_check_logic
+        from .check_systems.check_io import CheckIO
+        from .regression_systems.canon_index import build_file_index, build_test_index, run_pytest
         static_results = run_check_logic('.', fix=False, fast=True, no_cache=True, clones=False, continue_on_error=True)
+        file_index = build_file_index('.', CheckIO('.').resolve_files(), static_results.get('findings', []))
         echo(f'{Fore.WHITE}  > Fase 2: Mapeamento de Testes...')
         from .test_mapper import TestMapper
         test_matrix = TestMapper('.').scan()
         test_results = {'status': 'SKIPPED', 'exit_code': 0}
+        test_index = {}
         if run_tests:
             echo(f'{Fore.WHITE}  > Fase 3: Execução de Testes (Pytest)...')
-            from subprocess import run as sub_run
-            pt_res = sub_run([sys.executable, '-m', 'pytest', '-q', '--tb=no'], capture_output=True, text=True, shell=False)
-            test_results = {'exit_code': pt_res.returncode, 'status': 'PASS' if pt_res.returncode == 0 else 'FAIL', 'summary': pt_res.stdout.splitlines()[-1] if pt_res.stdout else 'No output'}
-        snapshot_data = {'timestamp': datetime.datetime.now().isoformat(), 'git_hash': git_hash, 'static_analysis': static_results, 'test_structure': test_matrix, 'test_execution': test_results}
+            pt_res = run_pytest('.', tb='no')
+            test_results = {'exit_code': pt_res['exit_code'], 'status': 'PASS' if pt_res['exit_code'] == 0 else 'FAIL', 'summary': pt_res['output'].splitlines()[-1] if pt_res['output'] else 'No output'}
+            test_index = build_test_index('.', pt_res['outcomes'])
+        snapshot_data = {'timestamp': datetime.datetime.now().isoformat(), 'git_hash': git_hash, 'static_analysis': static_results, 'test_structure': test_matrix, 'test_execution': test_results, 'file_index': file_index, 'test_index': test_index}
         with open(os.path.join(CANON_DIR, 'project_snapshot.json'), 'w', encoding='utf-8') as f:
             from json import dump
             dump(snapshot_data, f, indent=2, ensure_ascii=False)
@@ -20,12 +20,14 @@ __all__ = ['check', 'run_check_logic']
 @click.option('--no-cache', '-no', is_flag=True, help='Ignora o cache de arquivos.')
 @click.option('--npp', is_flag=True, help='Integração com Notepad++.')
 @click.option('--npp-clear', '-nppc', is_flag=True, help='Limpa marcações no editor.')
+@click.option('--recursion', '-r', is_flag=True, help='Ciclos de recursão entre módulos (grafo de chamadas do projeto).')
 @click.option('--only', '-o', type=str, help='Filtra apenas uma categoria.')
 @click.option('--security', '-s', is_flag=True, help='Ativa auditoria Aegis (Bandit/Safety).')
 @click.option('--structural-risk', '-sr', default=False, show_default=True, help='Classifica risco estrutural Python (dinamismo/import hooks).')
 @click.option('--ai/--no-ai', default=False, show_default=True, help='Aciona ponte IA (ORN) quando houver achados bloqueantes.')
-@click.option('--format', 'out_fmt', type=click.Choice(['text', 'json']), default='text')
+@click.option('--format', 'out_fmt', type=click.Choice(['text', 'json', 'sarif']), default='text')
 @click.option('--archaeology', '--arc', is_flag=True, help='Investiga a origem histórica de cada achado (Git Blame).')
+@click.option('--rule-timings', '-rt', is_flag=True, help='Exibe o tempo gasto por regra AST (motor fundido).')
 @click.pass_context
 def check(ctx, path: str, **kwargs):
     """🔍 Auditoria de Qualidade Modular v85.2 (Full Power)."""
@@ -59,6 +61,8 @@ def check(ctx, path: str, **kwargs):
         for f in state.findings:
             logger.add_finding(f['severity'], f['message'], f.get('category'), f.get('file'), f.get('line'))
         _render_output(state, kwargs)
+        if kwargs.get('rule_timings') and kwargs.get('out_fmt') == 'text':
+            _render_rule_timings(state)
         if kwargs.get('ai') and _has_blocking_findings(state):
             from ..API.orn_bridge import dispatch_check_errors_to_orn
             attempts = dispatch_check_errors_to_orn(path=state.target_path, summary=state.summary, findings=state.findings)
@@ -77,8 +81,11 @@ def _render_output(state: CheckState, kwargs: dict):
     from .check_systems.check_utils import render_archived_view, _render_issue_summary
     from doxoade.tools.display import _present_results
     if kwargs.get('out_fmt') == 'json':
+        click.echo(state.findings.to_json(state.summary, indent=2))
+        return
+    if kwargs.get('out_fmt') == 'sarif':
         import json
-        click.echo(json.dumps({'summary': state.summary, 'findings': state.findings}, indent=2))
+        click.echo(json.dumps(state.findings.to_sarif(root=state.root), indent=2))
         return
     if kwargs.get('archives'):
         render_archived_view(state)
@@ -87,6 +94,15 @@ def _render_output(state: CheckState, kwargs: dict):
         _present_results('text', legacy_data)
     _render_issue_summary(state.findings, **kwargs)
 
+def _render_rule_timings(state: CheckState):
+    """Tabela de custo por regra do motor AST (etapas do motor entre colchetes)."""
+    if not state.rule_timings:
+        click.echo(Fore.YELLOW + '\n[RULES] Nenhuma regra executada (arquivos vieram do cache).')
+        return
+    click.echo(Fore.CYAN + '\n[RULES] Tempo por regra AST:')
+    for name, ms in sorted(state.rule_timings.items(), key=lambda r: -r[1]):
+        click.echo(f'  {ms:>9.2f} ms  {name}')
+
 def _apply_modular_fixes(state, fix_specify):
     """Aplica os reparos e sincroniza o estado da auditoria."""
     from .check_systems.check_fixer import apply_fixes_to_state
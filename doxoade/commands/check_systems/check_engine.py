@@ -13,7 +13,6 @@ from .check_state import CheckState
 # [DOX-UNUSED] from .check_utils import _calculate_incident_stats
 from doxoade.tools.analysis import _get_code_snippet
 from doxoade.tools.filesystem import _find_project_root
-from doxoade.tools.memory_pool import finding_arena
 from doxoade.tools.telemetry_tools.logger import chief_heartbeat
 # [DOX-UNUSED] from doxoade.tools.vulcan.indent_fixer import perform_indent_surgery
 
@@ -115,7 +114,6 @@ def _run_integrity_check(files, project_root):
 
 def run_audit_engine(state, io_manager, **kwargs):
     from doxoade.probes.manager import ProbeManager
-    finding_arena.flush() 
     
     # Tratamento dual de parâmetros de cache para garantir compatibilidade com Click
     no_cache_active = kwargs.get('no_cache') or (kwargs.get('cache') is False)
@@ -123,14 +121,15 @@ def run_audit_engine(state, io_manager, **kwargs):
     manager = ProbeManager(sys.executable, state.root)
     files = io_manager.resolve_files(kwargs.get('target_files'))
     cache = {} if no_cache_active else io_manager.load_cache()
+    state.clones_active = bool(kwargs.get('clones'))
+    _check_rule_engine(state, clones=state.clones_active)
     to_scan = _filter_by_cache(files, cache, io_manager, state, no_cache_active)
-    finding_arena.recycled_count = 0
     
     if to_scan:
         with progressbar(to_scan, label='Auditando') as bar:
             for fp, cache_key, mtime, size in bar:
-                finding_arena.flush() 
-                results = _scan_single_file(fp, manager, kwargs)
+                start = len(state.findings)
+                results = _scan_single_file(fp, manager, kwargs, state)
                 
                 for res in results:
                     if kwargs.get('archaeology') and res.get('line', 0) > 0:
@@ -162,49 +161,43 @@ def run_audit_engine(state, io_manager, **kwargs):
                                     norm_file, res['attrition']['hash'], attr_line
                                 )
                     
-                    # --- SINCRONIA COM A ARENA ---
-                    f_hash = hashlib.sha256(res['message'].encode('utf-8')).hexdigest()
-                    arena_res = finding_arena.rent(
-                        res['severity'], res['category'], res['message'], res['file'], res['line']
-                    )
-                    
-                    if 'archaeology' in res: arena_res['archaeology'] = res['archaeology']
-                    if 'ghost_references' in res: arena_res['ghost_references'] = res['ghost_references']
-                    if 'attrition' in res: arena_res['attrition'] = res['attrition']
-                    
-                    arena_res['finding_hash'] = f_hash
-                    arena_res['snippet'] = _get_code_snippet(res['file'], res.get('line', 0))
-                    state.register_finding(arena_res)
+                    # --- SINCRONIA COM O STORE COLUNAR ---
+                    res['finding_hash'] = hashlib.sha256(res['message'].encode('utf-8')).hexdigest()
+                    res['snippet'] = _get_code_snippet(res['file'], res.get('line', 0))
+                    state.register_finding(res)
 
                 if mtime > 0 and (not any((f.get('category') == 'SYSTEM' for f in results))):
-                    cache[cache_key] = {'mtime': mtime, 'size': size, 'findings': results}
+                    cache[cache_key] = _cache_entry(state, fp, mtime, size, start)
     
+    state.merge_rule_timings(state.rule_engine)
     if kwargs.get('clones'):
-        _run_clone_detection(files, manager, state) 
+        _run_clone_detection(files, state)
+    if kwargs.get('recursion'):
+        _run_recursion_analysis(files, state)
     if not no_cache_active:
         io_manager.save_cache(cache)
 
-def _scan_single_file(fp, manager, kwargs):
+def _scan_single_file(fp, manager, kwargs, state=None):
     from doxoade.tools.governor import governor
     if governor.pace(file_path=fp, force=kwargs.get('full_power')):
         return [{'severity': 'INFO', 'category': 'SYSTEM', 'message': 'ALB_REDUCED', 'file': fp, 'line': 0}]
     if fp.endswith(('.c', '.cpp', '.h', '.hpp')): 
-        return _run_c_cpp_checks(fp)
-    findings = _run_syntax_check(fp, manager, kwargs)
-    if findings is None: findings = []
+        return _run_c_cpp_checks(fp) + _run_fused_rules(fp, None, state)
+    # Um único parse por arquivo: sintaxe, regras fundidas e radon compartilham a árvore.
+    tree, findings = _run_syntax_check(fp)
     if any(f.get('severity') == 'CRITICAL' for f in findings):
         return findings
-    findings.extend(_run_static_probes(fp, manager))
+    findings.extend(_run_static_probes(fp, manager, tree, state))
     if not kwargs.get('fast'):
-        findings.extend(_run_style_check(fp))
+        findings.extend(_run_style_check(fp, tree))
     return findings
 
-def _run_syntax_check(fp, manager, kwargs):
+def _run_syntax_check(fp):
+    """(árvore, achados): árvore None quando o arquivo não compila."""
     try:
         with open(fp, 'r', encoding='utf-8', errors='ignore') as src:
             source = src.read()
-        ast.parse(source)
-        return []
+        return ast.parse(source), []
     except (SyntaxError, IndentationError) as e:
         msg = str(e).lower()
         if "indent" in msg or "unindent" in msg or "expected an indented" in msg:
@@ -214,7 +207,7 @@ def _run_syntax_check(fp, manager, kwargs):
             cat = 'SYNTAX'
             action = None
         
-        return [{
+        return None, [{
             'severity': 'CRITICAL',
             'category': cat,
             'message': f"Erro de Sintaxe: {str(e)}",
@@ -223,17 +216,38 @@ def _run_syntax_check(fp, manager, kwargs):
             'suggestion_action': action
         }]
 
-def _run_style_check(f):
+def _check_rule_engine(state=None, clones=False):
+    """
+    Regras do check numa travessia só (hunter, indicadores estruturais, lembretes QA
+    e, com --clones, hashes estruturais); uma instância por execução.
+    """
+    if state is not None and state.rule_engine is not None:
+        return state.rule_engine
+    from doxoade.probes.rule_engine import RuleEngine
+    from doxoade.probes.hunter_probe import hunter_rules
+    from .check_structural import StructuralRiskRule
+    from .check_filters import QaReminderRule
+    rules = hunter_rules() + [StructuralRiskRule(), QaReminderRule()]
+    if clones:
+        from doxoade.probes.clone_probe import StructuralHashRule
+        rules.append(StructuralHashRule())
+    engine = RuleEngine(rules)
+    if state is not None:
+        state.rule_engine = engine
+    return engine
+
+def _run_style_check(f, tree=None):
     from radon.visitors import ComplexityVisitor
     from doxoade.tools.streamer import ufs
     try:
-        lines = ufs.get_lines(f)
-        v = ComplexityVisitor.from_ast(ast.parse(''.join(lines)))
+        if tree is None:
+            tree = ast.parse(''.join(ufs.get_lines(f)))
+        v = ComplexityVisitor.from_ast(tree)
         return [{'severity': 'WARNING', 'category': 'COMPLEXITY', 'message': f"Função '{func.name}' complexa (CC: {func.complexity}).", 'file': f, 'line': func.lineno} for func in v.functions if func.complexity > 12]
     except Exception:
         return []
 
-def _run_static_probes(f, manager):
+def _run_static_probes(f, manager, tree=None, state=None):
     from ..check import _get_probe_path
     results = []
     res_pf = manager.execute(_get_probe_path('static_probe.py'), f)
@@ -242,10 +256,26 @@ def _run_static_probes(f, manager):
             m = re.match('^(.+):(\\d+):(?:\\d+):? (.+)$', line)
             if m:
                 results.append({'severity': 'WARNING', 'category': 'STYLE', 'message': m.group(3), 'file': f, 'line': int(m.group(2))})
-    res_ht = manager.execute(_get_probe_path('hunter_probe.py'), f)
+    results.extend(_run_fused_rules(f, tree, state))
+    return results
+
+def _run_fused_rules(f, tree=None, state=None):
+    """
+    Motor fundido em processo sobre a árvore já parseada (antes: um subprocesso +
+    parse por arquivo). Sem árvore (C/C++), só os eventos de comentário.
+    """
+    from doxoade.tools.streamer import ufs
+    results = []
     try:
-        data = json.loads(res_ht['stdout'])
-        for d in data if isinstance(data, list) else [data]:
+        lines = ufs.get_lines(f)
+        if tree is None and not f.endswith(('.c', '.cpp', '.h', '.hpp')):
+            tree = ast.parse(''.join(lines), filename=f)
+        ctx = _check_rule_engine(state).run(filename=f, tree=tree, lines=lines)
+        if state is not None:
+            state.rule_counts[f] = dict(ctx.counts)
+            if 'hashes' in ctx.data:
+                state.clone_hashes[f] = ctx.data['hashes']
+        for d in ctx.findings:
             d['file'] = f
             results.append(d)
     except Exception as e:
@@ -253,31 +283,56 @@ def _run_static_probes(f, manager):
         handle_error(e, context=f'Static Probes (Hunter) -> {os.path.basename(f)}', debug=True)
     return results
 
+def _cache_entry(state, fp, mtime, size, start):
+    """Entrada de cache do arquivo: achados (visão do store, sem cópia dos dicts), indicadores e hashes de clone."""
+    entry = {'mtime': mtime, 'size': size, 'findings': state.findings[start:], 'indicators': state.rule_counts.get(fp)}
+    if state.clones_active:
+        entry['hashes'] = state.clone_hashes.get(fp, [])
+    return entry
+
 def _filter_by_cache(files, cache, io_manager, state, force_no_cache):
+    # Com --clones, entradas gravadas sem hashes estruturais forçam nova varredura do arquivo.
+    need_hashes = state.clones_active
     to_scan = []
     for fp in files:
         mtime, size = io_manager.get_file_metadata(fp)
         cache_key = fp.replace('\\', '/')
         c_entry = cache.get(cache_key)
-        if not force_no_cache and c_entry and (c_entry.get('mtime') == mtime):
+        if not force_no_cache and c_entry and (c_entry.get('mtime') == mtime) and (not need_hashes or 'hashes' in c_entry):
             if not any((f.get('category') == 'SYSTEM' for f in c_entry.get('findings', []))):
                 for f in c_entry.get('findings', []):
                     state.register_finding(f)
+                if c_entry.get('indicators') is not None:
+                    state.rule_counts[fp] = c_entry['indicators']
+                if 'hashes' in c_entry:
+                    state.clone_hashes[fp] = c_entry['hashes']
                 continue
         to_scan.append((fp, cache_key, mtime, size))
     return to_scan
 
-def _run_clone_detection(files, manager, state):
-    from ..check import _get_probe_path
-    res = manager.execute(_get_probe_path('clone_probe.py'), payload={'files': files})
-    if res['success'] and res['stdout']:
-        try:
-            clones = json.loads(res['stdout'])
-            for c in clones:
-                state.register_finding(c)
-        except Exception as e:
-            from doxoade.tools.error_info import handle_error
-            handle_error(e, context='Clone Detection JSON Parse', debug=True)
+def _run_clone_detection(files, state):
+    """Clones a partir dos hashes estruturais coletados na travessia fundida (ou no cache)."""
+    from doxoade.probes.clone_probe import find_clones_in_hashes
+    hashes = {}
+    for fp in files:
+        for occ in state.clone_hashes.get(fp, ()):
+            hashes.setdefault(occ['hash'], []).append(occ)
+    try:
+        for c in find_clones_in_hashes(hashes):
+            state.register_finding(c)
+    except Exception as e:
+        from doxoade.tools.error_info import handle_error
+        handle_error(e, context='Clone Detection', debug=True)
+
+def _run_recursion_analysis(files, state):
+    """Componentes recursivos do grafo de chamadas (tabela de símbolos compartilhada com xref/orphan)."""
+    from doxoade.tools.recursion_guard import RecursionGuard
+    try:
+        for finding in RecursionGuard().analyze_project(files, state.root):
+            state.register_finding(finding)
+    except Exception as e:
+        from doxoade.tools.error_info import handle_error
+        handle_error(e, context='Recursion Guard (projeto)', debug=True)
 
 def run_check_logic(path: str, state=None, *_args, **kwargs):
     from .check_io import CheckIO
@@ -317,7 +372,7 @@ def run_check_logic(path: str, state=None, *_args, **kwargs):
     _enrich_with_dependency_analysis(state.findings, path)
     apply_filters(state, **params)
     analyze_refactor_opportunities(state)
-    return {'summary': state.summary, 'findings': state.findings, 'alb_files': state.alb_files}
+    return {'summary': state.summary, 'findings': state.findings.to_dicts(), 'alb_files': state.alb_files}
 
 def _run_c_cpp_checks(fp):
     import subprocess
@@ -1,13 +1,15 @@
 # doxoade/doxoade/commands/check_systems/check_filters.py
 """
 Crivo de Qualidade e Injeção de Dívida Técnica (PASC 8.5 / MPoT-3).
-Responsável por filtrar silenciadores (# noqa) e injetar lembretes.
+Responsável por filtrar silenciadores (# noqa) e pela regra de lembretes QA
+(executada na travessia fundida do check_engine).
 """
-from typing import List, Dict, Any, Set
+from typing import Dict, Any, Set
 from doxoade.tools.streamer import ufs
-from doxoade.tools.analysis import _get_code_snippet
+# [DOX-UNUSED] from doxoade.tools.analysis import _get_code_snippet
 # [DOX-UNUSED] from .check_utils import _calculate_incident_stats
 from .check_state import CheckState
+from doxoade.probes.rule_engine import Rule
 SILENCERS: Set[str] = {'noqa', 'ignore', 'skipline', 'suppress', 'disable'}
 FACADE_FILES: Set[str] = {'shared_tools.py', '__init__.py', 'cli.py'}
 QA_TAGS: Dict[str, str] = {'TODO': 'INFO', 'FIXME': 'WARNING', 'BUG': 'ERROR', 'HACK': 'WARNING', 'ADTI': 'CRITICAL'}
@@ -82,25 +84,18 @@ def _is_facade_noise(finding: Dict[str, Any], filename: str) -> bool:
     cat = finding.get('category', '').upper()
     return 'unused' in msg or 'redefinition' in msg or cat == 'DEADCODE'
 
-def _inject_qa_reminders(state: 'CheckState', lines: List[str], file_path: str):
-    """Extrai TODOs/ADTIs e os registra como achados de QA (Suporta # e //)."""
-    is_c = file_path.endswith(('.c', '.cpp', '.h', '.hpp'))
-    for i, line in enumerate(lines):
-        comment_part = ''
-        if is_c and '//' in line:
-            comment_part = line.split('//', 1)[1].strip()
-        elif '#' in line:
-            comment_part = line.split('#', 1)[1].strip()
-        else:
-            continue
-        tokens = comment_part.split()
+class QaReminderRule(Rule):
+    """TODO/FIXME/BUG/HACK/ADTI em comentários (# ou //) viram achados QA-REMINDER."""
+    name = 'qa.reminders'
+    comments = True
+
+    def comment(self, line, text, ctx):
+        tokens = text.split()
         if not tokens:
-            continue
+            return
         tag = tokens[0].upper().rstrip(':')
-        if tag in QA_TAGS:
-            if 'ignore-todo' in comment_part.lower():
-                continue
-            state.register_finding({'severity': QA_TAGS[tag], 'category': 'QA-REMINDER', 'message': f"[{tag}] {comment_part[len(tag):].strip().lstrip(':').strip()}", 'file': file_path, 'line': i + 1, 'snippet': _get_code_snippet(file_path, i + 1)})
+        if tag in QA_TAGS and 'ignore-todo' not in text.lower():
+            ctx.report(line, QA_TAGS[tag], 'QA-REMINDER', f"[{tag}] {text[len(tag):].strip().lstrip(':').strip()}")
 
 def filter_and_inject_findings(findings: list, project_root: str) -> list:
     """Bridge de Compatibilidade: Conecta o motor legado à nova lógica (v84.2)."""
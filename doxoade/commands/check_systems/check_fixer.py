@@ -1,5 +1,6 @@
 # doxoade/doxoade/commands/check_systems/check_fixer.py
 import os
+import time
 from click import echo
 from doxoade.tools.doxcolors import Fore
 from doxoade.tools.telemetry_tools.logger import ExecutionLogger
@@ -25,11 +26,11 @@ def apply_fixes_to_state(state, fix_specify=None):
     fixed_count = 0
     findings_resolved = []
 
+    started = time.perf_counter()
     with ExecutionLogger('autofix', state.root, {'fix_specify': fix_specify}) as f_log:
         fixer = AutoFixer(f_log)
         for file_path, file_findings in files_map.items():
-            file_findings.sort(key=lambda x: x.get('line', 0), reverse=True)
-            
+            batch = []
             for f in file_findings:
                 # Captura o nome da variável da mensagem de erro
                 var_name = f.get('message', '').split("'")[1] if "'" in f.get('message', '') else None
@@ -38,12 +39,20 @@ def apply_fixes_to_state(state, fix_specify=None):
                 context = {'var_name': var_name}
                 if f.get('suggestion_meta'):
                     context.update(f['suggestion_meta'])
-                
-                # Agora passamos o 'context' completo
-                if fixer.apply_fix(f['file'], f['line'], f.get('suggestion_action'), context):
-                    echo(f"{Fore.GREEN}   [ FIX-OK ] {Fore.WHITE}{os.path.basename(f['file'])}:{f['line']}")
-                    fixed_count += 1
-                    findings_resolved.append(f)
+                batch.append((f['line'], f.get('suggestion_action'), context))
+
+            # Um único passe por arquivo: leitura, reparos em memória, gravação atômica
+            report = fixer.apply_batch(file_path, batch)
+            if report['rolled_back']:
+                echo(f"{Fore.RED}   [ ROLLBACK ] {Fore.WHITE}{os.path.basename(file_path)}: lote descartado ({len(batch)} correções quebrariam a sintaxe)")
+                continue
+            if report['applied']:
+                echo(f"{Fore.GREEN}   [ FIX-OK ] {Fore.WHITE}{os.path.basename(file_path)}: {len(report['applied'])}/{len(batch)} correções")
+                fixed_count += len(report['applied'])
+                findings_resolved.extend(file_findings[i] for i in report['applied'])
+
+    elapsed = time.perf_counter() - started
+    echo(f"{Fore.CYAN}   [ FIX ] {fixed_count} correções em {len(files_map)} arquivo(s) ({elapsed:.2f}s)")
 
     # --- SINCRONIA DE ESTADO ---
     # Remove da lista de pendências o que já foi resolvido
@@ -42,10 +42,11 @@ class CheckIO:
             return {}
 
     def save_cache(self, data: dict):
-        """Persiste os resultados para o próximo check."""
+        """Persiste os resultados para o próximo check (visões do FindingStore serializam direto das colunas)."""
+        from doxoade.tools.memory_pool import json_default
         self.cache_dir.mkdir(exist_ok=True)
         with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f)
+            json.dump(data, f, default=json_default)
 
     def get_file_metadata(self, fp: str) -> tuple:
         try:
@@ -7,30 +7,31 @@ Compliance: OSL-5, PASC-8.1.
 import sys
 # [DOX-UNUSED] from .check_engine import _run_clone_detection
 from click import progressbar
-from doxoade.tools.memory_pool import finding_arena
 
 def run_audit_engine_logic(state, io_manager, **kwargs):
     """Execução central sem dependências de CLI."""
     from ...probes.manager import ProbeManager
-    from .check_engine import _filter_by_cache, _scan_single_file, _run_clone_detection
+    from .check_engine import _filter_by_cache, _scan_single_file, _run_clone_detection, _check_rule_engine, _cache_entry
     from doxoade.tools.analysis import _get_code_snippet
     manager = ProbeManager(sys.executable, state.root)
     files = io_manager.resolve_files(kwargs.get('target_files'))
     cache = {} if kwargs.get('no_cache') else io_manager.load_cache()
+    state.clones_active = bool(kwargs.get('clones'))
+    _check_rule_engine(state, clones=state.clones_active)
     to_scan = _filter_by_cache(files, cache, io_manager, state, kwargs.get('no_cache'))
     if to_scan:
         with progressbar(to_scan, label='Auditando') as bar:
             for fp, cache_key, mtime, size in bar:
-                results = _scan_single_file(fp, manager, kwargs)
+                start = len(state.findings)
+                results = _scan_single_file(fp, manager, kwargs, state)
                 for res in results:
-                    snip = _get_code_snippet(res['file'], res.get('line', 0))
-                    arena_res = finding_arena.rent(res['severity'], res['category'], res['message'], res['file'], res['line'])
-                    arena_res['snippet'] = snip
-                    state.register_finding(arena_res)
+                    res['snippet'] = _get_code_snippet(res['file'], res.get('line', 0))
+                    state.register_finding(res)
                 if mtime > 0 and (not any((f.get('category') == 'SYSTEM' for f in results))):
-                    cache[cache_key] = {'mtime': mtime, 'size': size, 'findings': results}
+                    cache[cache_key] = _cache_entry(state, fp, mtime, size, start)
+    state.merge_rule_timings(state.rule_engine)
     if kwargs.get('clones'):
-        _run_clone_detection(files, manager, state)
+        _run_clone_detection(files, state)
     if not kwargs.get('no_cache'):
         io_manager.save_cache(cache)
 
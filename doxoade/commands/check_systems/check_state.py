@@ -1,24 +1,40 @@
 # doxoade/doxoade/commands/check_systems/check_state.py
+from collections.abc import MutableSequence
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from doxoade.tools.memory_pool import FindingStore
 
 @dataclass
 class CheckState:
     root: str
     target_path: str
     target_files: List[str] = field(default_factory=list)
-    findings: List[Dict[str, Any]] = field(default_factory=list)
+    findings: FindingStore = field(default_factory=FindingStore)
     alb_files: List[str] = field(default_factory=list)
     summary: Dict[str, int] = field(default_factory=lambda: {'errors': 0, 'warnings': 0, 'critical': 0})
     is_full_power: bool = False
     clones_active: bool = False
+    # Motor de regras fundido (uma travessia por arquivo), contadores por arquivo e tempo por regra (ms).
+    rule_engine: Optional[Any] = None
+    rule_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    rule_timings: Dict[str, float] = field(default_factory=dict)
+    # Hashes estruturais por arquivo (StructuralHashRule, só com --clones).
+    clone_hashes: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    def merge_rule_timings(self, engine):
+        for name, ms in engine.timing_report():
+            self.rule_timings[name] = self.rule_timings.get(name, 0.0) + ms
+
+    def __setattr__(self, name, value):
+        # Consumidores legados atribuem listas (ex.: state.findings = []); tudo vira store colunar.
+        if name == 'findings' and not isinstance(value, FindingStore) and isinstance(value, (MutableSequence, list)):
+            value = FindingStore(value)
+        object.__setattr__(self, name, value)
 
     def register_finding(self, f: Dict[str, Any]):
-        # Solução de Colisão: Cria uma cópia do dicionário para evitar que o flush 
-        # da arena de memória sobrescreva os achados anteriores por referência de ponteiro
-        f_copy = dict(f)
-        self.findings.append(f_copy)
-        sev = f_copy.get('severity', 'WARNING').upper()
+        # O store copia o achado para as colunas (sem aliasing com o dict de origem).
+        self.findings.append(f)
+        sev = (f.get('severity') or 'WARNING').upper()
         if sev == 'CRITICAL':
             self.summary['critical'] += 1
         elif sev == 'ERROR':
@@ -28,12 +44,4 @@ class CheckState:
 
     def sync_summary(self):
         """Recalcula o sumário baseado nos achados ATUAIS (PASC 8.7)."""
-        self.summary = {'errors': 0, 'warnings': 0, 'critical': 0}
-        for f in self.findings:
-            sev = f.get('severity', 'WARNING').upper()
-            if sev == 'CRITICAL':
-                self.summary['critical'] += 1
-            elif sev == 'ERROR':
-                self.summary['errors'] += 1
-            else:
-                self.summary['warnings'] += 1
\ No newline at end of file
+        self.summary = self.findings.summary()
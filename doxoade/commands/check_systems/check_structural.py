@@ -4,6 +4,7 @@ from __future__ import annotations
 import ast
 from collections import defaultdict
 from pathlib import Path
+from doxoade.probes.rule_engine import Rule, RuleEngine
 _LEVELS = {0: ('SEGURO', 'INFO'), 1: ('MODERADO', 'WARNING'), 2: ('ALTO', 'WARNING'), 3: ('CRÍTICO', 'CRITICAL')}
 
 def analyze_structural_risk(state, io_manager, **kwargs):
@@ -11,14 +12,21 @@ def analyze_structural_risk(state, io_manager, **kwargs):
     files = [f for f in io_manager.resolve_files(kwargs.get('target_files')) if f.endswith('.py')]
     findings = defaultdict(int)
     per_file = defaultdict(lambda: defaultdict(int))
+    engine = None
     for fp in files:
-        p = Path(fp)
-        try:
-            text = p.read_text(encoding='utf-8')
-            tree = ast.parse(text)
-        except Exception:
-            continue
-        _scan_tree(tree, findings, per_file[str(p)])
+        counts = state.rule_counts.get(fp)
+        if counts is None:
+            # Arquivo fora da varredura fundida do check (ALB/sintaxe): travessia só com esta regra.
+            engine = engine or RuleEngine([StructuralRiskRule()])
+            try:
+                counts = engine.run(Path(fp).read_text(encoding='utf-8'), filename=fp).counts
+            except Exception:
+                continue
+        for key, n in counts.items():
+            findings[key] += n
+            per_file[str(Path(fp))][key] += n
+    if engine:
+        state.merge_rule_timings(engine)
     level = _classify_level(findings)
     level_name, severity = _LEVELS[level]
     indicators = _summarize_indicators(findings)
@@ -29,28 +37,34 @@ def analyze_structural_risk(state, io_manager, **kwargs):
         msg += 'Monitorar evolução e manter contratos explícitos de importação/tipagem.'
     state.register_finding({'severity': severity, 'category': 'STRUCTURAL-RISK', 'message': msg, 'file': state.target_path, 'line': 0, 'meta': {'risk_level': level, 'risk_label': level_name, 'indicators': dict(findings), 'files_analyzed': len(files)}})
 
-def _scan_tree(tree: ast.AST, findings: dict, bucket: dict):
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and (node.func.id in {'exec', 'eval'}):
-            findings['dynamic_exec'] += 1
-            bucket['dynamic_exec'] += 1
+class StructuralRiskRule(Rule):
+    """Indicadores de dinamismo (exec/eval, hooks de import, reflexão) contados em ctx.counts."""
+    name = 'structural.risk'
+    nodes = (ast.Call, ast.Assign)
+
+    def visit(self, node, ctx):
         if isinstance(node, ast.Assign):
             for t in node.targets:
                 if isinstance(t, ast.Subscript) and _attr_chain(t.value) == 'sys.modules':
-                    findings['sys_modules_mutation'] += 1
-                    bucket['sys_modules_mutation'] += 1
-        if isinstance(node, ast.Call) and _attr_chain(node.func) in {'sys.meta_path.insert', 'sys.meta_path.append'}:
-            findings['meta_path_mutation'] += 1
-            bucket['meta_path_mutation'] += 1
-        if isinstance(node, ast.Call) and (_attr_chain(node.func) == 'importlib.import_module' or (isinstance(node.func, ast.Name) and node.func.id == '__import__')):
-            findings['dynamic_import'] += 1
-            bucket['dynamic_import'] += 1
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and (node.func.id in {'getattr', 'setattr', 'delattr'}):
-            findings['runtime_attr_access'] += 1
-            bucket['runtime_attr_access'] += 1
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and (node.func.id in {'globals', 'locals', 'vars'}):
-            findings['runtime_namespace'] += 1
-            bucket['runtime_namespace'] += 1
+                    ctx.counts['sys_modules_mutation'] += 1
+            return
+        func = node.func
+        if isinstance(func, ast.Name):
+            name = func.id
+            if name in {'exec', 'eval'}:
+                ctx.counts['dynamic_exec'] += 1
+            elif name == '__import__':
+                ctx.counts['dynamic_import'] += 1
+            elif name in {'getattr', 'setattr', 'delattr'}:
+                ctx.counts['runtime_attr_access'] += 1
+            elif name in {'globals', 'locals', 'vars'}:
+                ctx.counts['runtime_namespace'] += 1
+            return
+        chain = _attr_chain(func)
+        if chain in {'sys.meta_path.insert', 'sys.meta_path.append'}:
+            ctx.counts['meta_path_mutation'] += 1
+        elif chain == 'importlib.import_module':
+            ctx.counts['dynamic_import'] += 1
 
 def _classify_level(indicators: dict) -> int:
     lvl3 = indicators['dynamic_exec'] + indicators['sys_modules_mutation'] + indicators['meta_path_mutation']
@@ -53,10 +53,10 @@ def _render_issue_summary(findings: list, **kwargs):
             hint = f' {Fore.CYAN}· sugestão: {Fore.GREEN}{Style.BRIGHT}doxoade check -fs {id_map[sub]}' if sub in id_map else ''
             echo(f'{line}{hint}{Style.RESET_ALL}')
     echo(f'{Fore.CYAN}{Style.DIM}─' * 85 + Style.RESET_ALL)
-    _render_resource_report(kwargs.get('full_power'))
+    _render_resource_report(kwargs.get('full_power'), findings)
 
-def _render_resource_report(full_power):
-    from doxoade.tools.memory_pool import finding_arena
+def _render_resource_report(full_power, findings=None):
+    from doxoade.tools.memory_pool import interned_count
     from doxoade.tools.streamer import ufs
     from doxoade.tools.governor import governor
     status = f'{Fore.RED}OVERRIDE' if full_power else f'{Fore.GREEN}ATIVO'
@@ -64,8 +64,8 @@ def _render_resource_report(full_power):
     if governor.interventions > 0:
         echo(f'   Economia de CPU       : {Fore.GREEN}~{governor.get_savings_estimate()} poupados')
         echo(f'   Tarefas Adaptadas     : {Fore.YELLOW}{governor.interventions} arquivos omitidos')
-    recycled = finding_arena.get_stats()
-    echo(f'   Reciclagem de Memória : {Fore.GREEN}{recycled} objetos reutilizados')
+    stats = findings.stats() if hasattr(findings, 'stats') else {'findings': len(findings or []), 'interned': interned_count()}
+    echo(f'   Store Colunar         : {Fore.GREEN}{stats["findings"]} achados, {stats["interned"]} strings internadas')
     echo(f'   Economia de Disco     : {Fore.GREEN}{ufs.reads_saved} aberturas evitadas')
     echo(f'{Fore.CYAN}{Style.DIM}─' * 85 + Style.RESET_ALL)
 
@@ -1,6 +1,7 @@
 # doxoade/doxoade/commands/check_systems/fixer.py
 import os
 import re
+import shutil
 
 def get_block_indent(lines, line_index):
     """Detecta a identação correta para uma linha baseada nas linhas superiores."""
@@ -46,6 +47,43 @@ def repair_indentation(file_path):
         return True
     return False
 
+class _TrackedLines(list):
+    """Linhas em edição com a origem de cada posição (None = linha inserida por um reparo)."""
+
+    def __init__(self, lines):
+        super().__init__(lines)
+        self.origin = list(range(len(lines)))
+        self._pos = None
+
+    def insert(self, index, line):
+        super().insert(index, line)
+        self.origin.insert(index, None)
+        self._pos = None
+
+    def pop(self, index=-1):
+        self.origin.pop(index)
+        self._pos = None
+        return super().pop(index)
+
+    def append(self, line):
+        super().append(line)
+        self.origin.append(None)
+
+    def position(self, original_idx):
+        """Índice atual da linha original 'original_idx' (None se ela foi removida/movida)."""
+        if self._pos is None:
+            self._pos = {o: i for i, o in enumerate(self.origin) if o is not None}
+        return self._pos.get(original_idx)
+
+_TOP_INSERTS = {'ADD_IMPORT': 1, 'MOVE_FUTURE': 2}
+
+def _parses(lines):
+    try:
+        compile(''.join(lines), '<autofix>', 'exec', dont_inherit=True)
+        return True
+    except (SyntaxError, ValueError):
+        return False
+
 class AutoFixer:
 
     def __init__(self, logger):
@@ -153,43 +191,78 @@ class AutoFixer:
         return True
 
     def apply_fix(self, file_path, line_number, fix_type, context=None):
+        return bool(self.apply_batch(file_path, [(line_number, fix_type, context)])['applied'])
+
+    def apply_batch(self, file_path, fixes):
+        """
+        Aplica vários reparos de um arquivo num único passe em memória.
+        fixes: [(linha, tipo, contexto)], com linhas do arquivo original; a posição
+        de cada linha é rastreada através de inserções/remoções dos reparos anteriores.
+        Grava uma vez (atômico) e descarta o lote se um arquivo que compilava deixar de compilar.
+        Retorna {'applied': [índices em fixes], 'rolled_back': bool}.
+        """
+        report = {'applied': [], 'rolled_back': False}
+        abs_path = os.path.normpath(os.path.abspath(file_path))
         try:
-            abs_path = os.path.normpath(os.path.abspath(file_path))
             with open(abs_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            idx = line_number - 1
-            new_lines = list(lines)
-            modified = False
-            
-            if fix_type == 'FIX_UNUSED_IMPORT':
-                modified = self._apply_smart_import_fix(new_lines, idx, context.get('var_name'))
+                original = f.readlines()
+        except OSError:
+            return report
+        lines = _TrackedLines(original)
+        pending_surgery = []
+        # Reparos locais de baixo para cima; os que inserem no topo por último
+        # (__future__ sempre acima de imports injetados).
+        order = sorted(range(len(fixes)), key=lambda i: (_TOP_INSERTS.get(fixes[i][1], 0), -fixes[i][0]))
+        for i in order:
+            line_number, fix_type, context = fixes[i]
+            idx = lines.position(line_number - 1) if fix_type != 'ADD_IMPORT' else 0
+            if idx is None:
+                continue
+            try:
+                modified = self._dispatch(lines, idx, fix_type, context or {}, abs_path)
+            except Exception:
+                modified = False
+            if modified:
+                report['applied'].append(i)
             elif fix_type == 'INDENT_ERR':
-                if self._apply_indent_surgery(abs_path, line_number):
-                    return True
-                try:
-                    from doxoade.tools.vulcan.indent_fixer import perform_indent_surgery
-                    return perform_indent_surgery(abs_path)
-                except Exception:
-                    return False
-            elif fix_type == 'REPLACE_WITH_UNDERSCORE':
-                modified = self._apply_comment_unused_line(new_lines, idx)
-            elif fix_type == 'FIX_BLOCK_SYNTAX':
-                modified = self._repair_empty_block(new_lines, idx)
-            elif fix_type == 'RESTORE_UNUSED':
-                modified = self._apply_restore_line(new_lines, idx)
-            elif fix_type == 'ADD_IMPORT':
-                modified = self._apply_add_import(new_lines, context.get('module'))
-            elif fix_type == 'RESTRICT_EXCEPTION':
-                modified = self._apply_forensic_exception_fix(new_lines, idx, abs_path)
-            elif fix_type == 'REMOVE_F_PREFIX':
-                modified = self._apply_remove_f_prefix(new_lines, idx)
-            elif fix_type == 'MOVE_FUTURE':
-                modified = self._apply_move_future(new_lines, idx)
+                pending_surgery.append(i)
 
-            if modified:
-                return self._save_file(abs_path, new_lines)
-            return False
-        except Exception: return False
+        if report['applied']:
+            is_python = abs_path.endswith('.py')
+            if is_python and _parses(original) and not _parses(lines):
+                return {'applied': [], 'rolled_back': True}
+            if not self._save_file(abs_path, list(lines)):
+                return {'applied': [], 'rolled_back': False}
+        if pending_surgery:
+            # Último recurso (Vulcan) trabalha direto no arquivo já gravado.
+            try:
+                from doxoade.tools.vulcan.indent_fixer import perform_indent_surgery
+                if perform_indent_surgery(abs_path):
+                    report['applied'].extend(pending_surgery)
+            except Exception:
+                pass
+        return report
+
+    def _dispatch(self, lines, idx, fix_type, context, abs_path):
+        if fix_type == 'FIX_UNUSED_IMPORT':
+            return self._apply_smart_import_fix(lines, idx, context.get('var_name'))
+        if fix_type == 'INDENT_ERR':
+            return self._realign_line(lines, idx)
+        if fix_type == 'REPLACE_WITH_UNDERSCORE':
+            return self._apply_comment_unused_line(lines, idx)
+        if fix_type == 'FIX_BLOCK_SYNTAX':
+            return self._repair_empty_block(lines, idx)
+        if fix_type == 'RESTORE_UNUSED':
+            return self._apply_restore_line(lines, idx)
+        if fix_type == 'ADD_IMPORT':
+            return self._apply_add_import(lines, context.get('module'))
+        if fix_type == 'RESTRICT_EXCEPTION':
+            return self._apply_forensic_exception_fix(lines, idx, abs_path)
+        if fix_type == 'REMOVE_F_PREFIX':
+            return self._apply_remove_f_prefix(lines, idx)
+        if fix_type == 'MOVE_FUTURE':
+            return self._apply_move_future(lines, idx)
+        return False
 
     def _apply_restore_line(self, lines, idx):
         """Restaura a linha removendo tags e pass, respeitando a indentação."""
@@ -358,13 +431,19 @@ class AutoFixer:
         return True
 
     def _save_file(self, file_path, lines):
+        tmp_path = f'{file_path}.dox-fix.tmp'
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 f.writelines(lines)
+            if os.path.exists(file_path):
+                shutil.copymode(file_path, tmp_path)  # os.replace leva o modo do temporário
+            os.replace(tmp_path, file_path)
             return True
         except IOError as e:
             from doxoade.tools.error_info import handle_error
             handle_error(e, context=f'AutoFixer._save_file ({os.path.basename(file_path)})', debug=True)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
         except Exception as e:
             import sys as exc_sys
@@ -375,37 +454,39 @@ class AutoFixer:
             import traceback
             activate_protocol(traceback.format_exc())
             
-    def _apply_indent_surgery(self, file_path, line_num):
+    def _realign_line(self, lines, idx):
         """Realinha a linha defeituosa baseada no contexto do bloco."""
+        if idx < 0 or idx >= len(lines): return False
+        
+        target_line = lines[idx]
+        stripped = target_line.lstrip()
+        
+        # 1. Busca a indentação correta olhando para cima
+        correct_indent = ""
+        for i in range(idx - 1, -1, -1):
+            prev = lines[i]
+            if prev.strip() and not prev.strip().startswith('#'):
+                indent_match = re.match(r"^(\s*)", prev)
+                correct_indent = indent_match.group(1) if indent_match else ""
+                
+                # Se a linha anterior abre um bloco, esta deve ter +4 espaços
+                if prev.strip().endswith(':'):
+                    correct_indent += "    "
+                break
+        
+        new_line = correct_indent + stripped
+        if new_line != target_line:
+            lines[idx] = new_line
+            return True
+        return False
+
+    def _apply_indent_surgery(self, file_path, line_num):
+        """Realinha a linha defeituosa direto no arquivo."""
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 lines = f.readlines()
-            
-            idx = line_num - 1
-            if idx < 0 or idx >= len(lines): return False
-            
-            target_line = lines[idx]
-            stripped = target_line.lstrip()
-            
-            # 1. Busca a indentação correta olhando para cima
-            correct_indent = ""
-            for i in range(idx - 1, -1, -1):
-                prev = lines[i]
-                if prev.strip() and not prev.strip().startswith('#'):
-                    indent_match = re.match(r"^(\s*)", prev)
-                    correct_indent = indent_match.group(1) if indent_match else ""
-                    
-                    # Se a linha anterior abre um bloco, esta deve ter +4 espaços
-                    if prev.strip().endswith(':'):
-                        correct_indent += "    "
-                    break
-            
-            new_line = correct_indent + stripped
-            if new_line != target_line:
-                lines[idx] = new_line
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.writelines(lines)
-                return True
+            if self._realign_line(lines, line_num - 1):
+                return self._save_file(file_path, lines)
             return False
         except Exception:
             return False
\ No newline at end of file
@@ -9,7 +9,7 @@ import doxoade.tools.aegis.nexus_db as sqlite3  # noqa
 from collections import Counter
 from rich.console import Console
 from rich.table import Table
-from doxoade.core_database import get_db_connection
+from doxoade.core_database import get_db_connection, has_table
 
 def _display_error_trend_db(cursor: sqlite3.Cursor):
     """
@@ -24,7 +24,10 @@ def _display_error_trend_db(cursor: sqlite3.Cursor):
     table.add_column('Comando', style='white')
     table.add_column('Erros/Críticos', justify='right', style='red')
     try:
-        cursor.execute("\n            SELECT e.command, COUNT(f.id) as total\n            FROM events e\n            JOIN findings f ON e.id = f.event_id\n            WHERE f.severity IN ('ERROR', 'CRITICAL')\n            GROUP BY e.command\n            ORDER BY total DESC;\n        ")
+        if has_table(cursor, 'finding_rollup_daily'):
+            cursor.execute("\n                SELECT command, SUM(count) as total\n                FROM finding_rollup_daily\n                WHERE severity IN ('ERROR', 'CRITICAL')\n                GROUP BY command\n                HAVING total > 0\n                ORDER BY total DESC;\n            ")
+        else:
+            cursor.execute("\n                SELECT e.command, COUNT(f.id) as total\n                FROM events e\n                JOIN findings f ON e.id = f.event_id\n                WHERE f.severity IN ('ERROR', 'CRITICAL')\n                GROUP BY e.command\n                ORDER BY total DESC;\n            ")
         rows = cursor.fetchall()
         if not rows:
             console.print('[yellow]Nenhum erro crítico registrado no histórico.[/yellow]')
@@ -35,23 +38,28 @@ def _display_error_trend_db(cursor: sqlite3.Cursor):
     except sqlite3.Error as e:
         console.print(f'[yellow]Aviso: Falha ao gerar tendência de erros: {e}[/yellow]')
 
+def _top_error_patterns(cursor, limit: int) -> list:
+    """[(padrão, frequência)] via rollup mantido por gatilho; varredura completa só em bancos legados."""
+    if has_table(cursor, 'finding_message_rollup'):
+        cursor.execute('SELECT pattern, count FROM finding_message_rollup WHERE count > 0 ORDER BY count DESC LIMIT ?', (limit,))
+        return [(row['pattern'], row['count']) for row in cursor.fetchall()]
+    cursor.execute("SELECT message FROM findings WHERE severity IN ('ERROR', 'CRITICAL')")
+    return Counter((row['message'].split("'")[0].strip() for row in cursor.fetchall())).most_common(limit)
+
 def _display_common_issues_db(cursor: sqlite3.Cursor):
     """
     Agrupa e exibe os 5 padrões de erro mais frequentes.
-    Utiliza Counter nativo para manter leveza no Termux.
+    Lê o rollup finding_message_rollup (Counter apenas como fallback legado).
     """
     if cursor is None:
         raise ValueError('Cursor do banco de dados é obrigatório para análise de padrões.')
     console = Console()
     console.print('\n[bold cyan]--- Problemas Mais Comuns (Top 5) ---[/bold cyan]')
     try:
-        cursor.execute("\n            SELECT message \n            FROM findings \n            WHERE severity IN ('ERROR', 'CRITICAL')\n        ")
-        rows = cursor.fetchall()
-        if not rows:
+        counts = _top_error_patterns(cursor, 5)
+        if not counts:
             console.print('[dim]Nenhum problema comum catalogado.[/dim]')
             return
-        messages = [row['message'].split("'")[0].strip() for row in rows]
-        counts = Counter(messages).most_common(5)
         table = Table(show_header=True, header_style='bold magenta')
         table.add_column('Frequência', justify='center', style='dim')
         table.add_column('Padrão de Erro')
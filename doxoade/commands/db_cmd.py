@@ -67,6 +67,19 @@ def optimize(db_path):
     except Exception as e:
         click.echo(f"{Fore.RED}✘ Falha na otimização: {e}{Style.RESET_ALL}")
 
+@db_group.command('compact')
+@click.option('--retention-days', type=int, default=None, help='Dias mantidos em operational_logs (padrão: DOXOADE_TELEMETRY_RETENTION_DAYS ou 14).')
+def compact(retention_days):
+    """🗜️  Hades Ledger: Dobra os segmentos de telemetria no SQLite."""
+    from doxoade.tools.telemetry_tools.segment_log import segment_log, compact_segments
+    segment_log.seal()
+    try:
+        report = compact_segments(retention_days=retention_days)
+    except Exception as e:
+        click.echo(f"{Fore.RED}✘ Falha na compactação: {e}{Style.RESET_ALL}")
+        return
+    click.echo(f"{Fore.GREEN}✔ {report['segments']} segmento(s), {report['rows']} linha(s) ingeridas, {report['purged']} log(s) expirados removidos.{Style.RESET_ALL}")
+
 @db_group.command('view')
 @click.argument('db_path', type=click.Path(exists=True))
 @click.option('--limit', '-n', default=5, help='Quantidade de linhas por tabela.')
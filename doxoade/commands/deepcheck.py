@@ -1,5 +1,5 @@
 # doxoade/doxoade/commands/deepcheck.py
-import ast, json, click
+import os, ast, json, click
 from doxoade.tools.doxcolors import Fore
 from .deepcheck_utils import DeepAnalyzer, _render_deep_report
 from .deepcheck_io import load_git_content, save_snapshot, load_snapshot, render_lineage_summary
@@ -62,10 +62,21 @@ def _run_orchestrated_scan(file_path, func_filter, flags):
 @click.option('--compare-json', '-cj', is_flag=True, help='Compara com snapshot local.')
 @click.option('--compare-git', '-cg', default=None, help='Compara com Git.')
 @click.option('--json', 'as_json', is_flag=True, help='Saída em JSON.')
-def deepcheck(file_path, func, variable, flow, as_json, compare_json, compare_git):
+@click.option('--top', '-t', default=20, show_default=True, help='Modo projeto: quantas funções listar no ranking (0 = todas).')
+@click.option('--jobs', '-j', default=0, help='Modo projeto: processos de análise (0 = automático).')
+def deepcheck(file_path, func, variable, flow, as_json, compare_json, compare_git, top, jobs):
     """🩺 Raio-X Semântico com Linhagem de Dados e Snapshots."""
     flags = {'variable': variable, 'flow': flow, 'as_json': as_json, 'json_comp': compare_json, 'git': compare_git}
     try:
+        if os.path.isdir(file_path):
+            # Modo projeto: ranking com cache por função e diff semântico contra a ref
+            from .deepcheck_project import scan_project, render_project_report
+            result = scan_project(file_path, jobs=jobs or None, git_ref=compare_git, top=top)
+            if as_json:
+                print(json.dumps(result, indent=2, ensure_ascii=False))
+            else:
+                render_project_report(result, git_ref=compare_git)
+            return
         results = _run_orchestrated_scan(file_path, func, flags)
         if as_json:
             print(json.dumps(results, indent=2, ensure_ascii=False))
@@ -0,0 +1,284 @@
+# doxoade/doxoade/commands/deepcheck_project.py
+"""
+Deepcheck em modo projeto/diretório.
+- Arquivos distribuídos entre processos (ProcessPoolExecutor); cada arquivo é
+  parseado uma vez e o radon reaproveita a mesma árvore.
+- Relatórios por função em cache (.doxoade_cache/deepcheck_cache.json), chaveados
+  pelo hash do código da função + CC + imports do módulo: função inalterada
+  nunca é reanalisada. Arquivos com (mtime, size) igual nem são reabertos.
+- Ranking dos menores scores arquiteturais e diff semântico contra uma ref git
+  para as funções que mudaram.
+"""
+import os
+import ast
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+CACHE_FILE = 'deepcheck_cache.json'
+CACHE_VERSION = 2
+
+def _module_imports(node, imports):
+    names = [n.name.split('.')[0] for n in node.names]
+    if isinstance(node, ast.ImportFrom) and node.module:
+        names.append(node.module.split('.')[0])
+    imports.update(names)
+
+def function_key(segment: str, cc: int, imports) -> str:
+    return hashlib.sha1(f"{cc}\0{','.join(sorted(imports))}\0{segment}".encode('utf-8')).hexdigest()
+
+def _qualified_functions(tree):
+    """[(nome qualificado, FunctionDef)] em ordem de fonte: 'A.__init__', 'outer.inner'."""
+    found = []
+
+    def _walk(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = f'{prefix}{child.name}'
+                if isinstance(child, ast.FunctionDef):
+                    found.append((qualname, child))
+                _walk(child, qualname + '.')
+            else:
+                _walk(child, prefix)
+    _walk(tree, '')
+    return found
+
+def _radon_cc_map(tree) -> dict:
+    """{nome qualificado: CC} com métodos (classes e classes internas) e closures; '.functions' sozinho omite métodos."""
+    from radon.visitors import ComplexityVisitor
+    cc_map = {}
+
+    def _function(f, prefix):
+        qualname = f'{prefix}{f.name}'
+        cc_map[qualname] = f.complexity
+        for closure in f.closures:
+            _function(closure, qualname + '.')
+
+    def _class(c, prefix):
+        for m in c.methods:
+            _function(m, f'{prefix}{c.name}.')
+        for inner in c.inner_classes:
+            _class(inner, f'{prefix}{c.name}.')
+    visitor = ComplexityVisitor.from_ast(tree)
+    for f in visitor.functions:
+        _function(f, '')
+    for c in visitor.classes:
+        _class(c, '')
+    return cc_map
+
+def analyze_source(content: str, known=frozenset()) -> list:
+    """
+    [{'function', 'line', 'key', 'report'}] para cada FunctionDef, identificada pelo
+    nome qualificado (repetições no mesmo escopo ganham sufixo '#n'); 'line' é só
+    exibição. 'report' é None quando a chave já está em 'known' (relatório vem do cache).
+    """
+    from .deepcheck_utils import DeepAnalyzer, _render_deep_report
+    tree = ast.parse(content)
+    imports = set()
+    for node in ast.walk(tree):
+        for child in ast.iter_child_nodes(node):
+            child.parent = node
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            _module_imports(node, imports)
+    try:
+        cc_map = _radon_cc_map(tree)
+    except Exception:
+        cc_map = {}
+    entries, seen = [], {}
+    for qualname, node in _qualified_functions(tree):
+        cc = cc_map.get(qualname, 1)
+        seen[qualname] = seen.get(qualname, 0) + 1
+        ident = qualname if seen[qualname] == 1 else f'{qualname}#{seen[qualname]}'
+        key = function_key(ast.get_source_segment(content, node) or ast.unparse(node), cc, imports)
+        report = None
+        if key not in known:
+            visitor = DeepAnalyzer(module_imports=imports)
+            visitor.visit(node)
+            report = _render_deep_report(visitor, node.name, cc, as_json=True)
+        entries.append({'function': ident, 'line': node.lineno, 'key': key, 'report': report})
+    return entries
+
+_KNOWN = frozenset()
+
+def _init_worker(known):
+    global _KNOWN
+    _KNOWN = known
+
+def _analyze_task(task):
+    """Unidade de trabalho do pool: (rótulo, caminho ou None, conteúdo ou None)."""
+    label, path, content = task
+    try:
+        if content is None:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        return label, analyze_source(content, _KNOWN), None
+    except Exception as e:
+        return label, [], f'{type(e).__name__}: {e}'
+
+class DeepcheckCache:
+    """Relatórios por chave de função + lista de funções por arquivo."""
+
+    def __init__(self, root):
+        self.path = Path(root) / '.doxoade_cache' / CACHE_FILE
+        self.files, self.reports = {}, {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                if data.get('version') == CACHE_VERSION:
+                    self.files, self.reports = data.get('files', {}), data.get('reports', {})
+            except (OSError, ValueError):
+                pass
+
+    def save(self, keep=()):
+        live = {fn[2] for entry in self.files.values() for fn in entry['functions']} | set(keep)
+        self.reports = {k: v for k, v in self.reports.items() if k in live}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps({'version': CACHE_VERSION, 'files': self.files, 'reports': self.reports}, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+def _run_tasks(tasks, known, jobs):
+    if jobs <= 1 or len(tasks) <= 1:
+        _init_worker(known)
+        return [_analyze_task(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(known,)) as pool:
+        return list(pool.map(_analyze_task, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+def _git_changed(root, ref, files):
+    """{caminho relativo à raiz git: caminho absoluto} dos arquivos alterados desde 'ref'."""
+    from doxoade.tools.git import _run_git_command
+    top = _run_git_command(['rev-parse', '--show-toplevel'], capture_output=True, silent_fail=True, cwd=root)
+    if not top:
+        return None, {}
+    top = top.strip()
+    out = _run_git_command(['diff', '--name-only', ref, '--', '.'], capture_output=True, silent_fail=True, cwd=root)
+    if out is None:
+        return top, {}
+    by_rel = {os.path.relpath(f, top).replace('\\', '/'): f for f in files}
+    return top, {rel: by_rel[rel] for rel in out.splitlines() if rel.strip() in by_rel}
+
+def _stale_tasks(files, root, cache):
+    """Arquivos cujo (mtime, size) mudou ou cujos relatórios saíram do cache."""
+    tasks, sigs = [], {}
+    for fp in files:
+        rel = os.path.relpath(fp, root).replace('\\', '/')
+        try:
+            st = os.stat(fp)
+        except OSError:
+            continue
+        sigs[rel] = [st.st_mtime_ns, st.st_size]
+        entry = cache.files.get(rel)
+        if not entry or entry.get('sig') != sigs[rel] or any(fn[2] not in cache.reports for fn in entry['functions']):
+            tasks.append((rel, fp, None))
+    return tasks, sigs
+
+def _git_tasks(root, git_ref, files):
+    """Versões em 'git_ref' dos arquivos alterados (rótulo '@<caminho>'), lidas pelo cat-file persistente."""
+    from doxoade.tools.git_batch import get_reader
+    git_top, changed = _git_changed(root, git_ref, files)
+    if not git_top:
+        return []
+    reader = get_reader(git_top)
+    tasks = []
+    for git_rel, fp in changed.items():
+        old = reader.read_text(git_ref, git_rel)
+        if old:
+            tasks.append(('@' + os.path.relpath(fp, root).replace('\\', '/'), None, old))
+    return tasks
+
+def _rank(current, reports):
+    ranking = []
+    for rel, functions in current.items():
+        for name, line, key in functions:
+            rep = reports.get(key)
+            if rep:
+                ranking.append({'file': rel, 'line': line, 'function': name, 'score': rep['score'], 'cc': rep['cc'], 'issues': rep['issues']})
+    ranking.sort(key=lambda r: (r['score'], -r['cc'], r['file'], r['line']))
+    return ranking
+
+def _diff_entry(rel, line, name, status, old_rep, new_rep):
+    return {'file': rel, 'line': line, 'function': name, 'status': status,
+            'old_score': old_rep.get('score'), 'score': new_rep.get('score'),
+            'old_cc': old_rep.get('cc'), 'cc': new_rep.get('cc')}
+
+def _semantic_diffs(current, git_old, reports):
+    """Funções adicionadas, removidas ou com código diferente da ref; piores variações de score primeiro."""
+    diffs = []
+    for rel, old_functions in git_old.items():
+        old = {name: key for name, _, key in old_functions}
+        names = set()
+        for name, line, key in current.get(rel, []):
+            names.add(name)
+            if old.get(name) != key:
+                status = 'CHANGED' if name in old else 'ADDED'
+                diffs.append(_diff_entry(rel, line, name, status, reports.get(old.get(name)) or {}, reports.get(key) or {}))
+        for name, line, key in old_functions:
+            if name not in names:
+                diffs.append(_diff_entry(rel, line, name, 'REMOVED', reports.get(key) or {}, {}))
+
+    def _delta(d):
+        return (100 if d['score'] is None else d['score']) - (100 if d['old_score'] is None else d['old_score'])
+    diffs.sort(key=lambda d: (_delta(d), d['file'], d['line']))
+    return diffs
+
+def scan_project(target, jobs=None, git_ref=None, top=20):
+    """Analisa todos os .py de 'target'; retorna ranking, diffs e estatísticas do cache."""
+    from doxoade.dnm import DNM
+    from doxoade.tools.filesystem import _find_project_root
+    root = _find_project_root(target)
+    files = sorted(DNM(os.path.abspath(target)).scan(extensions=['py']))
+    cache = DeepcheckCache(root)
+    stats = {'files': len(files), 'parsed': 0, 'functions': 0, 'analyzed': 0, 'errors': []}
+    tasks, sigs = _stale_tasks(files, root, cache)
+    if git_ref:
+        tasks += _git_tasks(root, git_ref, files)
+
+    git_old = {}
+    for label, entries, error in _run_tasks(tasks, frozenset(cache.reports), jobs or min(8, os.cpu_count() or 1)):
+        stats['parsed'] += 1
+        if error:
+            stats['errors'].append((label.lstrip('@'), error))
+        for e in entries:
+            if e['report'] is not None:
+                cache.reports[e['key']] = e['report']
+                stats['analyzed'] += 1
+        functions = [[e['function'], e['line'], e['key']] for e in entries]
+        if label.startswith('@'):
+            git_old[label[1:]] = functions
+        else:
+            cache.files[label] = {'sig': sigs[label], 'functions': functions}
+
+    current = {rel: cache.files[rel]['functions'] for rel in sigs if rel in cache.files}
+    for rel in [r for r in cache.files if r not in sigs and not os.path.exists(os.path.join(root, r))]:
+        del cache.files[rel]
+    cache.save(keep={fn[2] for functions in git_old.values() for fn in functions})
+
+    ranking = _rank(current, cache.reports)
+    stats['functions'] = len(ranking)
+    return {'ranking': ranking[:top] if top else ranking, 'diffs': _semantic_diffs(current, git_old, cache.reports), 'stats': stats}
+
+def render_project_report(result, git_ref=None):
+    from click import echo
+    from doxoade.tools.doxcolors import Fore, Style
+    stats = result['stats']
+    echo(f"{Fore.CYAN}{Style.BRIGHT}--- [DEEPCHECK] {stats['functions']} funções em {stats['files']} arquivos "
+         f"({stats['parsed']} reabertos, {stats['analyzed']} reanalisadas) ---{Style.RESET_ALL}")
+    echo(f'\n   {Fore.MAGENTA}{Style.BRIGHT}[ MENORES SCORES ARQUITETURAIS ]{Style.RESET_ALL}')
+    for r in result['ranking']:
+        color = Fore.GREEN if r['score'] > 80 else Fore.YELLOW if r['score'] > 50 else Fore.RED
+        issues = '; '.join(r['issues'])
+        echo(f"   {color}{r['score']:>3}{Style.RESET_ALL}  CC {r['cc']:<3} {Fore.WHITE}{r['file']}:{r['line']} {Fore.CYAN}{r['function']}(){Style.RESET_ALL}  {Style.DIM}{issues}{Style.RESET_ALL}")
+    if git_ref:
+        echo(f"\n   {Fore.YELLOW}{Style.BRIGHT}[ 📊 SEMANTIC DIFF vs {git_ref} ]{Style.RESET_ALL}")
+        if not result['diffs']:
+            echo(f'      {Fore.GREEN}Nenhuma função alterada.{Style.RESET_ALL}')
+        for d in result['diffs']:
+            old_s = '—' if d['old_score'] is None else d['old_score']
+            new_s = '—' if d['score'] is None else d['score']
+            delta = (d['score'] or 0) - (d['old_score'] or 0) if d['status'] == 'CHANGED' else None
+            color = Fore.RED if delta is not None and delta < 0 else Fore.GREEN if delta else Fore.WHITE
+            tail = f' ({delta:+})' if delta is not None else ''
+            echo(f"      {d['status']:<8} {d['file']}:{d['line']} {d['function']}()  score {old_s} ➔ {new_s}{color}{tail}{Style.RESET_ALL}  CC {d['old_cc'] if d['old_cc'] is not None else '—'} ➔ {d['cc'] if d['cc'] is not None else '—'}")
+    for rel, err in stats['errors']:
+        echo(f'   {Fore.RED}[ ERRO ] {rel}: {err}{Style.RESET_ALL}')
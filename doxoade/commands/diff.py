@@ -49,7 +49,7 @@ def _run_legacy_audit(rel_path: str, limit: int, show_code: bool, search_moved:
     """Analisa a evolução semântica (Fix v88.1)."""
     from doxoade.tools.git import _get_file_history_metadata, _get_historical_content
     from doxoade.tools.analysis import _extract_function_signatures, _get_function_source
-    from .search import _search_in_code_stream
+    from .search_systems.search_symbols import SymbolIndex
     
     current_content = ''
     project_root = Path(_find_project_root(os.getcwd()))
@@ -62,6 +62,8 @@ def _run_legacy_audit(rel_path: str, limit: int, show_code: bool, search_moved:
         click.echo(f'{Fore.RED}[ERRO] Leitura falhou: {e}{Style.RESET_ALL}')
         return
     history = _get_file_history_metadata(rel_path, limit=limit)
+    symbol_index = None
+    traced = {}
     for commit in history:
         h_hash = commit['hash']
         click.echo(f"\n{Fore.WHITE}{Style.BRIGHT}Commit: {h_hash} ({commit['date']}) - {commit['subject']}{Style.RESET_ALL}")
@@ -83,16 +85,17 @@ def _run_legacy_audit(rel_path: str, limit: int, show_code: bool, search_moved:
                 found_regression = True
                 if search_moved:
                     click.echo(f'     {Fore.YELLOW}🔍 Rastreando migração...{Style.RESET_ALL}')
-                    queries = [f'def {name}', f'{name}_vulcan_optimized', name.lstrip('_')]
-                    found_locations = []
-                    for q in queries:
-                        hits = _search_in_code_stream(project_root, q, limit=5)
-                        if hits:
-                            for h in hits:
-                                h_path = h['file'].replace('\\', '/')
-                                loc_str = f"{h_path}:{h['line']}"
-                                if loc_str not in found_locations:
-                                    found_locations.append(loc_str)
+                    if name not in traced:
+                        if symbol_index is None:
+                            symbol_index = SymbolIndex(project_root)
+                        found_locations = []
+                        for h in symbol_index.trace(name, limit=5):
+                            h_path = os.path.relpath(h['file'], project_root).replace('\\', '/')
+                            loc_str = f"{h_path}:{h['line']}"
+                            if loc_str not in found_locations:
+                                found_locations.append(loc_str)
+                        traced[name] = found_locations
+                    found_locations = traced[name]
                     if found_locations:
                         for loc in found_locations:
                             tag = '➔ RENOMEADA/REFERENCIADA EM:' if loc.startswith(rel_path) else '➔ MIGRADA PARA:'
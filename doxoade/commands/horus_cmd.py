@@ -20,8 +20,10 @@ def _parse_ts(ts_str):
 def run_horus_view_logic(limit=100, full=False, focus=None):
     """Lógica de visualização NSR pura, invocável por outros sistemas."""
     from doxoade.core_database import get_db_connection
+    from doxoade.tools.telemetry_tools.segment_log import ensure_compacted
     import json
     
+    ensure_compacted()
     conn = get_db_connection()
     query = """
         SELECT timestamp, action, data, subsystem 
@@ -93,6 +95,8 @@ def horus_view(limit, full, focus):
 @horus_group.command('purge')
 def horus_purge():
     """Limpa o registro tático (HORUS, SHADOW e AEGIS)."""
+    from doxoade.tools.telemetry_tools.segment_log import ensure_compacted
+    ensure_compacted()  # segmentos pendentes não devem "ressuscitar" após o purge
     alexandria_write("DELETE FROM operational_logs WHERE subsystem IN ('HORUS', 'SHADOW', 'AEGIS', 'DIAG')")
     click.secho("[OK] Memória operacional do Nexus purificada.", fg='green')
     
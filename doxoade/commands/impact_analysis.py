@@ -5,6 +5,7 @@ import json
 from doxoade.tools.doxcolors import Fore, Style
 from doxoade.commands.impact_systems.impact_logic import build_project_index, get_external_consumers
 from doxoade.commands.impact_systems.impact_state import ImpactState
+from doxoade.commands.impact_systems.impact_graph import ImpactGraph
 from doxoade.commands.impact_systems.impact_utils import path_to_module_name, load_impact_cache, save_impact_cache
 # [DOX-UNUSED] from doxoade.commands.doxcolors_systems.colors_command import config
 from doxoade.tools.filesystem import _find_project_root
@@ -20,11 +21,12 @@ from doxoade.tools.telemetry_tools.logger import ExecutionLogger
 @click.option('--func', '-f', help='Foca em uma função específica.')
 @click.option('--graph', '-g', 'show_graph', is_flag=True, help='Gerar Mermaid.')
 @click.option('--alerts', '-a', is_flag=True, help='Detectar problemas estruturais.')
+@click.option('--blast-radius', '-b', 'blast', is_flag=True, help='Consumidores transitivos do módulo.')
 @click.option('--html', '-H', is_flag=True, help='Gerar HTML interativo.')
 @click.option('--xml', '-x', is_flag=True, default=False, help='Gerar XML.')
 @click.option('--output', '-o', type=click.Path(), help='Salvar saída em arquivo.')
 @click.pass_context
-def impact_analysis(ctx, file_path_arg, project_path, tracking, internal, external, func, show_graph, alerts, html, xml, output):
+def impact_analysis(ctx, file_path_arg, project_path, tracking, internal, external, func, show_graph, alerts, blast, html, xml, output):
     """Analisa dependências e rastreia fluxo via Cache Diferencial (v10.1)."""
     root = _find_project_root(project_path)
     with ExecutionLogger('impact-analysis', root, ctx.params) as logger:
@@ -34,11 +36,14 @@ def impact_analysis(ctx, file_path_arg, project_path, tracking, internal, extern
         click.echo(Fore.CYAN + f"--- [NEXUS IMPACT] Analisando '{os.path.basename(root)}' ---")
         idx = build_project_index(search_path, set(config.get('ignore', [])), old_idx)
         save_impact_cache(root, idx)
+        graph = ImpactGraph(root)
+        graph.sync(idx)
+        graph.close()
         target_mod = path_to_module_name(file_path_arg, search_path)
         if target_mod not in idx:
             click.echo(Fore.RED + f'Erro: Módulo {target_mod} não indexado.')
             return
-        state = ImpactState(target_module=target_mod, project_root=root, search_path=search_path, index=idx)
+        state = ImpactState(target_module=target_mod, project_root=root, search_path=search_path, index=idx, graph=graph)
         if internal:
             click.echo(Fore.CYAN + f"\n[INTERNAL] Fluxo de '{target_mod}':")
             meta = state.get_internal_metadata()
@@ -57,7 +62,18 @@ def impact_analysis(ctx, file_path_arg, project_path, tracking, internal, extern
                 click.echo(Fore.WHITE + f"    └── usa: {', '.join(c['calls'])}")
             if not consumers:
                 click.echo('  (Nenhum uso externo detectado)')
-        if tracking or (not internal and (not external) and (not show_graph) and (not html) and (not xml)):
+        if blast:
+            radius = graph.blast_radius(target_mod)
+            click.echo(Fore.MAGENTA + f"\n[BLAST] Raio de impacto de '{target_mod}': {len(radius)} módulos")
+            for mod, dist in sorted(radius.items(), key=lambda x: (x[1], x[0])):
+                click.echo(Fore.YELLOW + f'  {dist}⇢ ' + Fore.WHITE + mod)
+        if alerts:
+            from doxoade.commands.impact_systems.impact_fluxogram import classify_cycles, format_cycle_alert
+            cycle_alerts = classify_cycles(graph.cycles_through(target_mod))
+            click.echo(Fore.CYAN + f"\n[ALERTS] Ciclos que tocam '{target_mod}': {len(cycle_alerts)}")
+            for alert in cycle_alerts:
+                click.echo(Fore.RED + format_cycle_alert(alert))
+        if tracking or (not internal and (not external) and (not show_graph) and (not html) and (not xml) and (not blast)):
             from doxoade.commands.impact_systems.impact_utils import get_coupling_status
             data = idx[target_mod]
             fan_out = len(data['imports'])
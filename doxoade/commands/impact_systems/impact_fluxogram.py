@@ -125,7 +125,9 @@ def graph_stats(graph: FluxGraph) -> Dict[str, Any]:
     return {'nodes': len(graph.nodes), 'edges': len(graph.edges), 'incoming': incoming, 'outgoing': outgoing, 'isolated': sorted([m for m in graph.nodes if incoming.get(m, 0) == 0 and outgoing.get(m, 0) == 0])}
 
 def analyze_cycles(graph: FluxGraph):
-    cycles = detect_cycles(graph)
+    return classify_cycles(detect_cycles(graph))
+
+def classify_cycles(cycles):
     alerts = []
     for cycle in cycles:
         size = len(cycle) - 1
@@ -158,26 +160,30 @@ def find_cycle_hotspot(graph: FluxGraph, cycle: list):
     return max(cycle, key=lambda m: incoming.get(m, 0))
 
 def detect_cycles(graph: FluxGraph):
+    """DFS iterativa (sem limite de recursão em projetos com milhares de módulos); mesma ordem da versão recursiva."""
     visited = set()
     stack = []
-    on_stack = set()
+    position = {}
     cycles = []
     adj = graph.adjacency()
-
-    def dfs(node):
-        visited.add(node)
-        stack.append(node)
-        on_stack.add(node)
-        for neighbor in adj.get(node, []):
-            if neighbor not in visited:
-                dfs(neighbor)
-            elif neighbor in on_stack:
-                idx = stack.index(neighbor)
-                cycle = stack[idx:] + [neighbor]
-                cycles.append(cycle)
-        stack.pop()
-        on_stack.remove(node)
-    for n in graph.nodes:
-        if n not in visited:
-            dfs(n)
-    return cycles
\ No newline at end of file
+    for start in graph.nodes:
+        if start in visited:
+            continue
+        visited.add(start)
+        position[start] = len(stack)
+        stack.append(start)
+        work = [iter(adj.get(start, []))]
+        while work:
+            for neighbor in work[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    position[neighbor] = len(stack)
+                    stack.append(neighbor)
+                    work.append(iter(adj.get(neighbor, [])))
+                    break
+                if neighbor in position:
+                    cycles.append(stack[position[neighbor]:] + [neighbor])
+            else:
+                work.pop()
+                del position[stack.pop()]
+    return cycles
@@ -0,0 +1,148 @@
+# doxoade/doxoade/commands/impact_systems/impact_graph.py
+"""
+impact_graph.py
+
+Grafo de imports persistente (direto + reverso) em .doxoade_cache/impact_graph.db.
+- sync(index): só módulos cuja assinatura (mtime, size) mudou têm as arestas de
+  saída trocadas; módulos removidos saem do grafo. Nada é recalculado do zero.
+- Consultas (consumidores, raio de impacto transitivo, ciclos que tocam um módulo)
+  percorrem apenas a vizinhança alcançável, nunca o índice inteiro.
+"""
+from __future__ import annotations
+import doxoade.tools.aegis.nexus_db as sqlite3  # noqa
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+GRAPH_FILE = 'impact_graph.db'
+
+def module_signature(data: dict) -> str:
+    if data.get('mtime') is not None:
+        return f"{data.get('mtime')}:{data.get('size')}"
+    return 'imports:' + ','.join(sorted(data.get('imports', []) or []))
+
+class ImpactGraph:
+    """Arestas 'src importa dst' com adjacência reversa mantida em memória."""
+
+    def __init__(self, root: Optional[str]=None):
+        self.forward: Dict[str, Set[str]] = {}
+        self.reverse: Dict[str, Set[str]] = {}
+        self.sigs: Dict[str, str] = {}
+        self.conn = None
+        if root is not None:
+            cache_dir = Path(root) / '.doxoade_cache'
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(cache_dir / GRAPH_FILE))
+            self.conn.execute('CREATE TABLE IF NOT EXISTS nodes (module TEXT PRIMARY KEY, sig TEXT NOT NULL)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS edges (src TEXT NOT NULL, dst TEXT NOT NULL, PRIMARY KEY (src, dst))')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS edges_dst ON edges (dst)')
+            self._load()
+
+    @classmethod
+    def from_index(cls, index: dict) -> 'ImpactGraph':
+        graph = cls()
+        graph.sync(index)
+        return graph
+
+    def _load(self):
+        self.sigs = dict(self.conn.execute('SELECT module, sig FROM nodes'))
+        for src, dst in self.conn.execute('SELECT src, dst FROM edges'):
+            self.forward.setdefault(src, set()).add(dst)
+            self.reverse.setdefault(dst, set()).add(src)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    # --- Atualização incremental ------------------------------------------
+    def _unlink(self, mod: str):
+        for dst in self.forward.pop(mod, ()):
+            srcs = self.reverse.get(dst)
+            if srcs is not None:
+                srcs.discard(mod)
+                if not srcs:
+                    del self.reverse[dst]
+
+    def sync(self, index: dict) -> int:
+        """Aplica o índice atual; retorna quantos módulos tiveram arestas trocadas."""
+        changed = []
+        for mod, data in index.items():
+            sig = module_signature(data)
+            if self.sigs.get(mod) != sig:
+                changed.append((mod, sig, set(data.get('imports', []) or [])))
+        removed = [mod for mod in self.sigs if mod not in index]
+        for mod in removed:
+            self._unlink(mod)
+            del self.sigs[mod]
+        for mod, sig, imports in changed:
+            self._unlink(mod)
+            imports.discard(mod)  # auto-import não forma dependência
+            if imports:
+                self.forward[mod] = imports
+                for dst in imports:
+                    self.reverse.setdefault(dst, set()).add(mod)
+            self.sigs[mod] = sig
+        if self.conn is not None and (changed or removed):
+            with self.conn:
+                stale = [(mod,) for mod in removed] + [(mod,) for mod, _, _ in changed]
+                self.conn.executemany('DELETE FROM edges WHERE src = ?', stale)
+                self.conn.executemany('DELETE FROM nodes WHERE module = ?', [(mod,) for mod in removed])
+                self.conn.executemany('INSERT OR REPLACE INTO nodes (module, sig) VALUES (?, ?)', [(mod, sig) for mod, sig, _ in changed])
+                self.conn.executemany('INSERT OR IGNORE INTO edges (src, dst) VALUES (?, ?)', [(mod, dst) for mod, _, _ in changed for dst in self.forward.get(mod, ())])
+        return len(changed) + len(removed)
+
+    # --- Consultas --------------------------------------------------------
+    def consumers_of(self, module: str) -> Set[str]:
+        return set(self.reverse.get(module, ())) - {module}
+
+    def _reach(self, start: str, adj: Dict[str, Set[str]], depth: Optional[int]=None) -> Dict[str, int]:
+        dist = {start: 0}
+        queue = deque([start])
+        while queue:
+            mod = queue.popleft()
+            if depth is not None and dist[mod] >= depth:
+                continue
+            for nxt in adj.get(mod, ()):
+                if nxt not in dist:
+                    dist[nxt] = dist[mod] + 1
+                    queue.append(nxt)
+        return dist
+
+    def blast_radius(self, module: str, depth: Optional[int]=None) -> Dict[str, int]:
+        """Consumidores transitivos -> distância (1 = importa o módulo diretamente)."""
+        dist = self._reach(module, self.reverse, depth)
+        dist.pop(module, None)
+        return dist
+
+    def cycle_members(self, module: str) -> Set[str]:
+        """Componente fortemente conexa do módulo (vazia se ele não está em ciclo)."""
+        members = self._reach(module, self.forward).keys() & self._reach(module, self.reverse).keys()
+        return set(members) if len(members) > 1 else set()
+
+    def cycles_through(self, module: str, limit: int=20) -> List[List[str]]:
+        """Ciclo mais curto por cada sucessor dentro da componente (formato de detect_cycles)."""
+        members = self.cycle_members(module)
+        cycles = []
+        for first in sorted(self.forward.get(module, ()) & members):
+            prev = {first: None}
+            queue = deque([first])
+            while queue and module not in prev:
+                mod = queue.popleft()
+                for nxt in sorted(self.forward.get(mod, ()) & members):
+                    if nxt not in prev:
+                        prev[nxt] = mod
+                        queue.append(nxt)
+            if module not in prev:
+                continue
+            path, node = [], module
+            while node is not None:
+                path.append(node)
+                node = prev[node]
+            cycles.append([module] + path[::-1])
+            if len(cycles) >= limit:
+                break
+        return cycles
+
+    def modules(self) -> Iterable[str]:
+        return self.sigs.keys()
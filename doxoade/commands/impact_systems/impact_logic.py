@@ -13,6 +13,7 @@ class ImpactVisitor(ast.NodeTransformer):
     def __init__(self, current_module):
         super().__init__()
         self.imports = set()
+        self.from_imports = set()
         self.calls = set()
         self.defines = {}
         self.current_module = current_module
@@ -28,6 +29,9 @@ class ImpactVisitor(ast.NodeTransformer):
         resolved = resolve_relative_import(node.module, node.level, self.current_module)
         if resolved:
             self.imports.add(resolved)
+            for alias in node.names:
+                if alias.name != '*':
+                    self.from_imports.add(f'{resolved}.{alias.name}')
         return node
 
     def visit_FunctionDef(self, node):
@@ -68,7 +72,7 @@ def build_project_index(search_path: str, ignore_patterns: set, old_index: dict)
         mod_name = path_to_module_name(fp, search_path)
         mtime, size = get_file_metadata(fp)
         cached = old_index.get(mod_name)
-        if cached and cached.get('mtime') == mtime and (cached.get('size') == size):
+        if cached and cached.get('mtime') == mtime and (cached.get('size') == size) and ('from_imports' in cached):
             new_index[mod_name] = cached
             continue
         files_to_process.append((fp, mod_name, mtime, size))
@@ -84,23 +88,24 @@ def build_project_index(search_path: str, ignore_patterns: set, old_index: dict)
                 tree = ast.parse(content)
                 v = ImpactVisitor(mod_name)
                 v.visit(tree)
-                new_index[mod_name] = {'path': os.path.relpath(fp, search_path), 'mtime': mtime, 'size': size, 'imports': list(v.imports), 'calls': list(v.calls), 'defines': list(v.defines.keys()), 'metadata': v.defines}
+                new_index[mod_name] = {'path': os.path.relpath(fp, search_path), 'mtime': mtime, 'size': size, 'imports': list(v.imports), 'from_imports': list(v.from_imports), 'calls': list(v.calls), 'defines': list(v.defines.keys()), 'metadata': v.defines}
             except Exception as e:
-                new_index[mod_name] = {'path': os.path.relpath(fp, search_path), 'error': str(e), 'imports': [], 'calls': [], 'defines': [], 'metadata': {}}
+                new_index[mod_name] = {'path': os.path.relpath(fp, search_path), 'error': str(e), 'imports': [], 'from_imports': [], 'calls': [], 'defines': [], 'metadata': {}}
                 continue
     return new_index
 
 def get_external_consumers(state: ImpactState, func_filter: str=None) -> List[Dict]:
+    """Consumidores diretos via arestas reversas do grafo (só os importadores do alvo são lidos)."""
     consumers = []
     target = state.target_module
-    target_defines = state.get_defined_functions()
-    for mod, data in state.index.items():
-        if mod == target:
+    target_defines = set(state.get_defined_functions())
+    for mod in state.get_graph().consumers_of(target):
+        data = state.index.get(mod)
+        if not data:
             continue
-        if target in data.get('imports', []):
-            hits = set(data.get('calls', [])).intersection(target_defines)
-            if func_filter:
-                hits = {h for h in hits if h == func_filter}
-            if hits:
-                consumers.append({'path': data['path'], 'calls': sorted(list(hits))})
-    return consumers
+        hits = target_defines.intersection(data.get('calls', []))
+        if func_filter:
+            hits = {h for h in hits if h == func_filter}
+        if hits:
+            consumers.append({'path': data['path'], 'calls': sorted(list(hits))})
+    return sorted(consumers, key=lambda c: c['path'])
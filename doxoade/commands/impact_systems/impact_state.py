@@ -1,6 +1,6 @@
 # doxoade/doxoade/commands/impact_systems/impact_state.py
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 @dataclass
 class ImpactState:
@@ -8,6 +8,7 @@ class ImpactState:
     project_root: str
     search_path: str
     index: Dict[str, Any] = field(default_factory=dict)
+    graph: Optional[Any] = None  # ImpactGraph persistente (montado do índice se ausente)
 
     def get_internal_metadata(self) -> Dict[str, Any]:
         """Recupera metadados (linhas e chamadas) do módulo alvo (PASC 8.12)."""
@@ -15,4 +16,11 @@ class ImpactState:
 
     def get_defined_functions(self) -> List[str]:
         """Lista funções exportadas pelo módulo."""
-        return self.index.get(self.target_module, {}).get('defines', [])
\ No newline at end of file
+        return self.index.get(self.target_module, {}).get('defines', [])
+
+    def get_graph(self):
+        """Grafo direto/reverso de imports; sem grafo persistido, monta um em memória."""
+        if self.graph is None:
+            from .impact_graph import ImpactGraph
+            self.graph = ImpactGraph.from_index(self.index)
+        return self.graph
\ No newline at end of file
@@ -3,11 +3,23 @@
 """
 Motor de Grafo de Dependências para o Intelligence (PASC 13.0).
 Rastreia imports (AST) e referências textuais (comportamento Nexus Search).
+
+Índice de termos (.doxoade_cache/graph_terms.db): cada arquivo é lido uma única
+vez e reduzido ao conjunto de "runs" (sequências sem separadores) + imports AST.
+Como um termo indexável nunca cruza um separador, 'termo in conteúdo' equivale a
+'termo é substring de algum run' - a consulta varre só o vocabulário distinto.
 """
 import os
+import re
 import ast
+import bisect
+import doxoade.tools.aegis.nexus_db as sqlite3  # noqa
 from doxoade.dnm import DNM
 
+TEXT_EXTS = ['.py', '.c', '.cpp', '.h', '.html', '.js', '.ts', '.md', '.txt', '.toml', '.json', '.css']
+TERM_INDEX_FILE = 'graph_terms.db'
+RUN_RE = re.compile('[^\\s"\'`(){}\\[\\]<>,;:=]+')
+
 
 def get_module_path(file_path, project_root):
     """Converte caminho físico (abs ou rel) em caminho de módulo Python."""
@@ -24,12 +36,13 @@ def get_module_path(file_path, project_root):
     return rel.replace('/', '.')
 
 
-def extract_imports(file_path):
+def extract_imports(file_path, content=None):
     """Extrai imports via AST. Retorna set de strings de módulo."""
     imports = set()
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
         tree = ast.parse(content)
         for node in ast.walk(tree):
             if isinstance(node, ast.Import):
@@ -43,7 +56,100 @@ def extract_imports(file_path):
     return imports
 
 
-def build_project_graph(project_root, ignore_spec):
+class GraphTermIndex:
+    """Índice persistente arquivo -> (runs, imports), atualizado por (mtime_ns, size)."""
+
+    def __init__(self, project_root, ignore_spec):
+        self.root = project_root
+        self.ignore_spec = ignore_spec
+        cache_dir = os.path.join(project_root, '.doxoade_cache')
+        os.makedirs(cache_dir, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(cache_dir, TERM_INDEX_FILE))
+        self.conn.execute('CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, runs TEXT, imports TEXT)')
+        self.imports = {}
+        self._run_files = {}
+        self._vocab = None
+        self.refresh()
+
+    def close(self):
+        self.conn.close()
+
+    def refresh(self):
+        """Relê apenas arquivos novos/alterados; remove os que sumiram."""
+        known = {row[0]: row[1:] for row in self.conn.execute('SELECT path, mtime_ns, size, runs, imports FROM files')}
+        seen, updates = set(), []
+        for f_abs in DNM(self.root).scan(extensions=TEXT_EXTS):
+            f_rel = os.path.relpath(f_abs, self.root).replace('\\', '/')
+            if self.ignore_spec.match_file(f_rel):
+                continue
+            try:
+                st = os.stat(f_abs)
+            except OSError:
+                continue
+            seen.add(f_rel)
+            row = known.get(f_rel)
+            if not (row and row[0] == st.st_mtime_ns and row[1] == st.st_size):
+                try:
+                    with open(f_abs, 'r', encoding='utf-8', errors='ignore') as f:
+                        content = f.read()
+                except OSError:
+                    continue
+                imports = '\n'.join(sorted(extract_imports(f_abs, content))) if f_rel.endswith('.py') else ''
+                row = (st.st_mtime_ns, st.st_size, '\n'.join(set(RUN_RE.findall(content))), imports)
+                updates.append((f_rel,) + row)
+            if f_rel.endswith('.py'):
+                self.imports[f_rel] = set(row[3].split('\n')) - {''}
+            for run in row[2].split('\n'):
+                if run:
+                    self._run_files.setdefault(run, set()).add(f_rel)
+        gone = [(p,) for p in set(known) - seen]
+        if updates or gone:
+            with self.conn:
+                self.conn.executemany('INSERT OR REPLACE INTO files (path, mtime_ns, size, runs, imports) VALUES (?, ?, ?, ?, ?)', updates)
+                self.conn.executemany('DELETE FROM files WHERE path = ?', gone)
+        self._vocab = None
+
+    def _vocabulary(self):
+        if self._vocab is None:
+            runs = list(self._run_files)
+            starts, pos = [], 0
+            for run in runs:
+                starts.append(pos)
+                pos += len(run) + 1
+            self._vocab = (runs, starts, '\n'.join(runs))
+        return self._vocab
+
+    def files_containing(self, term):
+        """Arquivos cujo conteúdo contém 'term' (mesma semântica de 'term in content')."""
+        if not term or not RUN_RE.fullmatch(term):
+            return self._scan_files(term)
+        runs, starts, joined = self._vocabulary()
+        found = set()
+        pos = joined.find(term)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            found |= self._run_files[runs[i]]
+            nxt = starts[i + 1] if i + 1 < len(starts) else len(joined)
+            pos = joined.find(term, nxt)
+        return found
+
+    def _scan_files(self, term):
+        """Fallback para termos com separadores (ex.: espaços no caminho)."""
+        found = set()
+        for f_rel in {f for files in self._run_files.values() for f in files}:
+            try:
+                with open(os.path.join(self.root, f_rel), 'r', encoding='utf-8', errors='ignore') as f:
+                    if term in f.read():
+                        found.add(f_rel)
+            except OSError:
+                continue
+        return found
+
+    def lookup(self, terms):
+        return {term: self.files_containing(term) for term in terms}
+
+
+def build_project_graph(project_root, ignore_spec, term_index=None):
     """
     Constrói o mapa de módulos e dependências AST do projeto.
     Retorna:
@@ -68,10 +174,12 @@ def build_project_graph(project_root, ignore_spec):
         module_to_file[mod_path] = rel_path
         file_to_module[rel_path] = mod_path
 
-    # 2. Mapeia quem importa quem
+    # 2. Mapeia quem importa quem (imports já extraídos pelo índice, se houver)
     for rel_path, mod_path in file_to_module.items():
-        f_abs = os.path.join(project_root, rel_path)
-        imports = extract_imports(f_abs)
+        if term_index is not None and rel_path in term_index.imports:
+            imports = term_index.imports[rel_path]
+        else:
+            imports = extract_imports(os.path.join(project_root, rel_path))
         file_deps[rel_path] = imports
         for imp in imports:
             if imp not in module_dependents:
@@ -81,35 +189,21 @@ def build_project_graph(project_root, ignore_spec):
     return module_to_file, file_deps, module_dependents
 
 
-def build_text_index(project_root, ignore_spec, target_terms):
+def build_text_index(project_root, ignore_spec, target_terms, term_index=None):
     """
     Cria um índice reverso de texto para achar dependências 'ocultas'
     (ex: referências em .txt, .md, .json, ou imports dinâmicos).
-    Simula o comportamento do `doxoade search`.
+    Simula o comportamento do `doxoade search`, consultando o GraphTermIndex.
     """
-    index = {term: set() for term in target_terms}
     if not target_terms:
-        return index
-
-    nav = DNM(project_root)
-    all_files = nav.scan(extensions=[
-        '.py', '.c', '.cpp', '.h', '.html', '.js', '.ts',
-        '.md', '.txt', '.toml', '.json', '.css'
-    ])
-
-    for f_abs in all_files:
-        f_rel = os.path.relpath(f_abs, project_root).replace('\\', '/')
-        if ignore_spec.match_file(f_rel):
-            continue
-        try:
-            with open(f_abs, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            for term in target_terms:
-                if term in content:
-                    index[term].add(f_rel)
-        except Exception:
-            pass
-    return index
+        return {}
+    own = term_index is None
+    term_index = term_index or GraphTermIndex(project_root, ignore_spec)
+    try:
+        return term_index.lookup(target_terms)
+    finally:
+        if own:
+            term_index.close()
 
 
 def resolve_import(imp, module_to_file):
@@ -152,24 +246,33 @@ def get_graph_neighbors(initial_files_abs, project_root, ignore_spec, depth):
         rel = os.path.relpath(f, project_root).replace('\\', '/')
         initial_files_rel.add(rel)
 
-    module_to_file, file_deps, module_dependents = build_project_graph(
-        project_root, ignore_spec
-    )
+    term_index = GraphTermIndex(project_root, ignore_spec)
+    try:
+        module_to_file, file_deps, module_dependents = build_project_graph(
+            project_root, ignore_spec, term_index
+        )
+        edges, visited = _expand_levels(
+            initial_files_rel, project_root, ignore_spec, depth,
+            module_to_file, file_deps, module_dependents, term_index
+        )
+    finally:
+        term_index.close()
 
-    # Prepara termos para o índice de texto (comportamento Nexus Search)
-    target_terms = set()
-    for f_rel in initial_files_rel:
-        mod_path = get_module_path(f_rel, project_root)
-        target_terms.add(f_rel)                          # doxoade/commands/intelligence.py
-        target_terms.add(mod_path)                      # doxoade.commands.intelligence
-        target_terms.add(f_rel.replace('/', '.'))       # doxoade.commands.intelligence.py
-        # Sem extensão
-        base = f_rel.rsplit('.', 1)[0] if '.' in f_rel else f_rel
-        target_terms.add(base)                          # doxoade/commands/intelligence
-        target_terms.add(base.replace('/', '.'))        # doxoade.commands.intelligence
+    # Converte tudo para caminhos ABSOLUTOS para compatibilidade com _run_dossier_scan
+    edges_abs = {}
+    for k, v in edges.items():
+        if v:
+            k_abs = os.path.join(project_root, k)
+            edges_abs[k_abs] = sorted([os.path.join(project_root, x) for x in v])
 
-    text_index = build_text_index(project_root, ignore_spec, target_terms)
+    new_files_rel = visited - initial_files_rel
+    new_files_abs = sorted([os.path.join(project_root, x) for x in new_files_rel])
 
+    return edges_abs, new_files_abs
+
+
+def _expand_levels(initial_files_rel, project_root, ignore_spec, depth, module_to_file, file_deps, module_dependents, term_index):
+    """BFS por níveis; referências textuais de cada nível vêm do índice (sem reescanear a árvore)."""
     visited = set(initial_files_rel)
     current_level = set(initial_files_rel)
     edges = {f: set() for f in initial_files_rel}
@@ -177,6 +280,8 @@ def get_graph_neighbors(initial_files_abs, project_root, ignore_spec, depth):
     # BFS por níveis de profundidade
     for _ in range(depth):
         next_level = set()
+        # Termos do nível inteiro resolvidos de uma vez (comportamento Nexus Search)
+        text_index = build_text_index(project_root, ignore_spec, _search_terms(current_level, project_root), term_index)
         for curr in current_level:
             if curr not in edges:
                 edges[curr] = set()
@@ -207,12 +312,7 @@ def get_graph_neighbors(initial_files_abs, project_root, ignore_spec, depth):
                                 visited.add(dep_file)
 
             # 3. Dependências de Entrada (Text Search / Nexus Search Fallback)
-            search_terms = {
-                curr,
-                curr_mod,
-                curr.replace('/', '.'),
-            }
-            for term in search_terms:
+            for term in _search_terms([curr], project_root):
                 if term in text_index:
                     for dep_file in text_index[term]:
                         if dep_file != curr and not ignore_spec.match_file(dep_file):
@@ -225,14 +325,12 @@ def get_graph_neighbors(initial_files_abs, project_root, ignore_spec, depth):
         if not current_level:
             break
 
-    # Converte tudo para caminhos ABSOLUTOS para compatibilidade com _run_dossier_scan
-    edges_abs = {}
-    for k, v in edges.items():
-        if v:
-            k_abs = os.path.join(project_root, k)
-            edges_abs[k_abs] = sorted([os.path.join(project_root, x) for x in v])
+    return edges, visited
 
-    new_files_rel = visited - initial_files_rel
-    new_files_abs = sorted([os.path.join(project_root, x) for x in new_files_rel])
 
-    return edges_abs, new_files_abs
\ No newline at end of file
+def _search_terms(files_rel, project_root):
+    """Variações textuais pelas quais um arquivo pode ser referenciado."""
+    terms = set()
+    for f_rel in files_rel:
+        terms.update((f_rel, get_module_path(f_rel, project_root), f_rel.replace('/', '.')))
+    return terms
@@ -2,7 +2,6 @@
 # doxoade/commands/intelligence_systems/intelligence.py
 import os
 import re
-import json
 import click
 import traceback
 import xml.etree.ElementTree as ET
@@ -39,9 +38,10 @@ VALID_EXTS = (
 @click.option('--verbose',    '-v', is_flag=True,  help="Modo verboso.")
 @click.option('--graph',      '-g', is_flag=False, flag_value=1, default=0, type=int, help="Inclui arquivos relacionados (grafo de dependências). Nível de profundidade (padrão 1).")
 @click.option('--manifest',   '-m', is_flag=True, help="🦉 [THOTH] Gera o manifesto JSON de comandos para IAs (Tool Use).")
+@click.option('--jobs',       '-j', default=0, type=int, help="Processos de análise (0 = todos os núcleos, 1 = serial).")
 @click.argument('paths', nargs=-1, type=click.Path(exists=True))
 @click.pass_context
-def intelligence(ctx, docs, source, no_comments, no_spaces, concatenate, ai_export, ia_qwen, output, focus, exclude, ext_exclude, analyze, verbose, manifest, paths, graph):
+def intelligence(ctx, docs, source, no_comments, no_spaces, concatenate, ai_export, ia_qwen, output, focus, exclude, ext_exclude, analyze, verbose, manifest, jobs, paths, graph):
     """Módulo de Inteligência Topológica (v95.6 - Qwen Ready)."""
     if analyze:
         _run_analyze_coverage(paths, exclude, verbose, ext_exclude)
@@ -56,7 +56,7 @@ def intelligence(ctx, docs, source, no_comments, no_spaces, concatenate, ai_expo
         try:
             _run_dossier_scan(
                 scan_paths, output, docs, source,
-                no_comments, no_spaces, concatenate, focus, ai_export, ia_qwen, ctx, exclude, ext_exclude, graph
+                no_comments, no_spaces, concatenate, focus, ai_export, ia_qwen, ctx, exclude, ext_exclude, graph, jobs
             )
         except Exception:
             error_data = traceback.format_exc()
@@ -74,10 +74,10 @@ def recover(backup_path, output_path):
     if success: click.echo(f"\033[92m✅ {msg}\033[0m")
     else: click.echo(f"\033[91m✘ {msg}\033[0m")
 
-def _run_dossier_scan(scan_paths, output, include_docs, include_source, no_comments, no_spaces, concat, focus, ai_export, ia_qwen, ctx, cli_excludes, ext_excludes, graph_depth):
-    from doxoade.commands.intelligence_systems.intelligence_engine import analyze_file_chief
-    # 🆕 CORREÇÃO: Importar minify_code em vez de strip_comments
-    from doxoade.commands.intelligence_systems.intelligence_utils import minify_code, get_ignore_spec 
+def _run_dossier_scan(scan_paths, output, include_docs, include_source, no_comments, no_spaces, concat, focus, ai_export, ia_qwen, ctx, cli_excludes, ext_excludes, graph_depth, jobs=0):
+    from doxoade.commands.intelligence_systems.intelligence_utils import get_ignore_spec
+    from doxoade.commands.intelligence_systems.intelligence_pool import iter_dossier_results
+    from doxoade.commands.intelligence_systems.intelligence_report import DossierWriter
     
     root = _find_project_root(os.getcwd())
     console = Console()
@@ -139,348 +139,32 @@ def _run_dossier_scan(scan_paths, output, include_docs, include_source, no_comme
                 neighbors_map = {}
         # -------------------------------------------
 
-        dossier_files = []
-        with click.progressbar(unique_files, label='[VULCAN:INTEL]') as bar:
-            for f in bar:
-                try:
-                    res = analyze_file_chief(f, root, docs=include_docs, source=include_source)
-                    if res and isinstance(res, dict) and 'size' in res:
-                        # 🆕 PIPELINE DE MINIFICAÇÃO (-nc e -ns)
-                        src = res.get('source_minified')
-                        if src and (no_comments or no_spaces):
-                            res['source_minified'] = minify_code(src, f, no_comments, no_spaces)
-                        
-                        # 🆕 ANEXA O GRAFO AO RELATÓRIO (Convertendo caminhos absolutos para relativos)
-                        if graph_depth > 0 and f in neighbors_map:
-                            res['graph_neighbors'] = [
-                                os.path.relpath(x, root).replace('\\', '/') 
-                                for x in neighbors_map[f]
-                            ]
-                        dossier_files.append(res)
-                except Exception:
+        # Pool de processos + cache por hash de conteúdo; resultados fluem em ordem
+        # para o escritor incremental (memória limitada a uma janela).
+        writer = DossierWriter(output, root, concat, focus, ai_export, ia_qwen, console, graph_depth, include_source)
+        results = iter_dossier_results(unique_files, root, include_docs, include_source, no_comments, no_spaces, workers=jobs)
+        with click.progressbar(length=len(unique_files), label='[VULCAN:INTEL]') as bar:
+            for f, res in results:
+                bar.update(1)
+                if res is None:
                     continue
-
-        # Passa graph_depth e include_source para o salvador do relatório
-        _save_report(dossier_files, output, root, concat, focus, ai_export, ia_qwen, console, graph_depth, include_source)
+                # 🆕 ANEXA O GRAFO AO RELATÓRIO (Convertendo caminhos absolutos para relativos)
+                if graph_depth > 0 and f in neighbors_map:
+                    res['graph_neighbors'] = [
+                        os.path.relpath(x, root).replace('\\', '/')
+                        for x in neighbors_map[f]
+                    ]
+                writer.add(res)
+        writer.close()
 
 def _save_report(files, output, root, concat, focus, ai_export, ia_qwen, console, graph_depth=0, include_source=False):
-    from datetime import datetime, timezone
-    
-    report_files = []
-    economic_summary = {}
-    report_type = "nexus_intelligence_report"
-    
-    # Filtering logic based on 'focus'
-    if focus:
-        report_type = f"{focus}_intelligence_report"
-        console.print(f"[bold yellow]⚡ Gerando Relatório Focado: {focus.upper()}[/bold yellow]")
-        
-        total_complexity = 0
-        total_debt_tags = 0
-        total_mpot_violations = 0
-        
-        for f in files:
-            include_file = True
-            
-            if focus == 'vulcan':
-                god_assignment = f.get("god_assignment", "Unknown")
-                complexity = f.get("complexity", 0)
-                if god_assignment in ["Anúbis", "Zeus", "Atena"] or complexity > 10:
-                    include_file = True
-                else:
-                    include_file = False
-            elif focus == 'check':
-                mpot_violations = f.get("mpot_4_violations", 0)
-                debt_tags = f.get("debt_tags", [])
-                complexity = f.get("complexity", 0)
-                if mpot_violations > 0 or len(debt_tags) > 0 or complexity > 15:
-                    include_file = True
-                else:
-                    include_file = False
-            elif focus == 'economic':
-                include_file = True
-            
-            if include_file:
-                report_files.append(f)
-                total_complexity += f.get("complexity", 0)
-                total_debt_tags += len(f.get("debt_tags", []))
-                total_mpot_violations += f.get("mpot_4_violations", 0)
-        
-        economic_summary = {
-            "total_files_scanned": len(files),
-            "total_files_in_report": len(report_files),
-            "god_distribution_in_report": _calculate_distribution(report_files),
-            "average_complexity_in_report": (total_complexity / len(report_files)) if report_files else 0,
-            "total_debt_tags_in_report": total_debt_tags,
-            "total_mpot_violations_in_report": total_mpot_violations
-        }
-        
-        if focus == 'economic':
-            summarized_report_files = []
-            for f in report_files:
-                summarized_report_files.append({
-                    "path": f.get("path"),
-                    "god_assignment": f.get("god_assignment"),
-                    "status": f.get("status"),
-                    "complexity": f.get("complexity", 0),
-                    "functions_count": len(f.get("functions", [])),
-                    "classes_count": len(f.get("classes", [])),
-                    "docstring_intent": f.get("docstring_intent", "N/A"),
-                    "debt_tags_count": len(f.get("debt_tags", [])),
-                    "mpot_violations_count": f.get("mpot_4_violations", 0)
-                })
-            report_files = summarized_report_files
-    else:
-        report_files = files
-        total_complexity = sum(f.get("complexity", 0) for f in files)
-        total_debt_tags = sum(len(f.get("debt_tags", [])) for f in files)
-        total_mpot_violations = sum(f.get("mpot_4_violations", 0) for f in files)
-        economic_summary = {
-            "total_files_scanned": len(files),
-            "total_files_in_report": len(files),
-            "god_distribution_in_report": _calculate_distribution(files),
-            "average_complexity_in_report": (total_complexity / len(files)) if files else 0,
-            "total_debt_tags_in_report": total_debt_tags,
-            "total_mpot_violations_in_report": total_mpot_violations
-        }
-    
-    if graph_depth > 0:
-        total_graph_edges = sum(len(f.get('graph_neighbors', [])) for f in files)
-        economic_summary["total_graph_edges"] = total_graph_edges
-        economic_summary["graph_depth"] = graph_depth
-
-    # 🆕 Injeção do Glossário de Deuses
-    from doxoade.commands.intelligence_systems.intelligence_utils import get_god_glossary
-    
-    report = {
-        report_type: {
-            "version": "2026.Chief.v2",
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "target_project": os.path.basename(root),
-            "token_optimization": "ENABLED" if concat else "DISABLED",
-            "focus_applied": focus if focus else "NONE"
-        },
-        "god_glossary": get_god_glossary(),  # 🆕 Glossário embutido
-        "economic_summary": economic_summary,
-        "codebase_map": report_files
-    }
-    
-    # DESVIO PARA FORMATO QWEN (PRIORIDADE MÁXIMA)
-    if ia_qwen:
-        qwen_output = output.replace('.json', '') + "_qwen.xml" if output.endswith('.json') else output + "_qwen.xml"
-        _save_qwen_report(report, qwen_output, console)
-    elif ai_export:
-        ai_output = output.replace('.json', '') + "_llm.xml" if output.endswith('.json') else output + "_llm.xml"
-        _save_llm_report(report, ai_output, console, include_source)
-#        _save_report(dossier_files, output, root, concat, focus, ai_export, ia_qwen, console, graph_depth, include_source)
-    else:
-        with open(output, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=None if concat else 2, ensure_ascii=False)
-        console.print(f"\n[bold green]✅ Dossiê NEXUS Gerado: {output}[/bold green]")
-
-def _calculate_distribution(files):
-    dist = {}
+    """Serializa uma lista já materializada de resultados (mesmo formato do fluxo incremental)."""
+    from doxoade.commands.intelligence_systems.intelligence_report import DossierWriter
+    writer = DossierWriter(output, root, concat, focus, ai_export, ia_qwen, console, graph_depth, include_source)
     for f in files:
-        g = f.get("god_assignment", "Unknown")
-        dist[g] = dist.get(g, 0) + 1
-    return dist
-    
-def _save_llm_report(report_data, output_path, console, include_source=False):
-    """Traduz o JSON arquitetural para um formato XML bem indentado e legível (PASC 11.0)."""
-    lines = []
-    meta = None
-    for key in report_data.keys():
-        if key.endswith("intelligence_report"):
-            meta = report_data[key]
-            break
-    
-    if meta:
-        lines.append('<?xml version="1.0" encoding="UTF-8"?>')
-        lines.append('<doxoade_nexus_report>')
-        lines.append(f'  <target_project>{meta.get("target_project")}</target_project>')
-        lines.append(f'  <generated_at>{meta.get("generated_at")}</generated_at>')
-        lines.append(f'  <focus_applied>{meta.get("focus_applied")}</focus_applied>')
-        
-        eco = report_data.get("economic_summary", {})
-        lines.append('  <project_summary>')
-        lines.append(f'    <total_files_scanned>{eco.get("total_files_scanned", 0)}</total_files_scanned>')
-        lines.append(f'    <total_files_in_report>{eco.get("total_files_in_report", 0)}</total_files_in_report>')
-        lines.append(f'    <average_complexity>{eco.get("average_complexity_in_report", 0):.2f}</average_complexity>')
-        lines.append(f'    <total_debt_tags>{eco.get("total_debt_tags_in_report", 0)}</total_debt_tags>')
-        
-        # 🆕 Métricas do grafo
-        if "total_graph_edges" in eco:
-            lines.append(f'    <total_graph_edges>{eco.get("total_graph_edges", 0)}</total_graph_edges>')
-            lines.append(f'    <graph_depth>{eco.get("graph_depth", 0)}</graph_depth>')
-        
-        lines.append('    <god_distribution>')
-        for god, count in eco.get("god_distribution_in_report", {}).items():
-            safe_god = god.lower().replace('ú','u').replace('ã','a').replace('é','e').replace('í','i').replace('ó','o')
-            lines.append(f'      <{safe_god}>{count}</{safe_god}>')
-        lines.append('    </god_distribution>')
-        lines.append('  </project_summary>')
-        
-        # 🆕 Glossário de Deuses
-        glossary = report_data.get("god_glossary", {})
-        if glossary:
-            lines.append('  <god_glossary>')
-            for god, desc in glossary.items():
-                safe_god = god.lower().replace('ú','u').replace('ã','a').replace('é','e').replace('í','i').replace('ó','o').replace(' ','_')
-                import html
-                desc_escaped = html.escape(desc)
-                lines.append(f'    <{safe_god}>{desc_escaped}</{safe_god}>')
-            lines.append('  </god_glossary>')
-        
-        lines.append('  <codebase_map>')
-        for f in report_data.get("codebase_map", []):
-            path = f.get('path', 'unknown')
-            god = f.get('god_assignment', 'Unknown')
-            comp = f.get('complexity', 0)
-            status = f.get('status', 'unknown')
-            lines.append(f'    <file path="{path}" role="{god}" complexity="{comp}" status="{status}">')
-            
-            classes = f.get('classes', [])
-            if classes:
-                lines.append(f'      <classes>{", ".join(str(c) for c in classes)}</classes>')
-            
-            funcs = f.get('functions', [])
-            if funcs:
-                # 🛡️ Se -s (source) está ativo, não inclui docstrings (já estão no código)
-                if include_source:
-                    funcs_str = []
-                    for fn in funcs:
-                        if isinstance(fn, str): 
-                            funcs_str.append(fn)
-                        elif isinstance(fn, dict): 
-                            funcs_str.append(str(fn.get('name', 'unknown')))
-                        else: 
-                            funcs_str.append(str(getattr(fn, 'name', fn)))
-                    lines.append(f'      <functions>{", ".join(funcs_str)}</functions>')
-                else:
-                    # Inclui docstrings quando -s NÃO está ativo
-                    has_docs = any(isinstance(fn, dict) and fn.get('docstring') for fn in funcs)
-                    if has_docs:
-                        lines.append('      <functions>')
-                        for fn in funcs:
-                            if isinstance(fn, dict):
-                                name = fn.get('name', 'unknown')
-                                doc = fn.get('docstring', '')
-                                import html
-                                doc_escaped = html.escape(doc) if doc else ''
-                                lines.append(f'        <function name="{name}">{doc_escaped}</function>')
-                            else:
-                                lines.append(f'        <function name="{fn}"></function>')
-                        lines.append('      </functions>')
-                    else:
-                        funcs_str = []
-                        for fn in funcs:
-                            if isinstance(fn, str): funcs_str.append(fn)
-                            elif isinstance(fn, dict): funcs_str.append(str(fn.get('name', 'unknown')))
-                            else: funcs_str.append(str(getattr(fn, 'name', fn)))
-                        lines.append(f'      <functions>{", ".join(funcs_str)}</functions>')
-            
-            debt = f.get('debt_tags_count', len(f.get('debt_tags', [])))
-            mpot = f.get('mpot_violations_count', f.get('mpot_4_violations', 0))
-            if debt > 0 or mpot > 0:
-                lines.append(f'      <technical_debt tags="{debt}" mpot_violations="{mpot}" />')
-            
-            # 🆕 Grafo de vizinhos
-            graph_n = f.get('graph_neighbors', [])
-            if graph_n:
-                lines.append('      <graph_neighbors>')
-                for neighbor in graph_n:
-                    lines.append(f'        <neighbor>{neighbor}</neighbor>')
-                lines.append('      </graph_neighbors>')
-            
-            src = f.get('source_minified')
-            if src:
-                safe_src = src.replace(']]>', ']]]]><![CDATA[>')
-                lines.append('      <source_code><![CDATA[')
-                for code_line in safe_src.splitlines():
-                    lines.append(code_line)
-                lines.append('      ]]></source_code>')
-            
-            lines.append('    </file>')
-        
-        lines.append('  </codebase_map>')
-        lines.append('</doxoade_nexus_report>')
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
-        console.print(f"\n[bold magenta]🤖 Dossiê LLM-Ready Gerado: {output_path}[/bold magenta]")
+        writer.add(f)
+    return writer.close()
 
-def _save_qwen_report(report_data, output_path, console):
-    """
-    Gera relatório no formato nativo de Tool Calling do Qwen.
-    VERSÃO FINAL: Remove TODOS os espaços e valida estrutura XML.
-    """
-    import json as _json
-    import html
-    
-    lines = []
-    
-    # 1. Extrair metadados
-    meta = next((v for k, v in report_data.items() if k.endswith("intelligence_report")), None)
-    if not meta:
-        console.print("[bold red]✘ Metadados do relatório não encontrados.[/bold red]")
-        return
-    
-    eco = report_data.get("economic_summary", {})
-    codebase = report_data.get("codebase_map", [])
-    
-    # 2. BLOCO DE RACIOCÍNIO PRÉVIO (sem espaços extras)
-    lines.append("<think>")
-    lines.append(f"Analisando codebase do projeto: {meta.get('target_project', 'Desconhecido')}.")
-    lines.append(f"Total de arquivos escaneados: {eco.get('total_files_scanned', 0)}.")
-    lines.append(f"Filtros aplicados: {meta.get('focus_applied', 'NONE')}.")
-    lines.append("")
-    lines.append("Distribuição de responsabilidades (God Assignment):")
-    for god, count in eco.get("god_distribution_in_report", {}).items():
-        lines.append(f"  - {god}: {count} arquivos")
-    lines.append("")
-    lines.append(f"Complexidade média: {eco.get('average_complexity_in_report', 0):.2f}")
-    lines.append(f"Total de debt tags: {eco.get('total_debt_tags_in_report', 0)}")
-    lines.append(f"Total de MPoT violations: {eco.get('total_mpot_violations_in_report', 0)}")
-    lines.append("")
-    lines.append("Estruturando o codebase_map como JSON serializado dentro de CDATA para processamento seguro.")
-    lines.append("</think>")
-    lines.append("")
-    
-    # 3. BLOCO PRINCIPAL DE TOOL CALLING (SEM ESPAÇOS NAS TAGS)
-    lines.append("<tool_call>")
-    lines.append("<function=doxoade_nexus_report>")
-    
-    # Parâmetros simples (escapados, SEM espaços, com strip())
-    target = html.escape(str(meta.get('target_project', '')).strip())
-    gen_at = html.escape(str(meta.get('generated_at', '')).strip())
-    version = html.escape(str(meta.get('version', '')).strip())
-    focus = html.escape(str(meta.get('focus_applied', '')).strip())
-    
-    lines.append(f"<parameter=target_project>{target}</parameter=target_project>")
-    lines.append(f"<parameter=generated_at>{gen_at}</parameter=generated_at>")
-    lines.append(f"<parameter=report_version>{version}</parameter=report_version>")
-    lines.append(f"<parameter=focus_applied>{focus}</parameter=focus_applied>")
-    
-    # Parâmetros complexos (JSON COMPACTO sem espaços, dentro de CDATA válido)
-    # IMPORTANTE: separators=(',', ':') remove TODOS os espaços do JSON
-    eco_json = _json.dumps(eco, ensure_ascii=False, separators=(',', ':'))
-    codebase_json = _json.dumps(codebase, ensure_ascii=False, separators=(',', ':'))
-    
-    lines.append(f"<parameter=economic_summary><![CDATA[{eco_json}]]></parameter=economic_summary>")
-    lines.append(f"<parameter=codebase_map><![CDATA[{codebase_json}]]></parameter=codebase_map>")
-    
-    lines.append("</function>")
-    lines.append("</tool_call>")
-    
-    # 4. Escrita segura (UTF-8)
-    try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(lines))
-        console.print(f"\n[bold magenta]🧠 Dossiê Qwen-Ready Gerado: {output_path}[/bold magenta]")
-        console.print(f"[dim]   Formato: tool_call nativo + <think> + CDATA seguro[/dim]")
-    except Exception as e:
-        console.print(f"[bold red]✘ Falha ao gerar XML Qwen: {e}[/bold red]")
-        
 def _run_analyze_coverage(scan_paths, cli_excludes, verbose, ext_excludes):
     """Auditoria de Cobertura: Blacklist, Extensões e Integridade de Parsing (Nexus Scan)."""
     from doxoade.commands.intelligence_systems.intelligence_engine import analyze_file_chief
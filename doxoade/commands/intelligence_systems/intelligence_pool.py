@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# doxoade/commands/intelligence_systems/intelligence_pool.py
+"""
+Pipeline Paralelo do Dossiê (MPoT-17).
+- analyze_file_chief distribuído num ProcessPoolExecutor (AST/minificação são CPU-bound).
+- Resultados entregues em ordem, janela a janela: memória limitada a WINDOW resultados.
+- Cache por hash de conteúdo em .doxoade_cache/intelligence_cache.db: após uma
+  edição pequena, só os arquivos alterados voltam ao motor.
+"""
+import os
+import json
+import hashlib
+import doxoade.tools.aegis.nexus_db as sqlite3  # noqa
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+CACHE_FILE = 'intelligence_cache.db'
+CACHE_SCHEMA = 1
+WINDOW = 256
+MIN_PARALLEL = 16
+NATIVE_EXTS = ('.pyd', '.so', '.dll', '.exe')
+
+def analyze_job(job: tuple) -> Optional[dict]:
+    """Unidade de trabalho do pool (nível de módulo para ser picklável)."""
+    from doxoade.commands.intelligence_systems.intelligence_engine import analyze_file_chief
+    from doxoade.commands.intelligence_systems.intelligence_utils import minify_code
+    file_path, root, docs, source, no_comments, no_spaces = job
+    try:
+        res = analyze_file_chief(file_path, root, docs=docs, source=source)
+        if not (res and isinstance(res, dict) and 'size' in res):
+            return None
+        src = res.get('source_minified')
+        if src and (no_comments or no_spaces):
+            res['source_minified'] = minify_code(src, file_path, no_comments, no_spaces)
+        return res
+    except Exception:
+        return None
+
+def content_digest(file_path: str, options: tuple) -> Optional[str]:
+    """Hash de conteúdo + opções + camadas de backup (que alimentam archaeology_layers)."""
+    from doxoade.commands.intelligence_systems.intelligence_engine import _get_safe_backups
+    try:
+        h = hashlib.sha256(Path(file_path).read_bytes())
+        extra = [CACHE_SCHEMA, list(options)]
+        if file_path.endswith(NATIVE_EXTS):
+            extra.append(os.stat(file_path).st_mtime_ns)
+        elif file_path.endswith('.py'):
+            extra.append([(b, os.stat(b).st_mtime_ns) for b in _get_safe_backups(file_path)])
+    except OSError:
+        return None
+    h.update(json.dumps(extra).encode('utf-8'))
+    return h.hexdigest()
+
+class DossierCache:
+    """Resultados por arquivo: (caminho relativo, digest) -> JSON do analyze_file_chief."""
+
+    def __init__(self, root: str):
+        cache_dir = Path(root) / '.doxoade_cache'
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_dir / CACHE_FILE))
+        self.conn.execute('CREATE TABLE IF NOT EXISTS results (path TEXT PRIMARY KEY, digest TEXT NOT NULL, payload TEXT NOT NULL)')
+
+    def lookup(self, keys: List[Tuple[str, str]]) -> dict:
+        found = {}
+        for rel, digest in keys:
+            row = self.conn.execute('SELECT digest, payload FROM results WHERE path = ?', (rel,)).fetchone()
+            if row and row[0] == digest:
+                found[rel] = json.loads(row[1])
+        return found
+
+    def store(self, rows: List[Tuple[str, str, dict]]):
+        if not rows:
+            return
+        with self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO results (path, digest, payload) VALUES (?, ?, ?)', [(rel, digest, json.dumps(res, ensure_ascii=False)) for rel, digest, res in rows])
+
+    def close(self):
+        self.conn.close()
+
+def iter_dossier_results(files: Iterable[str], root: str, docs=False, source=False, no_comments=False, no_spaces=False, workers: int=0, use_cache: bool=True) -> Iterator[Tuple[str, Optional[dict]]]:
+    """
+    Gera (arquivo, resultado|None) na ordem de entrada.
+    workers: 0 = os.cpu_count(); 1 = serial no próprio processo.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+    options = (docs, source, no_comments, no_spaces)
+    workers = workers or os.cpu_count() or 1
+    cache = None
+    if use_cache:
+        try:
+            cache = DossierCache(root)
+        except (OSError, sqlite3.Error):
+            cache = None
+    pool = None
+    files = list(files)
+    try:
+        for start in range(0, len(files), WINDOW):
+            window = files[start:start + WINDOW]
+            rels = {f: os.path.relpath(f, root).replace('\\', '/') for f in window}
+            digests = {f: content_digest(f, options) for f in window} if cache else {}
+            hits = cache.lookup([(rels[f], d) for f, d in digests.items() if d]) if cache else {}
+            misses = [f for f in window if rels[f] not in hits]
+            jobs = [(f, root) + options for f in misses]
+            fresh = None
+            if workers > 1 and len(misses) >= MIN_PARALLEL:
+                try:
+                    if pool is None:
+                        pool = ProcessPoolExecutor(max_workers=workers)
+                    fresh = list(pool.map(analyze_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+                except (BrokenProcessPool, OSError):
+                    workers, pool, fresh = 1, None, None  # Ambiente sem fork/spawn: segue serial.
+            if fresh is None:
+                fresh = [analyze_job(job) for job in jobs]
+            computed = dict(zip(misses, fresh))
+            if cache:
+                cache.store([(rels[f], digests[f], res) for f, res in computed.items() if res is not None and digests.get(f)])
+            for f in window:
+                yield f, hits[rels[f]] if rels[f] in hits else computed.get(f)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if cache:
+            cache.close()
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+# doxoade/commands/intelligence_systems/intelligence_report.py
+"""
+Escritor Incremental do Dossiê (JSON / LLM XML / Qwen XML).
+Cada arquivo analisado é filtrado (focus), somado ao economic_summary e gravado
+num spool em disco; ao fechar, cabeçalho + sumário + spool formam a saída final.
+A saída é idêntica à serialização do relatório completo em memória.
+"""
+import os
+import html
+import json
+import shutil
+import tempfile
+from datetime import datetime, timezone
+
+from doxoade.commands.intelligence_systems.intelligence_utils import get_god_glossary
+
+def _calculate_distribution(files):
+    dist = {}
+    for f in files:
+        g = f.get("god_assignment", "Unknown")
+        dist[g] = dist.get(g, 0) + 1
+    return dist
+
+def _safe_tag(name: str) -> str:
+    return name.lower().replace('ú','u').replace('ã','a').replace('é','e').replace('í','i').replace('ó','o')
+
+def _focus_filter(focus, f) -> bool:
+    if focus == 'vulcan':
+        return f.get("god_assignment", "Unknown") in ["Anúbis", "Zeus", "Atena"] or f.get("complexity", 0) > 10
+    if focus == 'check':
+        return f.get("mpot_4_violations", 0) > 0 or len(f.get("debt_tags", [])) > 0 or f.get("complexity", 0) > 15
+    return True
+
+def _economic_entry(f) -> dict:
+    return {
+        "path": f.get("path"),
+        "god_assignment": f.get("god_assignment"),
+        "status": f.get("status"),
+        "complexity": f.get("complexity", 0),
+        "functions_count": len(f.get("functions", [])),
+        "classes_count": len(f.get("classes", [])),
+        "docstring_intent": f.get("docstring_intent", "N/A"),
+        "debt_tags_count": len(f.get("debt_tags", [])),
+        "mpot_violations_count": f.get("mpot_4_violations", 0)
+    }
+
+def _function_names(funcs) -> list:
+    names = []
+    for fn in funcs:
+        if isinstance(fn, str): names.append(fn)
+        elif isinstance(fn, dict): names.append(str(fn.get('name', 'unknown')))
+        else: names.append(str(getattr(fn, 'name', fn)))
+    return names
+
+def llm_file_lines(f, include_source=False) -> list:
+    """Bloco <file> do formato LLM para uma entrada do codebase_map."""
+    lines = []
+    path = f.get('path', 'unknown')
+    god = f.get('god_assignment', 'Unknown')
+    comp = f.get('complexity', 0)
+    status = f.get('status', 'unknown')
+    lines.append(f'    <file path="{path}" role="{god}" complexity="{comp}" status="{status}">')
+
+    classes = f.get('classes', [])
+    if classes:
+        lines.append(f'      <classes>{", ".join(str(c) for c in classes)}</classes>')
+
+    funcs = f.get('functions', [])
+    if funcs:
+        # 🛡️ Se -s (source) está ativo, não inclui docstrings (já estão no código)
+        if not include_source and any(isinstance(fn, dict) and fn.get('docstring') for fn in funcs):
+            lines.append('      <functions>')
+            for fn in funcs:
+                if isinstance(fn, dict):
+                    doc = fn.get('docstring', '')
+                    lines.append(f'        <function name="{fn.get("name", "unknown")}">{html.escape(doc) if doc else ""}</function>')
+                else:
+                    lines.append(f'        <function name="{fn}"></function>')
+            lines.append('      </functions>')
+        else:
+            lines.append(f'      <functions>{", ".join(_function_names(funcs))}</functions>')
+
+    debt = f.get('debt_tags_count', len(f.get('debt_tags', [])))
+    mpot = f.get('mpot_violations_count', f.get('mpot_4_violations', 0))
+    if debt > 0 or mpot > 0:
+        lines.append(f'      <technical_debt tags="{debt}" mpot_violations="{mpot}" />')
+
+    graph_n = f.get('graph_neighbors', [])
+    if graph_n:
+        lines.append('      <graph_neighbors>')
+        for neighbor in graph_n:
+            lines.append(f'        <neighbor>{neighbor}</neighbor>')
+        lines.append('      </graph_neighbors>')
+
+    src = f.get('source_minified')
+    if src:
+        safe_src = src.replace(']]>', ']]]]><![CDATA[>')
+        lines.append('      <source_code><![CDATA[')
+        lines.extend(safe_src.splitlines())
+        lines.append('      ]]></source_code>')
+
+    lines.append('    </file>')
+    return lines
+
+class DossierWriter:
+    """Recebe entradas uma a uma (add) e materializa o dossiê em close()."""
+
+    def __init__(self, output, root, concat=False, focus=None, ai_export=False, ia_qwen=False, console=None, graph_depth=0, include_source=False):
+        self.root = root
+        self.concat = concat
+        self.focus = focus
+        self.graph_depth = graph_depth
+        self.include_source = include_source
+        self.console = console
+        if ia_qwen:
+            self.fmt = 'qwen'
+            self.output = output.replace('.json', '') + "_qwen.xml" if output.endswith('.json') else output + "_qwen.xml"
+        elif ai_export:
+            self.fmt = 'llm'
+            self.output = output.replace('.json', '') + "_llm.xml" if output.endswith('.json') else output + "_llm.xml"
+        else:
+            self.fmt = 'json'
+            self.output = output
+        self.report_type = f"{focus}_intelligence_report" if focus else "nexus_intelligence_report"
+        self.scanned = 0
+        self.in_report = 0
+        self.complexity = 0
+        self.debt_tags = 0
+        self.mpot = 0
+        self.graph_edges = 0
+        self.gods = {}
+        self.spool = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+        if focus and console:
+            console.print(f"[bold yellow]⚡ Gerando Relatório Focado: {focus.upper()}[/bold yellow]")
+
+    def add(self, f: dict):
+        self.scanned += 1
+        self.graph_edges += len(f.get('graph_neighbors', []))
+        if not _focus_filter(self.focus, f):
+            return
+        self.complexity += f.get("complexity", 0)
+        self.debt_tags += len(f.get("debt_tags", []))
+        self.mpot += f.get("mpot_4_violations", 0)
+        god = f.get("god_assignment", "Unknown")
+        self.gods[god] = self.gods.get(god, 0) + 1
+        entry = _economic_entry(f) if self.focus == 'economic' else f
+        first = self.in_report == 0
+        self.in_report += 1
+        if self.fmt == 'llm':
+            self.spool.write("\n" + "\n".join(llm_file_lines(entry, self.include_source)))
+        elif self.fmt == 'qwen':
+            self.spool.write(("" if first else ",") + json.dumps(entry, ensure_ascii=False, separators=(',', ':')))
+        elif self.concat:
+            self.spool.write(("" if first else ", ") + json.dumps(entry, ensure_ascii=False))
+        else:
+            body = json.dumps(entry, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+            self.spool.write(("\n    " if first else ",\n    ") + body)
+
+    def economic_summary(self) -> dict:
+        summary = {
+            "total_files_scanned": self.scanned,
+            "total_files_in_report": self.in_report,
+            "god_distribution_in_report": self.gods,
+            "average_complexity_in_report": (self.complexity / self.in_report) if self.in_report else 0,
+            "total_debt_tags_in_report": self.debt_tags,
+            "total_mpot_violations_in_report": self.mpot
+        }
+        if self.graph_depth > 0:
+            summary["total_graph_edges"] = self.graph_edges
+            summary["graph_depth"] = self.graph_depth
+        return summary
+
+    def meta(self) -> dict:
+        return {
+            "version": "2026.Chief.v2",
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "target_project": os.path.basename(self.root),
+            "token_optimization": "ENABLED" if self.concat else "DISABLED",
+            "focus_applied": self.focus if self.focus else "NONE"
+        }
+
+    def close(self) -> str:
+        try:
+            self.spool.flush()
+            self.spool.seek(0)
+            if self.fmt == 'qwen':
+                try:
+                    self._write_qwen()
+                    self.console.print(f"\n[bold magenta]🧠 Dossiê Qwen-Ready Gerado: {self.output}[/bold magenta]")
+                    self.console.print(f"[dim]   Formato: tool_call nativo + <think> + CDATA seguro[/dim]")
+                except Exception as e:
+                    self.console.print(f"[bold red]✘ Falha ao gerar XML Qwen: {e}[/bold red]")
+            elif self.fmt == 'llm':
+                self._write_llm()
+                self.console.print(f"\n[bold magenta]🤖 Dossiê LLM-Ready Gerado: {self.output}[/bold magenta]")
+            else:
+                self._write_json()
+                self.console.print(f"\n[bold green]✅ Dossiê NEXUS Gerado: {self.output}[/bold green]")
+        finally:
+            self.spool.close()
+        return self.output
+
+    def _write_json(self):
+        head = [(self.report_type, self.meta()), ("god_glossary", get_god_glossary()), ("economic_summary", self.economic_summary())]
+        with open(self.output, 'w', encoding='utf-8') as out:
+            if self.concat:
+                out.write("{" + "".join(f"{json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}, " for k, v in head) + '"codebase_map": [')
+                shutil.copyfileobj(self.spool, out)
+                out.write("]}")
+                return
+            out.write("{")
+            for k, v in head:
+                out.write(f"\n  {json.dumps(k)}: " + json.dumps(v, indent=2, ensure_ascii=False).replace("\n", "\n  ") + ",")
+            if not self.in_report:
+                out.write('\n  "codebase_map": []\n}')
+                return
+            out.write('\n  "codebase_map": [')
+            shutil.copyfileobj(self.spool, out)
+            out.write("\n  ]\n}")
+
+    def _write_llm(self):
+        meta, eco = self.meta(), self.economic_summary()
+        lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<doxoade_nexus_report>']
+        lines.append(f'  <target_project>{meta.get("target_project")}</target_project>')
+        lines.append(f'  <generated_at>{meta.get("generated_at")}</generated_at>')
+        lines.append(f'  <focus_applied>{meta.get("focus_applied")}</focus_applied>')
+        lines.append('  <project_summary>')
+        lines.append(f'    <total_files_scanned>{eco.get("total_files_scanned", 0)}</total_files_scanned>')
+        lines.append(f'    <total_files_in_report>{eco.get("total_files_in_report", 0)}</total_files_in_report>')
+        lines.append(f'    <average_complexity>{eco.get("average_complexity_in_report", 0):.2f}</average_complexity>')
+        lines.append(f'    <total_debt_tags>{eco.get("total_debt_tags_in_report", 0)}</total_debt_tags>')
+        if "total_graph_edges" in eco:
+            lines.append(f'    <total_graph_edges>{eco.get("total_graph_edges", 0)}</total_graph_edges>')
+            lines.append(f'    <graph_depth>{eco.get("graph_depth", 0)}</graph_depth>')
+        lines.append('    <god_distribution>')
+        for god, count in eco.get("god_distribution_in_report", {}).items():
+            lines.append(f'      <{_safe_tag(god)}>{count}</{_safe_tag(god)}>')
+        lines.append('    </god_distribution>')
+        lines.append('  </project_summary>')
+        glossary = get_god_glossary()
+        if glossary:
+            lines.append('  <god_glossary>')
+            for god, desc in glossary.items():
+                tag = _safe_tag(god).replace(' ', '_')
+                lines.append(f'    <{tag}>{html.escape(desc)}</{tag}>')
+            lines.append('  </god_glossary>')
+        lines.append('  <codebase_map>')
+        with open(self.output, 'w', encoding='utf-8') as out:
+            out.write("\n".join(lines))
+            shutil.copyfileobj(self.spool, out)
+            out.write("\n  </codebase_map>\n</doxoade_nexus_report>")
+
+    def _write_qwen(self):
+        meta, eco = self.meta(), self.economic_summary()
+        lines = ["<think>"]
+        lines.append(f"Analisando codebase do projeto: {meta.get('target_project', 'Desconhecido')}.")
+        lines.append(f"Total de arquivos escaneados: {eco.get('total_files_scanned', 0)}.")
+        lines.append(f"Filtros aplicados: {meta.get('focus_applied', 'NONE')}.")
+        lines.append("")
+        lines.append("Distribuição de responsabilidades (God Assignment):")
+        for god, count in eco.get("god_distribution_in_report", {}).items():
+            lines.append(f"  - {god}: {count} arquivos")
+        lines.append("")
+        lines.append(f"Complexidade média: {eco.get('average_complexity_in_report', 0):.2f}")
+        lines.append(f"Total de debt tags: {eco.get('total_debt_tags_in_report', 0)}")
+        lines.append(f"Total de MPoT violations: {eco.get('total_mpot_violations_in_report', 0)}")
+        lines.append("")
+        lines.append("Estruturando o codebase_map como JSON serializado dentro de CDATA para processamento seguro.")
+        lines.append("</think>")
+        lines.append("")
+        lines.append("<tool_call>")
+        lines.append("<function=doxoade_nexus_report>")
+        # Parâmetros simples (escapados, SEM espaços, com strip())
+        for param, value in (('target_project', meta.get('target_project', '')), ('generated_at', meta.get('generated_at', '')), ('report_version', meta.get('version', '')), ('focus_applied', meta.get('focus_applied', ''))):
+            lines.append(f"<parameter={param}>{html.escape(str(value).strip())}</parameter={param}>")
+        # IMPORTANTE: separators=(',', ':') remove TODOS os espaços do JSON
+        eco_json = json.dumps(eco, ensure_ascii=False, separators=(',', ':'))
+        lines.append(f"<parameter=economic_summary><![CDATA[{eco_json}]]></parameter=economic_summary>")
+        with open(self.output, 'w', encoding='utf-8') as out:
+            out.write("\n".join(lines) + "\n<parameter=codebase_map><![CDATA[[")
+            shutil.copyfileobj(self.spool, out)
+            out.write("]]]></parameter=codebase_map>\n</function>\n</tool_call>")
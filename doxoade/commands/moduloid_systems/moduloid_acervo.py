@@ -25,7 +25,7 @@ from doxoade.commands.check_systems.check_engine import run_audit_engine
 from doxoade.commands.security_systems.maat_engine_integration import run_internal_security_audit
 from doxoade.commands.init import _refactor_to_silo
 
-from doxoade.core_database import get_db_connection, get_active_db_path, DB_FILE
+from doxoade.core_database import get_db_connection, get_active_db_path, DB_FILE, sweep_moduloid_orphans
 from doxoade.tools.core_locator import CORE_ROOT
 
 from doxoade.tools.alexandria.engine import alexandria_write
@@ -95,6 +95,70 @@ DEDUCAO_POR_RELACAO = {
     "mergeSort(":   "Coleção Ordenada (Recursiva)" # Adicionado para o MergeSort
 }
 
+_FUNC_SEP = '\x1f'
+_LIST_FUNCS = 8
+
+def _acervo_query(conn, search=None, func_filter=None):
+    """
+    SELECT do 'list': filtros via FTS5 trigram (substring, como o antigo LIKE) e
+    capacidades normalizadas; JSON decodificado no SQLite, só o que o card exibe.
+    Sem o índice (SQLite sem FTS5/banco não migrado) cai no LIKE original.
+    """
+    from doxoade.core_database import fts_phrase, has_table
+    cursor = conn.cursor()
+    has_fts = has_table(cursor, 'moduloid_acervo_fts')
+    has_caps = has_table(cursor, 'moduloid_capabilities')
+    where, params = [], []
+    if search:
+        phrase = fts_phrase(search) if has_fts else None
+        if phrase:
+            where.append("id IN (SELECT rowid FROM moduloid_acervo_fts WHERE moduloid_acervo_fts MATCH ?)")
+            params.append('{name category docstring} : ' + phrase)
+        else:
+            where.append("(name LIKE ? OR category LIKE ? OR docstring LIKE ?)")
+            params.extend([f"%{search}%"] * 3)
+    if func_filter:
+        phrase = fts_phrase(func_filter) if has_fts else None
+        if phrase:
+            where.append("id IN (SELECT rowid FROM moduloid_acervo_fts WHERE moduloid_acervo_fts MATCH ?)")
+            params.append('capabilities : ' + phrase)
+        elif has_caps:
+            where.append("id IN (SELECT brick_id FROM moduloid_capabilities WHERE name LIKE ?)")
+            params.append(f"%{func_filter}%")
+        else:
+            where.append("capabilities LIKE ?")
+            params.append(f"%{func_filter}%")
+    caps = "json_each(CASE WHEN json_valid(capabilities) THEN capabilities ELSE '[]' END)"
+    health = "CASE WHEN json_valid(health_report) THEN health_report END"
+    query = (f"SELECT name, version, category, docstring, quality_score, security_status, "
+             f"(SELECT group_concat(value, char(31)) FROM (SELECT value FROM {caps} LIMIT {_LIST_FUNCS})) AS funcs, "
+             f"({health}) IS NOT NULL AS has_health, json_extract({health}, '$.size_kb') AS size_kb, "
+             f"json_extract({health}, '$.lines') AS lines, json_extract({health}, '$.issues') AS issues "
+             f"FROM moduloid_acervo")
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    return query, params
+
+_WORKER = None
+
+def _init_refresh_worker():
+    global _WORKER
+    # Instância sem o auto-heal do __init__: o processo pai já garantiu o esquema.
+    _WORKER = AcervoEngine.__new__(AcervoEngine)
+
+def _analyze_brick_task(file_path):
+    return _WORKER._analyze_brick(file_path)
+
+def _analyze_bricks(paths, jobs=None):
+    """Metadados dos bricks, na ordem de 'paths'; processos paralelos quando há mais de um."""
+    jobs = jobs or min(8, os.cpu_count() or 1)
+    if jobs <= 1 or len(paths) <= 1:
+        _init_refresh_worker()
+        return [_analyze_brick_task(p) for p in paths]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_refresh_worker) as pool:
+        return list(pool.map(_analyze_brick_task, paths))
+
 class AcervoEngine:
     def __init__(self):
         BRICKS_DIR.mkdir(parents=True, exist_ok=True)
@@ -302,40 +366,43 @@ class AcervoEngine:
             print(f"\033[31m  ■ Type: {type(e).__name__} | Value: {e}\033[0m")
             return None
 
-    def refresh_acervo(self, force=False):
-        """Sincronização Diferencial: Velocidade Industrial."""
+    def refresh_acervo(self, force=False, jobs=None):
+        """Sincronização Diferencial: bricks alterados analisados em paralelo, gravados num único lote."""
         click.secho("[*] Iniciando Smart Refresh (Diferencial)...", fg="cyan")
         conn = get_db_connection()
-        conn.row_factory = __import__('sqlite3').Row
-        
-        # Mapeia estado atual do banco {nome: ultima_atualizacao}
-        db_state = {r['name']: r['last_updated'] for r in conn.execute("SELECT name, last_updated FROM moduloid_acervo").fetchall()}
-        
-        count_upd, count_skip = 0, 0
-        
-        for brick_file in BRICKS_DIR.glob("*.py"):
-            name = brick_file.stem
-            mtime = datetime.fromtimestamp(brick_file.stat().st_mtime).isoformat()
-            
-            # [MTIME-SHIELD] Só processa se o arquivo for mais novo que o registro ou se for 'force'
-            if not force and name in db_state and db_state[name] >= mtime:
-                count_skip += 1
-                continue
-            
-            meta = self._analyze_brick(brick_file)
-            if meta:
-                alexandria_write('''
+        try:
+            # Mapeia estado atual do banco {nome: ultima_atualizacao}
+            db_state = {r['name']: r['last_updated'] for r in conn.execute("SELECT name, last_updated FROM moduloid_acervo").fetchall()}
+
+            stale, count_skip = [], 0
+            for brick_file in BRICKS_DIR.glob("*.py"):
+                name = brick_file.stem
+                if name not in db_state:
+                    continue  # UPDATE não teria linha para atualizar
+                mtime = datetime.fromtimestamp(brick_file.stat().st_mtime).isoformat()
+                # [MTIME-SHIELD] Só processa se o arquivo for mais novo que o registro ou se for 'force'
+                if not force and db_state[name] and db_state[name] >= mtime:
+                    count_skip += 1
+                    continue
+                stale.append((brick_file, mtime))
+
+            updates = []
+            for (brick_file, mtime), meta in zip(stale, _analyze_bricks([str(b) for b, _ in stale], jobs)):
+                if meta:
+                    updates.append((meta['doc'], meta['capabilities'], meta['score'], meta['sec'], meta['health'], mtime, brick_file.stem))
+                    click.echo(f"   {Fore.GREEN}↻{Style.RESET_ALL} {brick_file.stem} (Score: {meta['score']})")
+
+            with conn:
+                conn.executemany('''
                     UPDATE moduloid_acervo 
                     SET docstring = ?, capabilities = ?, quality_score = ?, 
                         security_status = ?, health_report = ?, last_updated = ?
                     WHERE name = ?
-                ''', (meta['doc'], meta['capabilities'], meta['score'], 
-                      meta['sec'], meta['health'], mtime, name))
-                click.echo(f"   {Fore.GREEN}↻{Style.RESET_ALL} {name} (Score: {meta['score']})")
-                count_upd += 1
-        
-        conn.commit(); conn.close()
-        click.secho(f"✅ Sincronia concluída. Atualizados: {count_upd} | Mantidos: {count_skip}", fg="green", bold=True)
+                ''', updates)
+                sweep_moduloid_orphans(conn.cursor())
+        finally:
+            conn.close()
+        click.secho(f"✅ Sincronia concluída. Atualizados: {len(updates)} | Mantidos: {count_skip}", fg="green", bold=True)
 
     def _sanitize_source(self, file_path):
         """Limpeza Industrial: Prepara o código para o Estado de Ouro."""
@@ -386,6 +453,7 @@ class AcervoEngine:
             ''', (final_name, category, f"{final_name}.py", meta['doc'], meta['capabilities'], 
                   version, datetime.now().isoformat(), os.getcwd(), 
                   meta['score'], meta['sec'], meta['health']))
+            sweep_moduloid_orphans(conn.cursor())  # o REPLACE deixa as capacidades do id antigo
             conn.commit()  # ← Força commit imediato
             
             shutil.copy2(file_path, dest_path)
@@ -422,19 +490,7 @@ class AcervoEngine:
     def list_acervo(self, search=None, func_filter=None):
         """Lista o patrimônio com UI de Alta Visibilidade (V39)."""
         conn = get_db_connection()
-        query = "SELECT * FROM moduloid_acervo"
-        params = []
-        
-        if search or func_filter:
-            query += " WHERE "
-            if search:
-                query += "(name LIKE ? OR category LIKE ?)"
-                params.extend([f"%{search}%", f"%{search}%"])
-            if func_filter:
-                if search: query += " AND "
-                query += "capabilities LIKE ?"
-                params.append(f"%{func_filter}%")
-        
+        query, params = _acervo_query(conn, search, func_filter)
         rows = conn.execute(query, params).fetchall()
         conn.close()
 
@@ -444,7 +500,7 @@ class AcervoEngine:
 
         click.secho(f"\n--- 🏛️  ACERVO DE MODULOIDS ({len(rows)} Bricks) ---", fg="cyan", bold=True)
         for r in rows:
-            funcs = json.loads(r['capabilities'])
+            funcs = r['funcs'].split(_FUNC_SEP) if r['funcs'] else []
             score = r['quality_score']
             
             # Definição de Cores Dinâmicas
@@ -457,24 +513,24 @@ class AcervoEngine:
                        f"{color_sec}[🛡️ {r['security_status']}]{Style.RESET_ALL}")
             
             # EXIBIÇÃO DA CATEGORIA (Destaque Magenta)
-            click.echo(f"   {Fore.MAGENTA}🏷️  Categoria: {Style.BRIGHT}{r['category'].upper()}{Style.RESET_ALL}")
+            click.echo(f"   {Fore.MAGENTA}🏷️  Categoria: {Style.BRIGHT}{(r['category'] or '').upper()}{Style.RESET_ALL}")
 
-            if r['health_report']:
-                h = json.loads(r['health_report'])
-                click.echo(f"   {Style.DIM}⚖️ {h.get('size_kb')}KB | {h.get('lines')} linhas | ⚠️ {h.get('issues')} avisos")
+            if r['has_health']:
+                click.echo(f"   {Style.DIM}⚖️ {r['size_kb']}KB | {r['lines']} linhas | ⚠️ {r['issues']} avisos")
             
             # Tratamento da Descrição e IO
-            proposito = r['docstring'].split(" [In:")[0]
+            docstring = r['docstring'] or ''
+            proposito = docstring.split(" [In:")[0]
             click.echo(f"   {Fore.CYAN}Propósito: {Style.RESET_ALL}{proposito}")
             
-            in_m = re.search(r"\[In: (.*?)\]", r['docstring'])
+            in_m = re.search(r"\[In: (.*?)\]", docstring)
             if in_m: click.echo(f"       {Fore.LIGHTGREEN_EX}IN  ➔ {in_m.group(1)}{Style.RESET_ALL}")
-            out_m = re.search(r"\[Out: (.*?)\]", r['docstring'])
+            out_m = re.search(r"\[Out: (.*?)\]", docstring)
             if out_m: click.echo(f"       {Fore.LIGHTRED_EX}OUT ➔ {out_m.group(1)}{Style.RESET_ALL}")
             
             # Funções Internas
             funcs_fmt = [f"{Fore.YELLOW}{Style.BRIGHT}{f}{Style.RESET_ALL}" if func_filter and func_filter.lower() in f.lower() else f for f in funcs]
-            click.echo(f"   {Fore.WHITE}ƒ {Style.DIM}{', '.join(funcs_fmt[:8])}")
+            click.echo(f"   {Fore.WHITE}ƒ {Style.DIM}{', '.join(funcs_fmt)}")
         
         click.echo("")
 
@@ -594,7 +650,7 @@ def moduloid_save(path, cat, name):
     AcervoEngine().save_to_acervo(path, cat, custom_name=name)
 
 @moduloid_group.command('list')
-@click.option('--search', '-s', help='Buscar por nome ou categoria')
+@click.option('--search', '-s', help='Buscar por nome, categoria ou propósito')
 @click.option('--func', '-f', help='Buscar por nome de função interna')
 def moduloid_list(search, func):
     """Lista o acervo. Ex: list --func partition"""
@@ -609,9 +665,11 @@ def moduloid_pull(name, target_dir, up):
     AcervoEngine().pull_to_project(name, target_dir, open_editor=up)
     
 @moduloid_group.command('refresh')
-def moduloid_refresh():
+@click.option('--force', is_flag=True, help='Reanalisa todos os bricks, mesmo os inalterados.')
+@click.option('--jobs', '-j', default=0, help='Processos de análise (0 = automático).')
+def moduloid_refresh(force, jobs):
     """Atualiza o acervo com as novas regras taxonômicas."""
-    AcervoEngine().refresh_acervo()
+    AcervoEngine().refresh_acervo(force=force, jobs=jobs or None)
     
 @moduloid_group.command('build')
 @click.argument('modules', nargs=-1, required=True)
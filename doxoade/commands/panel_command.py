@@ -2,11 +2,16 @@
 """
 doxoade panel — Verificação de saúde do CLI.
 
-Executa smoke tests em todos os subcomandos registrados:
+Executa smoke tests em todos os subcomandos registrados no grupo Click vivo:
   - Importação dos módulos (detecta SyntaxError e ImportError)
-  - Invocação com --help (detecta erros em tempo de carga do Click)
+  - Renderização do --help em contexto isolado (detecta erros de carga do Click)
   - Compilação estática dos arquivos do projeto
 
+Tudo roda no mesmo processo: cada módulo é compilado uma única vez e o
+relatório traz percentis de tempo de importação dos módulos de comando, de
+resolução dos subcomandos (get_command) e de renderização do help. PATH só
+delimita a varredura de sintaxe; os comandos vêm sempre do grupo Click vivo.
+
 Uso:
   doxoade panel               # verificação completa
   doxoade panel --fast        # só importações (sem invocar --help)
@@ -16,7 +21,7 @@ from __future__ import annotations
 
 import importlib
 import importlib.util
-import subprocess
+import statistics
 import sys
 import time
 
@@ -38,7 +43,14 @@ class CommandHealth:
     help_ok: bool = False
     import_error: str = ''
     help_error: str = ''
-    duration_ms: float = 0.0
+    import_ms: float = 0.0
+    help_ms: float = 0.0
+    lookup_ms: float = 0.0
+    subcommand: bool = False
+
+    @property
+    def duration_ms(self) -> float:
+        return self.import_ms + self.lookup_ms + self.help_ms
 
     @property
     def healthy(self) -> bool:
@@ -67,6 +79,14 @@ class PanelReport:
     def broken_commands(self) -> int:
         return len(self.commands) - self.healthy_commands
 
+    def timings(self) -> dict[str, dict[str, float]]:
+        """Percentis (ms) de importação (só comandos de topo), de lookup de subcomandos e do help."""
+        return {
+            'import': _percentiles([c.import_ms for c in self.commands if not c.subcommand]),
+            'lookup': _percentiles([c.lookup_ms for c in self.commands if c.subcommand]),
+            'help': _percentiles([c.help_ms for c in self.commands if c.help_ms]),
+        }
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -80,75 +100,121 @@ def _find_project_root(start: Path = Path('.')) -> Path:
     return start.resolve()
 
 
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+    if len(values) == 1:
+        cuts = values * 99
+    else:
+        cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return {'p50': round(cuts[49], 1), 'p90': round(cuts[89], 1), 'p99': round(cuts[98], 1), 'max': round(max(values), 1)}
+
+
+_COMPILED: dict[str, tuple[bool, str]] = {}
+
+
 def _check_import(module_path: str) -> tuple[bool, str]:
-    """Tenta importar um módulo e retorna (ok, erro)."""
+    """Compila o arquivo do módulo (uma vez por caminho) e retorna (ok, erro)."""
+    if module_path in _COMPILED:
+        return _COMPILED[module_path]
     try:
-        spec = importlib.util.spec_from_file_location('_panel_probe', module_path)
-        if spec is None:
-            return False, 'spec_from_file_location retornou None'
-        mod = importlib.util.module_from_spec(spec)
         with open(module_path, 'rb') as f:
             compile(f.read(), module_path, 'exec')
-        return True, ''
+        result = (True, '')
     except SyntaxError as e:
-        return False, f'SyntaxError L{e.lineno}: {e.msg}'
+        result = (False, f'SyntaxError L{e.lineno}: {e.msg}')
     except Exception as e:
-        return False, str(e)
+        result = (False, str(e))
+    _COMPILED[module_path] = result
+    return result
 
 
-def _check_help(command_name: str) -> tuple[bool, str]:
-    """Executa `doxoade <cmd> --help` e verifica se retorna 0."""
+def _load_command(target: str) -> tuple[object, str]:
+    """Importa 'modulo:atributo' no processo atual; retorna (comando, erro)."""
+    module_name, attr = target.split(':')
     try:
-        # CORREÇÃO: Split no command_name para separar 'refactor' de 'path'
-        cmd_parts = command_name.split()
-        full_args = [sys.executable, '-m', 'doxoade'] + cmd_parts + ['--help']
-        
-        result = subprocess.run(
-            full_args,
-            capture_output=True, 
-            text=True, 
-            timeout=10,
-            encoding='utf-8',       # <-- Adicione isso
-            errors='replace'        # <-- Adicione isso
-        )
-        if result.returncode == 0:
-            return True, ''
-        return False, (result.stderr or result.stdout or 'returncode != 0').strip()[:200]
+        spec = importlib.util.find_spec(module_name)
     except Exception as e:
-        return False, str(e)
-
+        return None, str(e)
+    if spec is None or not spec.origin:
+        return None, f'módulo {module_name} não encontrado'
+    if spec.origin.endswith('.py'):
+        ok, err = _check_import(spec.origin)
+        if not ok:
+            return None, err
+    try:
+        return getattr(importlib.import_module(module_name), attr), ''
+    except BaseException as e:  # SystemExit/KeyboardInterrupt no import não derrubam o painel
+        if isinstance(e, KeyboardInterrupt):
+            raise
+        return None, f'{type(e).__name__}: {e}'[:200]
 
-# ---------------------------------------------------------------------------
-# Registro de comandos conhecidos do doxoade
-# Edite esta lista conforme novos comandos forem adicionados.
-# ---------------------------------------------------------------------------
 
-_KNOWN_COMMANDS: list[tuple[str, str]] = [
-    # (nome_do_subcomando, caminho_do_módulo_relativo_à_raiz)
-    ('refactor path',       'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor refs',       'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor move',       'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor verify',     'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor rename',     'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor syntax-fix', 'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor syntax-scan','doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor audit',      'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor headers',    'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor fix-imports','doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor repair',     'doxoade/commands/refactor_systems/refactor_command.py'),
-    ('refactor verify-cli', 'doxoade/commands/refactor_systems/refactor_command.py'),
-    # Adicione mais conforme o projeto crescer:
-    # ('migrate foo',  'doxoade/commands/migrate_command.py'),
-]
+def _render_help(command: click.Command, ctx: click.Context) -> tuple[bool, str]:
+    """Equivalente in-process a `doxoade <cmd> --help`, num contexto isolado."""
+    try:
+        command.get_help(ctx)
+        return True, ''
+    except BaseException as e:
+        if isinstance(e, KeyboardInterrupt):
+            raise
+        return False, f'{type(e).__name__}: {e}'[:200]
+
+
+def _module_of(command: object) -> str:
+    callback = getattr(command, 'callback', None)
+    return getattr(callback, '__module__', '') or type(command).__module__
+
+
+def _sweep(command: click.Command, name: str, ctx: click.Context, report: PanelReport, module: str,
+           import_ms: float = 0.0, lookup_ms: float | None = None) -> None:
+    """Renderiza o help do comando e desce nos subcomandos de grupos (lookup_ms só para subcomandos)."""
+    t0 = time.perf_counter()
+    help_ok, help_err = _render_help(command, ctx)
+    report.commands.append(CommandHealth(
+        name=name, module=module, import_ok=True, help_ok=help_ok,
+        help_error=help_err, import_ms=import_ms, help_ms=(time.perf_counter() - t0) * 1000,
+        lookup_ms=lookup_ms or 0.0, subcommand=lookup_ms is not None,
+    ))
+    if not isinstance(command, click.Group):
+        return
+    for sub_name in command.list_commands(ctx):
+        t0 = time.perf_counter()
+        try:
+            sub = command.get_command(ctx, sub_name)
+            err = '' if sub is not None else 'get_command retornou None'
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                raise
+            sub, err = None, f'{type(e).__name__}: {e}'[:200]
+        elapsed = (time.perf_counter() - t0) * 1000
+        full_name = f'{name} {sub_name}'
+        if sub is None:
+            report.commands.append(CommandHealth(name=full_name, module=module, import_error=err, lookup_ms=elapsed, subcommand=True))
+            continue
+        sub_ctx = click.Context(sub, info_name=sub_name, parent=ctx, resilient_parsing=True)
+        _sweep(sub, full_name, sub_ctx, report, _module_of(sub) or module, lookup_ms=elapsed)
+
+
+def _discover_commands() -> tuple[click.Group, dict[str, str]]:
+    """Grupo raiz vivo e o mapa 'nome -> modulo:atributo' que ele despacha."""
+    from doxoade.cli import cli
+    return cli, dict(getattr(cli, '_lazy_map', {}))
 
 
 # ---------------------------------------------------------------------------
 # Lógica principal
 # ---------------------------------------------------------------------------
 
-def _run_panel(root: Path, fast: bool = False, fix_syntax: bool = False) -> PanelReport:
+def _run_panel(root: Path, fast: bool = False, fix_syntax: bool = False, only: tuple[str, ...] = ()) -> PanelReport:
     report = PanelReport()
+    _scan_syntax(root, report, fix_syntax)
+    _sweep_commands(report, fast, only)
+    return report
+
 
+def _scan_syntax(root: Path, report: PanelReport, fix_syntax: bool) -> None:
+    """Erros de sintaxe dos .py sob 'root' (e reparo opcional)."""
     # 1. Scan de sintaxe
     from doxoade.commands.refactor_systems.refactor_syntax import scan_syntax_errors
  #   for issue in scan_syntax_errors(root):
@@ -161,26 +227,30 @@ def _run_panel(root: Path, fast: bool = False, fix_syntax: bool = False) -> Pane
     if fix_syntax and report.syntax_errors > 0:
         from doxoade.commands.refactor_systems.refactor_syntax import repair_all
         repair_all(root, dry_run=False)
+        _COMPILED.clear()
 
-    # 3. Verifica comandos
-    for cmd_name, rel_module in _KNOWN_COMMANDS:
-        module_path = str(root / rel_module)
-        t0 = time.monotonic()
-        import_ok, import_err = _check_import(module_path)
-        help_ok, help_err = (True, '') if fast else _check_help(cmd_name)
-        duration = (time.monotonic() - t0) * 1000
-
-        report.commands.append(CommandHealth(
-            name=cmd_name,
-            module=rel_module,
-            import_ok=import_ok,
-            help_ok=help_ok,
-            import_error=import_err,
-            help_error=help_err,
-            duration_ms=duration,
-        ))
 
-    return report
+def _sweep_commands(report: PanelReport, fast: bool, only: tuple[str, ...]) -> None:
+    """Comandos do grupo Click vivo (o doxoade em execução), sem subprocessos; independe do PATH."""
+    # 3. Verifica comandos
+    cli, targets = _discover_commands()
+    root_ctx = click.Context(cli, info_name='doxoade', resilient_parsing=True)
+    for cmd_name in sorted(targets):
+        if only and cmd_name not in only:
+            continue
+        target = targets[cmd_name]
+        module = target.split(':')[0]
+        t0 = time.perf_counter()
+        command, import_err = _load_command(target)
+        import_ms = (time.perf_counter() - t0) * 1000
+        if command is None:
+            report.commands.append(CommandHealth(name=cmd_name, module=module, import_error=import_err, import_ms=import_ms))
+            continue
+        if fast:
+            report.commands.append(CommandHealth(name=cmd_name, module=module, import_ok=True, help_ok=True, import_ms=import_ms))
+            continue
+        ctx = click.Context(command, info_name=cmd_name, parent=root_ctx, resilient_parsing=True)
+        _sweep(command, cmd_name, ctx, report, module, import_ms)
 
 
 def _print_report(report: PanelReport, verbose: bool = False) -> None:
@@ -211,7 +281,8 @@ def _print_report(report: PanelReport, verbose: bool = False) -> None:
         color = 'green' if cmd.healthy else 'red'
         tag = f"[{cmd.status_label}]"
         click.secho(f"  {tag:14s} {cmd.name}", fg=color, nl=False)
-        click.echo(f"  ({cmd.duration_ms:.0f}ms)")
+        stage = f"lookup {cmd.lookup_ms:.1f}ms" if cmd.subcommand else f"import {cmd.import_ms:.0f}ms"
+        click.echo(f"  ({stage} | help {cmd.help_ms:.0f}ms)")
         if not cmd.import_ok and verbose:
             click.secho(f"    IMPORT: {cmd.import_error}", fg='red')
         if not cmd.help_ok and verbose:
@@ -229,6 +300,11 @@ def _print_report(report: PanelReport, verbose: bool = False) -> None:
         f"Sintaxe: {report.syntax_errors} erros",
         fg=color, bold=True
     )
+    for label, stats in report.timings().items():
+        click.echo(
+            f" {label.capitalize():8s} p50 {stats['p50']:.1f}ms  p90 {stats['p90']:.1f}ms  "
+            f"p99 {stats['p99']:.1f}ms  max {stats['max']:.1f}ms"
+        )
     if broken > 0:
         click.secho(
             " DICA: execute 'doxoade refactor syntax-fix . --dry-run' para "
@@ -252,26 +328,29 @@ def _print_report(report: PanelReport, verbose: bool = False) -> None:
               help='Exibe detalhes dos erros de cada comando.')
 @click.option('--json', 'as_json', is_flag=True,
               help='Saída em JSON (para CI/integração).')
-def panel_command(path: Path, fast: bool, fix_syntax: bool, verbose: bool, as_json: bool) -> None:
+@click.option('--command', '-c', 'only', multiple=True,
+              help='Restringe a verificação a estes comandos (repetível).')
+def panel_command(path: Path, fast: bool, fix_syntax: bool, verbose: bool, as_json: bool, only: tuple[str, ...]) -> None:
     """Verificação de saúde completa do CLI doxoade.
 
     \\x08
     Verifica:
-      1. Erros de sintaxe em todos os arquivos Python do projeto
+      1. Erros de sintaxe em todos os arquivos Python do projeto em PATH
       2. Importabilidade de cada módulo de comando
-      3. Execução do --help de cada subcomando registrado
+      3. Renderização do --help de cada subcomando do grupo Click
 
     \\x08
     Exemplos:
       doxoade panel
       doxoade panel --fast --verbose
+      doxoade panel -c refactor -c check
       doxoade panel --fix-syntax
       doxoade panel --json | python -m json.tool
     """
     import json as _json
 
     root = _find_project_root(Path(path))
-    report = _run_panel(root, fast=fast, fix_syntax=fix_syntax)
+    report = _run_panel(root, fast=fast, fix_syntax=fix_syntax, only=only)
 
     if as_json:
         data = {
@@ -285,10 +364,14 @@ def panel_command(path: Path, fast: bool, fix_syntax: bool, verbose: bool, as_js
                     'help_ok': c.help_ok,
                     'import_error': c.import_error,
                     'help_error': c.help_error,
+                    'import_ms': round(c.import_ms, 1),
+                    'lookup_ms': round(c.lookup_ms, 1),
+                    'help_ms': round(c.help_ms, 1),
                     'duration_ms': round(c.duration_ms, 1),
                 }
                 for c in report.commands
             ],
+            'timings': report.timings(),
         }
         click.echo(_json.dumps(data, indent=2, ensure_ascii=False))
         return
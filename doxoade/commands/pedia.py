@@ -10,10 +10,10 @@ from .pedia_systems.pedia_engine import PediaEngine
 from doxoade.tools.filesystem import _find_project_root
 from doxoade.tools.telemetry_tools.logger import ExecutionLogger
 
-def _get_engine():
+def _get_engine(rebuild: bool=False):
     """Factory para instanciar a Engine com o contexto correto."""
     root = _find_project_root(os.getcwd())
-    return PediaEngine(root)
+    return PediaEngine(root, rebuild=rebuild)
 
 @click.group('pedia', invoke_without_command=True)
 @click.pass_context
@@ -61,5 +61,5 @@ def list_cmd():
 def refresh_cmd():
     """Força a reindexação da base de conhecimento (Cache Busting)."""
     with ExecutionLogger('pedia-refresh', '.', {}):
-        _get_engine()
-        click.echo('✅ Índice de conhecimento recarregado da memória física.')
+        engine = _get_engine(rebuild=True)
+        click.echo(f'✅ Índice invertido reconstruído: {len(engine.articles)} artigos, {len(engine.io.index["postings"])} termos.')
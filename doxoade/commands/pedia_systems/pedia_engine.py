@@ -9,10 +9,10 @@ from .pedia_json import SemanticJSONRenderer
 class PediaEngine:
     """Motor central de Inteligência Documental (Atena/Thoth)."""
 
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, rebuild: bool=False):
         self.io = KnowledgeBaseIO(project_root)
-        self.articles = self.io.load_all_knowledge()
-        self.searcher = PediaSearch(self.articles)
+        self.articles = self.io.load_all_knowledge(rebuild=rebuild)
+        self.searcher = PediaSearch(self.articles, self.io.index)
         self.md_renderer = MarkdownRenderer()
         self.json_renderer = SemanticJSONRenderer()
 
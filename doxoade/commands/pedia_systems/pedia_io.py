@@ -1,23 +1,53 @@
 # doxoade/doxoade/commands/pedia_systems/pedia_io.py
 """
-Pedia I/O - v96.3 (Refined Scanner).
+Pedia I/O - v96.4 (Índice Invertido).
 Alteração: Filtro estrito de extensões (Ignora .py, binários, etc).
+- Índice invertido persistente (.doxoade_cache/pedia_index.json): termos de
+  título e corpo por artigo, reconstruído apenas para arquivos alterados (mtime_ns, size).
+  Cada arquivo guarda seus termos (mapa reverso), então remover um arquivo só
+  toca os postings desses termos.
+- Corpos carregados sob demanda: Article.content só lê o disco ao exibir.
 """
 import json
 import re
 import os
 import doxoade
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
+
+INDEX_FILE = 'pedia_index.json'
+INDEX_VERSION = 2
+TOKEN_RE = re.compile('\\w+')
+
+def tokenize(text: str) -> list:
+    """Termos normalizados (minúsculas, palavras unicode) usados no índice e nas consultas."""
+    return TOKEN_RE.findall(text.lower())
+
+def _term_freqs(text: str) -> dict:
+    freqs = {}
+    for term in tokenize(text):
+        freqs[term] = freqs.get(term, 0) + 1
+    return freqs
 
 @dataclass
 class Article:
     key: str
     title: str
-    content: str
     source: str
     category: str
     date: str = ''
+    path: str = ''
+    json_key: Optional[str] = None
+    doc_id: str = ''
+    _body: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def content(self) -> str:
+        """Corpo do artigo, lido do arquivo de origem no primeiro acesso."""
+        if self._body is None:
+            self._body = KnowledgeBaseIO.load_body(self.path, self.json_key)
+        return self._body
 
 class KnowledgeBaseIO:
 
@@ -33,15 +63,91 @@ class KnowledgeBaseIO:
                 return c
         return self.user_root / 'docs'
 
-    def load_all_knowledge(self) -> dict:
-        articles = {}
+    def load_all_knowledge(self, rebuild: bool=False) -> dict:
+        """Artigos por chave (corpos preguiçosos); sincroniza o índice invertido de passagem."""
+        self.index = self._load_index()
+        self._dirty = False
+        if rebuild:
+            self.index = {'version': INDEX_VERSION, 'files': {}, 'docs': {}, 'postings': {}}
+            self._dirty = True
+        seen, articles = set(), {}
         if self.system_docs.exists():
-            articles.update(self._scan_tree(self.system_docs, source='DOXOADE CORE'))
+            articles.update(self._scan_tree(self.system_docs, 'DOXOADE CORE', seen))
         if self.user_docs.exists():
-            articles.update(self._scan_tree(self.user_docs, source='local'))
+            articles.update(self._scan_tree(self.user_docs, 'local', seen))
+        gone = set(self.index['files']) - seen
+        if gone:
+            self._drop_files(gone)
+        if self._dirty:
+            self._save_index()
         return articles
 
-    def _scan_tree(self, root_path: Path, source: str) -> dict:
+    def _index_path(self) -> Path:
+        return self.user_root / '.doxoade_cache' / INDEX_FILE
+
+    def _load_index(self) -> dict:
+        try:
+            data = json.loads(self._index_path().read_text(encoding='utf-8'))
+            if data.get('version') == INDEX_VERSION:
+                return data
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {'version': INDEX_VERSION, 'files': {}, 'docs': {}, 'postings': {}}
+
+    def _save_index(self):
+        path = self._index_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(self.index, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+            os.replace(tmp, path)
+        except OSError:
+            pass  # Somente leitura: o índice vale para esta execução.
+
+    def _drop_files(self, paths):
+        """Remove documentos e postings de arquivos alterados/apagados (só os termos de cada arquivo)."""
+        docs, postings = self.index['docs'], self.index['postings']
+        for p in paths:
+            entry = self.index['files'].pop(p, None)
+            if not entry:
+                continue
+            for doc_id in entry['docs']:
+                docs.pop(doc_id, None)
+            for term in entry['terms']:
+                plist = postings.get(term)
+                if plist is None:
+                    continue
+                for doc_id in entry['docs']:
+                    plist.pop(doc_id, None)
+                if not plist:
+                    del postings[term]
+        self._dirty = True
+
+    def _index_file(self, file_path: Path, st, source: str, category: str):
+        """(Re)indexa um arquivo: metadados + frequências de termos de título e corpo."""
+        key = str(file_path)
+        if key in self.index['files']:
+            self._drop_files([key])
+        if file_path.suffix.lower() == '.json':
+            parsed = list(self._parse_json(file_path, source, category).values())
+        else:
+            art = self._parse_markdown(file_path, source, category)
+            parsed = [art] if art else []
+        docs, postings = self.index['docs'], self.index['postings']
+        doc_ids, terms = [], set()
+        for art in parsed:
+            doc_id = f'{key}::{art.json_key}' if art.json_key is not None else key
+            title_tf, body_tf = _term_freqs(art.title), _term_freqs(art._body)
+            docs[doc_id] = {'key': art.key, 'title': art.title, 'source': source, 'category': art.category, 'date': art.date, 'json_key': art.json_key, 'tlen': sum(title_tf.values()), 'blen': sum(body_tf.values())}
+            doc_terms = title_tf.keys() | body_tf.keys()
+            for term in doc_terms:
+                postings.setdefault(term, {})[doc_id] = [title_tf.get(term, 0), body_tf.get(term, 0)]
+            terms |= doc_terms
+            doc_ids.append(doc_id)
+        self.index['files'][key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'docs': doc_ids, 'terms': sorted(terms)}
+        self._dirty = True
+
+    def _scan_tree(self, root_path: Path, source: str, seen: set) -> dict:
         loaded = {}
         ignore_dirs = {'.git', '__pycache__', '_build', 'site', 'node_modules', 'venv'}
         valid_exts = {'.json', '.md', '.txt', '.dox'}
@@ -58,14 +164,62 @@ class KnowledgeBaseIO:
                         category = 'Geral'
                 except ValueError:
                     category = 'Geral'
-                if file.endswith('.json'):
-                    loaded.update(self._parse_json(file_path, source, category))
-                elif file.endswith(('.md', '.txt', '.dox')):
-                    art = self._parse_markdown(file_path, source, category)
-                    if art:
-                        loaded[art.key] = art
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    continue
+                key = str(file_path)
+                seen.add(key)
+                entry = self.index['files'].get(key)
+                if not (entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size):
+                    self._index_file(file_path, st, source, category)
+                    entry = self.index['files'][key]
+                for doc_id in entry['docs']:
+                    meta = self.index['docs'][doc_id]
+                    loaded[meta['key']] = Article(meta['key'], meta['title'], meta['source'], meta['category'], meta['date'], key, meta['json_key'], doc_id)
         return loaded
 
+    @staticmethod
+    def _json_entry(key: str, val) -> tuple:
+        """(título, data, corpo) de uma entrada de um artigo JSON."""
+        title = key
+        date = ''
+        body = ''
+        if isinstance(val, dict):
+            title = val.get('title', key)
+            date = val.get('date', '')
+            raw_content = val.get('content')
+            if raw_content is None:
+                clean_val = val.copy()
+                clean_val.pop('title', None)
+                clean_val.pop('date', None)
+                target_data = clean_val
+            else:
+                target_data = raw_content
+            if isinstance(target_data, str):
+                body = target_data
+            elif isinstance(target_data, (dict, list)):
+                body = json.dumps(target_data, indent=2, ensure_ascii=False)
+            else:
+                body = str(target_data)
+        else:
+            body = str(val)
+        return (str(title), str(date), body)
+
+    @classmethod
+    def load_body(cls, path: str, json_key: Optional[str]) -> str:
+        """Relê o corpo de um único artigo do arquivo de origem."""
+        content = cls._read_robust(Path(path))
+        if json_key is None or not content:
+            return content
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            return ''
+        if not isinstance(data, dict) or json_key not in data:
+            return ''
+        return cls._json_entry(json_key, data[json_key])[2]
+
     def _parse_json(self, path: Path, source: str, category: str) -> dict:
         content = self._read_robust(path)
         batch = {}
@@ -75,31 +229,10 @@ class KnowledgeBaseIO:
             data = json.loads(content)
             if isinstance(data, dict):
                 for key, val in data.items():
-                    title = key
-                    date = ''
-                    body = ''
-                    if isinstance(val, dict):
-                        title = val.get('title', key)
-                        date = val.get('date', '')
-                        raw_content = val.get('content')
-                        if raw_content is None:
-                            clean_val = val.copy()
-                            clean_val.pop('title', None)
-                            clean_val.pop('date', None)
-                            target_data = clean_val
-                        else:
-                            target_data = raw_content
-                        if isinstance(target_data, str):
-                            body = target_data
-                        elif isinstance(target_data, (dict, list)):
-                            body = json.dumps(target_data, indent=2, ensure_ascii=False)
-                        else:
-                            body = str(target_data)
-                    else:
-                        body = str(val)
+                    title, date, body = self._json_entry(key, val)
                     final_cat = category if category != 'Geral' else path.stem.title()
                     clean_key = key.lower().strip()
-                    batch[clean_key] = Article(clean_key, title, body, source, final_cat, date)
+                    batch[clean_key] = Article(clean_key, title, source, final_cat, date, str(path), key, _body=body)
         except json.JSONDecodeError:
             pass
         return batch
@@ -116,9 +249,10 @@ class KnowledgeBaseIO:
                 break
         date_match = re.search('(?:Data|Date|Atualizado):\\s*(\\d{4}-\\d{2}-\\d{2})', content)
         date = date_match.group(1) if date_match else ''
-        return Article(path.stem.lower(), title, content, source, category, date)
+        return Article(path.stem.lower(), title, source, category, date, str(path), _body=content)
 
-    def _read_robust(self, filepath: Path) -> str:
+    @staticmethod
+    def _read_robust(filepath: Path) -> str:
         for enc in ['utf-8', 'cp1252', 'latin-1']:
             try:
                 return filepath.read_text(encoding=enc)
@@ -1,34 +1,75 @@
 # doxoade/doxoade/commands/pedia_systems/pedia_search.py
-from typing import Dict, List
+"""
+Motor de Busca da Doxoadepédia (Thoth).
+Ranking BM25 sobre o índice invertido do KnowledgeBaseIO (título com peso extra),
+somado aos bônus de chave/título exatos. Nenhum corpo de artigo é lido na busca.
+"""
+import math
+from typing import Dict, List, Optional
+from .pedia_io import tokenize, _term_freqs
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 3.0
+BM25_SCALE = 10.0
+
+def build_index(articles_db: Dict) -> dict:
+    """Índice em memória para bases sem índice persistente (lê os corpos)."""
+    docs, postings = {}, {}
+    for art in articles_db.values():
+        doc_id = art.doc_id or art.key
+        title_tf, body_tf = _term_freqs(art.title), _term_freqs(art.content)
+        docs[doc_id] = {'key': art.key, 'tlen': sum(title_tf.values()), 'blen': sum(body_tf.values())}
+        for term in title_tf.keys() | body_tf.keys():
+            postings.setdefault(term, {})[doc_id] = [title_tf.get(term, 0), body_tf.get(term, 0)]
+    return {'docs': docs, 'postings': postings}
 
 class PediaSearch:
     """Motor de Busca Semântica Simples (Thoth)."""
 
-    def __init__(self, articles_db: Dict):
+    def __init__(self, articles_db: Dict, index: Optional[dict]=None):
         self.db = articles_db
+        self.index = index if index is not None else build_index(articles_db)
+        docs = self.index['docs']
+        self.avg_len = sum((d['blen'] + TITLE_WEIGHT * d['tlen'] for d in docs.values())) / len(docs) if docs else 1.0
+        # Só o documento vencedor de cada chave é pontuado (chaves repetidas: último arquivo vence).
+        self.live = {(art.doc_id or art.key): art for art in articles_db.values()}
+
+    def bm25(self, terms: List[str]) -> Dict[str, float]:
+        """Pontuação BM25 por doc_id; tf = corpo + TITLE_WEIGHT * título."""
+        docs, postings = self.index['docs'], self.index['postings']
+        n_docs = len(docs)
+        scores = {}
+        for term in set(terms):
+            plist = postings.get(term)
+            if not plist:
+                continue
+            idf = math.log(1 + (n_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+            for doc_id, (title_tf, body_tf) in plist.items():
+                if doc_id not in self.live:
+                    continue
+                meta = docs[doc_id]
+                tf = body_tf + TITLE_WEIGHT * title_tf
+                doc_len = meta['blen'] + TITLE_WEIGHT * meta['tlen']
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len / (self.avg_len or 1.0))
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
 
     def rank_articles(self, query: str, limit: int=10) -> List:
         query = query.lower().strip()
-        query_words = set(query.split())
-        results = []
-        for key, art in self.db.items():
-            score = 0
+        if not query:
+            return []
+        scores = {doc_id: round(s * BM25_SCALE, 1) for doc_id, s in self.bm25(tokenize(query)).items()}
+        for doc_id, art in self.live.items():
             art_title_low = art.title.lower()
-            if query == key:
-                score += 100
+            if query == art.key:
+                bonus = 100
             elif query == art_title_low:
-                score += 90
-            elif query in key or query in art_title_low:
-                score += 50
-            word_hits = sum((1 for w in query_words if w in art_title_low))
-            if word_hits > 0:
-                score += word_hits * 10
-            content_low = art.content.lower()
-            if query in content_low:
-                score += 20
-            content_hits = sum((content_low.count(w) for w in query_words))
-            score += min(content_hits * 2, 30)
-            if score > 0:
-                results.append({'article': art, 'score': score})
-        results.sort(key=lambda x: x, reverse=True)
-        return results
\ No newline at end of file
+                bonus = 90
+            elif query in art.key or query in art_title_low:
+                bonus = 50
+            else:
+                continue
+            scores[doc_id] = scores.get(doc_id, 0.0) + bonus
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.live[item[0]].key))
+        return [{'article': self.live[doc_id], 'score': score} for doc_id, score in ranked[:limit] if score > 0]
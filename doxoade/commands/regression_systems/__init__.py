@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+# doxoade/commands/regression_systems/__init__.py
+"""
+Doxoade Regression Systems — Veredito incremental contra o Cânone.
+===================================================================
+• Índice por arquivo: impressão digital do conteúdo + hashes dos achados
+• Índice por módulo de teste: impressão digital + resultado (JUnit)
+• Só o que mudou desde a canonização é reavaliado; o veredito compara com o cânone inteiro
+"""
+
+from doxoade.commands.regression_systems.canon_index import build_file_index, build_test_index, diff_file_index, run_pytest
+
+__all__ = ['build_file_index', 'build_test_index', 'diff_file_index', 'run_pytest']
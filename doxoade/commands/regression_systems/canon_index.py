@@ -0,0 +1,78 @@
+# doxoade/doxoade/commands/regression_systems/canon_index.py
+"""
+Índices de conteúdo do Cânone (project_snapshot.json).
+- file_index: {arquivo relativo: {'fp': sha1 do conteúdo, 'hashes': [finding_hash]}}
+- test_index: {módulo de teste relativo: {'fp', 'tests', 'failures'}}
+Permitem ao regression-test reavaliar só arquivos e testes cuja impressão
+digital mudou desde a canonização.
+"""
+import os
+import sys
+import hashlib
+import subprocess
+from collections import defaultdict
+
+def fingerprint(path: str) -> str:
+    h = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                h.update(chunk)
+    except OSError:
+        return ''
+    return h.hexdigest()
+
+def rel_path(path: str, root: str) -> str:
+    return os.path.relpath(os.path.abspath(path), root).replace('\\', '/')
+
+def finding_key(finding: dict):
+    return finding.get('finding_hash') or finding.get('hash')
+
+def hashes_by_file(findings, root: str) -> dict:
+    """Agrupa os hashes dos achados por arquivo relativo à raiz."""
+    grouped = defaultdict(set)
+    for f in findings:
+        key = finding_key(f)
+        if key and f.get('file'):
+            grouped[rel_path(f['file'], root)].add(key)
+    return grouped
+
+def build_file_index(root: str, files, findings) -> dict:
+    """Impressão digital de cada arquivo auditado + os hashes dos seus achados."""
+    root = os.path.abspath(root)
+    grouped = hashes_by_file(findings, root)
+    index = {rel_path(fp, root): {'fp': fingerprint(fp), 'hashes': []} for fp in files}
+    for rel, hashes in grouped.items():
+        index.setdefault(rel, {'fp': fingerprint(os.path.join(root, rel)), 'hashes': []})['hashes'] = sorted(hashes)
+    return index
+
+def diff_file_index(root: str, file_index: dict, files) -> tuple:
+    """(alterados ou novos, removidos) em caminhos relativos, comparando com o cânone."""
+    root = os.path.abspath(root)
+    current = {rel_path(fp, root) for fp in files}
+    changed = sorted(rel for rel in current if file_index.get(rel, {}).get('fp') != fingerprint(os.path.join(root, rel)))
+    removed = sorted(rel for rel in file_index if rel not in current and not os.path.exists(os.path.join(root, rel)))
+    return changed, removed
+
+def build_test_index(root: str, outcomes: dict) -> dict:
+    """Resultados por módulo de teste (parse_junit_outcomes) com a impressão digital do arquivo."""
+    root = os.path.abspath(root)
+    return {rel: {'fp': fingerprint(os.path.join(root, rel)), 'tests': o['tests'], 'failures': o['failures']} for rel, o in outcomes.items()}
+
+def run_pytest(root: str, tests=None, tb: str='short') -> dict:
+    """Roda o pytest (suíte inteira ou 'tests') com JUnit; {'exit_code', 'outcomes', 'output'}."""
+    from doxoade.commands.test_systems.selection_engine import parse_junit_outcomes
+    root = os.path.abspath(root)
+    junit_path = os.path.join(root, '.doxoade_cache', 'regression_junit.xml')
+    os.makedirs(os.path.dirname(junit_path), exist_ok=True)
+    if os.path.exists(junit_path):
+        os.remove(junit_path)
+    cmd = [sys.executable, '-m', 'pytest', '-q', f'--tb={tb}', f'--junitxml={junit_path}', '-o', 'junit_family=xunit1', *(tests or [])]
+    res = subprocess.run(cmd, capture_output=True, text=True, shell=False, cwd=root)
+    outcomes = {}
+    if os.path.exists(junit_path):
+        try:
+            outcomes = parse_junit_outcomes(junit_path, root)
+        except Exception:
+            outcomes = {}
+    return {'exit_code': res.returncode, 'outcomes': outcomes, 'output': res.stdout}
@@ -27,21 +27,79 @@ def _load_canon() -> Optional[Dict]:
     except Exception:
         return None
 
-def _run_audit_pipeline(canon: dict, verbose: bool) -> dict:
+def _run_audit_pipeline(canon: dict, verbose: bool, full: bool = False) -> dict:
     """Executa e compara os dados atuais contra o cânone (MPoT-5)."""
     if not canon or 'static_analysis' not in canon:
         raise ValueError('Invalid Canon data provided to audit pipeline.')
+    if not full and 'file_index' in canon:
+        return _run_incremental_pipeline(canon, verbose)
     from .check import run_check_logic
+    from .regression_systems.canon_index import finding_key
     from subprocess import run as sub_run
     current_check = run_check_logic('.', fix=False, fast=True, no_cache=True, clones=False, continue_on_error=True)
 
     def get_hashes(findings):
-        return {f.get('hash') for f in findings if f.get('hash')}
+        return {finding_key(f) for f in findings if finding_key(f)}
     old_hashes = get_hashes(canon['static_analysis'].get('findings', []))
     new_hashes = get_hashes(current_check.get('findings', []))
     pt_res = sub_run([sys.executable, '-m', 'pytest', '-q', '--tb=short'], capture_output=True, text=True, shell=False)
     return {'new_lint_errors': list(new_hashes - old_hashes), 'lint_total': len(new_hashes), 'test_exit_code': pt_res.returncode, 'canon_test_exit': canon.get('test_execution', {}).get('exit_code', 0), 'test_output': pt_res.stdout, 'verbose': verbose}
 
+def _run_incremental_pipeline(canon: dict, verbose: bool) -> dict:
+    """
+    Reavalia só o que mudou desde a canonização: o check roda nos arquivos cuja
+    impressão digital difere do cânone e o pytest nos módulos de teste afetados;
+    o restante herda os hashes/resultados do cânone, e o veredito compara o
+    conjunto completo.
+    """
+    from .check import run_check_logic
+    from .check_systems.check_io import CheckIO
+    from .regression_systems.canon_index import diff_file_index, hashes_by_file, fingerprint, run_pytest
+    from .test_systems.selection_engine import discover_test_files, select_tests_for_changes
+    root = os.path.abspath('.')
+    file_index = canon['file_index']
+    files = CheckIO('.').resolve_files()
+    changed, removed = diff_file_index(root, file_index, files)
+    current = {rel: set(entry.get('hashes', [])) for rel, entry in file_index.items() if rel not in removed}
+    if changed:
+        targets = [os.path.join(root, rel) for rel in changed]
+        partial = run_check_logic('.', fix=False, fast=True, no_cache=True, clones=False, continue_on_error=True, target_files=targets)
+        fresh = hashes_by_file(partial.get('findings', []), root)
+        for rel in changed:
+            current[rel] = fresh.get(rel, set())
+    old_hashes = {h for entry in file_index.values() for h in entry.get('hashes', [])}
+    new_hashes = set().union(*current.values()) if current else set()
+    echo(f'{Fore.WHITE}  > Estático: {len(changed)} alterado(s), {len(removed)} removido(s) de {len(files)} arquivo(s).')
+
+    canon_exit = canon.get('test_execution', {}).get('exit_code', 0)
+    test_index = canon.get('test_index') or {}
+    if not test_index:
+        pt_res = run_pytest(root)
+        test_exit, test_output = pt_res['exit_code'], pt_res['output']
+    else:
+        all_tests = discover_test_files(root)
+        edited_tests = [t for t in all_tests if test_index.get(t, {}).get('fp') != fingerprint(os.path.join(root, t))]
+        selection = select_tests_for_changes(root, sorted(set(changed) | set(removed) | set(edited_tests)))
+        if selection['fallback']:
+            echo(f"{Fore.YELLOW}  > Testes: suíte completa ({selection['fallback']}).")
+            pt_res = run_pytest(root)
+            test_exit, test_output = pt_res['exit_code'], pt_res['output']
+        else:
+            selected = selection['tests']
+            echo(f'{Fore.WHITE}  > Testes: {len(selected)} de {len(all_tests)} módulo(s) afetado(s).')
+            outcomes = {t: o for t, o in test_index.items() if t in all_tests}
+            test_exit, test_output = canon_exit, ''
+            if selected:
+                pt_res = run_pytest(root, selected)
+                test_output = pt_res['output']
+                for t in selected:
+                    outcomes[t] = pt_res['outcomes'].get(t, {'tests': 0, 'failures': 0})
+                if pt_res['exit_code'] not in (0, 1, 5):
+                    test_exit = pt_res['exit_code']
+            if test_exit in (0, 1):
+                test_exit = 1 if any(o['failures'] for o in outcomes.values()) else 0
+    return {'new_lint_errors': list(new_hashes - old_hashes), 'lint_total': len(new_hashes), 'test_exit_code': test_exit, 'canon_test_exit': canon_exit, 'test_output': test_output, 'verbose': verbose}
+
 def _render_final_verdict(ev: dict):
     """Apresenta o laudo de evidências simétrico (MPoT-4)."""
     if not ev:
@@ -72,13 +130,14 @@ def _render_final_verdict(ev: dict):
 
 @command('regression-test')
 @option('--verbose', '-v', 'verbose', is_flag=True, help='Exibe detalhes técnicos dos erros.')
-def regression_test(verbose: bool):
+@option('--full', is_flag=True, help='Reavalia o projeto inteiro (check sem cache + pytest completo).')
+def regression_test(verbose: bool, full: bool):
     """Verifica a saúde do projeto comparando com o 'Cânone' (MPoT-5)."""
     canon = _load_canon()
     if not canon:
         echo(Fore.RED + "[ERRO] Cânone não encontrado. Execute 'doxoade canonize --all' primeiro.")
         return
-    with ExecutionLogger('regression-test', '.', {'verbose': verbose}) as _:
+    with ExecutionLogger('regression-test', '.', {'verbose': verbose, 'full': full}) as _:
         echo(f'{Fore.CYAN}{Style.BRIGHT}--- [REGRESSION] Auditoria de Qualidade Chief-Gold ---{Style.RESET_ALL}')
-        evidence = _run_audit_pipeline(canon, verbose)
+        evidence = _run_audit_pipeline(canon, verbose, full)
         _render_final_verdict(evidence)
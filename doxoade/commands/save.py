@@ -294,56 +294,71 @@ def _capture_delta_knowledge(new_commit_hash, project_path):
     """
     Minerador de Conhecimento em Tempo Real.
     Cruza incidentes resolvidos com o diff do Git para criar o Acervo.
+    Um único 'git diff -U0' por commit: só incidentes cujas linhas caem num hunk
+    alterado são minerados (com a posição remapeada), cada blob é lido uma vez
+    pelo cat-file persistente e o Lexicon é atualizado numa só transação.
     """
     from doxoade.core_database import get_db_connection
-    import subprocess
+    from doxoade.tools.git_batch import diff_hunks, get_reader, map_old_line
     
     conn = get_db_connection()
     # 1. Busca incidentes que estavam abertos neste projeto mas NÃO estão no commit atual
     # (Ou seja, o que você acabou de consertar)
     query = "SELECT * FROM open_incidents WHERE project_path = ?"
     old_incidents = conn.execute(query, (os.path.abspath(project_path),)).fetchall()
-    
-    for inc in old_incidents:
-        f_hash = inc['finding_hash']
-        f_path = inc['file_path']
-        f_line = inc['line']
-        
-        # 2. Pergunta ao Git o que tinha ANTES e o que tem AGORA
-        try:
-            # Pega a linha no commit anterior (O Veneno)
-            cmd_before = ["git", "show", f"{new_commit_hash}^:{f_path}"]
-            res_before = subprocess.run(cmd_before, capture_output=True, text=True, encoding='utf-8', errors='ignore')
-            
-            # Pega a linha no commit atual (O Remédio)
-            cmd_after = ["git", "show", f"{new_commit_hash}:{f_path}"]
-            res_after = subprocess.run(cmd_after, capture_output=True, text=True, encoding='utf-8', errors='ignore')
+    if not old_incidents:
+        conn.close()
+        return 0
 
-            if res_before.returncode == 0 and res_after.returncode == 0:
-                lines_before = res_before.stdout.splitlines()
-                lines_after = res_after.stdout.splitlines()
-                
-                # Extrai os snippets exatos
-                snippet_broken = lines_before[f_line-1].strip() if f_line <= len(lines_before) else None
-                snippet_fixed  = lines_after[f_line-1].strip() if f_line <= len(lines_after) else None
-                
-                if snippet_broken and snippet_fixed and snippet_broken != snippet_fixed:
-                    # 3. Alimenta o Acervo (Lexicon)
-                    alexandria_write("""
-                        UPDATE knowledge_lexicon 
-                        SET snippet_broken = ?, snippet_fixed = ?, tags = 'AUTODIDATA'
-                        WHERE finding_hash = ?
-                    """, (snippet_broken, snippet_fixed, f_hash))
-        except Exception as e:
-            import sys as _dox_sys, os as _dox_os
-            from traceback import print_tb as exc_trace
-            exc_obj, exc_tb = _dox_sys.exc_info() #exc_type
-            f_name = _dox_os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-            line_n = exc_tb.tb_lineno
-            exc_trace(exc_tb)
-            print(f"\033[1;34m[ FORENSIC ]\033[0m \033[1mFile: {f_name} | L: {line_n} | Func: _capture_delta_knowledge\033[0m")
-            print(f"\033[31m  ■ Type: {type(e).__name__} | Value: {e}\033[0m")
-            continue
-        
-    conn.commit()
-    conn.close()
+    parent = f"{new_commit_hash}^"
+    updates = []
+    try:
+        git_root = subprocess.run(['git', 'rev-parse', '--show-toplevel'], capture_output=True, text=True, cwd=project_path).stdout.strip()
+        # 2. Pergunta ao Git, de uma vez, o que mudou entre o ANTES e o AGORA
+        changed = diff_hunks(parent, new_commit_hash, cwd=project_path)
+        reader = get_reader(git_root or project_path)
+        blobs = {}
+
+        def _lines(commit, path):
+            if (commit, path) not in blobs:
+                blobs[(commit, path)] = reader.read_text(commit, path).splitlines()
+            return blobs[(commit, path)]
+
+        for inc in old_incidents:
+            f_path, f_line = inc['file_path'], inc['line']
+            if not f_path or not f_line:
+                continue
+            rel_path = os.path.relpath(os.path.abspath(f_path), git_root).replace('\\', '/') if git_root else f_path
+            entry = changed.get(rel_path)
+            if not entry or not entry['new_path']:
+                continue  # arquivo intocado (ou apagado): nada a aprender
+            new_line, touched = map_old_line(entry['hunks'], f_line)
+            if not touched or new_line is None:
+                continue
+            lines_before = _lines(parent, rel_path)            # O Veneno
+            lines_after = _lines(new_commit_hash, entry['new_path'])  # O Remédio
+            snippet_broken = lines_before[f_line-1].strip() if f_line <= len(lines_before) else None
+            snippet_fixed  = lines_after[new_line-1].strip() if new_line <= len(lines_after) else None
+            if snippet_broken and snippet_fixed and snippet_broken != snippet_fixed:
+                updates.append((snippet_broken, snippet_fixed, inc['finding_hash']))
+
+        # 3. Alimenta o Acervo (Lexicon) numa única transação
+        if updates:
+            with conn:
+                conn.executemany("""
+                    UPDATE knowledge_lexicon 
+                    SET snippet_broken = ?, snippet_fixed = ?, tags = 'AUTODIDATA'
+                    WHERE finding_hash = ?
+                """, updates)
+    except Exception as e:
+        import sys as _dox_sys, os as _dox_os
+        from traceback import print_tb as exc_trace
+        exc_obj, exc_tb = _dox_sys.exc_info() #exc_type
+        f_name = _dox_os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
+        line_n = exc_tb.tb_lineno
+        exc_trace(exc_tb)
+        print(f"\033[1;34m[ FORENSIC ]\033[0m \033[1mFile: {f_name} | L: {line_n} | Func: _capture_delta_knowledge\033[0m")
+        print(f"\033[31m  ■ Type: {type(e).__name__} | Value: {e}\033[0m")
+    finally:
+        conn.close()
+    return len(updates)
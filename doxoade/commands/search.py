@@ -4,7 +4,8 @@ Hub de Pesquisa Híbrido Nexus v100.0.
 Suporta buscas textuais no código, incidentes, histórico Git e arquivos deletados com exibição rica e defensiva.
 """
 import os
-# [DOX-UNUSED] import sys
+import re
+import sys
 import click
 # [DOX-UNUSED] import json
 # [DOX-UNUSED] from collections import defaultdict
@@ -28,7 +29,8 @@ from doxoade.commands.search_systems.search_diff import (
 @click.option('--limit', '-n', default=100, type=int, help="Limite de resultados")
 @click.option('--deleted', '-d', is_flag=True, help="Busca arquivos deletados na história do Git")
 @click.option('--diffs', '-dp', is_flag=True, help="Busca termos dentro dos diffs históricos (Git Pickaxe)")
-def search(query, code, full, commits, here, specify_commit, incidents, timeline, limit, deleted, diffs):
+@click.option('--regex', '-R', is_flag=True, help="Trata a consulta de código como expressão regular")
+def search(query, code, full, commits, here, specify_commit, incidents, timeline, limit, deleted, diffs, regex):
     """🧠 Hub de Busca Nexus: Investiga código, histórico, logs e arquivos deletados."""
     if not query:
         click.echo("❌ Forneça um termo de pesquisa.")
@@ -107,12 +109,17 @@ def search(query, code, full, commits, here, specify_commit, incidents, timeline
         filters = {
             'here': here,
             'commits': commits,
+            'regex': regex,
             'run_code': code or not any([incidents, timeline]),
             'run_time': timeline or not any([code, incidents]),
             'run_db': incidents or not any([code, timeline])
         }
         
-        run_search_engine(state, filters)
+        try:
+            run_search_engine(state, filters)
+        except re.error as e:
+            click.echo(f"❌ Expressão regular inválida: {e}")
+            sys.exit(1)
         render_search_results(state)
         
     except ImportError:
@@ -4,9 +4,9 @@ Motor de Busca em Diffs, Commits e Arquivos Deletados (PASC 8.12).
 Disponibiliza buscas por símbolos históricos (Pickaxe) e rastreamento textual de alta velocidade.
 """
 import os
-import re
 import subprocess
 from doxoade.tools.filesystem import _find_project_root
+from doxoade.tools.git_batch import get_reader, iter_git_lines
 from doxoade.tools.telemetry_tools.logger import chief_heartbeat
 
 def search_git_diffs_pickaxe(query: str, file_path: str = None) -> list:
@@ -21,35 +21,36 @@ def search_git_diffs_pickaxe(query: str, file_path: str = None) -> list:
         })
         return []
 
-    cmd = ['git', 'log', '-S', query, '--patch', '--oneline']
+    # %x00 marca o cabeçalho do commit: nenhuma linha de patch começa com NUL (dispensa regex por linha).
+    args = ['log', '-S', query, '--patch', '--format=%x00%h %s']
     if file_path:
         rel_path = os.path.relpath(file_path, project_root).replace('\\', '/')
-        cmd.extend(['--', rel_path])
+        args.extend(['--', rel_path])
 
+    needle = query.lower()
+    commits = []
+    current = None
     try:
-        res = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True, encoding='utf-8', errors='ignore')
-        if res.returncode == 0:
-            commits = []
-            current = None
-            for line in res.stdout.splitlines():
-                if re.match(r'^[0-9a-f]{7,40}\s', line):
-                    parts = line.split(' ', 1)
-                    current = {
-                        'hash': parts[0],
-                        'summary': parts[1] if len(parts) > 1 else '',
-                        'matches': []
-                    }
-                    commits.append(current)
-                elif current and (line.startswith('+') or line.startswith('-')) and not (line.startswith('+++') or line.startswith('---')):
-                    if query.lower() in line.lower():
-                        current['matches'].append({'type': 'ADD' if line.startswith('+') else 'DEL', 'content': line[1:].strip()})
-            return [c for c in commits if c['matches']]
-        else:
-            chief_heartbeat("HORUS", "SEARCH_DIFF_ERROR", {
-                "query": query,
-                "exit_code": res.returncode,
-                "stderr": res.stderr.strip()
-            })
+        for line in iter_git_lines(args, cwd=project_root):
+            head = line[:1]
+            if head == '\0':
+                parts = line[1:].split(' ', 1)
+                current = {
+                    'hash': parts[0],
+                    'summary': parts[1] if len(parts) > 1 else '',
+                    'matches': []
+                }
+                commits.append(current)
+            elif current and (head == '+' or head == '-') and not line.startswith(('+++', '---')):
+                if needle in line.lower():
+                    current['matches'].append({'type': 'ADD' if head == '+' else 'DEL', 'content': line[1:].strip()})
+        return [c for c in commits if c['matches']]
+    except subprocess.CalledProcessError as e:
+        chief_heartbeat("HORUS", "SEARCH_DIFF_ERROR", {
+            "query": query,
+            "exit_code": e.returncode,
+            "stderr": (e.stderr or '').strip()
+        })
     except Exception as e:
         chief_heartbeat("HORUS", "SEARCH_DIFF_ERROR", {
             "query": query,
@@ -159,11 +160,10 @@ def search_deleted_files(query: str) -> list:
         summary = parts[3] if len(parts) > 3 else 'No message'
         
         # Recupera o conteúdo do arquivo no commit imediatamente anterior à deleção (usando o pai '^')
-        show_cmd = ['git', 'show', f'{deletion_commit}^:{rel_path}']
-        show_res = subprocess.run(show_cmd, cwd=project_root, capture_output=True, text=True, encoding='utf-8', errors='ignore')
+        blob = get_reader(project_root).read_blob(f'{deletion_commit}^', rel_path)
         
-        if show_res.returncode == 0:
-            content = show_res.stdout
+        if blob is not None:
+            content = blob.decode('utf-8', errors='ignore')
             lines = content.splitlines()
             
             # Busca pelo termo pesquisado no corpo do arquivo excluído
@@ -1,9 +1,10 @@
 # doxoade/doxoade/commands/search_systems/search_engine.py
 """Motor Nexus Search - Casa de Máquinas (MPoT-17)."""
-from doxoade.tools.alexandria.engine import alexandria_write
 import os
+import re
 from pathlib import Path
 from .search_state import SearchState
+from .search_index import TrigramIndex, index_terms, iter_search_files
 from doxoade.tools.streamer import ufs
 from doxoade.tools.vulcan.bridge import vulcan_bridge
 
@@ -13,7 +14,7 @@ def run_search_engine(state: SearchState, filters: dict):
     limit = state.limit
     path_filter = os.getcwd().replace('\\', '/').lower() if filters.get('here') else None
     if filters.get('run_code'):
-        state.matches = _search_code_logic(Path(state.root), q, limit)
+        state.matches = _search_code_logic(Path(state.root), q, limit, regex=filters.get('regex', False))
     if filters.get('run_time'):
         state.timeline = _search_timeline_logic(q, limit, path_filter)
     if filters.get('run_db'):
@@ -22,47 +23,62 @@ def run_search_engine(state: SearchState, filters: dict):
         from .search_utils import _handle_git_search
         state.git_results = _handle_git_search(q, limit)
 
-def _search_code_logic(root: Path, query: str, limit: int) -> list:
+def _code_candidates(root: Path, files: list, query: str, regex: bool):
+    """Filtra pelo índice trigram; None = confirmar em todos os arquivos."""
+    if os.environ.get('DOXOADE_SEARCH_INDEX') == '0' or not index_terms(query, regex):
+        return None
+    try:
+        index = TrigramIndex(root)
+        try:
+            index.refresh(files)
+            return index.candidates(query, regex)
+        finally:
+            index.close()
+    except Exception as e:
+        print(f'\x1b[0;33m _code_candidates - índice indisponível: {e}')
+        return None
+
+def _search_code_logic(root: Path, query: str, limit: int, regex: bool = False) -> list:
+    """Ocorrências da consulta no código; re.error (regex inválida) propaga para o comando."""
     matches = []
     q_lower = query.lower()
     q_bytes = query.encode('utf-8')
-    QUARANTINE = {'.git', 'venv', '__pycache__', 'build', 'dist', '.doxoade', '.doxoade_cache'}
-    v_mod = vulcan_bridge.get_optimized_module('vulcan_search')
-    for r, dirs, files in os.walk(root):
-        dirs[:] = [d for d in dirs if d not in QUARANTINE]
-        for filename in files:
-            file_path = Path(r) / filename
-            if file_path.suffix not in {'.py', '.md', '.txt', '.dox', '.toml'}:
-                continue
-            try:
-                if v_mod and hasattr(v_mod, 'scan_buffer_with_lines'):
-                    raw_data = ufs.get_raw_content(str(file_path))
-                    hits = v_mod.scan_buffer_with_lines(raw_data, q_bytes)
-                    if hits:
-                        content_str = raw_data.decode('utf-8', 'ignore')
-                        lines_cache = content_str.splitlines()
-                        for off, line_n in hits:
-                            if line_n <= len(lines_cache):
-                                matches.append({'file': str(file_path.relative_to(root)), 'line': line_n, 'text': lines_cache[line_n - 1].strip(), 'type': file_path.suffix})
+    pattern = re.compile(query, re.IGNORECASE) if regex else None
+    v_mod = None if regex else vulcan_bridge.get_optimized_module('vulcan_search')
+    files = list(iter_search_files(root))
+    candidates = _code_candidates(root, files, query, regex)
+    for file_path in files:
+        if candidates is not None and file_path.relative_to(root).as_posix() not in candidates:
+            continue
+        try:
+            if v_mod and hasattr(v_mod, 'scan_buffer_with_lines'):
+                raw_data = ufs.get_raw_content(str(file_path))
+                hits = v_mod.scan_buffer_with_lines(raw_data, q_bytes)
+                if hits:
+                    content_str = raw_data.decode('utf-8', 'ignore')
+                    lines_cache = content_str.splitlines()
+                    for off, line_n in hits:
+                        if line_n <= len(lines_cache):
+                            matches.append({'file': str(file_path.relative_to(root)), 'line': line_n, 'text': lines_cache[line_n - 1].strip(), 'type': file_path.suffix})
+                        if len(matches) >= limit:
+                            return matches
+            else:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    for i, line in enumerate(f, 1):
+                        if (pattern.search(line) if pattern else q_lower in line.lower()):
+                            matches.append({'file': str(file_path.relative_to(root)), 'line': i, 'text': line.strip(), 'type': file_path.suffix})
                             if len(matches) >= limit:
                                 return matches
-                else:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        for i, line in enumerate(f, 1):
-                            if q_lower in line.lower():
-                                matches.append({'file': str(file_path.relative_to(root)), 'line': i, 'text': line.strip(), 'type': file_path.suffix})
-                                if len(matches) >= limit:
-                                    return matches
-            except Exception as e:
-                print(f'\x1b[0;33m _search_code_logic - Exception: {e}')
-                continue
+        except Exception as e:
+            print(f'\x1b[0;33m _search_code_logic - Exception: {e}')
+            continue
     return matches
 
 def _search_database_logic(query, limit, path_filter) -> dict:
-    from doxoade.core_database import get_db_connection
+    from doxoade.core_database import get_db_connection, fts_phrase, has_table
     from doxoade.tools.aegis.nexus_db import Row
     
-    res = {'incidents': [], 'solutions': [], 'lexicon': []}
+    res = {'incidents': [], 'solutions': [], 'lexicon': [], 'findings': []}
     conn = get_db_connection()
     
     # Configura o retorno para dicionários (Rows)
@@ -111,6 +127,18 @@ def _search_database_logic(query, limit, path_filter) -> dict:
         for row in cursor.fetchall():
             res['solutions'].append({'file': row['file_path'], 'line': row.get('error_line', 0), 'message': row['message']})
             
+        # 4. Histórico de Findings (somente via FTS; a tabela cresce sem limite)
+        phrase = fts_phrase(query)
+        if phrase and has_table(cursor, 'findings_fts'):
+            cursor.execute('''
+                SELECT f.severity, f.message, f.file, f.line, e.command, e.timestamp
+                FROM findings_fts JOIN findings f ON f.id = findings_fts.rowid
+                JOIN events e ON e.id = f.event_id
+                WHERE findings_fts MATCH ? ORDER BY f.id DESC LIMIT ?
+            ''', (phrase, limit))
+            for row in cursor.fetchall():
+                res['findings'].append(dict(row))
+            
     except Exception as e:
         import logging
         logging.error(f"[SEARCH_DB] Falha na busca: {e}")
@@ -120,7 +148,7 @@ def _search_database_logic(query, limit, path_filter) -> dict:
     return res
 
 def _search_timeline_logic(query, limit, path_filter) -> list:
-    from doxoade.core_database import get_db_connection
+    from doxoade.core_database import get_db_connection, fts_phrase, has_table
     from doxoade.tools.aegis.nexus_db import Row  # noqa
     results = []
     conn = get_db_connection()
@@ -131,18 +159,27 @@ def _search_timeline_logic(query, limit, path_filter) -> list:
     else:
         conn.row_factory = Row
         
-    sql_q = f'%{query}%'
-    q = 'SELECT * FROM command_history WHERE full_command_line LIKE ?'
-    params = [sql_q]
-    if path_filter:
-        q += ' AND working_dir LIKE ?'
-        params.append(f'%{path_filter}%')
     try:
         cursor = conn.cursor()
-        alexandria_write("SELECT name FROM sqlite_master WHERE type='table' AND name='command_history'")
-        if not cursor.fetchone():
+        if not has_table(cursor, 'command_history'):
             return []
-        alexandria_write(q + ' ORDER BY id DESC LIMIT ?', params + [limit])
+        phrase = fts_phrase(query)
+        if phrase and has_table(cursor, 'command_history_fts'):
+            # Índice trigram: mesma semântica de substring do LIKE, sem varrer a tabela
+            q = 'SELECT h.* FROM command_history_fts JOIN command_history h ON h.id = command_history_fts.rowid WHERE command_history_fts MATCH ?'
+            params = [f'full_command_line : {phrase}']
+            if path_filter:
+                q += ' AND h.working_dir LIKE ?'
+                params.append(f'%{path_filter}%')
+            q += ' ORDER BY h.id DESC LIMIT ?'
+        else:
+            q = 'SELECT * FROM command_history WHERE full_command_line LIKE ?'
+            params = [f'%{query}%']
+            if path_filter:
+                q += ' AND working_dir LIKE ?'
+                params.append(f'%{path_filter}%')
+            q += ' ORDER BY id DESC LIMIT ?'
+        cursor.execute(q, params + [limit])
         for row in cursor.fetchall():
             results.append({'full_line': row['full_command_line'], 'dir': row['working_dir'], 'timestamp': row['timestamp'], 'exit_code': row['exit_code']})
     except Exception as e:
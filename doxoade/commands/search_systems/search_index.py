@@ -0,0 +1,112 @@
+# doxoade/doxoade/commands/search_systems/search_index.py
+"""
+Índice Trigram Persistente para 'doxoade search' (MPoT-17).
+- Posting lists trigram -> arquivos via FTS5 (tokenizer trigram, em C) em
+  .doxoade_cache/search_trigrams.db.
+- Atualização incremental por (mtime_ns, size): só arquivos alterados são relidos.
+- O índice só estreita candidatos (case-insensitive, superconjunto dos acertos);
+  a confirmação linha a linha continua no motor de busca.
+"""
+import os
+import doxoade.tools.aegis.nexus_db as sqlite3  # noqa
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+try:
+    import re._parser as _re_parser
+except ImportError:  # Python < 3.11
+    import sre_parse as _re_parser
+
+INDEX_FILE = 'search_trigrams.db'
+SEARCH_SUFFIXES = {'.py', '.md', '.txt', '.dox', '.toml'}
+QUARANTINE = {'.git', 'venv', '__pycache__', 'build', 'dist', '.doxoade', '.doxoade_cache'}
+
+def iter_search_files(root: Path) -> Iterable[Path]:
+    """Mesma ordem e poda do walker original do _search_code_logic."""
+    for r, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in QUARANTINE]
+        for filename in files:
+            file_path = Path(r) / filename
+            if file_path.suffix in SEARCH_SUFFIXES:
+                yield file_path
+
+def literal_runs(query: str, regex: bool = False) -> List[str]:
+    """Trechos literais obrigatórios da consulta (regex: apenas a sequência de topo)."""
+    if not regex:
+        return [query]
+    try:
+        parsed = _re_parser.parse(query)
+    except Exception:
+        return []
+    runs, current = [], []
+    for op, arg in parsed:
+        if op is _re_parser.LITERAL:
+            current.append(chr(arg))
+            continue
+        if current:
+            runs.append(''.join(current))
+            current = []
+    if current:
+        runs.append(''.join(current))
+    return runs
+
+def index_terms(query: str, regex: bool = False) -> List[str]:
+    """Trechos consultáveis no índice: < 3 chars não têm trigramas; não-ASCII evita divergência de case-folding FTS x Python."""
+    return [r for r in literal_runs(query, regex) if len(r) >= 3 and r.isascii()]
+
+class TrigramIndex:
+    """Índice de candidatos; a confirmação (linha a linha) continua no motor de busca."""
+
+    def __init__(self, root: Path, cache_dir: Optional[Path] = None):
+        self.root = Path(root)
+        cache_dir = cache_dir or self.root / '.doxoade_cache'
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_dir / INDEX_FILE))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE, mtime_ns INTEGER, size INTEGER)')
+        self.conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS bodies USING fts5(body, tokenize='trigram')")
+
+    def close(self):
+        self.conn.close()
+
+    def refresh(self, files: List[Path]) -> int:
+        """Sincroniza o índice com a lista atual; retorna quantos arquivos foram (re)indexados."""
+        known = {path: (fid, mt, sz) for fid, path, mt, sz in self.conn.execute('SELECT id, path, mtime_ns, size FROM files')}
+        seen, changed = set(), 0
+        with self.conn:
+            for file_path in files:
+                rel = file_path.relative_to(self.root).as_posix()
+                seen.add(rel)
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    continue
+                row = known.get(rel)
+                if row and row[1] == st.st_mtime_ns and row[2] == st.st_size:
+                    continue
+                try:
+                    body = file_path.read_bytes().decode('utf-8', 'ignore')
+                except OSError:
+                    continue
+                if row:
+                    fid = row[0]
+                    self.conn.execute('DELETE FROM bodies WHERE rowid = ?', (fid,))
+                    self.conn.execute('UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?', (st.st_mtime_ns, st.st_size, fid))
+                else:
+                    fid = self.conn.execute('INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)', (rel, st.st_mtime_ns, st.st_size)).lastrowid
+                self.conn.execute('INSERT INTO bodies (rowid, body) VALUES (?, ?)', (fid, body))
+                changed += 1
+            for rel in set(known) - seen:
+                fid = known[rel][0]
+                self.conn.execute('DELETE FROM bodies WHERE rowid = ?', (fid,))
+                self.conn.execute('DELETE FROM files WHERE id = ?', (fid,))
+        return changed
+
+    def candidates(self, query: str, regex: bool = False) -> Optional[Set[str]]:
+        """Caminhos relativos que podem conter a consulta; None = sem filtro possível."""
+        runs = index_terms(query, regex)
+        if not runs:
+            return None
+        expr = ' AND '.join('"' + r.replace('"', '""') + '"' for r in runs)
+        sql = 'SELECT f.path FROM bodies JOIN files f ON f.id = bodies.rowid WHERE bodies MATCH ?'
+        return {row[0] for row in self.conn.execute(sql, (expr,))}
@@ -9,7 +9,7 @@ class SearchState:
     query: str
     matches: List[Dict[str, Any]] = field(default_factory=list)
     timeline: List[Dict[str, Any]] = field(default_factory=list)
-    db_results: Dict[str, List] = field(default_factory=lambda: {'incidents': [], 'solutions': []})
+    db_results: Dict[str, List] = field(default_factory=lambda: {'incidents': [], 'solutions': [], 'findings': []})
     git_results: List[Dict[str, Any]] = field(default_factory=list)
     limit: int = 20
     is_full_mode: bool = False
\ No newline at end of file
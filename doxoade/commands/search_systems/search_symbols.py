@@ -0,0 +1,67 @@
+# doxoade/doxoade/commands/search_systems/search_symbols.py
+"""
+Índice de Símbolos do Projeto (MPoT-17).
+Uma única varredura dos .py monta identificador -> ocorrências e nome -> definições;
+o rastreio de funções migradas ('diff -s') consulta o índice em vez de reler a árvore
+a cada função removida e variante de consulta.
+"""
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+from .search_index import iter_search_files
+
+_IDENT = re.compile(r'[A-Za-z_]\w*')
+_DEF = re.compile(r'^\s*(?:async\s+)?(?:def|class)\s+([A-Za-z_]\w*)')
+
+class SymbolIndex:
+    """Ocorrências (arquivo, linha) por identificador, na ordem do walker de busca."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.files: List[str] = []
+        self.refs: Dict[str, List[Tuple[int, int]]] = {}
+        self.defs: Dict[str, List[Tuple[int, int]]] = {}
+        for file_path in iter_search_files(self.root):
+            if file_path.suffix == '.py':
+                self._index_file(file_path)
+
+    def _index_file(self, file_path: Path):
+        try:
+            text = file_path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            return
+        fid = len(self.files)
+        self.files.append(str(file_path))
+        refs, defs = self.refs, self.defs
+        for line_no, line in enumerate(text.splitlines(), 1):
+            seen = set()
+            for ident in _IDENT.findall(line):
+                if ident not in seen:
+                    seen.add(ident)
+                    refs.setdefault(ident, []).append((fid, line_no))
+            m = _DEF.match(line)
+            if m:
+                defs.setdefault(m.group(1), []).append((fid, line_no))
+
+    def _hits(self, postings, limit: int) -> List[dict]:
+        return [{'file': self.files[fid], 'line': line} for fid, line in sorted(set(postings))[:limit]]
+
+    def find_definitions(self, name: str, limit: int = 5) -> List[dict]:
+        return self._hits(self.defs.get(name, ()), limit)
+
+    def find_references(self, fragment: str, limit: int = 5) -> List[dict]:
+        """Linhas com um identificador que contém 'fragment' (equivale à busca textual para nomes)."""
+        if not fragment:
+            return []
+        postings = list(self.refs.get(fragment, ()))
+        for ident, occ in self.refs.items():
+            if fragment in ident and ident != fragment:
+                postings.extend(occ)
+        return self._hits(postings, limit)
+
+    def trace(self, name: str, limit: int = 5) -> List[dict]:
+        """Mesmas variantes do rastreio legado: 'def nome', versão Vulcan e nome sem '_' inicial."""
+        hits = self.find_definitions(name, limit)
+        hits += self.find_references(f'{name}_vulcan_optimized', limit)
+        hits += self.find_references(name.lstrip('_'), limit)
+        return hits
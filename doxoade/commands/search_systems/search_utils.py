@@ -36,12 +36,17 @@ def render_search_results(state: 'SearchState'):
         for inc in state.db_results['incidents']:
             echo(f"{Fore.YELLOW}[{inc['category']}] {Fore.WHITE}{inc['message']}{Style.RESET_ALL}")
             echo(f"  Em: {inc['file']}:{inc['line']}")
+    if state.db_results.get('findings'):
+        echo(f'{Fore.YELLOW}{Style.BRIGHT}\n╔═══ Histórico de Findings ═══╗{Style.RESET_ALL}')
+        for f in state.db_results['findings']:
+            echo(f"{Fore.YELLOW}[{f['severity']}] {Fore.WHITE}{f['message']}{Style.RESET_ALL}")
+            echo(f"  {Style.DIM}{(f['timestamp'] or '')[:10]} | {f['command']} | {f['file']}:{f['line']}{Style.RESET_ALL}")
     if state.timeline:
         echo(f'{Fore.MAGENTA}{Style.BRIGHT}\n╔═══ Timeline (Chronos) ═══╗{Style.RESET_ALL}')
         for t in state.timeline:
             status = f'{Fore.GREEN}✔' if t['exit_code'] == 0 else f'{Fore.RED}✘'
             echo(f" {status} {Fore.WHITE}{t['timestamp'][:19]} | {Fore.CYAN}{t['full_line']}{Style.RESET_ALL}")
-    has_results = any([state.matches, state.timeline, state.db_results['incidents'], state.db_results['solutions'], state.git_results])
+    has_results = any([state.matches, state.timeline, state.db_results['incidents'], state.db_results['solutions'], state.db_results.get('findings'), state.git_results])
     if not has_results:
         echo(f"\n{Fore.YELLOW}   [!] Nenhum resultado encontrado para '{state.query}' nos filtros ativos.{Style.RESET_ALL}")
 
@@ -8,6 +8,7 @@ import doxoade.tools.aegis.nexus_db as sqlite3 # noqa
 import json
 from doxoade.tools.doxcolors import Fore, Style
 from doxoade.core_database import get_db_connection
+from doxoade.tools.telemetry_tools.segment_log import ensure_compacted
 from . import telemetry_utils as utils
 from . import telemetry_io as io
 
@@ -21,10 +22,18 @@ from . import telemetry_io as io
 @click.option('--after', '-a', default=2, help='Linhas de contexto DEPOIS da hot-line (padrão: 2).')
 def telemetry(limit, command, stats, verbose, flow, context, after):
     """Análise profunda de Recursos (MPoT-12)."""
+    ensure_compacted()
     conn = get_db_connection()
     cursor = conn.cursor()
     try:
-        cursor.execute("SELECT * FROM command_history ORDER BY id DESC LIMIT ?", (limit,))
+        if stats:
+            _render_rollup_stats(cursor, command)
+            return
+        if command:
+            # idx_cmd_hist_name (command_name, id) cobre filtro + ordenação
+            cursor.execute("SELECT * FROM command_history WHERE command_name = ? ORDER BY id DESC LIMIT ?", (command, limit))
+        else:
+            cursor.execute("SELECT * FROM command_history ORDER BY id DESC LIMIT ?", (limit,))
         
         # FIX: Mapeamento manual de colunas para suportar NexusDB (Aegis)
         columns = [column[0] for column in cursor.description]
@@ -39,6 +48,22 @@ def telemetry(limit, command, stats, verbose, flow, context, after):
     finally:
         conn.close()
 
+def _render_rollup_stats(cursor, command=None):
+    """Visão executiva a partir de command_rollup_daily (sem varrer command_history)."""
+    sql = """
+        SELECT command_name, SUM(runs) AS runs, SUM(failures) AS failures,
+               SUM(total_ms) / SUM(runs) AS avg_ms, SUM(total_ram_mb) / SUM(runs) AS avg_ram,
+               SUM(total_io_read_mb) / SUM(runs) AS avg_io_r, SUM(total_io_write_mb) / SUM(runs) AS avg_io_w
+        FROM command_rollup_daily
+    """
+    params = ()
+    if command:
+        sql += " WHERE command_name = ?"
+        params = (command,)
+    cursor.execute(sql + " GROUP BY command_name ORDER BY avg_ms DESC", params)
+    columns = [column[0] for column in cursor.description]
+    io.render_rollup_stats([dict(zip(columns, row)) for row in cursor.fetchall()])
+
 def _render_entry(row, verbose: bool, flow: bool, context: int, after: int):
     # Agora row['exit_code'] e row['timestamp'] funcionam 100%
     status = Fore.GREEN + '✔' if row['exit_code'] == 0 else Fore.RED + '✘'
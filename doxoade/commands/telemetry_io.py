@@ -266,6 +266,13 @@ def render_stats_table(stats):
         avg = lambda x: sum(x) / len(x) if x else 0
         echo(f"{Fore.WHITE}{cmd:<15}{Style.RESET_ALL} | {len(data['dur']):<5} | {avg(data['dur']):<10.0f} | {avg(data['ram']):<8.1f} | {avg(data['io_r']):<8.2f} | {avg(data['io_w']):<8.2f}")
 
+def render_rollup_stats(rows):
+    header = f"""{'COMANDO':<15} | {'QTD':<5} | {'FALHAS':<6} | {'T-AVG(ms)':<10} | {'RAM(MB)':<8} | {'I/O R':<8} | {"I/O W":<8}"""
+    echo(Fore.CYAN + Style.BRIGHT + '\n=== 📈 DASHBOARD DE PERFORMANCE INDUSTRIAL ===')
+    echo(header + '\n' + '-' * len(header))
+    for r in rows:
+        echo(f"{Fore.WHITE}{r['command_name']:<15}{Style.RESET_ALL} | {r['runs']:<5} | {r['failures']:<6} | {r['avg_ms'] or 0:<10.0f} | {r['avg_ram'] or 0:<8.1f} | {r['avg_io_r'] or 0:<8.2f} | {r['avg_io_w'] or 0:<8.2f}")
+
 def render_vulcan_stats(stats, verbose=False):
     if not stats:
         return
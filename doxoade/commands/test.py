@@ -3,10 +3,11 @@ import click
 import subprocess
 import sys
 import os
+import time
 from doxoade.tools.doxcolors import Fore
 from doxoade.core_database import get_db_connection
 from datetime import datetime, timezone
-from doxoade.tools.filesystem import _get_venv_python_executable
+from doxoade.tools.filesystem import _get_venv_python_executable, _find_project_root
 from doxoade.tools.telemetry_tools.logger import ExecutionLogger
 
 def _register_test_failure(node_id, error_message):
@@ -27,29 +28,66 @@ def _register_test_failure(node_id, error_message):
 @click.argument('target', default='tests/', required=False)
 @click.option('-v', '--verbose', is_flag=True, help='Saída detalhada.')
 @click.option('--watch', is_flag=True, help='Modo sentinela (roda ao salvar). Requer pytest-watch.')
-def test(target, verbose, watch):
+@click.option('--changed', is_flag=True, help='Roda apenas os testes afetados pelas mudanças do working tree.')
+@click.option('--since', 'since_ref', default=None, help='Roda apenas os testes afetados desde a ref git informada.')
+def test(target, verbose, watch, changed, since_ref):
     """
     Executa a suíte de testes unitários (wrapper do Pytest).
     Registra falhas na memória do sistema.
     """
     python_exe = _get_venv_python_executable() or sys.executable
-    with ExecutionLogger('test', target, {'verbose': verbose}) as logger:
+    root = _find_project_root('.')
+    with ExecutionLogger('test', target, {'verbose': verbose, 'changed': changed, 'since': since_ref}) as logger:
         click.echo(Fore.CYAN + f"--- [TEST] Iniciando bateria de testes em '{target}' ---")
+        selection = [target]
+        if (changed or since_ref) and (not watch):
+            selection = _resolve_selection(root, target, since_ref)
+            if selection is None:
+                return
+        junit_path = os.path.join(root, '.doxoade_cache', 'last_junit.xml')
         if watch:
             cmd = [python_exe, '-m', 'pytest_watch', target]
         else:
-            cmd = [python_exe, '-m', 'pytest', target]
+            os.makedirs(os.path.dirname(junit_path), exist_ok=True)
+            cmd = [python_exe, '-m', 'pytest', *selection, f'--junitxml={junit_path}', '-o', 'junit_family=xunit1']
             if verbose:
                 cmd.append('-v')
             cmd.append('--color=yes')
         try:
+            t0 = time.perf_counter()
             result = subprocess.run(cmd)
+            elapsed = time.perf_counter() - t0
+            if not watch:
+                _persist_outcomes(junit_path, root)
             if result.returncode == 0:
-                click.echo(Fore.GREEN + '\n[OK] Todos os testes passaram.')
+                click.echo(Fore.GREEN + f'\n[OK] Todos os testes passaram ({elapsed:.2f}s).')
             else:
-                click.echo(Fore.RED + '\n[FALHA] Alguns testes quebraram.')
+                click.echo(Fore.RED + f'\n[FALHA] Alguns testes quebraram ({elapsed:.2f}s).')
                 logger.add_finding('ERROR', 'Falha na execução dos testes.')
         except KeyboardInterrupt:
             click.echo(Fore.YELLOW + '\n[TEST] Interrompido.')
         except Exception as e:
             click.echo(Fore.RED + f'[ERRO SISTEMA] {e}')
+
+def _resolve_selection(root, target, since_ref):
+    """Traduz o diff em alvos do pytest; None quando não há nada a rodar."""
+    from doxoade.commands.test_systems.selection_engine import select_affected_tests
+    sel = select_affected_tests(root, target=target.rstrip('/\\'), since=since_ref)
+    if sel['fallback']:
+        click.echo(Fore.YELLOW + f"[TEST] Grafo ambíguo: {sel['fallback']}. Rodando a suíte completa.")
+        return [target]
+    click.echo(Fore.WHITE + f"[TEST] {len(sel['changed'])} arquivo(s) alterado(s), {len(sel['affected'])} módulo(s) no raio de impacto.")
+    if not sel['tests']:
+        click.echo(Fore.GREEN + '[OK] Nenhum teste afetado pelas mudanças.')
+        return None
+    for t in sel['tests']:
+        click.echo(Fore.CYAN + f'   > {t}')
+    return [os.path.join(root, t) for t in sel['tests']]
+
+def _persist_outcomes(junit_path, root):
+    """Alimenta o histórico usado na ordenação do modo --changed."""
+    try:
+        from doxoade.commands.test_systems.selection_engine import record_test_outcomes
+        record_test_outcomes(junit_path, root)
+    except Exception as e:
+        click.echo(Fore.YELLOW + f'[TEST] Histórico de testes não gravado (ordenação do --changed): {e}')
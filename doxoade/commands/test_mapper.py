@@ -83,7 +83,7 @@ class TestMapper:
                 sources.append(p)
         test_metadata = {}
         for t in tests:
-            targets = self._find_targets_in_test(t)
+            targets = self.find_targets_in_test(t)
             test_metadata[t] = targets
         for s in sources:
             try:
@@ -109,7 +109,8 @@ class TestMapper:
                 self.map['orphans'].append(rel_s_str)
         return self.map
 
-    def _find_targets_in_test(self, test_path):
+    def find_targets_in_test(self, test_path):
+        """Alvos declarados no teste via '# TEST-TARGET: <caminho>' (normalizados com '/')."""
         targets = []
         try:
             with open(test_path, 'r', encoding='utf-8', errors='ignore') as f:
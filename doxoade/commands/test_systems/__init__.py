@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+# doxoade/commands/test_systems/__init__.py
+"""
+Doxoade Test Systems — Seleção de testes guiada por mudanças.
+=============================================================
+• Arquivos alterados via git (working tree ou desde uma ref)
+• Fecho transitivo reverso sobre o grafo de imports do Nexus Impact
+• Ordenação por histórico de falhas/duração gravado no banco global
+"""
+
+from doxoade.commands.test_systems.selection_engine import select_affected_tests, record_test_outcomes
+
+__all__ = ['select_affected_tests', 'record_test_outcomes']
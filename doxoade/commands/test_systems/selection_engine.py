@@ -0,0 +1,242 @@
+# doxoade/doxoade/commands/test_systems/selection_engine.py
+"""
+Seletor de Testes por Impacto (Change-Aware Selection).
+Cruza o diff do git com o grafo reverso de imports do Nexus Impact e com o
+TestMapper para rodar apenas os módulos de teste afetados.
+"""
+import os
+import ast
+import xml.etree.ElementTree as ET
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+from doxoade.tools.git import _run_git_command
+from doxoade.tools.filesystem import _get_project_config
+from doxoade.commands.impact_systems.impact_logic import build_project_index
+from doxoade.commands.impact_systems.impact_utils import path_to_module_name, resolve_relative_import, load_impact_cache, save_impact_cache
+
+# Arquivos que alteram a coleta/execução do pytest como um todo.
+GLOBAL_TRIGGERS = {'conftest.py', 'pyproject.toml', 'setup.py', 'setup.cfg', 'pytest.ini', 'tox.ini', 'requirements.txt'}
+# Mudanças que nunca afetam o resultado dos testes.
+INERT_SUFFIXES = {'.md', '.rst'}
+TEST_PRUNE = {'.git', 'venv', '.venv', '__pycache__', '.pytest_cache', '.doxoade_cache', 'build', 'dist', 'node_modules', 'pytest_temp_dir'}
+
+def _norm_module(name: str) -> str:
+    """'pkg.__init__' e 'pkg' são o mesmo nó do grafo."""
+    return name[:-len('.__init__')] if name.endswith('.__init__') else name
+
+def _is_test_file(name: str) -> bool:
+    return name.endswith('.py') and (name.startswith('test_') or name.endswith('_test.py'))
+
+def _conventional_source(test_rel: str) -> str:
+    """Convenção do TestMapper: test_foo.py / foo_test.py -> foo.py."""
+    stem = Path(test_rel).stem
+    if stem.startswith('test_'):
+        return f'{stem[5:]}.py'
+    return f'{stem[:-5]}.py'
+
+def get_changed_files(root: str, since: str=None):
+    """Retorna caminhos (relativos à raiz) alterados no git, ou None se o git falhar."""
+    ref = since or 'HEAD'
+    diff_out = _run_git_command(['diff', '--name-only', '--relative', ref], capture_output=True, silent_fail=True, cwd=root)
+    if diff_out is None:
+        return None
+    untracked = _run_git_command(['ls-files', '--others', '--exclude-standard'], capture_output=True, silent_fail=True, cwd=root) or ''
+    changed = {line.strip().replace('\\', '/') for line in (diff_out + '\n' + untracked).splitlines() if line.strip()}
+    return sorted(changed)
+
+def build_reverse_graph(index: dict) -> dict:
+    """
+    Inverte o índice de imports: módulo -> conjunto de módulos que o importam.
+    Importar 'a.b.c' também executa 'a' e 'a.b', então os pacotes pais herdam a aresta.
+    """
+    reverse = defaultdict(set)
+    for mod, data in index.items():
+        importer = _norm_module(mod)
+        for imp in set(data.get('imports', [])) | set(data.get('from_imports', [])):
+            parts = imp.split('.')
+            for i in range(1, len(parts) + 1):
+                node = '.'.join(parts[:i])
+                if node != importer:
+                    reverse[node].add(importer)
+    return reverse
+
+def reverse_closure(seeds: set, reverse: dict) -> set:
+    """Fecho transitivo reverso (BFS iterativo, imune a ciclos)."""
+    seen = set(seeds)
+    queue = deque(seeds)
+    while queue:
+        mod = queue.popleft()
+        for importer in reverse.get(mod, ()):
+            if importer not in seen:
+                seen.add(importer)
+                queue.append(importer)
+    return seen
+
+def discover_test_files(root: str, target: str=None) -> list:
+    """Localiza módulos de teste sob o alvo (ou sob a raiz inteira)."""
+    base = Path(root) / target if target and (Path(root) / target).is_dir() else Path(root)
+    found = []
+    for r, dirs, files in os.walk(base):
+        dirs[:] = [d for d in dirs if d not in TEST_PRUNE]
+        for f in files:
+            if _is_test_file(f):
+                found.append(os.path.relpath(os.path.join(r, f), root).replace('\\', '/'))
+    return sorted(found)
+
+def _scan_test_dependencies(test_abs: str, root: str):
+    """Extrai módulos importados e caminhos .py literais de um arquivo de teste."""
+    with open(test_abs, 'r', encoding='utf-8', errors='ignore') as f:
+        tree = ast.parse(f.read())
+    mod_name = path_to_module_name(test_abs, root)
+    modules, paths = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            resolved = resolve_relative_import(node.module, node.level, mod_name)
+            if resolved:
+                modules.add(resolved)
+                modules.update(f'{resolved}.{alias.name}' for alias in node.names if alias.name != '*')
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.endswith('.py'):
+            paths.add(os.path.normpath(node.value).replace('\\', '/'))
+    return modules, paths
+
+def select_affected_tests(root: str, target: str=None, since: str=None) -> dict:
+    """
+    Seleciona os testes afetados pelas mudanças desde 'since' (ou o working tree).
+    Retorna {'tests', 'changed', 'affected', 'fallback'}; 'fallback' preenchido
+    significa que o grafo é ambíguo e a suíte completa deve rodar.
+    """
+    changed = get_changed_files(root, since)
+    if changed is None:
+        return {'tests': [], 'changed': [], 'affected': set(), 'fallback': 'git indisponível ou ref inválida'}
+    return select_tests_for_changes(root, changed, target)
+
+def select_tests_for_changes(root: str, changed: list, target: str=None) -> dict:
+    """Mesma seleção de select_affected_tests, a partir de uma lista já conhecida de caminhos alterados."""
+    result = {'tests': [], 'changed': list(changed), 'affected': set(), 'fallback': None}
+    config = _get_project_config(None, start_path=root)
+    search_path = config['search_path']
+    index = build_project_index(search_path, set(config.get('ignore', [])), load_impact_cache(root))
+    save_impact_cache(root, index)
+    known = {_norm_module(m): data for m, data in index.items()}
+    all_tests = discover_test_files(root, target)
+    seeds, changed_tests, changed_paths = set(), set(), set()
+    for rel in changed:
+        name = os.path.basename(rel)
+        suffix = os.path.splitext(rel)[1].lower()
+        if name in GLOBAL_TRIGGERS:
+            result['fallback'] = f'{rel} altera a suíte inteira'
+            return result
+        if suffix in INERT_SUFFIXES:
+            continue
+        if _is_test_file(name):
+            changed_tests.add(rel)
+            continue
+        if suffix != '.py':
+            result['fallback'] = f'{rel} não pertence ao grafo de imports'
+            return result
+        abs_p = os.path.join(root, rel)
+        mod = _norm_module(path_to_module_name(abs_p, search_path))
+        entry = known.get(mod)
+        if entry is None and name != '__init__.py' and os.path.exists(abs_p):
+            result['fallback'] = f'{rel} está fora do índice Nexus'
+            return result
+        if entry is not None and entry.get('error'):
+            result['fallback'] = f"{rel} não pôde ser analisado ({entry['error']})"
+            return result
+        seeds.add(mod)
+        changed_paths.add(rel)
+    affected = reverse_closure(seeds, build_reverse_graph(index))
+    result['affected'] = affected
+    affected_paths = {os.path.relpath(os.path.join(search_path, known[m]['path']), root).replace('\\', '/') for m in affected if m in known} | changed_paths
+    affected_names = {os.path.basename(p) for p in affected_paths}
+    from doxoade.commands.test_mapper import TestMapper
+    mapper = TestMapper(root)
+    selected = set()
+    for test_rel in all_tests:
+        if test_rel in changed_tests:
+            selected.add(test_rel)
+            continue
+        test_abs = os.path.join(root, test_rel)
+        try:
+            modules, literals = _scan_test_dependencies(test_abs, root)
+        except (SyntaxError, ValueError):
+            selected.add(test_rel)
+            continue
+        if modules & affected or literals & affected_paths:
+            selected.add(test_rel)
+            continue
+        targets = set(mapper.find_targets_in_test(Path(test_abs)))
+        if targets & (affected_paths | affected_names) or _conventional_source(test_rel) in affected_names:
+            selected.add(test_rel)
+    result['tests'] = order_by_history(sorted(selected), root)
+    return result
+
+def _ensure_history_table(conn):
+    conn.execute('\n        CREATE TABLE IF NOT EXISTS test_history (\n            id INTEGER PRIMARY KEY AUTOINCREMENT, project_path TEXT NOT NULL,\n            test_file TEXT NOT NULL, tests INTEGER NOT NULL DEFAULT 0,\n            failures INTEGER NOT NULL DEFAULT 0, duration_ms REAL NOT NULL DEFAULT 0,\n            timestamp TEXT NOT NULL\n        )\n    ')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_test_history_file ON test_history(project_path, test_file)')
+
+def load_test_history(root: str) -> dict:
+    """Agrega o histórico por módulo de teste: {arquivo: (execuções, falhas, ms médio)}."""
+    from doxoade.core_database import get_db_connection
+    try:
+        conn = get_db_connection()
+    except Exception:
+        return {}
+    try:
+        _ensure_history_table(conn)
+        rows = conn.execute('SELECT test_file, COUNT(*), SUM(CASE WHEN failures > 0 THEN 1 ELSE 0 END), AVG(duration_ms) FROM test_history WHERE project_path = ? GROUP BY test_file', (os.path.abspath(root),)).fetchall()
+        return {r[0]: (r[1], r[2] or 0, r[3] or 0.0) for r in rows}
+    except Exception:
+        return {}
+    finally:
+        conn.close()
+
+def order_by_history(tests: list, root: str) -> list:
+    """Testes que mais quebram primeiro; empate resolvido pelos mais rápidos (fail-fast)."""
+    history = load_test_history(root)
+
+    def _rank(test_rel):
+        runs, fails, avg_ms = history.get(test_rel, (0, 0, 0.0))
+        fail_rate = (fails + 1) / (runs + 2)
+        return (-fail_rate, avg_ms, test_rel)
+    return sorted(tests, key=_rank)
+
+def parse_junit_outcomes(junit_path: str, root: str) -> dict:
+    """Consolida o relatório JUnit (xunit1) por arquivo de teste."""
+    outcomes = defaultdict(lambda: {'tests': 0, 'failures': 0, 'duration_ms': 0.0})
+    tree = ET.parse(junit_path)
+    for case in tree.iter('testcase'):
+        file_attr = case.get('file')
+        if not file_attr:
+            file_attr = case.get('classname', '').replace('.', '/') + '.py'
+        rel = os.path.relpath(os.path.join(root, file_attr), root).replace('\\', '/')
+        slot = outcomes[rel]
+        slot['tests'] += 1
+        slot['duration_ms'] += float(case.get('time', 0) or 0) * 1000
+        if case.find('failure') is not None or case.find('error') is not None:
+            slot['failures'] += 1
+    return dict(outcomes)
+
+def record_test_outcomes(junit_path: str, root: str) -> int:
+    """Grava os resultados da execução em uma única transação."""
+    from doxoade.core_database import get_db_connection
+    if not os.path.exists(junit_path):
+        return 0
+    outcomes = parse_junit_outcomes(junit_path, root)
+    if not outcomes:
+        return 0
+    ts = datetime.now(timezone.utc).isoformat()
+    project = os.path.abspath(root)
+    rows = [(project, f, o['tests'], o['failures'], o['duration_ms'], ts) for f, o in outcomes.items()]
+    conn = get_db_connection()
+    try:
+        _ensure_history_table(conn)
+        with conn:
+            conn.executemany('INSERT INTO test_history (project_path, test_file, tests, failures, duration_ms, timestamp) VALUES (?, ?, ?, ?, ?, ?)', rows)
+    finally:
+        conn.close()
+    return len(rows)
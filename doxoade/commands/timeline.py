@@ -7,6 +7,7 @@ from datetime import datetime, timezone  # <--- ADICIONE ESTA LINHA
 from doxoade.tools.doxcolors   import Fore, Style
 from doxoade.tools.aegis.vault import NexusVault
 from doxoade.core_database import get_db_connection
+from doxoade.tools.telemetry_tools.segment_log import ensure_compacted
 import doxoade.tools.aegis.nexus_db as sqlite3  # noqa
 
 def _format_local_timestamp(ts_str: str) -> str:
@@ -34,6 +35,7 @@ def _format_local_timestamp(ts_str: str) -> str:
 @click.option('--full', is_flag=True, help='Mostra os detalhes do Payload.')
 def timeline(limit, full):
     """Exibe o histórico cronológico de ações e alterações."""
+    ensure_compacted()
     conn = get_db_connection()
     conn.row_factory = sqlite3.Row 
     events = conn.execute('SELECT * FROM command_history ORDER BY id DESC LIMIT ?', (limit,)).fetchall()
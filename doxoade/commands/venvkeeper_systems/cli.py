@@ -143,11 +143,7 @@ def cli(ctx, guard):
     """olDox222 Advanced Development Environment (doxoade)."""
     ctx.ensure_object(dict)
 
-    # 1. Persistência (Osíris)
-    from doxoade.tools.db_utils import start_persistence_worker
-    start_persistence_worker()
-
-    # 2. Banco de Dados (Ma'at)
+    # 1. Banco de Dados (Ma'at)
     from doxoade.core_database import init_db
     try: init_db()
     except Exception as e:
@@ -161,7 +157,7 @@ def cli(ctx, guard):
         exc_trace(exc_tb)
         sys.exit(1)
 
-    # 3. Telemetria (Chronos)
+    # 2. Telemetria (Chronos)
     # Registrada para QUALQUER subcomando invocado — o atexit no ChronosRecorder
     # garante que end_command seja chamado mesmo se sys.exit() vier antes do
     # result_callback (comportamento padrão do Click standalone_mode=True).
@@ -0,0 +1,270 @@
+# doxoade/doxoade/commands/venvkeeper_systems/store.py
+"""
+Store endereçado por conteúdo para site-packages (dedup por hardlink).
+
+- dedup_tree: cada arquivo regular vira um hardlink para STORE/objects/<sha256>.<modo>;
+  wheels idênticos (numpy, pandas, Cython...) em vários venvs ocupam um só inode.
+- expand_tree: reverte, devolvendo cópias independentes; objetos órfãos são coletados.
+- site_packages_sizes: tamanhos por pacote a partir do RECORD dos dist-info,
+  memorizados num ledger (STORE/size_ledger.json) por (mtime_ns, size) do RECORD.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import shutil
+import stat
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .constants import BASE, DUMP_DIR_NAMES
+
+STORE = BASE / "store"
+OBJECTS = STORE / "objects"
+LEDGER = STORE / "ledger.json"
+SIZE_LEDGER = STORE / "size_ledger.json"
+MIN_DEDUP_BYTES = 1024
+_CHUNK = 1 << 20
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _read_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def iter_regular_files(root: Path):
+    """(caminho, stat) de arquivos regulares, sem seguir symlinks (scandir: 1 stat por arquivo)."""
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield Path(entry.path), entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def dir_size(path: Path, seen: set | None = None) -> int:
+    """Tamanho total; com 'seen' cada inode (hardlink) conta uma única vez."""
+    total = 0
+    for _, st in iter_regular_files(path):
+        if seen is not None:
+            ident = (st.st_dev, st.st_ino)
+            if ident in seen:
+                continue
+            seen.add(ident)
+        total += st.st_size
+    return total
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _object_path(digest: str, mode: int) -> Path:
+    # O modo inteiro entra na chave: hardlinks compartilham o modo do inode.
+    return OBJECTS / digest[:2] / f"{digest}.{stat.S_IMODE(mode):04o}"
+
+
+def _store_inodes() -> set:
+    return {(st.st_dev, st.st_ino) for _, st in iter_regular_files(OBJECTS)} if OBJECTS.exists() else set()
+
+
+# ---------------------------------------------------------------------------
+# Dedup / Expand
+# ---------------------------------------------------------------------------
+
+def dedup_tree(root: Path, dry_run: bool = False, min_size: int = MIN_DEDUP_BYTES) -> dict:
+    """
+    Substitui arquivos por hardlinks para o store.
+    Retorna {'files', 'linked', 'saved', 'stored', 'skipped'}.
+    """
+    stats = {"files": 0, "linked": 0, "saved": 0, "stored": 0, "skipped": 0}
+    if not dry_run:
+        OBJECTS.mkdir(parents=True, exist_ok=True)
+    store_dir = OBJECTS
+    while not store_dir.exists() and store_dir.parent != store_dir:
+        store_dir = store_dir.parent  # dry-run: o store ainda pode não existir
+    if os.stat(root).st_dev != os.stat(store_dir).st_dev:
+        raise RuntimeError(f"Hardlink impossível: {root} está em outro volume que {STORE}")
+
+    for path, st in iter_regular_files(root):
+        if st.st_size < min_size:
+            continue
+        stats["files"] += 1
+        try:
+            obj = _object_path(file_digest(path), st.st_mode)
+            if obj.exists():
+                ost = obj.stat()
+                if (ost.st_dev, ost.st_ino) == (st.st_dev, st.st_ino):
+                    continue
+                if not dry_run:
+                    tmp = path.with_name(path.name + ".vk-link")
+                    os.link(obj, tmp)
+                    os.replace(tmp, path)
+                stats["linked"] += 1
+                stats["saved"] += st.st_size
+            elif not dry_run:
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                os.link(path, obj)  # o próprio arquivo vira o objeto (sem cópia)
+                stats["stored"] += 1
+        except OSError:
+            stats["skipped"] += 1
+
+    if not dry_run:
+        ledger = _read_json(LEDGER)
+        ledger[str(root)] = {"linked": stats["linked"], "saved": stats["saved"],
+                             "at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+        _write_json(LEDGER, ledger)
+    return stats
+
+
+def expand_tree(root: Path, dry_run: bool = False) -> dict:
+    """Troca hardlinks do store por cópias independentes. Retorna {'restored', 'bytes'}."""
+    stats = {"restored": 0, "bytes": 0}
+    inodes = _store_inodes()
+    for path, st in iter_regular_files(root):
+        if st.st_nlink < 2 or (st.st_dev, st.st_ino) not in inodes:
+            continue
+        if not dry_run:
+            tmp = path.with_name(path.name + ".vk-copy")
+            shutil.copy2(path, tmp)
+            os.replace(tmp, path)
+        stats["restored"] += 1
+        stats["bytes"] += st.st_size
+
+    if not dry_run:
+        ledger = _read_json(LEDGER)
+        if ledger.pop(str(root), None) is not None:
+            _write_json(LEDGER, ledger)
+    return stats
+
+
+def gc_store() -> int:
+    """Remove objetos que nenhum venv referencia mais (st_nlink == 1)."""
+    removed = 0
+    if not OBJECTS.exists():
+        return 0
+    for path, st in iter_regular_files(OBJECTS):
+        if st.st_nlink == 1:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def store_ledger() -> dict:
+    return _read_json(LEDGER)
+
+
+# ---------------------------------------------------------------------------
+# Tamanhos via RECORD
+# ---------------------------------------------------------------------------
+
+def _group_name(top: str) -> str:
+    return top.split("-")[0].split(".")[0].lower()
+
+
+def _record_groups(sp: Path, record: Path) -> dict:
+    """{pacote: bytes} de um RECORD; entradas sem tamanho (ex.: .pyc) recebem um stat."""
+    groups: dict[str, int] = {}
+    try:
+        with open(record, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return groups
+    for row in rows:
+        if not row or row[0].startswith(("..", "/")):
+            continue
+        rel = row[0].replace("\\", "/")
+        top = rel.split("/")[0]
+        if top in DUMP_DIR_NAMES or top.startswith("_"):
+            continue
+        size = row[2] if len(row) > 2 else ""
+        if size.isdigit():
+            n = int(size)
+        else:
+            try:
+                n = (sp / rel).stat().st_size
+            except OSError:
+                n = 0
+        name = _group_name(top)
+        groups[name] = groups.get(name, 0) + n
+    return groups
+
+
+def site_packages_sizes(sp: Path) -> dict:
+    """
+    Tamanho por pacote primário (mesmo agrupamento do _analyze_libs).
+    Só itens sem dist-info/RECORD são percorridos em disco.
+    """
+    ledger = _read_json(SIZE_LEDGER)
+    sizes: dict[str, int] = {}
+    owned: set[str] = set()
+    dirty = False
+    records = [p / "RECORD" for p in sp.glob("*.dist-info")]
+    for record in records:
+        try:
+            st = record.stat()
+        except OSError:
+            continue
+        key = str(record)
+        entry = ledger.get(key)
+        if not (entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size):
+            entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "groups": _record_groups(sp, record)}
+            ledger[key] = entry
+            dirty = True
+        for name, n in entry["groups"].items():
+            sizes[name] = sizes.get(name, 0) + n
+        owned.update(entry["groups"])
+        owned.add(_group_name(record.parent.name))
+
+    for item in sp.iterdir():
+        if item.name in DUMP_DIR_NAMES or item.name.startswith("_"):
+            continue
+        name = _group_name(item.name)
+        if name in owned:
+            continue
+        try:
+            n = dir_size(item) if item.is_dir() else (item.stat().st_size if item.is_file() else 0)
+        except OSError:
+            n = 0
+        sizes[name] = sizes.get(name, 0) + n
+
+    if dirty:
+        live = {str(r) for r in records}
+        prefix = str(sp)
+        ledger = {k: v for k, v in ledger.items() if not k.startswith(prefix) or k in live}
+        try:
+            _write_json(SIZE_LEDGER, ledger)
+        except OSError:
+            pass
+    return sizes
@@ -14,6 +14,8 @@ from pathlib import Path
 
 import click
 
+from .store import dedup_tree, dir_size, expand_tree, gc_store, site_packages_sizes, store_ledger
+
 # ---------------------------------------------------------------------------
 # Constantes
 # ---------------------------------------------------------------------------
@@ -350,11 +352,15 @@ def show_status(root: Path | None = None) -> None:
         click.echo(msg)
         return
 
+    dedup = store_ledger()
     for src, info in filtered.items():
         click.echo(f"- {src}")
         click.echo(f"  stored: {info['stored']}")
         click.echo(f"  state : {info.get('state', 'unknown')}")
         click.echo(f"  at    : {info.get('created_at', '-')}")
+        sp = _get_site_packages_path(Path(info["stored"]))
+        if sp is not None and str(sp) in dedup:
+            click.echo(f"  dedup : {dedup[str(sp)]['linked']} arquivo(s), {fmt_size(dedup[str(sp)]['saved'])} economizados")
 
 
 # ---------------------------------------------------------------------------
@@ -420,18 +426,8 @@ def batch_return_venvs(root: Path, force: bool = False) -> None:
 # ---------------------------------------------------------------------------
 
 def _dir_size(path: Path) -> int:
-    """Tamanho total de um diretório. Compatível com Python 3.8+."""
-    total = 0
-    try:
-        for entry in path.rglob("*"):
-            try:
-                if not entry.is_symlink() and entry.is_file():
-                    total += entry.stat().st_size
-            except OSError:
-                pass
-    except OSError:
-        pass
-    return total
+    """Tamanho total de um diretório (scandir: um stat por arquivo)."""
+    return dir_size(path)
 
 
 def _collect_dump_targets(
@@ -601,6 +597,50 @@ def batch_dump_venvs(root: Path | None, dry_run: bool = False) -> None:
         click.secho(f"             {failures} falha(s)", fg="yellow")
 
 
+# ---------------------------------------------------------------------------
+# Dedup — store endereçado por conteúdo (hardlinks)
+# ---------------------------------------------------------------------------
+
+def dedup_venv(src: Path, dry_run: bool = False) -> None:
+    """Liga os arquivos de site-packages ao store compartilhado."""
+    src = src.absolute()
+    for real in _resolve_real_paths(src):
+        sp = _get_site_packages_path(real)
+        if sp is None:
+            click.secho(f"[SKIP] {real}: site-packages não encontrado", fg="yellow")
+            continue
+        try:
+            stats = dedup_tree(sp, dry_run=dry_run)
+        except RuntimeError as e:
+            click.secho(f"[SKIP] {e}", fg="yellow")
+            continue
+        prefix = "[DRY-RUN] " if dry_run else ""
+        click.echo(f"{prefix}[DEDUP] {real}")
+        click.echo(f"  analisados : {stats['files']}")
+        click.echo(f"  hardlinks  : {stats['linked']} ({fmt_size(stats['saved'])} economizados)")
+        click.echo(f"  novos objs : {stats['stored']}")
+        if stats["skipped"]:
+            click.secho(f"  ignorados  : {stats['skipped']}", fg="yellow")
+
+
+def expand_venv(src: Path, dry_run: bool = False) -> None:
+    """Reverte o dedup: cada arquivo volta a ser uma cópia independente."""
+    src = src.absolute()
+    for real in _resolve_real_paths(src):
+        sp = _get_site_packages_path(real)
+        if sp is None:
+            click.secho(f"[SKIP] {real}: site-packages não encontrado", fg="yellow")
+            continue
+        stats = expand_tree(sp, dry_run=dry_run)
+        prefix = "[DRY-RUN] " if dry_run else ""
+        click.echo(f"{prefix}[EXPAND] {real}")
+        click.echo(f"  restaurados: {stats['restored']} ({fmt_size(stats['bytes'])})")
+    if not dry_run:
+        removed = gc_store()
+        if removed:
+            click.echo(f"[STORE] {removed} objeto(s) órfão(s) removido(s)")
+
+
 # ---------------------------------------------------------------------------
 # Inteligência AST e Análise de Libs
 # ---------------------------------------------------------------------------
@@ -657,15 +697,8 @@ def _analyze_libs(venv_path: Path) -> dict:
         click.secho(f"  [WARN] Pasta site-packages não encontrada em {venv_path}", fg="yellow")
         return {}
 
-    lib_sizes: dict[str, int] = {}
-
-    for item in sp.iterdir():
-        if item.name in DUMP_DIR_NAMES or item.name.startswith("_"):
-            continue
-
-        base_name = item.name.split("-")[0].split(".")[0].lower()
-        size = _dir_size(item) if item.is_dir() else (item.stat().st_size if item.is_file() else 0)
-        lib_sizes[base_name] = lib_sizes.get(base_name, 0) + size
+    # RECORD dos dist-info + ledger de tamanhos; só pacotes sem RECORD são percorridos.
+    lib_sizes = site_packages_sizes(sp)
 
     sorted_libs = dict(sorted(lib_sizes.items(), key=lambda x: x[1], reverse=True))
 
@@ -1042,6 +1075,28 @@ def optimize_venv(
     help="Limpar resíduos de todos os venvs na árvore atual.",
 )
 
+# ---------------- STORE (DEDUP) ----------------
+@click.option(
+    "-dd",
+    "--dedup",
+    "dedup_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    is_flag=False,
+    flag_value=Path("."),
+    help="Deduplicar site-packages via hardlinks no store (com --move: após mover).",
+)
+@click.option(
+    "-ex",
+    "--expand",
+    "expand_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    is_flag=False,
+    flag_value=Path("."),
+    help="Reverter o dedup (cópias independentes).",
+)
+
 # ---------------- OPERAÇÕES DE OTIMIZAÇÃO ----------------
 @click.option(
     "--optimize",
@@ -1084,6 +1139,8 @@ def venvkeeper(
     batch_return,
     dump_path,
     batch_dump_root,
+    dedup_path,
+    expand_path,
     optimize_path,
     clean_lib,
     update,
@@ -1130,6 +1187,20 @@ def venvkeeper(
         batch_dump_venvs(root, dry_run=dry_run)
         return
 
+    if expand_path is not None:
+        try:
+            expand_venv(Path(str(expand_path)), dry_run=dry_run)
+        except Exception as e:
+            click.secho(f"[ERRO] {e}", fg="red")
+        return
+
+    if dedup_path is not None and move_path is None:
+        try:
+            dedup_venv(Path(str(dedup_path)), dry_run=dry_run)
+        except Exception as e:
+            click.secho(f"[ERRO] {e}", fg="red")
+        return
+
     if batch_alloc_root is not None:
         root = Path(str(batch_alloc_root))
         _batch_optimize_alloc(root, dry_run=dry_run)
@@ -1146,6 +1217,8 @@ def venvkeeper(
     if move_path is not None:
         try:
             move_venv(move_path, force=force)
+            if dedup_path is not None:
+                dedup_venv(move_path, dry_run=dry_run)
         except Exception as e:
             click.secho(f"[ERRO] {e}", fg="red")
         return
@@ -1159,7 +1232,7 @@ def venvkeeper(
 
     raise click.UsageError(
         "Use --move, --return, --scan, --batch-move, --batch-return, "
-        "--dump, --batch-dump, --optimize, --batch-alloc ou --status"
+        "--dump, --batch-dump, --dedup, --expand, --optimize, --batch-alloc ou --status"
     )
 
 
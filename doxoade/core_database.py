@@ -37,9 +37,8 @@ DOXOADE_GLOBAL_DIR = Path.home() / ".doxoade"
 DB_DIR = GLOBAL_DATA_DIR
 DB_FILE = GLOBAL_DB_FILE
 
-DB_VERSION = 134
+DB_VERSION = 136
 _CACHED_DB_PATH = None
-_LOG_QUEUE = None
 
 if os.environ.get("VULCAN_VERBOSE") == "1":
     click.echo(f"[DB-TRACE] 📡 Beacon travou o DB Global em: {DB_FILE}")
@@ -231,6 +230,170 @@ def _m_v134_incident_schema_repair(cursor):
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_incidents_hash ON open_incidents(finding_hash);')
 
 
+# Padrão de erro = prefixo da mensagem até a primeira aspa (mesma regra do dashboard).
+_MESSAGE_PATTERN_SQL = "trim(CASE WHEN instr({m}, char(39)) > 0 THEN substr({m}, 1, instr({m}, char(39)) - 1) ELSE {m} END, char(9, 10, 13, 32))"
+
+def fts5_trigram_available() -> bool:
+    """Sonda se o SQLite embarcado tem FTS5 com tokenizer trigram (>= 3.34)."""
+    probe = real_sqlite3.connect(':memory:')
+    try:
+        probe.execute("CREATE VIRTUAL TABLE _probe USING fts5(x, tokenize='trigram')")
+        return True
+    except real_sqlite3.Error:
+        return False
+    finally:
+        probe.close()
+
+def fts_phrase(query: str):
+    """Frase FTS5 segura para o tokenizer trigram; None quando a consulta é curta demais (< 3 chars)."""
+    if len(query) < 3:
+        return None
+    return '"' + query.replace('"', '""') + '"'
+
+def has_table(cursor, name: str) -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,))
+    return cursor.fetchone() is not None
+
+def _m_v135_analytics_rollups(cursor):
+    """Rollups mantidos por gatilho, índices de cobertura e FTS5 (dashboard/telemetry/search)."""
+    click.secho("📊 [HADES] Instalando rollups analíticos e índices de texto...", fg='cyan')
+    # 1. Índices de cobertura
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_findings_sev_event ON findings(severity, event_id);')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_cmd_hist_name ON command_history(command_name, id);')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_command ON events(command);')
+
+    # 2. Rollups
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS finding_rollup_daily (
+            day TEXT NOT NULL, command TEXT NOT NULL, category TEXT NOT NULL, severity TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, command, category, severity)
+        ) WITHOUT ROWID;
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS finding_message_rollup (
+            pattern TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_msg_rollup_count ON finding_message_rollup(count DESC);')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS command_rollup_daily (
+            day TEXT NOT NULL, command_name TEXT NOT NULL,
+            runs INTEGER NOT NULL DEFAULT 0, failures INTEGER NOT NULL DEFAULT 0,
+            total_ms REAL NOT NULL DEFAULT 0, total_ram_mb REAL NOT NULL DEFAULT 0,
+            total_io_read_mb REAL NOT NULL DEFAULT 0, total_io_write_mb REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, command_name)
+        ) WITHOUT ROWID;
+    ''')
+
+    pattern_new = _MESSAGE_PATTERN_SQL.format(m='NEW.message')
+    pattern_old = _MESSAGE_PATTERN_SQL.format(m='OLD.message')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_findings_rollup_ai AFTER INSERT ON findings BEGIN
+            INSERT INTO finding_rollup_daily (day, command, category, severity, count)
+                SELECT substr(e.timestamp, 1, 10), e.command, COALESCE(NEW.category, 'UNCATEGORIZED'), NEW.severity, 1
+                FROM events e WHERE e.id = NEW.event_id
+                ON CONFLICT(day, command, category, severity) DO UPDATE SET count = count + 1;
+            INSERT INTO finding_message_rollup (pattern, count)
+                SELECT {pattern_new}, 1 WHERE NEW.severity IN ('ERROR', 'CRITICAL')
+                ON CONFLICT(pattern) DO UPDATE SET count = count + 1;
+        END;
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_findings_rollup_ad AFTER DELETE ON findings BEGIN
+            UPDATE finding_rollup_daily SET count = count - 1
+                WHERE (day, command, category, severity) IN (
+                    SELECT substr(e.timestamp, 1, 10), e.command, COALESCE(OLD.category, 'UNCATEGORIZED'), OLD.severity
+                    FROM events e WHERE e.id = OLD.event_id);
+            UPDATE finding_message_rollup SET count = count - 1
+                WHERE pattern = {pattern_old} AND OLD.severity IN ('ERROR', 'CRITICAL');
+        END;
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_cmd_hist_rollup_ai AFTER INSERT ON command_history BEGIN
+            INSERT INTO command_rollup_daily (day, command_name, runs, failures, total_ms, total_ram_mb, total_io_read_mb, total_io_write_mb)
+                VALUES (substr(NEW.timestamp, 1, 10), NEW.command_name, 1, NEW.exit_code IS NOT NULL AND NEW.exit_code != 0,
+                        COALESCE(NEW.duration_ms, 0), COALESCE(NEW.peak_memory_mb, 0), COALESCE(NEW.io_read_mb, 0), COALESCE(NEW.io_write_mb, 0))
+                ON CONFLICT(day, command_name) DO UPDATE SET
+                    runs = runs + 1, failures = failures + excluded.failures, total_ms = total_ms + excluded.total_ms,
+                    total_ram_mb = total_ram_mb + excluded.total_ram_mb,
+                    total_io_read_mb = total_io_read_mb + excluded.total_io_read_mb,
+                    total_io_write_mb = total_io_write_mb + excluded.total_io_write_mb;
+        END;
+    ''')
+
+    # 3. Backfill do histórico já existente (uma vez)
+    cursor.execute('''
+        INSERT OR REPLACE INTO finding_rollup_daily (day, command, category, severity, count)
+        SELECT substr(e.timestamp, 1, 10), e.command, COALESCE(f.category, 'UNCATEGORIZED'), f.severity, COUNT(*)
+        FROM findings f JOIN events e ON e.id = f.event_id
+        GROUP BY 1, 2, 3, 4
+    ''')
+    cursor.execute(f'''
+        INSERT OR REPLACE INTO finding_message_rollup (pattern, count)
+        SELECT {_MESSAGE_PATTERN_SQL.format(m='message')}, COUNT(*)
+        FROM findings WHERE severity IN ('ERROR', 'CRITICAL') GROUP BY 1
+    ''')
+    cursor.execute('''
+        INSERT OR REPLACE INTO command_rollup_daily (day, command_name, runs, failures, total_ms, total_ram_mb, total_io_read_mb, total_io_write_mb)
+        SELECT substr(timestamp, 1, 10), command_name, COUNT(*), SUM(exit_code IS NOT NULL AND exit_code != 0),
+               SUM(COALESCE(duration_ms, 0)), SUM(COALESCE(peak_memory_mb, 0)), SUM(COALESCE(io_read_mb, 0)), SUM(COALESCE(io_write_mb, 0))
+        FROM command_history GROUP BY 1, 2
+    ''')
+
+    # 4. FTS5 (trigram = semântica de substring do LIKE '%q%'); opcional se o SQLite não suportar
+    if not fts5_trigram_available():
+        return
+    for table, cols in (('command_history', ('full_command_line', 'working_dir')), ('findings', ('message',))):
+        fts = f'{table}_fts'
+        col_list = ', '.join(cols)
+        new_vals = ', '.join(f'NEW.{c}' for c in cols)
+        old_vals = ', '.join(f'OLD.{c}' for c in cols)
+        cursor.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({col_list}, content='{table}', content_rowid='id', tokenize='trigram');")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{fts}_ai AFTER INSERT ON {table} BEGIN INSERT INTO {fts}(rowid, {col_list}) VALUES (NEW.id, {new_vals}); END;")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{fts}_ad AFTER DELETE ON {table} BEGIN INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', OLD.id, {old_vals}); END;")
+        cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild');")
+
+
+# Lista JSON de funções do brick (inválida/nula = vazia) como linhas de json_each.
+_CAPS_JSON_SQL = "json_each(CASE WHEN json_valid({c}) THEN {c} ELSE '[]' END)"
+
+def _m_v136_moduloid_index(cursor):
+    """Acervo de moduloids: capacidades normalizadas + FTS5 (nome, categoria, docstring, capacidades)."""
+    cursor.execute('CREATE TABLE IF NOT EXISTS moduloid_capabilities (brick_id INTEGER NOT NULL, name TEXT NOT NULL, PRIMARY KEY (brick_id, name)) WITHOUT ROWID;')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_moduloid_caps_name ON moduloid_capabilities(name COLLATE NOCASE);')
+    new_caps = _CAPS_JSON_SQL.format(c='NEW.capabilities')
+    has_fts = fts5_trigram_available()
+    if has_fts:
+        cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS moduloid_acervo_fts USING fts5(name, category, docstring, capabilities, tokenize='trigram');")
+    # O gatilho de INSERT só limpa o próprio id (rowid reaproveitado); as linhas órfãs de um
+    # INSERT OR REPLACE (que não dispara o de DELETE) saem em sweep_moduloid_orphans, uma vez por lote.
+    orphan = ['DELETE FROM moduloid_capabilities WHERE brick_id = NEW.id;']
+    index_new = [f'INSERT OR IGNORE INTO moduloid_capabilities (brick_id, name) SELECT NEW.id, value FROM {new_caps};']
+    drop_old = ['DELETE FROM moduloid_capabilities WHERE brick_id = OLD.id;']
+    if has_fts:
+        orphan.append('DELETE FROM moduloid_acervo_fts WHERE rowid = NEW.id;')
+        index_new.append(f"INSERT INTO moduloid_acervo_fts (rowid, name, category, docstring, capabilities) VALUES (NEW.id, NEW.name, NEW.category, NEW.docstring, (SELECT group_concat(value, ' ') FROM {new_caps}));")
+        drop_old.append('DELETE FROM moduloid_acervo_fts WHERE rowid = OLD.id;')
+    for name, event, body in (('ai', 'AFTER INSERT', orphan + index_new), ('ad', 'AFTER DELETE', drop_old),
+                              ('au', 'AFTER UPDATE OF name, category, docstring, capabilities', drop_old + index_new)):
+        cursor.execute(f'DROP TRIGGER IF EXISTS trg_moduloid_{name};')
+        cursor.execute(f"CREATE TRIGGER trg_moduloid_{name} {event} ON moduloid_acervo BEGIN {' '.join(body)} END;")
+    # Backfill do acervo existente
+    caps = _CAPS_JSON_SQL.format(c='a.capabilities')
+    cursor.execute('DELETE FROM moduloid_capabilities;')
+    cursor.execute(f'INSERT OR IGNORE INTO moduloid_capabilities (brick_id, name) SELECT a.id, value FROM moduloid_acervo a, {caps};')
+    if has_fts:
+        cursor.execute('DELETE FROM moduloid_acervo_fts;')
+        cursor.execute(f"INSERT INTO moduloid_acervo_fts (rowid, name, category, docstring, capabilities) SELECT a.id, a.name, a.category, a.docstring, (SELECT group_concat(value, ' ') FROM {caps}) FROM moduloid_acervo a;")
+
+def sweep_moduloid_orphans(cursor):
+    """Remove capacidades/FTS de bricks que não existem mais (rodar após um lote de INSERT OR REPLACE)."""
+    cursor.execute('DELETE FROM moduloid_capabilities WHERE brick_id NOT IN (SELECT id FROM moduloid_acervo);')
+    if has_table(cursor, 'moduloid_acervo_fts'):
+        cursor.execute('DELETE FROM moduloid_acervo_fts WHERE rowid NOT IN (SELECT id FROM moduloid_acervo);')
+
 def _apply_incremental_patches(cursor, current_version):
     """Aplica alterações de colunas em tabelas existentes (Resiliência)."""
     alterations = [(2, 'ALTER TABLE findings ADD COLUMN category TEXT;'), (6, "ALTER TABLE solutions ADD COLUMN message TEXT NOT NULL DEFAULT '';"), (12, 'ALTER TABLE open_incidents ADD COLUMN category TEXT;')]
@@ -242,7 +405,7 @@ def _apply_incremental_patches(cursor, current_version):
                 pass
 
 def _log_execution(command_name, path, results, arguments, execution_time_ms, exit_code=0):
-    start_persistence_worker()
+    from doxoade.tools.telemetry_tools.segment_log import append_row
     from datetime import datetime, timezone
     import uuid
 
@@ -263,22 +426,15 @@ def _log_execution(command_name, path, results, arguments, execution_time_ms, ex
     json_bytes = json.dumps(payload_data).encode('utf-8')
     compressed = zlib.compress(json_bytes, level=6)
 
-    # 3. Inserção no Banco
+    # 3. Ledger append-only (compactado depois no SQLite)
     _ts = datetime.now(timezone.utc).isoformat()
     _session = uuid.uuid4().hex
     
-    _query = '''
-        INSERT INTO command_history 
-        (session_uuid, timestamp, command_name, full_command_line, working_dir, exit_code, duration_ms, compressed_payload)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    '''
-    
-    _params = (
-        _session, _ts, command_name, " ".join(sys.argv), 
-        os.path.abspath(path), exit_code, execution_time_ms, compressed
-    )
-    
-    _LOG_QUEUE.put((_query, _params))
+    append_row('command_history', {
+        'session_uuid': _session, 'timestamp': _ts, 'command_name': command_name,
+        'full_command_line': " ".join(sys.argv), 'working_dir': os.path.abspath(path),
+        'exit_code': exit_code, 'duration_ms': execution_time_ms, 'compressed_payload': compressed,
+    })
 
 def init_db():
     """Inicializa o banco de dados de forma resiliente (Gênese)."""
@@ -310,11 +466,13 @@ def init_db():
             _m_v24_lexicon_expansion(cursor)
             _m_v132_lexicon_expansion(cursor)
             _m_v134_incident_schema_repair(cursor)
+            _m_v135_analytics_rollups(cursor)
+            _m_v136_moduloid_index(cursor)
             
             # Sela a versão atual base
-            cursor.execute("UPDATE schema_version SET version = 134")
+            cursor.execute("UPDATE schema_version SET version = ?", (DB_VERSION,))
             conn.commit()
-            current_version = 134
+            current_version = DB_VERSION
         else:
             # BANCO EXISTENTE: Lê a versão para saber se precisa de patches
             current_version = row[0]
@@ -322,6 +480,11 @@ def init_db():
         # 3. Aplica patches incrementais se o banco já existia (passando a versão)
         # Se a sua função exigir (conn, current_version), troque "cursor" por "conn" abaixo
         _apply_incremental_patches(cursor, current_version)
+        if current_version < 135:
+            _m_v135_analytics_rollups(cursor)
+        if current_version < 136:
+            _m_v136_moduloid_index(cursor)
+            cursor.execute("UPDATE schema_version SET version = ?", (DB_VERSION,))
         conn.commit()
         
     except Exception as e:
@@ -387,11 +550,6 @@ def get_db_path():
     """Retorna o caminho do DB Global ditado pelo Beacon."""
     return GLOBAL_DB_FILE
 
-def start_persistence_worker():
-    """Stub para evitar erro antes do import real."""
-    from .tools.db_utils import start_persistence_worker as start_real
-    start_real()
-
 def get_active_db_path():
     """Alias de segurança para o DB Global."""
     return GLOBAL_DB_FILE
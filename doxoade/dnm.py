@@ -1,5 +1,7 @@
 # doxoade/doxoade/dnm.py
 import os
+import json
+import time
 import logging
 
 from typing import List, Optional
@@ -7,7 +9,7 @@ from pathlib import Path
 
 # [DOX-UNUSED] from doxoade.commands.doxcolors_systems.colors_command import config
 
-from doxoade.tools.filesystem import is_ignored as central_is_ignored
+from doxoade.tools.filesystem import SYSTEM_IGNORES as central_ignores
 from doxoade.tools.filesystem import _get_project_config
 
 try:
@@ -28,6 +30,51 @@ try:
 except ImportError:
     msvcrt = None # Mock para Linux
 
+_WILDCARD_CHARS = frozenset('*?[\\')
+SNAPSHOT_FILE = 'dnm_snapshot.json'
+# Diretórios alterados muito perto da gravação do snapshot são relistados
+# (granularidade de mtime do FS; mesma ideia do "racy git").
+_RACY_WINDOW_NS = 2_000_000_000
+
+class IgnoreMatcher:
+    """
+    Matcher único pré-compilado (SYSTEM_IGNORES + FORGE_JUNK + pyproject + .gitignore).
+    Padrões que são só um nome viram lookup em set; o resto fica no pathspec.
+    Avalia uma entrada por vez: o walker já podou os ancestrais.
+    """
+
+    def __init__(self, junk_names, patterns, substr_markers=()):
+        self.junk_names = frozenset(junk_names)
+        self.substr_markers = tuple(substr_markers)
+        self.names, self.dir_names = set(), set()
+        residual = []
+        negated = any(p.strip().startswith('!') for p in patterns)
+        for raw in patterns:
+            line = raw.strip()
+            if not line or line.startswith('#'):
+                continue
+            name = line[:-1] if line.endswith('/') else line
+            if negated or '/' in name or _WILDCARD_CHARS.intersection(name):
+                residual.append(line)
+            elif line.endswith('/'):
+                self.dir_names.add(name)
+            else:
+                self.names.add(name)
+        self.spec = pathspec.PathSpec.from_lines('gitwildmatch', residual) if residual and pathspec else None
+
+    def match_name(self, name: str) -> bool:
+        """Regras por componente (nome da entrada), válidas para arquivo e diretório."""
+        if name.lower() in self.junk_names or name in self.names:
+            return True
+        return any(m in name for m in self.substr_markers)
+
+    def match(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        if self.match_name(name) or (is_dir and name in self.dir_names):
+            return True
+        if self.spec is not None:
+            return self.spec.match_file(rel_path + '/' if is_dir else rel_path)
+        return False
+
 class DNM:
     """
     Directory Navigation Module.
@@ -44,13 +91,21 @@ class DNM:
         'foundry', 'opt_py', 'staging', 'lib_bin', 
         '.doxoade_cache', 'c_lang_build', 'obj'
     }
-    def __init__(self, root_path: str='.'):
+    SAFETY_MARKERS = ('nppBackup', '.bak', 'pytest_temp_dir')
+
+    def __init__(self, root_path: str='.', use_snapshot: Optional[bool]=None):
         self.root = Path(root_path).resolve()
+        self._root_str = str(self.root).replace('\\', '/')
+        self._patterns = self._load_ignore_patterns()
         self.ignore_spec = self._load_ignore_spec()
+        self.matcher = IgnoreMatcher(self.FORGE_JUNK | central_ignores, self._patterns, self.SAFETY_MARKERS)
+        # Snapshot opcional: por padrão só quando o projeto já tem .doxoade_cache (não suja pastas alheias)
+        cache_dir = self.root / '.doxoade_cache'
+        self.use_snapshot = cache_dir.is_dir() if use_snapshot is None else use_snapshot
+        self._snapshot_path = cache_dir / SNAPSHOT_FILE
 
-    def _load_ignore_spec(self) -> Optional[pathspec.PathSpec]:
-#    def _load_ignore_spec(self) -> pathspec.PathSpec:
-        """Carrega regras de ignore com fallback para Modo Genérico."""
+    def _load_ignore_patterns(self) -> List[str]:
+        """Regras de ignore: sistema + pyproject.toml + .gitignore."""
         patterns = list(self.SYSTEM_IGNORES)
         try:
             config = _get_project_config(None, start_path=str(self.root))
@@ -68,55 +123,105 @@ class DNM:
         if len(patterns) == len(self.SYSTEM_IGNORES):
             patterns.append('*.pyc')
             patterns.append('__pycache__/')
+        return patterns
+
+    def _load_ignore_spec(self) -> Optional[pathspec.PathSpec]:
+        """PathSpec completo (mantido para consumidores externos)."""
         if pathspec is None:
             return None
-        return pathspec.PathSpec.from_lines('gitwildmatch', patterns)
+        return pathspec.PathSpec.from_lines('gitwildmatch', self._patterns)
 
     def is_ignored(self, file_path) -> bool:
         abs_p = os.path.abspath(file_path).replace('\\', '/')
-        
-        # 1. Filtro de Pastas de Fundição (Vulcan Junk)
-        # Se qualquer parte do caminho estiver na lista de lixo, ignora.
-        path_parts = set(abs_p.lower().split('/'))
-        if not path_parts.isdisjoint(self.FORGE_JUNK):
-            return True
-
-        # 2. Filtro de Segurança Aegis (Backups e temporários)
-        if any(x in abs_p for x in ['nppBackup', '.bak', 'pytest_temp_dir']):
-            return True
-            
-        # 3. Filtro Central (SYSTEM_IGNORES e pyproject.toml)
-        if central_is_ignored(abs_p, str(self.root)):
-            return True
-            
+        if abs_p == self._root_str:
+            return False
+        if abs_p.startswith(self._root_str + '/'):
+            parts = abs_p[len(self._root_str) + 1:].split('/')
+        else:
+            parts = abs_p.split('/')
+        # Ancestrais são avaliados como diretórios, a folha como o que ela é no disco.
+        for depth, name in enumerate(parts, 1):
+            is_dir = depth < len(parts) or os.path.isdir(abs_p)
+            if self.matcher.match('/'.join(parts[:depth]), name, is_dir):
+                return True
         return False
 
+    def _load_snapshot(self) -> dict:
+        try:
+            with open(self._snapshot_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('dirs', {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_snapshot(self, dirs: dict):
+        try:
+            tmp = self._snapshot_path.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'written_ns': time.time_ns(), 'dirs': dirs}, f)
+            os.replace(tmp, self._snapshot_path)
+        except OSError:
+            pass
+
+    def _list_dir(self, abs_dir: str, rel_dir: str, old: dict, new: dict, horizon_ns: int):
+        """(subdirs, files) de um diretório; reaproveita o snapshot se o mtime não mudou."""
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+        except OSError:
+            return [], []
+        cached = old.get(rel_dir)
+        if cached and cached[0] == mtime_ns and mtime_ns < horizon_ns:
+            new[rel_dir] = cached
+            return cached[1], cached[2]
+        subdirs, files = [], []
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            # Igual ao os.walk(followlinks=False): symlink de pasta não é descido
+                            if not entry.is_symlink():
+                                subdirs.append(entry.name)
+                        else:
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return [], []
+        if self.use_snapshot:
+            new[rel_dir] = [mtime_ns, subdirs, files]
+        return subdirs, files
+
     def scan(self, extensions: Optional[List[str]]=None, include_internal: bool = False) -> List[str]:
         valid_files = []
         # Normaliza extensões
         if extensions:
             extensions = {e.lower() if e.startswith('.') else f'.{e.lower()}' for e in extensions}
-            
-        for root, dirs, files in os.walk(str(self.root)):
-            # PODA AGRESSIVA DE DIRETÓRIOS (Chief-Gold Optimization)
-            # Isso impede que o os.walk sequer entre nas pastas proibidas
-            dirs[:] = [d for d in dirs if d.lower() not in self.FORGE_JUNK and not self.is_ignored(Path(root) / d)]
-#            dirs[:] = [d for d in dirs if not self.is_ignored(Path(root) / d)]
 
+        match = self.matcher.match
+        old = self._load_snapshot() if self.use_snapshot else {}
+        new = {}
+        horizon_ns = time.time_ns() - _RACY_WINDOW_NS
+        stack = [('', self._root_str)]
+        while stack:
+            rel_dir, abs_dir = stack.pop()
+            subdirs, files = self._list_dir(abs_dir, rel_dir, old, new, horizon_ns)
+            prefix = rel_dir + '/' if rel_dir else ''
+            # PODA AGRESSIVA DE DIRETÓRIOS: pastas ignoradas nunca são abertas
+            for d in subdirs:
+                rel = prefix + d
+                if not match(rel, d, True):
+                    stack.append((rel, abs_dir + '/' + d))
             for file in files:
-                file_path = Path(root) / file
-                
                 # Verifica extensão
-                if extensions and file_path.suffix.lower() not in extensions:
+                if extensions and os.path.splitext(file)[1].lower() not in extensions:
                     continue
-                
                 # Filtro final de arquivo
-                if self.is_ignored(file_path) and not include_internal:
+                if not include_internal and match(prefix + file, file, False):
                     continue
-                    
-                canonical_path = str(file_path.absolute()).replace('\\', '/')
-                valid_files.append(canonical_path)
-                
+                valid_files.append(abs_dir + '/' + file)
+
+        if self.use_snapshot:
+            self._save_snapshot(new)
         return sorted(valid_files)
 
 try:
@@ -8,6 +8,11 @@ import binascii
 import ast
 from doxoade.tools.vulcan.bridge import vulcan_bridge
 
+try:
+    from rule_engine import Rule, RuleEngine
+except ImportError:
+    from doxoade.probes.rule_engine import Rule, RuleEngine
+
 class StructuralNormalizer(ast.NodeTransformer):
     """Normaliza a AST focando na ESTRUTURA (MPoT-1)."""
 
@@ -58,9 +63,14 @@ def find_clones_turbo(hashes_list):
 
 def find_clones(files: list) -> list:
     """Orquestrador Central."""
+    engine = RuleEngine([StructuralHashRule()])
     hashes_dict = {}
     for f_path in files:
-        _process_file_for_hashes(f_path, hashes_dict)
+        _process_file_for_hashes(f_path, hashes_dict, engine)
+    return find_clones_in_hashes(hashes_dict)
+
+def find_clones_in_hashes(hashes_dict: dict) -> list:
+    """Clones a partir de {hash: [ocorrências]} (coletados aqui ou na travessia fundida do check)."""
     flat_hashes = []
     for h_val, occurrences in hashes_dict.items():
         for occ in occurrences:
@@ -80,18 +90,26 @@ def get_structural_hash(node):
     dump = ast.dump(normalized, include_attributes=False)
     return hashlib.sha256(dump.encode('utf-8')).hexdigest()
 
-def _process_file_for_hashes(file_path: str, hashes: dict):
+class StructuralHashRule(Rule):
+    """Hash estrutural de cada função (exceto dunders) em ctx.data['hashes']."""
+    name = 'clone.structural-hash'
+    nodes = (ast.FunctionDef,)
+
+    def start(self, ctx):
+        ctx.data['hashes'] = []
+
+    def visit(self, node, ctx):
+        if not node.name.startswith('__'):
+            ctx.data['hashes'].append({'file': ctx.filename, 'line': node.lineno, 'name': node.name, 'hash': get_structural_hash(node)})
+
+def _process_file_for_hashes(file_path: str, hashes: dict, engine):
     if not os.path.exists(file_path):
         return
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            tree = ast.parse(f.read())
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and (not node.name.startswith('__')):
-                h = get_structural_hash(node)
-                if h not in hashes:
-                    hashes[h] = []
-                hashes[h].append({'file': file_path, 'line': node.lineno, 'name': node.name, 'hash': h})
+            ctx = engine.run(f.read(), filename=file_path)
+        for occ in ctx.data['hashes']:
+            hashes.setdefault(occ['hash'], []).append(occ)
     except Exception:
         pass
 
@@ -12,6 +12,7 @@ import tracemalloc
 import linecache
 import io
 from doxoade.tools.aegis.aegis_utils import restricted_safe_exec
+from doxoade.probes.trace_backend import NexusTracer
 
 _MARKER_DEBUG = '---DOXOADE-DEBUG-DATA---'
 
@@ -89,71 +90,32 @@ def _extract_memory_stats(snapshot, target_file, project_root):
 # --- SENTINELA DE RASTRO ---
 
 class _LineTimer:
-    __slots__ = ('data', '_last', 'target_file', 'project_root', 'live_flow', 'last_vars', 'watch_vars', 'internal_mode')
-
-    def __init__(self, target_file, project_root, live_flow=True, watch_vars=False, internal_mode=False):
-        self.data = {}
-        self._last = {}
+    """
+    Sentinela de linha sobre o Nexus Trace (trace_backend).
+    A poda acontece uma vez por code object e o fluxo é renderizado ao final
+    com start()/stop(), em vez de formatar cada evento durante a execução.
+    """
+    __slots__ = ('target_file', 'project_root', 'live_flow', 'watch_vars', 'internal_mode', 'engine')
+
+    def __init__(self, target_file, project_root, live_flow=True, watch_vars=False, internal_mode=False, backend='auto'):
         self.target_file = target_file
         self.project_root = os.path.abspath(project_root).replace('\\', '/').lower()
         self.live_flow = live_flow
         self.watch_vars = watch_vars
         self.internal_mode = internal_mode
-        self.last_vars = {}
-
-    def tracer(self, frame, event, arg):
-        if event != 'line': return self.tracer
-        raw_fname = frame.f_code.co_filename
-        norm_fname = raw_fname.replace('\\', '/').lower()
-        
-        if 'site-packages' in norm_fname or '/lib/' in norm_fname or norm_fname.startswith('<'):
-            return self.tracer
-            
-        # 2. Whitelist: Só permite rastro se estiver na pasta do projeto
-        if not norm_fname.startswith(self.project_root):
-            return self.tracer
-        
-        # Filtro de Domínio
-        if not self.internal_mode:
-            if raw_fname.startswith('<'): return self.tracer
-            abs_fname = os.path.abspath(raw_fname).replace('\\', '/')
-            if not abs_fname.lower().startswith(self.project_root): return self.tracer
-            if any(x in abs_fname.lower() for x in ['debug_probe', 'flow_runner', 'site-packages']):
-                return self.tracer
-        
-        lineno = frame.f_lineno
-        content = linecache.getline(raw_fname, lineno).strip()
-        if not content: return self.tracer
-
-        # [PLATINUM] Vigilância de Variáveis à prova de falhas
-        meta = ""
-        if self.watch_vars:
-            curr_vars = {k: v for k, v in frame.f_locals.items() if not k.startswith('__')}
-            diffs = []
-            for k, v in curr_vars.items():
-                if self.last_vars.get(k) is not v:
-                    try:
-                        # [FIX] Tenta converter para string, se falhar, usa o tipo
-                        val_repr = str(v)
-                    except Exception as e:
-                        import sys as _dox_sys, os as _dox_os
-                        from traceback import print_tb as exc_trace
-                        exc_obj, exc_tb = _dox_sys.exc_info()
-                        f_name = _dox_os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-                        line_n = exc_tb.tb_lineno
-                        exc_trace(exc_tb)
-                        print(f"\033[1;34m[ FORENSIC ]\033[0m \033[1mFile: {f_name} | L: {line_n} | Func: tracer\033[0m")
-                        print(f"\033[31m  ■ Type: {type(e).__name__} | Value: {e}\033[0m")
-                        val_repr = f"<{type(v).__name__}>"
-                    
-                    diffs.append(f"\x1b[36m{k}\x1b[0m=\x1b[33m{val_repr[:20]}\x1b[0m")
-                    self.last_vars[k] = v
-            if diffs: meta = "  " + " ".join(diffs)
+        self.engine = NexusTracer(project_root, internal_mode=internal_mode, watch_vars=watch_vars, backend=backend)
+
+    def start(self):
+        self.engine.start()
 
+    def stop(self):
+        self.engine.stop()
         if self.live_flow:
-            f_short = os.path.basename(raw_fname)
-            sys.stdout.write(f"\x1b[32m{f_short:<18}\x1b[0m │ \x1b[93m{lineno:<4}\x1b[0m │ {content}{meta}\n")
-            sys.stdout.flush()
+            self.engine.render_flow()
+
+    @property
+    def data(self):
+        return self.engine.line_stats()
 
     def top_lines(self, limit=15):
         res = []
@@ -182,7 +144,7 @@ def run_profile(script_path):
     line_timer = _LineTimer(abs_path, project_root, live_flow=False)
     profiler = cProfile.Profile()
     tracemalloc.start()
-    sys.settrace(line_timer.tracer)
+    line_timer.start()
     profiler.enable()
     t0 = time.perf_counter()
     try:
@@ -197,7 +159,7 @@ def run_profile(script_path):
         print(f"\033[1;34m[ FORENSIC ]\033[0m \033[1mFile: {f_name} | L: {line_n} | Func: run_profile\033[0m")
         print(f"\033[31m  ■ Type: {type(e).__name__} | Value: {e}\033[0m")
     profiler.disable()
-    sys.settrace(None)
+    line_timer.stop()
     _, peak = tracemalloc.get_traced_memory()
     snapshot = tracemalloc.take_snapshot()
     tracemalloc.stop()
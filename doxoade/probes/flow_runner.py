@@ -46,6 +46,9 @@ C_BORDER, C_MAGENTA, C_GREEN = ('\x1b[90m', '\x1b[95m', '\x1b[92m')
 C_BOLD, C_DIM, C_RED, SEP = ('\x1b[1m', '\x1b[2m', '\x1b[91m', '\x1b[90m│\x1b[0m')
 _STATE = {'last_time': time.perf_counter(), 'last_locals': {}, 'project_root': '', 'target_file': None, 'indent_level': 0, 'flow_base': False, 'flow_val': False, 'flow_import': False, 'flow_func': False, 'history': [], 'active_pattern': None, 'pattern_idx': 0, 'hidden_count': 0, 'no_compress': False}
 
+# Decisão de poda memorizada por code object (uma checagem de path por função).
+_SKIP_CACHE = {}
+
 def _flush_iron_gate():
     if _STATE['hidden_count'] > 0:
         p_len = len(_STATE['active_pattern'])
@@ -83,10 +86,14 @@ def _handle_compression(current_id):
 
 def static_trace_calls(frame, event, arg):
     """Tratador de eventos de rastro (Refatorado v81.8)."""
-    filename = frame.f_code.co_filename
-    lineno = frame.f_lineno
-    if _should_skip_trace(filename):
+    code = frame.f_code
+    skip = _SKIP_CACHE.get(code)
+    if skip is None:
+        skip = _SKIP_CACHE[code] = _should_skip_trace(code.co_filename)
+    if skip:
         return None
+    filename = code.co_filename
+    lineno = frame.f_lineno
     if event == 'line' and (not _STATE['no_compress']) and _handle_compression((filename, lineno)):
         return static_trace_calls
     _render_trace_event(frame, event)
@@ -160,7 +167,7 @@ def run_flow(target_path, **kwargs):
     is_b = kwargs.get('bottleneck', False)
     timer = _LineTimer(abs_path, project_root, live_flow=not is_b)
     
-    sys.settrace(timer.tracer)
+    timer.start()
     try:
         os.environ['DOXOADE_AUTHORIZED_RUN'] = '1'
         restricted_safe_exec(code, {'__file__': abs_path, '__name__': '__main__'}, allow_imports=True)
@@ -173,7 +180,7 @@ def run_flow(target_path, **kwargs):
             sys.stdout.write(f"\n{_MARKER_DEBUG}{json.dumps(data)}\n")
         raise e
     finally:
-        sys.settrace(None)
+        timer.stop()
         # EMISSÃO ÚNICA DE DADOS DE PERFORMANCE
         stats = timer.top_lines(limit=15)
         sys.stdout.write(f"\n---DOXOADE-DATA-BLOCK---\n{json.dumps({'line_hotspots': stats})}\n")
@@ -234,7 +241,7 @@ def run_flow(target_path, shadow_src=None, **kwargs):
         code = f.read()
 
     timer = _LineTimer(target_file=abs_path, project_root=project_root)
-    sys.settrace(timer.tracer)
+    timer.start()
     
     try:
         # Define autorização para o Aegis
@@ -247,7 +254,7 @@ def run_flow(target_path, shadow_src=None, **kwargs):
         _, exc_obj, exc_tb = exc_sys.exc_info()
         exc_trace(exc_tb)
     finally:
-        sys.settrace(None)
+        timer.stop()
         # Agora a função abaixo já foi definida e o Python a encontrará
         _render_flow_results(timer)
 
@@ -273,7 +280,7 @@ def run_flow(target_path, **kwargs):
     globs = {'__file__': abs_path, '__name__': '__main__'}
     os.environ['DOXOADE_AUTHORIZED_RUN'] = '1'
     
-    sys.settrace(timer.tracer)
+    timer.start()
     try:
         restricted_safe_exec(code, globs, allow_imports=True, filename=abs_path)
     except Exception as e:
@@ -295,7 +302,7 @@ def run_flow(target_path, **kwargs):
         sys.stdout.flush()
         raise e
     finally:
-        sys.settrace(None)
+        timer.stop()
         _render_flow_results(timer)
 
 if __name__ == '__main__':
@@ -313,7 +320,7 @@ if __name__ == '__main__':
 
     # O timer agora é alimentado com o marcador unificado
     timer = _LineTimer(abs_path, project_root, live_flow=not is_bottleneck)
-    sys.settrace(timer.tracer)
+    timer.start()
     
     try:
         os.environ['DOXOADE_AUTHORIZED_RUN'] = '1'
@@ -324,7 +331,7 @@ if __name__ == '__main__':
         _, exc_obj, exc_tb = exc_sys.exc_info()
         exc_trace(exc_tb)
     finally:
-        sys.settrace(None)
+        timer.stop()
         # EMITE O RESULTADO EM JSON PARA O PAI
         stats = timer.top_lines(limit=15)
         # O marcador deve ser o mesmo que o _stream_and_capture procura
@@ -374,14 +381,14 @@ def run_flow_direct(target, watch_vars=False, is_internal=False):
                            watch_vars=watch_vars, internal_mode=True)
         # Sincroniza argv para o comando interno
         sys.argv = ['doxoade'] + shlex.split(target)
-        sys.settrace(timer.tracer)
+        timer.start()
         try:
             cli(standalone_mode=False)
         except SystemExit: pass # Click chama exit(0) ao final, capturamos aqui
         except Exception as e:
             print(f"\n\x1b[31m✘ Falha no comando interno: {e}\x1b[0m")
         finally:
-            sys.settrace(None)
+            timer.stop()
             render_flow_table(timer)
     else:
         # [OURO] Rastro de Arquivo .py
@@ -392,13 +399,13 @@ def run_flow_direct(target, watch_vars=False, is_internal=False):
             
         timer = _LineTimer(abs_path, project_root, live_flow=True, watch_vars=watch_vars)
         code = open(abs_path, 'r', encoding='utf-8', errors='ignore').read()
-        sys.settrace(timer.tracer)
+        timer.start()
         from doxoade.tools.aegis.aegis_core import nexus_exec
         
         try:
             nexus_exec(code, {'__name__': '__main__', '__file__': abs_path})
         finally:
-            sys.settrace(None)
+            timer.stop()
             render_flow_table(timer)
 
 if __name__ == '__main__':
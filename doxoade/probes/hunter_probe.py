@@ -3,55 +3,63 @@ import ast
 import sys
 import json
 
-class RiskHunter(ast.NodeVisitor):
+try:
+    from rule_engine import Rule, RuleEngine
+except ImportError:
+    from doxoade.probes.rule_engine import Rule, RuleEngine
 
-    def __init__(self):
-        self.findings = []
+class MutableDefaultRule(Rule):
+    name = 'hunter.mutable-default'
+    nodes = (ast.FunctionDef,)
 
-    def add_finding(self, node, severity, category, message):
-        self.findings.append({'severity': severity, 'category': category, 'message': message, 'line': node.lineno})
-
-    def visit_FunctionDef(self, node):
+    def visit(self, node, ctx):
         for default in node.args.defaults:
             if isinstance(default, (ast.List, ast.Dict, ast.Set)):
-                self.add_finding(node, 'ERROR', 'RISK-MUTABLE', f"Argumento padrão mutável detectado na função '{node.name}'. Isso retém estado entre chamadas. Use 'None' como padrão.")
-        self.generic_visit(node)
+                ctx.report(node.lineno, 'ERROR', 'RISK-MUTABLE', f"Argumento padrão mutável detectado na função '{node.name}'. Isso retém estado entre chamadas. Use 'None' como padrão.")
+
+class BareExceptRule(Rule):
+    name = 'hunter.bare-except'
+    nodes = (ast.ExceptHandler,)
 
-    def visit_ExceptHandler(self, node):
+    def visit(self, node, ctx):
         if node.type is None:
-            self.add_finding(node, 'WARNING', 'RISK-EXCEPTION', "Uso de 'except:' genérico detectado. Isso captura interrupções de sistema. Use 'except Exception:'.")
-        self.generic_visit(node)
-
-    def visit_Compare(self, node):
-        for _zi in range(min(len(node.ops), len(node.comparators))):
-            op = node.ops[_zi]
-            comparator = node.comparators[_zi]
-            if isinstance(op, (ast.Eq, ast.NotEq)):
-                if isinstance(comparator, ast.Constant) and comparator.value is None:
-                    msg = "Comparação '== None' não é recomendada. Use 'is None'."
-                    if isinstance(op, ast.NotEq):
-                        msg = "Comparação '!= None' não é recomendada. Use 'is not None'."
-                    self.add_finding(node, 'WARNING', 'STYLE', msg)
-        self.generic_visit(node)
-
-    def visit_Call(self, node):
-        if isinstance(node.func, ast.Name):
-            if node.func.id in ['eval', 'exec']:
-                self.add_finding(node, 'CRITICAL', 'SECURITY', f"Uso de '{node.func.id}' detectado. Alto risco de segurança.")
-        self.generic_visit(node)
+            ctx.report(node.lineno, 'WARNING', 'RISK-EXCEPTION', "Uso de 'except:' genérico detectado. Isso captura interrupções de sistema. Use 'except Exception:'.")
+
+class NoneCompareRule(Rule):
+    name = 'hunter.none-compare'
+    nodes = (ast.Compare,)
+
+    def visit(self, node, ctx):
+        for op, comparator in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.Eq, ast.NotEq)) and isinstance(comparator, ast.Constant) and comparator.value is None:
+                msg = "Comparação '== None' não é recomendada. Use 'is None'."
+                if isinstance(op, ast.NotEq):
+                    msg = "Comparação '!= None' não é recomendada. Use 'is not None'."
+                ctx.report(node.lineno, 'WARNING', 'STYLE', msg)
+
+class EvalExecRule(Rule):
+    name = 'hunter.eval-exec'
+    nodes = (ast.Call,)
+
+    def visit(self, node, ctx):
+        if isinstance(node.func, ast.Name) and node.func.id in ('eval', 'exec'):
+            ctx.report(node.lineno, 'CRITICAL', 'SECURITY', f"Uso de '{node.func.id}' detectado. Alto risco de segurança.")
+
+HUNTER_RULES = (MutableDefaultRule, BareExceptRule, NoneCompareRule, EvalExecRule)
+
+def hunter_rules():
+    return [rule() for rule in HUNTER_RULES]
 
 def hunt(file_path):
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
-        tree = ast.parse(content, filename=file_path)
-        hunter = RiskHunter()
-        hunter.visit(tree)
-        print(json.dumps(hunter.findings))
+        ctx = RuleEngine(hunter_rules()).run(content, filename=file_path)
+        print(json.dumps(ctx.findings))
     except Exception as e:
         error = [{'severity': 'ERROR', 'category': 'INTERNAL', 'message': str(e), 'line': 1}]
         print(json.dumps(error))
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         sys.exit(1)
-    hunt(sys.argv[1])
\ No newline at end of file
+    hunt(sys.argv[1])
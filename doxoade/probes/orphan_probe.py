@@ -8,101 +8,62 @@ Identifica funções que:
 3. Não são comandos CLI (decoradores @click.command)
 4. Não são métodos mágicos (__init__, __str__, etc)
 """
-import ast
 import sys
 import json
 import os
 
-class FunctionIndexer(ast.NodeVisitor):
-    """Indexa todas as definições de funções."""
+try:
+    from symbol_table import SymbolTable, canonical, find_root
+except ImportError:
+    from doxoade.probes.symbol_table import SymbolTable, canonical, find_root
 
-    def __init__(self, file_path):
-        self.file_path = file_path
-        self.definitions = []
+IGNORED_METHODS = ['setUp', 'tearDown', 'setUpClass', 'tearDownClass']
 
-    def visit_FunctionDef(self, node):
-        if node.name.startswith('__') and node.name.endswith('__'):
-            self.generic_visit(node)
-            return
-        is_cli_command = any((isinstance(d, ast.Call) and hasattr(d.func, 'attr') and (d.func.attr in ['command', 'group']) or (isinstance(d, ast.Attribute) and d.attr in ['command', 'group']) for d in node.decorator_list))
-        self.definitions.append({'name': node.name, 'line': node.lineno, 'file': self.file_path, 'is_cli': is_cli_command, 'is_private': node.name.startswith('_')})
-        self.generic_visit(node)
-
-class CallTracker(ast.NodeVisitor):
-    """Rastreia todas as chamadas de função."""
-
-    def __init__(self):
-        self.calls = set()
-
-    def visit_Call(self, node):
-        if isinstance(node.func, ast.Name):
-            self.calls.add(node.func.id)
-        elif isinstance(node.func, ast.Attribute):
-            self.calls.add(node.func.attr)
-        self.generic_visit(node)
-
-class ExportChecker(ast.NodeVisitor):
-    """Verifica se uma função está em __all__."""
-
-    def __init__(self):
-        self.exported = set()
-
-    def visit_Assign(self, node):
-        for target in node.targets:
-            if isinstance(target, ast.Name) and target.id == '__all__':
-                if isinstance(node.value, (ast.List, ast.Tuple)):
-                    for elt in node.value.elts:
-                        if isinstance(elt, ast.Constant):
-                            self.exported.add(elt.value)
-        self.generic_visit(node)
+def _file_orphans(file_path, functions, used):
+    orphans = []
+    for func_name, line, is_cli in functions:
+        if is_cli or func_name in used:
+            continue
+        if func_name.startswith('test_') or func_name in IGNORED_METHODS:
+            continue
+        is_private = func_name.startswith('_')
+        severity = 'WARNING' if is_private else 'INFO'
+        category = 'DEADCODE' if not is_private else 'UNUSED-PRIVATE'
+        orphans.append({'severity': severity, 'category': category, 'message': f"Função '{func_name}' não é chamada em nenhum lugar do projeto.", 'file': file_path, 'line': line, 'details': 'Considere remover ou documentar se for API pública/futura.'})
+    return orphans
 
-def analyze_orphans(files):
+def analyze_orphans(files, root=None, table=None):
     """
     Análise principal: encontra funções órfãs.
     
     Args:
         files: Lista de caminhos de arquivos Python
+        root: Raiz onde a tabela de símbolos é persistida (padrão: detectada pelos arquivos)
         
     Returns:
         Lista de findings com funções órfãs detectadas
     """
-    all_definitions = []
-    all_calls = set()
-    all_exports = set()
-    for file_path in files:
-        if not os.path.exists(file_path):
-            continue
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            tree = ast.parse(content, filename=file_path)
-            indexer = FunctionIndexer(file_path)
-            indexer.visit(tree)
-            all_definitions.extend(indexer.definitions)
-            tracker = CallTracker()
-            tracker.visit(tree)
-            all_calls.update(tracker.calls)
-            exporter = ExportChecker()
-            exporter.visit(tree)
-            all_exports.update(exporter.exported)
-        except Exception:
-            continue
+    files = [f for f in files if os.path.exists(f)]
+    table = table or SymbolTable(root or find_root(files))
+    index = table.refresh(files)
+    used = set()
+    for entry in index.values():
+        used.update(entry['called'])
+        used.update(entry['exports'])
     orphans = []
-    for defn in all_definitions:
-        func_name = defn['name']
-        if defn['is_cli']:
-            continue
-        if func_name in all_exports:
-            continue
-        if func_name in all_calls:
-            continue
-        if func_name.startswith('test_'):
-            continue
-        if func_name in ['setUp', 'tearDown', 'setUpClass', 'tearDownClass']:
+    for file_path in files:
+        key = canonical(file_path)
+        entry = index[key]
+        if not entry.get('parsed'):
             continue
-        severity = 'WARNING' if defn['is_private'] else 'INFO'
-        category = 'DEADCODE' if not defn['is_private'] else 'UNUSED-PRIVATE'
-        orphans.append({'severity': severity, 'category': category, 'message': f"Função '{func_name}' não é chamada em nenhum lugar do projeto.", 'file': defn['file'], 'line': defn['line'], 'details': 'Considere remover ou documentar se for API pública/futura.'})
+        # Só o uso das funções do próprio arquivo afeta seu veredito.
+        dep_key = SymbolTable.dep_key(entry['sig'], file_path, [name in used for name, _, _ in entry['functions']])
+        result = table.cached_result(key, 'orphan', dep_key)
+        if result is None:
+            result = _file_orphans(file_path, entry['functions'], used)
+            table.store_result(key, 'orphan', dep_key, result)
+        orphans.extend(result)
+    table.save()
     return orphans
 
 def main():
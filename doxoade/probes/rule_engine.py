@@ -0,0 +1,183 @@
+# doxoade/doxoade/probes/rule_engine.py
+"""
+Motor de Regras AST (travessia única por arquivo).
+- Cada regra declara os tipos de nó que quer receber (subclasses incluídas) e se
+  consome eventos de comentário ou de tokens; o motor monta uma tabela de despacho
+  por tipo e percorre a árvore uma única vez (pré-ordem, mesma ordem do
+  ast.NodeVisitor), entregando cada nó só às regras interessadas.
+- Comentários em Python vêm dos tokens COMMENT (um '#' dentro de string não
+  conta); em C/C++, da leitura das linhas ('//', senão '#'). Os tokens (tokenize)
+  só são gerados se alguma regra pedir comentários ou tokens, uma vez por arquivo.
+- Tempo acumulado por regra (ms) e por etapa (parse, walk) entre arquivos.
+Somente stdlib: as sondas rodam sem o pacote doxoade no path.
+"""
+import io
+import ast
+import tokenize
+from time import perf_counter
+from collections import defaultdict
+
+C_SUFFIXES = ('.c', '.cpp', '.h', '.hpp')
+
+class Rule:
+    """Regra registrável: sobrescreva os ganchos dos eventos declarados."""
+    name = 'rule'
+    nodes = ()
+    comments = False
+    tokens = False
+
+    def start(self, ctx):
+        pass
+
+    def visit(self, node, ctx):
+        pass
+
+    def comment(self, line, text, ctx):
+        pass
+
+    def token(self, tok, ctx):
+        pass
+
+    def finish(self, ctx):
+        pass
+
+class RuleContext:
+    """Estado de um arquivo: achados, contadores e dados livres por regra."""
+    __slots__ = ('filename', 'lines', 'findings', 'counts', 'data')
+
+    def __init__(self, filename, lines):
+        self.filename = filename
+        self.lines = lines
+        self.findings = []
+        self.counts = defaultdict(int)
+        self.data = {}
+
+    def report(self, line, severity, category, message, **extra):
+        finding = {'severity': severity, 'category': category, 'message': message, 'line': line}
+        finding.update(extra)
+        self.findings.append(finding)
+
+def _with_subclasses(node_type):
+    found, pending = set(), [node_type]
+    while pending:
+        t = pending.pop()
+        if t not in found:
+            found.add(t)
+            pending.extend(t.__subclasses__())
+    return found
+
+class RuleEngine:
+    """Despacho por tipo de nó; uma travessia por arquivo para todas as regras."""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.dispatch = defaultdict(list)
+        for rule in self.rules:
+            for declared in rule.nodes:
+                for node_type in _with_subclasses(declared):
+                    self.dispatch[node_type].append(rule)
+        self.comment_rules = [r for r in self.rules if r.comments]
+        self.token_rules = [r for r in self.rules if r.tokens]
+        self.timings = defaultdict(float)
+        self.stages = defaultdict(float)
+
+    def run(self, source=None, filename='<unknown>', tree=None, lines=None):
+        """
+        Executa as regras sobre um arquivo. Aceita o fonte ou a árvore já parseada
+        (reaproveitada de outra etapa); sem árvore nem fonte Python, só os eventos
+        de comentário. SyntaxError propaga para o chamador.
+        """
+        if lines is None:
+            lines = source.splitlines() if source is not None else []
+        ctx = RuleContext(filename, lines)
+        timings = self.timings
+        for rule in self.rules:
+            t0 = perf_counter()
+            rule.start(ctx)
+            timings[rule.name] += perf_counter() - t0
+        is_c = filename.endswith(C_SUFFIXES)
+        if tree is None and source is not None and not is_c and (self.dispatch or self.token_rules):
+            t0 = perf_counter()
+            tree = ast.parse(source, filename=filename)
+            self.stages['parse'] += perf_counter() - t0
+        if tree is not None and self.dispatch:
+            self._walk(tree, ctx)
+        toks = None
+        if not is_c and (self.comment_rules or self.token_rules) and (source is not None or lines):
+            toks = self._tokenize(source if source is not None else '\n'.join(l.rstrip('\r\n') for l in lines) + '\n')
+        if self.comment_rules:
+            if is_c:
+                self._line_comments(lines, ctx)
+            else:
+                self._token_comments(toks or (), ctx)
+        if self.token_rules and toks is not None:
+            self._tokens(toks, ctx)
+        for rule in self.rules:
+            t0 = perf_counter()
+            rule.finish(ctx)
+            timings[rule.name] += perf_counter() - t0
+        return ctx
+
+    def _walk(self, tree, ctx):
+        dispatch, timings = self.dispatch, self.timings
+        iter_children = ast.iter_child_nodes
+        start = perf_counter()
+        spent = 0.0
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            handlers = dispatch.get(type(node))
+            if handlers:
+                for rule in handlers:
+                    t0 = perf_counter()
+                    rule.visit(node, ctx)
+                    elapsed = perf_counter() - t0
+                    timings[rule.name] += elapsed
+                    spent += elapsed
+            children = list(iter_children(node))
+            children.reverse()
+            stack.extend(children)
+        self.stages['walk'] += perf_counter() - start - spent
+
+    def _emit_comment(self, line, text, ctx):
+        for rule in self.comment_rules:
+            t0 = perf_counter()
+            rule.comment(line, text, ctx)
+            self.timings[rule.name] += perf_counter() - t0
+
+    def _line_comments(self, lines, ctx):
+        for i, line in enumerate(lines):
+            if '//' in line:
+                self._emit_comment(i + 1, line.split('//', 1)[1].strip(), ctx)
+            elif '#' in line:
+                self._emit_comment(i + 1, line.split('#', 1)[1].strip(), ctx)
+
+    def _token_comments(self, toks, ctx):
+        for tok in toks:
+            if tok.type == tokenize.COMMENT:
+                self._emit_comment(tok.start[0], tok.string[1:].strip(), ctx)
+
+    def _tokenize(self, source):
+        """Tokens até o fim ou até o primeiro erro de tokenização (os anteriores são mantidos)."""
+        t0 = perf_counter()
+        toks = []
+        try:
+            for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+                toks.append(tok)
+        except (tokenize.TokenError, SyntaxError):
+            pass
+        self.stages['tokenize'] += perf_counter() - t0
+        return toks
+
+    def _tokens(self, toks, ctx):
+        for rule in self.token_rules:
+            t0 = perf_counter()
+            for tok in toks:
+                rule.token(tok, ctx)
+            self.timings[rule.name] += perf_counter() - t0
+
+    def timing_report(self):
+        """[(regra ou etapa, ms)] do mais caro para o mais barato."""
+        rows = [(name, secs * 1000) for name, secs in self.timings.items()]
+        rows += [(f'[{stage}]', secs * 1000) for stage, secs in self.stages.items()]
+        return sorted(rows, key=lambda r: -r[1])
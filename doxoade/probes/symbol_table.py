@@ -0,0 +1,219 @@
+# doxoade/doxoade/probes/symbol_table.py
+"""
+Tabela de Símbolos do Projeto (compartilhada por xref_probe e orphan_probe).
+- Uma única travessia de AST por arquivo extrai: definições de topo e assinaturas,
+  imports 'from' e chamadas (na ordem do IntegrityChecker), funções, nomes chamados
+  e exports (__all__) para o detector de órfãos, além do grafo de chamadas por
+  função e dos nomes ligados por import (ciclos de recursão do RecursionGuard).
+- Persistida em <raiz>/.doxoade_cache/symbol_table.json; só arquivos com
+  (mtime_ns, size) diferente são reanalisados.
+- Resultados por arquivo guardam a chave das suas dependências (assinatura própria
+  + imports resolvidos + hash das definições importadas) e só são recalculados
+  quando ela muda.
+Somente stdlib: as sondas rodam sem o pacote doxoade no path.
+"""
+import os
+import ast
+import json
+import hashlib
+
+TABLE_FILE = 'symbol_table.json'
+TABLE_VERSION = 2
+ROOT_MARKERS = ('.git', 'pyproject.toml', 'setup.py')
+CLI_DECORATORS = ('command', 'group')
+
+def canonical(p):
+    return os.path.abspath(p).replace('\\', '/').lower()
+
+def find_root(files):
+    """Raiz do projeto a partir dos arquivos (primeiro ancestral com marcador)."""
+    dirs = [os.path.dirname(os.path.abspath(f)) for f in files]
+    if not dirs:
+        return None
+    try:
+        start = os.path.commonpath(dirs)
+    except ValueError:
+        return None
+    current = start
+    while True:
+        if any(os.path.exists(os.path.join(current, m)) for m in ROOT_MARKERS):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return start
+        current = parent
+
+def _digest(obj):
+    return hashlib.sha1(json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+def _is_cli(node):
+    for dec in node.decorator_list:
+        if isinstance(dec, ast.Call) and isinstance(dec.func, ast.Attribute) and dec.func.attr in CLI_DECORATORS:
+            return True
+        if isinstance(dec, ast.Attribute) and dec.attr in CLI_DECORATORS:
+            return True
+    return False
+
+def _call_ref(node, cls):
+    """[base, nome, linha]: base '' para f(), 'self' para self.m()/cls.m() em método, ou o nome em x.f()."""
+    func = node.func
+    if isinstance(func, ast.Name):
+        return ['', func.id, node.lineno]
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        base = func.value.id
+        if cls and base in ('self', 'cls'):
+            base = 'self'
+        return [base, func.attr, node.lineno]
+    return None
+
+def _bind_import(node, bindings):
+    if isinstance(node, ast.Import):
+        for a in node.names:
+            if a.asname:
+                bindings[a.asname] = [a.name, 0, None]
+            else:
+                top = a.name.split('.')[0]
+                bindings[top] = [top, 0, None]
+    else:
+        for a in node.names:
+            if a.name != '*':
+                bindings[a.asname or a.name] = [node.module or '', node.level, a.name]
+
+def extract_symbols(tree):
+    """
+    Travessia pré-ordem única (mesma ordem do ast.NodeVisitor).
+    top: fora de def/class (definições do xref); xref: fora de argumentos de
+    chamadas por atributo (o IntegrityChecker não desce nelas); scope/func/cls:
+    nome qualificado do escopo, da função e da classe que envolvem o nó.
+    """
+    defs, events, functions, called, exports = {}, [], [], set(), set()
+    callgraph, bindings = {}, {}
+    stack = [(tree, True, True, '', None, None)]
+    while stack:
+        node, top, xref, scope, func, cls = stack.pop()
+        descend_top, child_scope, child_func, child_cls = top, scope, func, cls
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if top:
+                args = node.args
+                defs[node.name] = {'type': 'function', 'min_args': len(args.args) - len(args.defaults), 'max_args': len(args.args), 'has_varargs': args.vararg is not None, 'is_click': _is_cli(node), 'lineno': node.lineno}
+            if isinstance(node, ast.FunctionDef) and not (node.name.startswith('__') and node.name.endswith('__')):
+                functions.append([node.name, node.lineno, _is_cli(node)])
+            descend_top = False
+            child_scope = child_func = f'{scope}.{node.name}' if scope else node.name
+            callgraph[child_func] = {'line': node.lineno, 'calls': []}
+        elif isinstance(node, ast.ClassDef):
+            if top:
+                defs[node.name] = {'type': 'class', 'lineno': node.lineno}
+            descend_top = False
+            child_scope = child_cls = f'{scope}.{node.name}' if scope else node.name
+            child_func = None
+        elif isinstance(node, ast.Assign):
+            if top and node.col_offset == 0:
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        defs[target.id] = {'type': 'variable', 'lineno': node.lineno}
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id == '__all__' and isinstance(node.value, (ast.List, ast.Tuple)):
+                    exports.update(elt.value for elt in node.value.elts if isinstance(elt, ast.Constant) and isinstance(elt.value, str))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            _bind_import(node, bindings)
+            if xref and isinstance(node, ast.ImportFrom):
+                events.append(['from', node.module or '', node.level, [[a.name, a.asname] for a in node.names], node.lineno])
+        elif isinstance(node, ast.Call):
+            if func:
+                ref = _call_ref(node, cls)
+                if ref:
+                    callgraph[func]['calls'].append(ref)
+            if isinstance(node.func, ast.Name):
+                called.add(node.func.id)
+                if xref:
+                    events.append(['call', node.func.id, len(node.args) + len(node.keywords), len(node.keywords), node.lineno])
+            else:
+                if isinstance(node.func, ast.Attribute):
+                    called.add(node.func.attr)
+                xref = False
+        children = list(ast.iter_child_nodes(node))
+        for child in reversed(children):
+            stack.append((child, descend_top, xref, child_scope, child_func, child_cls))
+    return {'defs': defs, 'events': events, 'functions': functions, 'called': sorted(called), 'exports': sorted(exports), 'callgraph': callgraph, 'bindings': bindings}
+
+class SymbolTable:
+    """Entradas por caminho canônico; refresh() reanalisa só o que mudou."""
+
+    def __init__(self, root=None):
+        self.root = root
+        self.path = os.path.join(root, '.doxoade_cache', TABLE_FILE) if root else None
+        self.entries = {}
+        self.dirty = False
+        self.parsed = 0
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == TABLE_VERSION:
+                    self.entries = data.get('files', {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def refresh(self, files):
+        """Garante entradas atualizadas para 'files'; retorna {caminho canônico: entrada}."""
+        view = {}
+        for file_path in files:
+            key = canonical(file_path)
+            try:
+                st = os.stat(file_path)
+                sig = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                view[key] = {'sig': None, 'defs': {}, 'events': [], 'functions': [], 'called': [], 'exports': [], 'callgraph': {}, 'bindings': {}, 'parsed': False, 'defs_hash': ''}
+                continue
+            entry = self.entries.get(key)
+            if not entry or entry.get('sig') != sig:
+                entry = self._analyze(file_path, sig)
+                self.entries[key] = entry
+                self.dirty = True
+                self.parsed += 1
+            view[key] = entry
+        return view
+
+    def _analyze(self, file_path, sig):
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                tree = ast.parse(f.read(), filename=file_path)
+            entry = extract_symbols(tree)
+            entry['parsed'] = True
+        except Exception:
+            entry = {'defs': {}, 'events': [], 'functions': [], 'called': [], 'exports': [], 'callgraph': {}, 'bindings': {}, 'parsed': False}
+        entry['sig'] = sig
+        entry['path'] = os.path.abspath(file_path)
+        entry['defs_hash'] = _digest(entry['defs'])
+        return entry
+
+    def cached_result(self, key, kind, dep_key):
+        cached = self.entries.get(key, {}).get(kind)
+        if cached and cached.get('key') == dep_key:
+            return cached['findings']
+        return None
+
+    def store_result(self, key, kind, dep_key, findings):
+        entry = self.entries.get(key)
+        if entry is not None and entry.get('sig') is not None:
+            entry[kind] = {'key': dep_key, 'findings': findings}
+            self.dirty = True
+
+    def save(self):
+        if not (self.path and self.dirty):
+            return
+        live = {k: v for k, v in self.entries.items() if os.path.exists(v.get('path', k))}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': TABLE_VERSION, 'files': live}, f, separators=(',', ':'))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+    @staticmethod
+    def dep_key(*parts):
+        return _digest(parts)
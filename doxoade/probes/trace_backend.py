@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# doxoade/doxoade/probes/trace_backend.py
+"""
+Backend de Rastro de Baixo Overhead (Nexus Trace).
+- Decide UMA vez por code object se ele deve ser rastreado.
+- Frames estrangeiros são podados no evento 'call' (settrace) ou
+  desligados na origem com DISABLE (sys.monitoring, PEP 669, 3.12+).
+- Eventos vão para um ring buffer de arrays pré-alocados; a renderização
+  (linecache, cores, variáveis) só acontece depois da execução.
+"""
+import os
+import sys
+import time
+import linecache
+from array import array
+
+_SELF_MODULES = ('debug_probe', 'flow_runner', 'trace_backend')
+_FOREIGN_MARKERS = ('site-packages', 'dist-packages')
+HAS_MONITORING = sys.version_info >= (3, 12) and hasattr(sys, 'monitoring')
+
+class CodeFilter:
+    """Cache de decisão por code object (uma avaliação de path por função)."""
+    __slots__ = ('project_root', 'internal_mode', '_decisions')
+
+    def __init__(self, project_root, internal_mode=False):
+        self.project_root = os.path.abspath(project_root).replace('\\', '/').lower()
+        self.internal_mode = internal_mode
+        self._decisions = {}
+
+    def accepts(self, code) -> bool:
+        hit = self._decisions.get(code)
+        if hit is None:
+            hit = self._decisions[code] = self._evaluate(code.co_filename)
+        return hit
+
+    def _evaluate(self, raw_fname: str) -> bool:
+        if not raw_fname or raw_fname.startswith('<'):
+            return False
+        norm = os.path.abspath(raw_fname).replace('\\', '/').lower()
+        if not norm.startswith(self.project_root):
+            return False
+        if any(m in norm for m in _FOREIGN_MARKERS):
+            return False
+        if not self.internal_mode and any(m in os.path.basename(norm) for m in _SELF_MODULES):
+            return False
+        return True
+
+class TraceRing:
+    """
+    Ring buffer de eventos de linha em arrays contíguos.
+    Quando o anel completa uma volta, o bloco é consolidado em 'stats'
+    (hits e ns por linha), então as métricas nunca perdem eventos.
+    """
+    __slots__ = ('capacity', 'mask', 'code_ids', 'lines', 'stamps', 'pos', 'codes', '_code_index', 'stats', '_folded')
+
+    def __init__(self, capacity_pow2=16):
+        self.capacity = 1 << capacity_pow2
+        self.mask = self.capacity - 1
+        self.code_ids = array('i', bytes(4 * self.capacity))
+        self.lines = array('i', bytes(4 * self.capacity))
+        self.stamps = array('q', bytes(8 * self.capacity))
+        self.pos = 0
+        self.codes = []
+        self._code_index = {}
+        self.stats = {}
+        self._folded = 0
+
+    def code_id(self, code) -> int:
+        cid = self._code_index.get(code)
+        if cid is None:
+            cid = self._code_index[code] = len(self.codes)
+            self.codes.append(code)
+        return cid
+
+    def push(self, cid, lineno, stamp):
+        i = self.pos & self.mask
+        if i == 0 and self.pos:
+            self._fold(self.capacity, closing_stamp=stamp)
+        self.code_ids[i] = cid
+        self.lines[i] = lineno
+        self.stamps[i] = stamp
+        self.pos += 1
+
+    def _fold(self, count, closing_stamp=None):
+        """Consolida os 'count' eventos do anel em stats (tempo = delta até o próximo evento)."""
+        stats = self.stats
+        ids, lines, stamps = self.code_ids, self.lines, self.stamps
+        for i in range(count):
+            nxt = stamps[i + 1] if i + 1 < count else (closing_stamp or stamps[i])
+            key = (ids[i], lines[i])
+            slot = stats.get(key)
+            if slot is None:
+                slot = stats[key] = [0, 0]
+            slot[0] += 1
+            slot[1] += max(0, nxt - stamps[i])
+        self._folded += count
+
+    def close(self):
+        pending = self.pos - self._folded
+        if pending > 0:
+            self._fold(pending, closing_stamp=time.perf_counter_ns())
+
+    def recent(self, limit):
+        """Últimos eventos retidos no anel, em ordem cronológica: (code, lineno)."""
+        start = max(self.pos - min(limit, self.capacity), 0)
+        return [(self.codes[self.code_ids[p & self.mask]], self.lines[p & self.mask]) for p in range(start, self.pos)]
+
+class _SettraceBackend:
+    """sys.settrace com poda no evento 'call': frames estrangeiros recebem None."""
+
+    def __init__(self, ring, code_filter, watch=None):
+        self.ring = ring
+        self.filter = code_filter
+        self.watch = watch
+
+    def start(self):
+        ring, accepts, watch = self.ring, self.filter.accepts, self.watch
+        push, code_id, clock = ring.push, ring.code_id, time.perf_counter_ns
+
+        def _global(frame, event, arg):
+            code = frame.f_code
+            if not accepts(code):
+                return None
+            cid = code_id(code)
+
+            def _local(frame, event, arg):
+                if event == 'line':
+                    push(cid, frame.f_lineno, clock())
+                    if watch is not None:
+                        watch(ring.pos - 1, frame.f_locals)
+                return _local
+            return _local
+        sys.settrace(_global)
+
+    def stop(self):
+        sys.settrace(None)
+
+class _MonitoringBackend:
+    """PEP 669: LINE desligado por localização (DISABLE) fora do projeto."""
+
+    def __init__(self, ring, code_filter):
+        self.ring = ring
+        self.filter = code_filter
+        self.tool_id = None
+
+    def start(self):
+        mon = sys.monitoring
+        for tool_id in (mon.DEBUGGER_ID, mon.PROFILER_ID, 3, 4):
+            if mon.get_tool(tool_id) is None:
+                self.tool_id = tool_id
+                break
+        if self.tool_id is None:
+            raise RuntimeError('sys.monitoring sem tool id livre')
+        ring, accepts, disable = self.ring, self.filter.accepts, mon.DISABLE
+        push, code_id, clock = ring.push, ring.code_id, time.perf_counter_ns
+
+        def _on_start(code, offset):
+            if not accepts(code):
+                return disable
+
+        def _on_line(code, lineno):
+            if not accepts(code):
+                return disable
+            push(code_id(code), lineno, clock())
+        mon.use_tool_id(self.tool_id, 'doxoade-trace')
+        mon.register_callback(self.tool_id, mon.events.PY_START, _on_start)
+        mon.register_callback(self.tool_id, mon.events.LINE, _on_line)
+        mon.set_events(self.tool_id, mon.events.PY_START | mon.events.LINE)
+
+    def stop(self):
+        mon = sys.monitoring
+        if self.tool_id is None:
+            return
+        mon.set_events(self.tool_id, 0)
+        mon.register_callback(self.tool_id, mon.events.PY_START, None)
+        mon.register_callback(self.tool_id, mon.events.LINE, None)
+        mon.free_tool_id(self.tool_id)
+        self.tool_id = None
+
+class VarWatch:
+    """
+    Diferença de variáveis por identidade; stringifica só o que mudou.
+    As diferenças ficam em slots alinhados ao anel: quando o anel dá a volta,
+    o slot é sobrescrito junto com o evento (memória limitada à capacidade).
+    """
+    __slots__ = ('last', 'mask', 'slots')
+
+    def __init__(self, capacity):
+        self.last = {}
+        self.mask = capacity - 1
+        self.slots = [None] * capacity
+
+    def __call__(self, event_pos, f_locals):
+        last = self.last
+        diffs = None
+        for k, v in f_locals.items():
+            if last.get(k, last) is not v and (not k.startswith('__')):
+                last[k] = v
+                if diffs is None:
+                    diffs = []
+                try:
+                    diffs.append((k, str(v)[:20]))
+                except Exception:
+                    diffs.append((k, f'<{type(v).__name__}>'))
+        if diffs:
+            self.slots[event_pos & self.mask] = (event_pos, diffs)
+
+    def diffs_at(self, event_pos):
+        """Diferenças do evento, ou None se não houve mudança (ou o slot já foi reciclado)."""
+        slot = self.slots[event_pos & self.mask]
+        if slot is not None and slot[0] == event_pos:
+            return slot[1]
+        return None
+
+class NexusTracer:
+    """
+    Fachada usada por debug/flow: start() / stop() / top_lines() / render_flow().
+    backend='auto' usa sys.monitoring quando disponível (e sem watch_vars,
+    que exige o frame e portanto settrace).
+    """
+
+    def __init__(self, project_root, internal_mode=False, watch_vars=False, backend='auto', capacity_pow2=16):
+        self.ring = TraceRing(capacity_pow2)
+        self.filter = CodeFilter(project_root, internal_mode=internal_mode)
+        self.watch = VarWatch(self.ring.capacity) if watch_vars else None
+        if backend == 'auto':
+            backend = 'monitoring' if HAS_MONITORING and (not watch_vars) else 'settrace'
+        self.backend_name = backend
+        if backend == 'monitoring':
+            self._backend = _MonitoringBackend(self.ring, self.filter)
+        else:
+            self._backend = _SettraceBackend(self.ring, self.filter, self.watch)
+        self._closed = False
+
+    def start(self):
+        try:
+            self._backend.start()
+        except (RuntimeError, ValueError):
+            self.backend_name = 'settrace'
+            self._backend = _SettraceBackend(self.ring, self.filter, self.watch)
+            self._backend.start()
+
+    def stop(self):
+        self._backend.stop()
+        if not self._closed:
+            self.ring.close()
+            self._closed = True
+
+    @property
+    def event_count(self) -> int:
+        return self.ring.pos
+
+    def line_stats(self) -> dict:
+        """{(filename, lineno): {'hits': int, 'total_ns': int}} — formato legado do _LineTimer."""
+        codes = self.ring.codes
+        data = {}
+        for (cid, lineno), (hits, ns) in self.ring.stats.items():
+            key = (codes[cid].co_filename, lineno)
+            slot = data.setdefault(key, {'hits': 0, 'total_ns': 0})
+            slot['hits'] += hits
+            slot['total_ns'] += ns
+        return data
+
+    def render_flow(self, write=None, limit=2000):
+        """Renderiza o fluxo retido no anel depois da execução."""
+        write = write or sys.stdout.write
+        base = self.ring.pos - min(limit, self.ring.capacity, self.ring.pos)
+        if base > 0:
+            write(f'\x1b[90m[ ... {base} eventos anteriores omitidos ... ]\x1b[0m\n')
+        watch = self.watch
+        for offset, (code, lineno) in enumerate(self.ring.recent(limit)):
+            content = linecache.getline(code.co_filename, lineno).strip()
+            if not content:
+                continue
+            meta = ''
+            diffs = watch.diffs_at(base + offset) if watch else None
+            if diffs:
+                meta = '  ' + ' '.join((f'\x1b[36m{k}\x1b[0m=\x1b[33m{v}\x1b[0m' for k, v in diffs))
+            f_short = os.path.basename(code.co_filename)
+            write(f'\x1b[32m{f_short:<18}\x1b[0m │ \x1b[93m{lineno:<4}\x1b[0m │ {content}{meta}\n')
+        sys.stdout.flush()
@@ -1,146 +1,90 @@
 # doxoade/doxoade/probes/xref_probe.py
-import ast
+"""
+XRef Probe - Integridade entre arquivos (imports quebrados e aridade de chamadas).
+Opera sobre a tabela de símbolos persistida: cada arquivo é analisado uma vez por
+alteração e seus achados só são recalculados quando ele ou um módulo que ele
+importa mudou.
+"""
 import sys
 import os
 import json
 
-def canonical(p):
-    return os.path.abspath(p).replace('\\', '/').lower()
+try:
+    from symbol_table import SymbolTable, canonical
+except ImportError:
+    from doxoade.probes.symbol_table import SymbolTable, canonical
 
-class ProjectIndexer(ast.NodeVisitor):
+def resolve_module_path(current_file, module_name, level, project_root, index):
     """
-    Passo 1: Cria um índice de definições (Funções, Classes e Variáveis Globais).
+    Resolve o caminho físico de um módulo com precisão cirúrgica.
+    Trata: 'import os', 'from modulo import x' e 'from .importado import y'.
     """
-
-    def __init__(self, index, project_root):
-        self.index = index
-        self.project_root = os.path.abspath(project_root).replace('\\', '/')
-        self.current_file = None
-        self.findings = []
-        self.imports_map = {}
-
-    def index_file(self, file_path):
-        self.current_file = canonical(file_path)
-        self.index[self.current_file] = {'defs': {}}
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            tree = ast.parse(content, filename=file_path)
-            self.visit(tree)
-        except Exception:
-            pass
-
-    def visit_FunctionDef(self, node):
-        is_click = False
-        for dec in node.decorator_list:
-            if isinstance(dec, ast.Call) and isinstance(dec.func, ast.Attribute) and (dec.func.attr in ['command', 'group']):
-                is_click = True
-            elif isinstance(dec, ast.Attribute) and dec.attr in ['command', 'group']:
-                is_click = True
-        args_count = len(node.args.args)
-        defaults_count = len(node.args.defaults)
-        min_args = args_count - defaults_count
-        self.index[self.current_file]['defs'][node.name] = {'type': 'function', 'min_args': min_args, 'max_args': args_count, 'has_varargs': node.args.vararg is not None, 'is_click': is_click, 'lineno': node.lineno}
-
-    def visit_AsyncFunctionDef(self, node):
-        self.visit_FunctionDef(node)
-
-    def visit_ClassDef(self, node):
-        self.index[self.current_file]['defs'][node.name] = {'type': 'class', 'lineno': node.lineno}
-
-    def visit_Assign(self, node):
-        if node.col_offset == 0:
-            for target in node.targets:
-                if isinstance(target, ast.Name):
-                    self.index[self.current_file]['defs'][target.id] = {'type': 'variable', 'lineno': node.lineno}
-
-class IntegrityChecker(ast.NodeVisitor):
-
-    def __init__(self, index, project_root):
-        self.index = index
-        self.project_root = canonical(project_root)
-        self.current_file = None
-        self.findings = []
-        self.imports_map = {}
-
-    def check_file(self, file_path):
-        self.current_file = canonical(file_path)
-        self.imports_map = {}
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            tree = ast.parse(content, filename=file_path)
-            self.visit(tree)
-        except Exception:
-            pass
-
-    def _resolve_module_path(self, module_name, level=0):
-        """
-        Resolve o caminho físico de um módulo com precisão cirúrgica.
-        Trata: 'import os', 'from modulo import x' e 'from .importado import y'.
-        """
-        current_dir = os.path.dirname(self.current_file)
-        if level > 0:
-            for _ in range(level - 1):
-                current_dir = os.path.dirname(current_dir)
-            start_dir = current_dir
-        else:
-            start_dir = self.project_root
-        parts = module_name.split('.') if module_name else []
-        candidate = os.path.join(start_dir, *parts) + '.py'
+    current_dir = os.path.dirname(current_file)
+    if level > 0:
+        for _ in range(level - 1):
+            current_dir = os.path.dirname(current_dir)
+        start_dir = current_dir
+    else:
+        start_dir = project_root
+    parts = module_name.split('.') if module_name else []
+    for candidate in (os.path.join(start_dir, *parts) + '.py', os.path.join(start_dir, *parts, '__init__.py'), os.path.join(project_root, *parts) + '.py'):
         can_path = canonical(candidate)
-        if can_path in self.index:
+        if can_path in index:
             return can_path
-        candidate_pkg = os.path.join(start_dir, *parts, '__init__.py')
-        can_pkg = canonical(candidate_pkg)
-        if can_pkg in self.index:
-            return can_pkg
-        candidate_root = os.path.join(self.project_root, *parts) + '.py'
-        can_root = canonical(candidate_root)
-        if can_root in self.index:
-            return can_root
-        return None
+    return None
 
-    def visit_ImportFrom(self, node):
-        module_name = node.module if node.module else ''
-        target_file = self._resolve_module_path(module_name, node.level)
-        if not target_file or target_file not in self.index:
-            return
-        target_defs = self.index[target_file]['defs']
-        for alias in node.names:
-            if alias.name == '*':
+def check_file(current_file, index, project_root):
+    """Reproduz o IntegrityChecker sobre os eventos (imports/chamadas) já extraídos."""
+    findings = []
+    imports_map = {}
+    own_defs = index[current_file]['defs']
+    for event in index[current_file]['events']:
+        if event[0] == 'from':
+            _, module_name, level, names, lineno = event
+            target_file = resolve_module_path(current_file, module_name, level, project_root, index)
+            if not target_file:
                 continue
-            if alias.name not in target_defs:
-                self.findings.append({'severity': 'ERROR', 'category': 'BROKEN-LINK', 'message': f"Import quebrado: '{alias.name}' não existe em '{module_name}'.", 'line': node.lineno, 'file': self.current_file})
-            else:
-                local_name = alias.asname or alias.name
-                self.imports_map[local_name] = target_defs[alias.name]
+            target_defs = index[target_file]['defs']
+            for name, asname in names:
+                if name == '*':
+                    continue
+                if name not in target_defs:
+                    findings.append({'severity': 'ERROR', 'category': 'BROKEN-LINK', 'message': f"Import quebrado: '{name}' não existe em '{module_name}'.", 'line': lineno, 'file': current_file})
+                else:
+                    imports_map[asname or name] = target_defs[name]
+            continue
+        _, func_name, args_passed, n_keywords, lineno = event
+        def_info = imports_map.get(func_name) if func_name in imports_map else own_defs.get(func_name)
+        if not def_info or def_info.get('type') != 'function' or def_info.get('is_click') or def_info['has_varargs']:
+            continue
+        if args_passed < def_info['min_args']:
+            findings.append({'severity': 'WARNING', 'category': 'SIGNATURE-MISMATCH', 'message': f"Chamada para '{func_name}' com poucos argumentos (passou {args_passed}, exige {def_info['min_args']}).", 'line': lineno, 'file': current_file})
+        elif n_keywords == 0 and args_passed > def_info['max_args']:
+            findings.append({'severity': 'WARNING', 'category': 'SIGNATURE-MISMATCH', 'message': f"Chamada para '{func_name}' com muitos argumentos (passou {args_passed}, máx {def_info['max_args']}).", 'line': lineno, 'file': current_file})
+    return findings
+
+def _dependency_key(current_file, index, project_root):
+    """Assinatura do arquivo + destino resolvido de cada import + hash das definições importadas."""
+    entry = index[current_file]
+    targets = [resolve_module_path(current_file, ev[1], ev[2], project_root, index) for ev in entry['events'] if ev[0] == 'from']
+    return SymbolTable.dep_key(entry['sig'], targets, [index[t]['defs_hash'] for t in targets if t])
+
+def analyze_integrity(project_root, files, table=None):
+    """Achados BROKEN-LINK / SIGNATURE-MISMATCH do conjunto 'files'."""
+    table = table or SymbolTable(project_root)
+    project_root = canonical(project_root)
+    index = table.refresh(files)
+    findings = []
+    for current_file in index:
+        dep_key = _dependency_key(current_file, index, project_root)
+        result = table.cached_result(current_file, 'xref', dep_key)
+        if result is None:
+            result = check_file(current_file, index, project_root)
+            table.store_result(current_file, 'xref', dep_key, result)
+        findings.extend(result)
+    table.save()
+    return findings
 
-    def visit_Call(self, node):
-        func_name = None
-        if isinstance(node.func, ast.Name):
-            func_name = node.func.id
-        if not func_name:
-            return
-        def_info = None
-        if func_name in self.imports_map:
-            def_info = self.imports_map[func_name]
-        elif self.current_file in self.index and func_name in self.index[self.current_file]['defs']:
-            def_info = self.index[self.current_file]['defs'][func_name]
-        if def_info:
-            if def_info.get('type') == 'function':
-                if def_info.get('is_click'):
-                    self.generic_visit(node)
-                    return
-                args_passed = len(node.args) + len(node.keywords)
-                min_req = def_info['min_args']
-                max_req = def_info['max_args']
-                if not def_info['has_varargs']:
-                    if args_passed < min_req:
-                        self.findings.append({'severity': 'WARNING', 'category': 'SIGNATURE-MISMATCH', 'message': f"Chamada para '{func_name}' com poucos argumentos (passou {args_passed}, exige {min_req}).", 'line': node.lineno, 'file': self.current_file})
-                    elif len(node.keywords) == 0 and args_passed > max_req:
-                        self.findings.append({'severity': 'WARNING', 'category': 'SIGNATURE-MISMATCH', 'message': f"Chamada para '{func_name}' com muitos argumentos (passou {args_passed}, máx {max_req}).", 'line': node.lineno, 'file': self.current_file})
-        self.generic_visit(node)
 if __name__ == '__main__':
     try:
         if len(sys.argv) < 2:
@@ -151,13 +95,8 @@ if __name__ == '__main__':
         if not input_data:
             print('[]')
             sys.exit(0)
-        files = json.loads(input_data)
-        indexer = ProjectIndexer()
-        for f in files:
-            indexer.index_file(f)
-        checker = IntegrityChecker(indexer.index, project_root)
-        for f in files:
-            checker.check_file(f)
-        print(json.dumps(checker.findings))
+        data = json.loads(input_data)
+        files = data.get('files', []) if isinstance(data, dict) else data
+        print(json.dumps(analyze_integrity(project_root, files)))
     except Exception:
-        print('[]')
\ No newline at end of file
+        print('[]')
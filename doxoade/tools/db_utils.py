@@ -7,77 +7,24 @@ import threading
 import queue
 import os
 # [DOX-UNUSED] import sys
+from collections.abc import MutableSequence
 import hashlib
 from pathlib import Path
 
 from doxoade.core_database import get_db_connection
 from doxoade.tools.git import _get_git_commit_hash 
+from doxoade.tools.telemetry_tools.segment_log import append_row, segment_log
 
-_LOG_QUEUE = queue.Queue()
-_WORKER_THREAD = None
 _HADES_QUEUE = queue.Queue(maxsize=1000)
 _STOP_EVENT = threading.Event()
-
-def _db_worker():
-    from doxoade.core_database import get_db_connection
-    import time
-    time.sleep(0.5) 
-    conn = get_db_connection()
-    
-    try:
-        conn.execute("SELECT 1 FROM events LIMIT 1")
-    except Exception:
-        # Se as tabelas não existem, o worker aguarda ou encerra
-        conn.close()
-        return
-    
-    conn.execute("PRAGMA busy_timeout = 10000") 
-#    conn.execute("PRAGMA busy_timeout = 20000") 
-    cursor = conn.cursor()
-    batch_buffer = []
-    while not _STOP_EVENT.is_set() or not _LOG_QUEUE.empty():
-        try:
-            item = _LOG_QUEUE.get(timeout=0.5)
-            if item is None:
-                break
-            batch_buffer.append(item)
-            if len(batch_buffer) >= 50:
-                for query, params in batch_buffer:
-                    cursor.execute(query, params)
-                conn.commit()
-                batch_buffer = []
-        except queue.Empty:
-            if batch_buffer:
-                for query, params in batch_buffer:
-                    cursor.execute(query, params)
-                conn.commit()
-                batch_buffer = []
-            continue
-    if batch_buffer:
-        for query, params in batch_buffer:
-            cursor.execute(query, params)
-        conn.commit()
-    conn.close()
-
-def start_persistence_worker():
-    global _WORKER_THREAD
-    if _WORKER_THREAD is None or not _WORKER_THREAD.is_alive():
-        _STOP_EVENT.clear()
-        _WORKER_THREAD = threading.Thread(target=_db_worker, daemon=True)
-        _WORKER_THREAD.start()
+_HADES_THREAD = None
 
 def stop_persistence_worker():
-    """Garante o sepultamento dos logs antes do encerramento do processo."""
-    global _WORKER_THREAD
-    if _WORKER_THREAD:
-        _STOP_EVENT.set()
-        _LOG_QUEUE.put(None)
-        _WORKER_THREAD.join(timeout=3.0)
-        _WORKER_THREAD = None
+    """Garante o sepultamento dos logs antes do encerramento do processo (sela o segmento ativo)."""
+    segment_log.seal()
 
 def _log_execution(command_name, path, results, arguments, execution_time_ms, exit_code=0, payload=None):
     """Gravador Mestre: Sincroniza Findings (Events) e Timeline (History)."""
-    start_persistence_worker() 
     
     from datetime import datetime, timezone
     import json
@@ -89,31 +36,20 @@ def _log_execution(command_name, path, results, arguments, execution_time_ms, ex
     _session = uuid.uuid4().hex
     _full_cmd = "doxoade " + " ".join(sys.argv[1:])
 
-    # 1. Grava na tabela EVENTS (Para o sistema de Findings/History)
-    # Retornamos o ID para que o findings_arena ou logger possa associar
-    _query_events = '''
-        INSERT INTO events (timestamp, doxoade_version, command, project_path, execution_time_ms, status)
-        VALUES (?, ?, ?, ?, ?, ?)
-    '''
+    # 1. Linha da tabela EVENTS (Para o sistema de Findings/History)
     _params_events = (_ts, "85.2", command_name, _p_abs, execution_time_ms, "completed")
     
-    # 2. Grava na tabela COMMAND_HISTORY (Para a Timeline/Arqueologia)
-    _query_hist = '''
-        INSERT INTO command_history 
-        (session_uuid, timestamp, command_name, full_command_line, working_dir, 
-         exit_code, duration_ms, system_info, compressed_payload)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    '''
+    # 2. Linha da tabela COMMAND_HISTORY (Para a Timeline/Arqueologia)
     _sys_info = json.dumps({"args": arguments, "summary": results.get('summary', {})})
     _params_hist = (_session, _ts, command_name, _full_cmd, _p_abs, exit_code, execution_time_ms, _sys_info, payload)
 
-    # Envia ambos para a fila de persistência
-    _LOG_QUEUE.put((_query_events, _params_events))
-    _LOG_QUEUE.put((_query_hist, _params_hist))
+    # Envia ambos para o ledger append-only (compactado depois no SQLite)
+    append_row('events', dict(zip(('timestamp', 'doxoade_version', 'command', 'project_path', 'execution_time_ms', 'status'), _params_events)))
+    append_row('command_history', dict(zip(('session_uuid', 'timestamp', 'command_name', 'full_command_line', 'working_dir', 'exit_code', 'duration_ms', 'system_info', 'compressed_payload'), _params_hist)))
 
 def _update_open_incidents(findings, project_path):
     """Sincroniza o estado atual do linter com o banco de dados."""
-    if not isinstance(findings, list): return
+    if not isinstance(findings, MutableSequence): return
     
     from doxoade.core_database import get_db_connection
     conn = get_db_connection()
@@ -177,11 +113,16 @@ def _hades_worker():
                 conn.close()
         except Exception: pass
 
-# Inicia o worker automaticamente
-threading.Thread(target=_hades_worker, daemon=True).start()
+def _ensure_hades_worker():
+    """Inicia o worker sob demanda (nada de threads criadas no import)."""
+    global _HADES_THREAD
+    if _HADES_THREAD is None or not _HADES_THREAD.is_alive():
+        _HADES_THREAD = threading.Thread(target=_hades_worker, daemon=True)
+        _HADES_THREAD.start()
 
 def async_db_exec(sql, params=()):
     """Joga o comando no buffer e libera a CPU imediatamente."""
+    _ensure_hades_worker()
     try:
         _HADES_QUEUE.put_nowait((sql, params))
     except queue.Full:
@@ -192,33 +133,19 @@ def async_db_exec(sql, params=()):
         conn.close()
 
 def chief_heartbeat(subsystem: str, action: str, details: dict):
-    """Grava telemetria. Síncrono em modo HORUS para evitar perda de dados."""
+    """Grava telemetria no ledger. Em modo HORUS o segmento é descarregado a cada batida."""
     import json, os
     from datetime import datetime
-    from doxoade.core_database import get_db_connection
-    
-    data_payload = json.dumps(details, ensure_ascii=False)
-    
-    # [PLATINUM] Se o Horus está vigiando, grava imediatamente
+
+    append_row('operational_logs', {
+        'timestamp': datetime.now().isoformat(),
+        'subsystem': subsystem.upper(),
+        'action': action.upper(),
+        'data': json.dumps(details, ensure_ascii=False),
+        'pid': os.getpid(),
+    })
     if os.environ.get('DOXOADE_HORUS_ACTIVE') == '1' or subsystem == 'HORUS':
-        try:
-            conn = get_db_connection()
-            conn.execute('''
-                INSERT INTO operational_logs (timestamp, subsystem, action, data, pid)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (datetime.now().isoformat(), subsystem.upper(), action.upper(), data_payload, os.getpid()))
-            conn.commit()
-            conn.close()
-            return
-        except Exception as e:
-            import logging as _dox_log
-            _dox_log.error(f"[INFRA] chief_heartbeat: {e}")
-
-    # Fluxo normal assíncrono
-    from .db_utils import _LOG_QUEUE # Referência circular guard
-    _query = 'INSERT INTO operational_logs (timestamp, subsystem, action, data, pid) VALUES (?, ?, ?, ?, ?)'
-    _params = (datetime.now().isoformat(), subsystem.upper(), action.upper(), data_payload, os.getpid())
-    _LOG_QUEUE.put((_query, _params))
+        segment_log.flush()
 
 # No momento de gravar:
 #if vault_is_active:
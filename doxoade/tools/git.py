@@ -123,20 +123,22 @@ def _get_file_history_metadata(path: str, limit: int=10):
     """
     Recupera metadados dos últimos commits que afetaram o arquivo (PASC-1.1).
     """
+    from .git_batch import iter_git_lines
     fmt = '%h|%as|%an|%s'
-    cmd = ['log', f'-{limit}', f'--format={fmt}', '--', path]
-    raw = _run_git_command(cmd, capture_output=True, silent_fail=True)
     history = []
-    if raw:
-        for line in raw.splitlines():
+    try:
+        for line in iter_git_lines(['log', f'-{limit}', f'--format={fmt}', '--', path]):
             parts = line.split('|')
             if len(parts) >= 4:
                 history.append({'hash': parts[0], 'date': parts[1], 'author': parts[2], 'subject': parts[3]})
+    except (OSError, subprocess.CalledProcessError):
+        pass
     return history
 
 def _get_historical_content(path: str, commit_hash: str) -> str:
-    """Recupera o conteúdo de um arquivo em um ponto específico do tempo."""
-    return _run_git_command(['show', f'{commit_hash}:{path}'], capture_output=True, silent_fail=True) or ''
+    """Recupera o conteúdo de um arquivo em um ponto específico do tempo (cat-file --batch memorizado)."""
+    from .git_batch import get_reader
+    return get_reader().read_text(commit_hash, path).strip()
     
 def _get_line_history(file_path: str, line_num: int) -> dict:
     """Escava a origem de uma linha específica via Git Blame (PASC 8.19)."""
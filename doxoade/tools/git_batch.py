@@ -0,0 +1,161 @@
+# doxoade/doxoade/tools/git_batch.py
+"""
+Leitura de Histórico Git em Processo Único (MPoT-17).
+- CatFileReader: um 'git cat-file --batch' vivo por repositório; cada blob
+  (commit, caminho) custa uma linha no stdin em vez de um 'git show'.
+- Conteúdos memorizados por (commit, caminho) com teto de entradas.
+- iter_git_lines: 'git log' consumido em streaming, linha a linha.
+- diff_hunks / map_old_line: um único 'git diff -U0' por par de commits e
+  mapeamento de linhas antigas para as novas posições pelos hunks.
+"""
+import os
+import re
+import atexit
+import subprocess
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MEMO_LIMIT = 512
+
+class CatFileReader:
+    """Cliente do protocolo 'git cat-file --batch' (reinicia sozinho se o processo morrer)."""
+
+    def __init__(self, cwd: Optional[str] = None):
+        self.cwd = cwd
+        self._proc = None
+        self._memo = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hits = 0
+
+    def _start(self):
+        self._proc = subprocess.Popen(['git', 'cat-file', '--batch'], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=self.cwd)
+
+    def _query(self, spec: str) -> Optional[bytes]:
+        if '\n' in spec:
+            return None
+        try:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            self._proc.stdin.write(spec.encode('utf-8') + b'\n')
+            self._proc.stdin.flush()
+            header = self._proc.stdout.readline()
+            if not header:
+                raise OSError('cat-file encerrou')
+            parts = header.split()
+            if len(parts) != 3 or not parts[2].isdigit():
+                return None  # '<spec> missing' / '<spec> ambiguous'
+            data = self._proc.stdout.read(int(parts[2]))
+            self._proc.stdout.read(1)
+            return data if parts[1] == b'blob' else None
+        except (OSError, ValueError):
+            self.close()
+            return None
+
+    def read_blob(self, commit: str, path: str) -> Optional[bytes]:
+        """Bytes do arquivo 'path' em 'commit' (None se não existir)."""
+        key = (commit, path)
+        self.requests += 1
+        if key in self._memo:
+            self.hits += 1
+            return self._memo[key]
+        with self._lock:
+            data = self._query(f'{commit}:{path}')
+        if len(self._memo) >= MEMO_LIMIT:
+            self._memo.pop(next(iter(self._memo)))
+        self._memo[key] = data
+        return data
+
+    def read_text(self, commit: str, path: str) -> str:
+        data = self.read_blob(commit, path)
+        return data.decode('utf-8', errors='replace') if data is not None else ''
+
+    def close(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+_READERS = {}
+
+def get_reader(cwd: Optional[str] = None) -> CatFileReader:
+    """Leitor compartilhado por diretório (vive até o fim do processo)."""
+    key = os.path.abspath(cwd or os.getcwd())
+    reader = _READERS.get(key)
+    if reader is None:
+        reader = _READERS[key] = CatFileReader(key)
+    return reader
+
+@atexit.register
+def close_readers():
+    for reader in list(_READERS.values()):
+        reader.close()
+    _READERS.clear()
+
+def iter_git_lines(args: List[str], cwd: Optional[str] = None) -> Iterator[str]:
+    """Linhas de stdout de 'git <args>' sem bufferizar a saída inteira; levanta CalledProcessError no fim se o git falhar."""
+    cmd = ['git'] + args
+    # stderr descartado: um PIPE não lido enquanto o stdout é consumido pode travar o git.
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=cwd, text=True, encoding='utf-8', errors='ignore')
+    finished = False
+    try:
+        for line in proc.stdout:
+            yield line.rstrip('\n')
+        finished = True
+    finally:
+        if not finished:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+_HUNK_RE = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+def diff_hunks(old: str, new: str, cwd: Optional[str] = None) -> Dict[str, dict]:
+    """
+    {caminho antigo: {'new_path': caminho novo, 'hunks': [(old_start, old_len, new_start, new_len)]}}
+    de um único 'git diff -U0 -M old new'. Arquivos criados no commit ficam de fora.
+    """
+    files: Dict[str, dict] = {}
+    current = None
+    old_path = None
+    for line in iter_git_lines(['-c', 'core.quotePath=false', 'diff', '--unified=0', '--no-color', '--no-ext-diff', '-M', old, new], cwd):
+        if line.startswith('diff --git '):
+            current, old_path = None, None
+        elif line.startswith('--- '):
+            old_path = line[6:] if line.startswith('--- a/') else None
+        elif line.startswith('+++ ') and old_path:
+            new_path = line[6:] if line.startswith('+++ b/') else None
+            current = files.setdefault(old_path, {'new_path': new_path, 'hunks': []})
+        elif line.startswith('@@') and current is not None:
+            m = _HUNK_RE.match(line)
+            if m:
+                a, b, c, d = m.groups()
+                current['hunks'].append((int(a), int(b or 1), int(c), int(d or 1)))
+    return files
+
+def map_old_line(hunks: List[Tuple[int, int, int, int]], line: int) -> Tuple[Optional[int], bool]:
+    """
+    Posição na versão nova da linha 'line' da versão antiga -> (linha nova, alterada).
+    Linhas dentro de um hunk de substituição caem na linha correspondente do trecho
+    novo; linhas apagadas sem substituto retornam (None, True).
+    """
+    delta = 0
+    for old_start, old_len, new_start, new_len in hunks:
+        o0 = old_start if old_len else old_start + 1
+        n0 = new_start if new_len else new_start + 1
+        if line < o0:
+            break
+        if line < o0 + old_len:
+            return (n0 + min(line - o0, new_len - 1) if new_len else None), True
+        delta = (n0 + new_len) - (o0 + old_len)
+    return line + delta, False
@@ -156,10 +156,12 @@ class HermesDiagnostic:
         # Tenta adicionar informações do Hermes
         try:
             from doxoade.tools.hermes_systems.hermes_loader import HermesLoader
+            from doxoade.tools.hermes_systems.hermes_metrics import cache_report
             loader = HermesLoader(str(self.root))
             dump_data['hermes'] = {
                 'cache_size': len(loader._code_cache),
-                'cache_max': loader._cache_max_size
+                'cache_max': loader._cache_max_size,
+                'caches': cache_report()
             }
         except Exception:
             pass
@@ -2,6 +2,9 @@
 # doxoade/tools/hermes_systems/hermes_loader.py
 """
 Hermes Loader Unificado — HBC3, HBC4, HBC5 e HBC6 (Varints + LZ4 + HRT)
+- MACRO_DICT e HRT decodificados em uma chamada (decoder nativo ou fallback em lote).
+- Code objects num LRU por processo, limitado por entradas e bytes, com
+  hit/miss/evicção expostos em hermes_metrics.cache_report().
 """
 import hashlib
 import lzma
@@ -10,11 +13,18 @@ import json
 import dis
 import types
 import struct
+from collections import OrderedDict
 from pathlib import Path
 from .hermes_format import parse_header, get_bitmap, string_needs_reverse, MAGIC_HBC3
 from .hermes_format_hbc4 import parse_header_hbc4, get_bitmap_hbc4, MAGIC_HBC4
 from .hermes_format_hbc5 import parse_header_hbc5, get_bitmap_hbc5, MAGIC_HBC5
 from .hermes_decoder_vector import VectorDecoder, build_vector_decoder, reverse_tokens_vectorized
+from .hermes_metrics import cache_metrics
+from .native import parse_hbc6_tables as _native_hbc6_tables
+
+CODE_CACHE_MAX_ENTRIES = 1024
+CODE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_HRT_RECORD = struct.Struct('<IIHH')  # co_index, offset, token_id, orig_len
 
 
 def decode_varint(data: bytes, offset: int = 0) -> tuple:
@@ -36,6 +46,112 @@ def decode_varint(data: bytes, offset: int = 0) -> tuple:
     return result, consumed
 
 
+def _read_varint(data: bytes, pos: int) -> tuple:
+    """(valor, nova_posição); varints de 1 byte (a maioria) não passam pelo laço."""
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value, consumed = decode_varint(data, pos)
+    return value, pos + consumed
+
+
+def parse_macro_dict(data: bytes, offset: int, size: int) -> dict:
+    """MACRO_DICT: count, depois (token_id, length, opcodes) em varints. Truncado = parcial."""
+    macro_dict = {}
+    if size < 1:
+        return macro_dict
+    end = offset + size
+    try:
+        count, pos = _read_varint(data, offset)
+        for _ in range(count):
+            if pos >= end:
+                break
+            tid, pos = _read_varint(data, pos)
+            length, pos = _read_varint(data, pos)
+            if pos + length > end:
+                break
+            macro_dict[tid] = data[pos:pos + length]
+            pos += length
+    except (ValueError, IndexError):
+        pass
+    return macro_dict
+
+
+def parse_hrt(data: bytes, offset: int, size: int) -> dict:
+    """HRT: registros fixos <IIHH desempacotados de uma vez -> {(co_index, offset): orig_len}."""
+    usable = max(0, min(size, len(data) - offset)) // _HRT_RECORD.size * _HRT_RECORD.size
+    view = memoryview(data)[offset:offset + usable]
+    return {(co, off): orig_len for co, off, _tid, orig_len in _HRT_RECORD.iter_unpack(view)}
+
+
+def parse_hbc6_tables(data: bytes, hrt_offset: int, hrt_size: int, macro_offset: int, macro_size: int) -> tuple:
+    """(macro_dict, hrt_map) numa chamada: decoder nativo se compilado, senão fallback Python."""
+    tables = _native_hbc6_tables(data, hrt_offset, hrt_size, macro_offset, macro_size)
+    if tables is not None:
+        return tables
+    return parse_macro_dict(data, macro_offset, macro_size), parse_hrt(data, hrt_offset, hrt_size)
+
+
+class CodeCache:
+    """LRU de code objects; o custo de cada entrada é o tamanho do .hermes lido."""
+
+    def __init__(self, name: str = 'hermes_loader', max_entries: int = CODE_CACHE_MAX_ENTRIES,
+                 max_bytes: int = CODE_CACHE_MAX_BYTES):
+        self._items = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.metrics = cache_metrics(name)
+        self.metrics.max_entries = max_entries
+        self.metrics.max_bytes = max_bytes
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            self.metrics.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.metrics.hits += 1
+        return item[0]
+
+    def put(self, key, code_obj, cost: int = 0):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._items[key] = (code_obj, cost)
+        self.bytes += cost
+        while len(self._items) > 1 and (len(self._items) > self.max_entries or self.bytes > self.max_bytes):
+            _, (_, evicted_cost) = self._items.popitem(last=False)
+            self.bytes -= evicted_cost
+            self.metrics.evictions += 1
+        self._sync()
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+        self._sync()
+
+    def _sync(self):
+        self.metrics.entries = len(self._items)
+        self.metrics.bytes = self.bytes
+
+
+# Compartilhado entre instâncias: o hook cria um HermesLoader por import.
+_CODE_CACHE = CodeCache()
+
+
+def _cache_key(tag: str, hermes_path: Path) -> tuple:
+    """Chave com (mtime_ns, size): um .hermes recompilado nunca devolve o code antigo."""
+    st = hermes_path.stat()
+    return (tag, str(hermes_path), st.st_mtime_ns, st.st_size)
+
+
 class HermesLoader:
     SKIP_THRESHOLD = 10 * 1024
     TIER1_THRESHOLD = 30 * 1024
@@ -47,8 +163,8 @@ class HermesLoader:
         self.hermes_base_dir = self.root / '.doxoade' / 'hermes' / 'build'
         self.decoder = self._load_decoder()
         self._vector_decoder = build_vector_decoder(self.decoder) if self.decoder else None
-        self._code_cache = {}
-        self._cache_max_size = 100
+        self._code_cache = _CODE_CACHE
+        self._cache_max_size = _CODE_CACHE.max_entries
 
     def _load_decoder(self) -> dict:
         if not self.dict_file.exists():
@@ -74,9 +190,10 @@ class HermesLoader:
 
     def decompress_to_code(self, hermes_path: Path):
         """Decompressão unificada com suporte a HBC3, HBC4, HBC5 e HBC6."""
-        cache_key = str(hermes_path)
-        if cache_key in self._code_cache:
-            return self._code_cache[cache_key]
+        cache_key = _cache_key('code', hermes_path)
+        cached = self._code_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         data = hermes_path.read_bytes()
         code_obj = None
@@ -128,10 +245,7 @@ class HermesLoader:
         
         # Cache LRU
         if code_obj is not None:
-            if len(self._code_cache) >= self._cache_max_size:
-                oldest = next(iter(self._code_cache))
-                del self._code_cache[oldest]
-            self._code_cache[cache_key] = code_obj
+            self._code_cache.put(cache_key, code_obj, len(data))
         
         return code_obj
 
@@ -193,52 +307,13 @@ class HermesLoader:
         """
         Expande os macros 0xC0 usando Varints no MacroDict e HRT para pular NOPs.
         """
-        # 1. Parse do MACRO_DICT com VARINTS
-        macro_dict = {}
-        pos = macro_dict_offset
-        end_pos = macro_dict_offset + macro_dict_size
-        
-        if macro_dict_size >= 1:
-            try:
-                # Count como Varint
-                dict_count, consumed = decode_varint(data, pos)
-                pos += consumed
-                
-                for _ in range(dict_count):
-                    if pos >= end_pos:
-                        break
-                    
-                    # TokenID como Varint
-                    tid, consumed_tid = decode_varint(data, pos)
-                    pos += consumed_tid
-                    
-                    # Length como Varint
-                    length, consumed_len = decode_varint(data, pos)
-                    pos += consumed_len
-                    
-                    if pos + length > end_pos:
-                        break
-                    
-                    opcodes = data[pos:pos + length]
-                    macro_dict[tid] = opcodes
-                    pos += length
-            except (ValueError, IndexError):
-                pass
-        
+        # 1-2. MACRO_DICT (Varints) e HRT (Hermes Relocation Table) numa única chamada
+        macro_dict, hrt_map = parse_hbc6_tables(
+            data, hrt_offset, hrt_size, macro_dict_offset, macro_dict_size
+        )
         if not macro_dict:
             return code_obj
         
-        # 2. Parse da HRT (Hermes Relocation Table)
-        hrt_map = {}
-        pos = hrt_offset
-        end_hrt = hrt_offset + hrt_size
-        while pos + 12 <= end_hrt:
-            co_index = struct.unpack_from('<I', data, pos)[0]; pos += 4
-            offset_val = struct.unpack_from('<I', data, pos)[0]; pos += 4
-            token_id = struct.unpack_from('<H', data, pos)[0]; pos += 2
-            orig_len = struct.unpack_from('<H', data, pos)[0]; pos += 2
-            hrt_map[(co_index, offset_val)] = orig_len
-        
         # 3. Mapeia id -> co_index usando DFS pré-ordem
         dfs_index_map = {}
         def assign_indices(co, idx=0):
@@ -253,26 +328,30 @@ class HermesLoader:
         # 4. Walker DFS para expandir (usando HRT para pular NOPs)
         def expand_code(co):
             my_index = dfs_index_map.get(id(co), -1)
-            bytecode = bytearray(co.co_code)
+            bytecode = co.co_code
+            size = len(bytecode)
             expanded = bytearray()
-            i = 0
+            i = start = 0
             changed = False
             
-            while i < len(bytecode):
-                if bytecode[i] == 0xC0 and (i + 1) < len(bytecode):
-                    token_id = bytecode[i + 1]
-                    if token_id in macro_dict:
-                        expanded.extend(macro_dict[token_id])
-                        # USA A HRT PARA PULAR O 0xC0 + token_id + NOPs
-                        orig_len = hrt_map.get((my_index, i), 2)
-                        i += orig_len
-                        changed = True
-                        continue
-                expanded.append(bytecode[i])
-                i += 1
+            # Salta direto entre ocorrências de 0xC0 (bytes.find em C), copiando os trechos.
+            while True:
+                j = bytecode.find(0xC0, start)
+                if j < 0 or j + 1 >= size:
+                    break
+                token_id = bytecode[j + 1]
+                if token_id in macro_dict:
+                    expanded += bytecode[i:j]
+                    expanded += macro_dict[token_id]
+                    # USA A HRT PARA PULAR O 0xC0 + token_id + NOPs
+                    i = start = j + hrt_map.get((my_index, j), 2)
+                    changed = True
+                else:
+                    start = j + 1
             
             new_co = co
             if changed:
+                expanded += bytecode[i:]
                 new_co = co.replace(co_code=bytes(expanded))
             
             new_consts = []
@@ -335,9 +414,10 @@ class HermesLoader:
         return self.decompress_to_code(hermes_path)
 
     def _decompress_tier1(self, hermes_path: Path):
-        cache_key = f"tier1:{hermes_path}"
-        if cache_key in self._code_cache:
-            return self._code_cache[cache_key]
+        cache_key = _cache_key('tier1', hermes_path)
+        cached = self._code_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         data = hermes_path.read_bytes()
         
@@ -382,10 +462,7 @@ class HermesLoader:
         else:
             raise ValueError(f"Formato desconhecido: {hermes_path}")
         
-        if len(self._code_cache) >= self._cache_max_size:
-            oldest = next(iter(self._code_cache))
-            del self._code_cache[oldest]
-        self._code_cache[cache_key] = code_obj
+        self._code_cache.put(cache_key, code_obj, len(data))
         return code_obj
 
     def _reverse_dynamic_tokens(self, code_obj, decoder_dict, bitmap=None):
@@ -4,6 +4,7 @@
 Hermes Metrics - Sistema de Medição e Cobertura.
 Responsável por coletar métricas em cada etapa do pipeline de compressão
 e gerar relatórios de cobertura do dicionário.
+Também expõe as estatísticas (hit/miss/evicção) dos caches de runtime do loader.
 """
 import json
 import time
@@ -92,6 +93,46 @@ class ProjectMetrics:
         self.total_tokenized_lines += metrics.tokenized_lines
 
 
+@dataclass
+class CacheMetrics:
+    """Estatísticas de um cache de runtime (ex.: code objects do HermesLoader)."""
+    name: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+    max_entries: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """% de consultas atendidas pelo cache."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits / total) * 100
+
+
+_CACHE_METRICS: Dict[str, CacheMetrics] = {}
+
+
+def cache_metrics(name: str) -> CacheMetrics:
+    """Registro por processo: o mesmo nome devolve sempre o mesmo contador."""
+    metrics = _CACHE_METRICS.get(name)
+    if metrics is None:
+        metrics = _CACHE_METRICS[name] = CacheMetrics(name=name)
+    return metrics
+
+
+def cache_report() -> Dict[str, dict]:
+    """Snapshot serializável de todos os caches registrados."""
+    return {
+        name: {**asdict(m), 'hit_rate': round(m.hit_rate, 2)}
+        for name, m in _CACHE_METRICS.items()
+    }
+
+
 class HermesMetricsCollector:
     """Coletor de métricas durante a compressão."""
     
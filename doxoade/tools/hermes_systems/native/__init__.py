@@ -25,6 +25,12 @@ except ImportError:
     except ImportError:
         pass
 
+# Tabelas HBC6 (MACRO_DICT + HRT) só existem no decoder base.
+try:
+    from .hermes_decoder import parse_hbc6_tables as _parse_hbc6_tables
+except ImportError:
+    _parse_hbc6_tables = None
+
 def decode(hermes_path: str):
     """
     Decodifica arquivo .hermes usando o melhor decoder disponível.
@@ -44,4 +50,16 @@ def get_decoder_type() -> str:
 
 def is_simd_available() -> bool:
     """Verifica se o decoder SIMD está disponível."""
-    return _decoder_type == 'simd'
\ No newline at end of file
+    return _decoder_type == 'simd'
+
+def parse_hbc6_tables(data: bytes, hrt_offset: int, hrt_size: int, macro_offset: int, macro_size: int):
+    """
+    Decodifica MACRO_DICT e HRT em uma chamada nativa.
+    Retorna (macro_dict, hrt_map) ou None se o decoder não estiver compilado.
+    """
+    if _parse_hbc6_tables is None:
+        return None
+    try:
+        return _parse_hbc6_tables(data, hrt_offset, hrt_size, macro_offset, macro_size)
+    except Exception:
+        return None
@@ -227,8 +227,86 @@ static PyObject* hermes_decode(PyObject* self, PyObject* args) {
     return res;
 }
 
+/* Varint LEB128 (mesmos limites do decode_varint Python: no máximo 5 bytes). */
+static int read_varint(const uint8_t* buf, Py_ssize_t len, Py_ssize_t* pos, uint64_t* out) {
+    uint64_t result = 0;
+    int shift = 0;
+    for (;;) {
+        if (*pos >= len) return -1;
+        uint8_t b = buf[(*pos)++];
+        result |= (uint64_t)(b & 0x7F) << shift;
+        if (!(b & 0x80)) break;
+        shift += 7;
+        if (shift > 35) return -1;
+    }
+    *out = result;
+    return 0;
+}
+
+static int dict_set_steal(PyObject* d, PyObject* k, PyObject* v) {
+    int rc = (k && v) ? PyDict_SetItem(d, k, v) : -1;
+    Py_XDECREF(k); Py_XDECREF(v);
+    return rc;
+}
+
+/*
+ * parse_hbc6_tables(data, hrt_offset, hrt_size, macro_offset, macro_size)
+ * -> ({token_id: opcodes}, {(co_index, offset): orig_len})
+ * Decodifica MACRO_DICT (varints) e HRT (registros <IIHH) numa única chamada.
+ */
+static PyObject* hermes_parse_hbc6_tables(PyObject* self, PyObject* args) {
+    Py_buffer view;
+    Py_ssize_t hrt_off, hrt_size, mac_off, mac_size;
+    if (!PyArg_ParseTuple(args, "y*nnnn", &view, &hrt_off, &hrt_size, &mac_off, &mac_size)) return NULL;
+
+    const uint8_t* buf = (const uint8_t*)view.buf;
+    Py_ssize_t len = view.len;
+    PyObject* macros = PyDict_New();
+    PyObject* hrt = PyDict_New();
+    if (!macros || !hrt) goto fail;
+
+    if (mac_size >= 1 && mac_off >= 0) {
+        Py_ssize_t pos = mac_off, end = mac_off + mac_size;
+        uint64_t count, tid, plen;
+        /* Truncamento/overflow encerra o dicionário no que já foi lido (igual ao fallback). */
+        if (read_varint(buf, len, &pos, &count) == 0) {
+            for (uint64_t i = 0; i < count && pos < end; i++) {
+                if (read_varint(buf, len, &pos, &tid) < 0) break;
+                if (read_varint(buf, len, &pos, &plen) < 0) break;
+                if (pos > end || (uint64_t)(end - pos) < plen) break;
+                if (dict_set_steal(macros, PyLong_FromUnsignedLongLong(tid),
+                                   PyBytes_FromStringAndSize((const char*)buf + pos, (Py_ssize_t)plen)) < 0) goto fail;
+                pos += (Py_ssize_t)plen;
+            }
+        }
+    }
+
+    if (hrt_off >= 0) {
+        Py_ssize_t end = hrt_off + hrt_size;
+        if (end > len) end = len;
+        for (Py_ssize_t pos = hrt_off; pos + 12 <= end; pos += 12) {
+            const uint8_t* r = buf + pos;
+            uint32_t co_index = (uint32_t)r[0] | ((uint32_t)r[1] << 8) | ((uint32_t)r[2] << 16) | ((uint32_t)r[3] << 24);
+            uint32_t offset = (uint32_t)r[4] | ((uint32_t)r[5] << 8) | ((uint32_t)r[6] << 16) | ((uint32_t)r[7] << 24);
+            uint16_t orig_len = (uint16_t)(r[10] | (r[11] << 8));
+            if (dict_set_steal(hrt, Py_BuildValue("(kk)", (unsigned long)co_index, (unsigned long)offset),
+                               PyLong_FromLong(orig_len)) < 0) goto fail;
+        }
+    }
+
+    PyBuffer_Release(&view);
+    return Py_BuildValue("(NN)", macros, hrt);
+
+fail:
+    Py_XDECREF(macros); Py_XDECREF(hrt);
+    PyBuffer_Release(&view);
+    return NULL;
+}
+
 static PyMethodDef HermesMethods[] = {
-    {"decode", hermes_decode, METH_VARARGS, "Decodifica HBC3/HBC4"}, {NULL, NULL, 0, NULL}
+    {"decode", hermes_decode, METH_VARARGS, "Decodifica HBC3/HBC4"},
+    {"parse_hbc6_tables", hermes_parse_hbc6_tables, METH_VARARGS, "Decodifica MACRO_DICT e HRT do HBC6"},
+    {NULL, NULL, 0, NULL}
 };
 
 static struct PyModuleDef hermesmodule = {
@@ -1,50 +1,226 @@
 # doxoade/doxoade/tools/horus.py
-import functools
-# [DOX-UNUSED] import json
+"""
+Horus Trace - Observador funcional.
+
+Modos (DOXOADE_HORUS_MODE ou argumento 'mode'):
+  full      -> heartbeat por chamada (comportamento clássico; padrão).
+  ring      -> amostragem por função + ring buffer em memória, despejado em lote no exit (opt-in).
+  aggregate -> apenas contagem, tempo total e latência máxima por função (opt-in).
+"""
+import os
+import sys
 import time
-# [DOX-UNUSED] import os
+import atexit
+import functools
+import threading
+from array import array
 from .telemetry_tools.logger import chief_heartbeat
+# Importado antes do atexit abaixo: o selo do segmento roda depois do flush.
+from .telemetry_tools.segment_log import append_row, segment_log
+
+RING_CAPACITY = 4096
+_MODES = ('full', 'ring', 'aggregate')
+
+def _default_mode():
+    mode = os.environ.get('DOXOADE_HORUS_MODE', '').lower()
+    return mode if mode in _MODES else 'full'
 
-def horus_trace(func):
+def _default_sample():
+    try:
+        return min(1.0, max(0.0, float(os.environ.get('DOXOADE_HORUS_SAMPLE', '1.0'))))
+    except ValueError:
+        return 1.0
+
+class HorusRing:
     """
-    Shadow Trace v1.1 - Platinum Observer.
-    Captura o ciclo de vida completo da função para o banco Hades.
+    Buffer circular de tamanho fixo. As colunas numéricas são arrays
+    pré-alocados; args/resultado entram já truncados em texto (nenhum objeto
+    do chamador fica vivo até o exit).
     """
+    ST_OK, ST_ERROR = 0, 1
+
+    def __init__(self, capacity=RING_CAPACITY):
+        self.capacity = capacity
+        self.func_ids = array('i', bytes(4 * capacity))
+        self.t_start = array('q', bytes(8 * capacity))
+        self.elapsed = array('q', bytes(8 * capacity))
+        self.status = array('b', bytes(capacity))
+        self.refs = [None] * capacity
+        self.pos = 0
+        self.names = []
+        self.stats = []
+        self._lock = threading.Lock()
+
+    def register(self, name):
+        with self._lock:
+            self.names.append(name)
+            self.stats.append([0, 0, 0, 0])
+            return len(self.names) - 1
+
+    def push(self, fid, t0, ns, status, ref):
+        i = self.pos % self.capacity
+        self.pos += 1
+        self.func_ids[i] = fid
+        self.t_start[i] = t0
+        self.elapsed[i] = ns
+        self.status[i] = status
+        self.refs[i] = ref
+
+    def account(self, fid, ns, failed):
+        slot = self.stats[fid]
+        slot[0] += 1
+        slot[1] += ns
+        if ns > slot[2]:
+            slot[2] = ns
+        if failed:
+            slot[3] += 1
+
+    def drain(self):
+        """Eventos retidos em ordem cronológica; esvazia o anel."""
+        count = min(self.pos, self.capacity)
+        start = self.pos - count
+        events = []
+        for p in range(start, self.pos):
+            i = p % self.capacity
+            events.append((self.names[self.func_ids[i]], self.t_start[i], self.elapsed[i], self.status[i], self.refs[i]))
+            self.refs[i] = None
+        self.pos = 0
+        return events
+
+    def drain_stats(self):
+        rows = [(self.names[fid], c, total, peak, err) for fid, (c, total, peak, err) in enumerate(self.stats) if c]
+        for slot in self.stats:
+            slot[:] = [0, 0, 0, 0]
+        return rows
+
+_RING = HorusRing()
+
+def _fmt_args(args, kwargs):
+    combined = f'args={args}' if args else ''
+    if kwargs:
+        combined += f' kwargs={kwargs}' if combined else f'kwargs={kwargs}'
+    return combined or '()'
+
+def _safe_text(fn, *payload):
+    try:
+        return fn(*payload)[:200]
+    except Exception:
+        return '<unrepr>'
+
+def flush_horus():
+    """Despeja anel e agregados no Hades Ledger (segmento append-only)."""
+    import json
+    from datetime import datetime
+    events = _RING.drain()
+    stats = _RING.drain_stats()
+    if not events and (not stats):
+        return 0
+    wall_offset = time.time() - time.perf_counter_ns() / 1e9
+    pid = os.getpid()
+    rows = []
+    for name, t0, ns, status, ref in events:
+        ts = datetime.fromtimestamp(wall_offset + t0 / 1e9).isoformat()
+        args_text, outcome_text = ref if ref else ('()', 'None')
+        rows.append((ts, 'HORUS', 'FUNCTION_IN', json.dumps({'func': name, 'args': args_text, 'sampled': True}), pid))
+        if status == HorusRing.ST_ERROR:
+            rows.append((ts, 'HORUS', 'FUNCTION_ERROR', json.dumps({'func': name, 'error': outcome_text, 'ms': round(ns / 1e6, 3)}), pid))
+        else:
+            rows.append((ts, 'HORUS', 'FUNCTION_OUT', json.dumps({'func': name, 'output': outcome_text, 'ms': round(ns / 1e6, 3)}), pid))
+    now = datetime.now().isoformat()
+    for name, count, total, peak, errors in stats:
+        rows.append((now, 'HORUS', 'FUNCTION_STATS', json.dumps({'func': name, 'calls': count, 'total_ms': round(total / 1e6, 3), 'max_ms': round(peak / 1e6, 3), 'errors': errors}), pid))
+    try:
+        for ts, subsystem, action, data, row_pid in rows:
+            append_row('operational_logs', {'timestamp': ts, 'subsystem': subsystem, 'action': action, 'data': data, 'pid': row_pid})
+        segment_log.flush()
+    except Exception as e:
+        if os.environ.get('VULCAN_VERBOSE') == '1':
+            print(f'\x1b[33m [HORUS-FLUSH-FAIL] {e}\x1b[0m', file=sys.stderr)
+        return 0
+    return len(rows)
+
+def horus_snapshot():
+    """Agregados correntes sem despejar: {func: {'calls', 'total_ms', 'max_ms', 'errors'}}."""
+    return {_RING.names[fid]: {'calls': c, 'total_ms': round(t / 1e6, 3), 'max_ms': round(p / 1e6, 3), 'errors': e} for fid, (c, t, p, e) in enumerate(_RING.stats) if c}
+
+atexit.register(flush_horus)
+
+def _full_wrapper(func):
+    """Shadow Trace v1.1 - captura completa via heartbeat."""
+    func_name = f'{func.__name__}'
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Nome qualificado para facilitar a busca
-        func_name = f"{func.__name__}"
-        
-        # Combina args e kwargs de forma inteligível para a chave 'args' consumida pelo view
-        combined_args = f"args={args}" if args else ""
-        if kwargs:
-            combined_args += f" kwargs={kwargs}" if combined_args else f"kwargs={kwargs}"
-        if not combined_args:
-            combined_args = "()"
-        
-        # Injetamos o rastro de entrada utilizando a chave correta 'args'
-        chief_heartbeat("HORUS", "FUNCTION_IN", {
-            "func": func_name,
-            "args": combined_args[:200]  # Captura tática
-        })
-        
+        chief_heartbeat('HORUS', 'FUNCTION_IN', {'func': func_name, 'args': _fmt_args(args, kwargs)[:200]})
         t0 = time.perf_counter()
         try:
             result = func(*args, **kwargs)
             ms = (time.perf_counter() - t0) * 1000
-            
-            # Registro de saída bem-sucedida
-            chief_heartbeat("HORUS", "FUNCTION_OUT", {
-                "func": func_name,
-                "output": str(result)[:200],
-                "ms": round(ms, 2)
-            })
+            chief_heartbeat('HORUS', 'FUNCTION_OUT', {'func': func_name, 'output': str(result)[:200], 'ms': round(ms, 2)})
             return result
         except Exception as e:
-            # Captura o erro no nível funcional antes de subir
-            chief_heartbeat("HORUS", "FUNCTION_ERROR", {
-                "func": func_name,
-                "error": str(e)
-            })
+            chief_heartbeat('HORUS', 'FUNCTION_ERROR', {'func': func_name, 'error': str(e)})
             raise e
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+def _ring_wrapper(func, sample):
+    """Amostragem determinística (1 a cada N chamadas); erros são sempre capturados."""
+    fid = _RING.register(func.__name__)
+    period = max(1, round(1 / sample)) if sample > 0 else 0
+    counter = [0]
+    clock, push, account = time.perf_counter_ns, _RING.push, _RING.account
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        counter[0] += 1
+        sampled = period and counter[0] % period == 0
+        t0 = clock()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            ns = clock() - t0
+            account(fid, ns, True)
+            push(fid, t0, ns, HorusRing.ST_ERROR, (_safe_text(_fmt_args, args, kwargs), _safe_text(str, e)))
+            raise
+        ns = clock() - t0
+        account(fid, ns, False)
+        if sampled:
+            push(fid, t0, ns, HorusRing.ST_OK, (_safe_text(_fmt_args, args, kwargs), _safe_text(str, result)))
+        return result
+    return wrapper
+
+def _aggregate_wrapper(func):
+    fid = _RING.register(func.__name__)
+    clock, account = time.perf_counter_ns, _RING.account
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        t0 = clock()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            account(fid, clock() - t0, True)
+            raise
+        account(fid, clock() - t0, False)
+        return result
+    return wrapper
+
+def horus_trace(func=None, *, sample=None, mode=None):
+    """
+    Decorador de observação Hórus.
+    Uso: @horus_trace  |  @horus_trace(sample=0.01)  |  @horus_trace(mode='aggregate')
+    Um 'sample' explícito implica o modo 'ring' (só ele amostra); combiná-lo com outro modo é erro.
+    """
+    if sample is not None and mode not in (None, 'ring'):
+        raise ValueError(f"horus_trace: sample={sample} só vale no modo 'ring' (recebido mode={mode!r})")
+
+    def decorate(f):
+        chosen = 'ring' if sample is not None else (mode or _default_mode())
+        if chosen == 'full':
+            return _full_wrapper(f)
+        if chosen == 'aggregate':
+            return _aggregate_wrapper(f)
+        return _ring_wrapper(f, _default_sample() if sample is None else sample)
+    if func is not None:
+        return decorate(func)
+    return decorate
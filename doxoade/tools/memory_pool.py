@@ -1,29 +1,373 @@
 # doxoade/doxoade/tools/memory_pool.py
-import sys
-
-class FindingArena:
-    def __init__(self, size=2000):
-        self._pool = [{'severity':None, 'message':None, 'finding_hash':None} for _ in range(size)]
-        self._ptr = 0
-        self.recycled_count = 0 
-
-    def rent(self, severity, category, message, file, line):
-        if self._ptr >= 2000: return {'severity': severity, 'message': message}
-        slot = self._pool[self._ptr]
-        # [PLATINUM] Detecta reuso real de espaço na RAM
-        if slot.get('message') is not None:
-            self.recycled_count += 1
-        slot.update({'severity': severity, 'category': category, 'message': message, 'file': file, 'line': line})
-        self._ptr += 1
-        return slot
-
-    def flush(self):
-        self._ptr = 0
-
-    def get_stats(self):
-        return self.recycled_count
-
-# --- ANCORAGEM GLOBAL ---
-if 'doxoade_arena_instance' not in sys.modules:
-    sys.modules['doxoade_arena_instance'] = FindingArena()
-finding_arena = sys.modules['doxoade_arena_instance']
\ No newline at end of file
+"""
+Finding Store Colunar (MPoT-17) — substitui a antiga FindingArena.
+- severity/category/message/file: ids numa tabela de strings internadas (array 'I').
+- line: array 'q'; finding_hash: 32 bytes por achado (bytearray).
+- Demais campos (snippet, archaeology, suggestion_*...) em extras esparsos.
+- Fatias, filtros e agrupamentos devolvem visões (apenas um array de ids).
+- Dicts só nascem quando alguém indexa/itera: Finding é um dict cujas
+  escritas voltam para as colunas, então os consumidores legados seguem iguais.
+- JSON, SARIF e o cache do check serializam direto das colunas.
+"""
+import os
+import re
+import json
+import weakref
+from array import array
+from collections import Counter
+from collections.abc import MutableSequence
+
+STR_KEYS = ('severity', 'category', 'message', 'file')
+CORE_KEYS = STR_KEYS + ('line', 'finding_hash')
+SARIF_LEVELS = {'CRITICAL': 'error', 'ERROR': 'error', 'WARNING': 'warning'}
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+_ABSENT = -(1 << 63)
+_NONE = _ABSENT + 1
+_HEX64 = re.compile(r'[0-9a-f]{64}\Z')
+
+# Tabela de strings do processo (id 0 = chave ausente); compartilhada entre stores,
+# copiar um achado de um store para outro é copiar inteiros.
+_STRINGS = [None]
+_IDS = {}
+
+
+def intern_id(value: str) -> int:
+    sid = _IDS.get(value)
+    if sid is None:
+        sid = _IDS[value] = len(_STRINGS)
+        _STRINGS.append(value)
+    return sid
+
+
+def interned_count() -> int:
+    return len(_STRINGS) - 1
+
+
+class _Columns:
+    """Colunas compartilhadas por um store e todas as suas visões."""
+
+    def __init__(self):
+        self.strs = {k: array('I') for k in STR_KEYS}
+        self.line = array('q')
+        self.hash = bytearray()
+        self.has_hash = bytearray()
+        self.extras = {}
+        self.rows = weakref.WeakValueDictionary()  # rid -> Finding vivo
+
+    def __len__(self):
+        return len(self.line)
+
+    def _new_row(self) -> int:
+        rid = len(self.line)
+        for col in self.strs.values():
+            col.append(0)
+        self.line.append(_ABSENT)
+        self.hash += bytes(32)
+        self.has_hash.append(0)
+        return rid
+
+    def add(self, finding) -> int:
+        if isinstance(finding, Finding):
+            return self._copy_row(finding._cols, finding._rid)
+        rid = self._new_row()
+        for key, value in finding.items():
+            self.set(rid, key, value)
+        return rid
+
+    def _copy_row(self, src, rid_src) -> int:
+        rid = self._new_row()
+        for key, col in self.strs.items():
+            col[rid] = src.strs[key][rid_src]
+        self.line[rid] = src.line[rid_src]
+        self.hash[rid * 32:rid * 32 + 32] = src.hash[rid_src * 32:rid_src * 32 + 32]
+        self.has_hash[rid] = src.has_hash[rid_src]
+        extras = src.extras.get(rid_src)
+        if extras:
+            self.extras[rid] = dict(extras)
+        return rid
+
+    def discard(self, rid, key):
+        if key in self.strs:
+            self.strs[key][rid] = 0
+        elif key == 'line':
+            self.line[rid] = _ABSENT
+        elif key == 'finding_hash':
+            self.has_hash[rid] = 0
+        extras = self.extras.get(rid)
+        if extras and key in extras:
+            del extras[key]
+            if not extras:
+                del self.extras[rid]
+
+    def set(self, rid, key, value):
+        self.discard(rid, key)
+        if key in self.strs and isinstance(value, str):
+            self.strs[key][rid] = intern_id(value)
+        elif key == 'line' and (value is None or (type(value) is int and _NONE < value < (1 << 63))):
+            self.line[rid] = _NONE if value is None else value
+        elif key == 'finding_hash' and isinstance(value, str) and _HEX64.match(value):
+            self.hash[rid * 32:rid * 32 + 32] = bytes.fromhex(value)
+            self.has_hash[rid] = 1
+        else:
+            self.extras.setdefault(rid, {})[key] = value
+
+    def get(self, rid, key, default=None):
+        if key in self.strs:
+            sid = self.strs[key][rid]
+            if sid:
+                return _STRINGS[sid]
+        elif key == 'line':
+            value = self.line[rid]
+            if value != _ABSENT:
+                return None if value == _NONE else value
+        elif key == 'finding_hash' and self.has_hash[rid]:
+            return self.hash[rid * 32:rid * 32 + 32].hex()
+        return self.extras.get(rid, {}).get(key, default)
+
+    def materialize(self, rid) -> dict:
+        data = {}
+        for key, col in self.strs.items():
+            sid = col[rid]
+            if sid:
+                data[key] = _STRINGS[sid]
+        value = self.line[rid]
+        if value != _ABSENT:
+            data['line'] = None if value == _NONE else value
+        if self.has_hash[rid]:
+            data['finding_hash'] = self.hash[rid * 32:rid * 32 + 32].hex()
+        extras = self.extras.get(rid)
+        if extras:
+            data.update(extras)
+        return data
+
+    def row(self, rid) -> 'Finding':
+        row = self.rows.get(rid)
+        if row is None:
+            row = Finding(self, rid)
+            self.rows[rid] = row
+        return row
+
+
+class Finding(dict):
+    """Achado materializado sob demanda; toda escrita volta para as colunas."""
+    __slots__ = ('_cols', '_rid', '__weakref__')
+
+    def __init__(self, cols, rid):
+        super().__init__(cols.materialize(rid))
+        self._cols = cols
+        self._rid = rid
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._cols.set(self._rid, key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._cols.discard(self._rid, key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def pop(self, key, *default):
+        if key in self:
+            value = super().pop(key)
+            self._cols.discard(self._rid, key)
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._cols.discard(self._rid, key)
+        return key, value
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FindingStore(MutableSequence):
+    """Sequência de achados em colunas; fatias/filtros são visões baratas."""
+
+    def __init__(self, findings=None, _cols=None, _order=None):
+        self._cols = _cols if _cols is not None else _Columns()
+        self._order = _order if _order is not None else array('I')
+        if findings:
+            self.extend(findings)
+
+    @classmethod
+    def from_dicts(cls, findings) -> 'FindingStore':
+        return findings if isinstance(findings, cls) else cls(findings)
+
+    def _view(self, order) -> 'FindingStore':
+        return FindingStore(_cols=self._cols, _order=order)
+
+    # --- Protocolo de sequência -------------------------------------------
+    def __len__(self):
+        return len(self._order)
+
+    def __iter__(self):
+        row = self._cols.row
+        for rid in self._order:
+            yield row(rid)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view(self._order[index])
+        return self._cols.row(self._order[index])
+
+    def __setitem__(self, index, finding):
+        if isinstance(index, slice):
+            self._order[index] = array('I', (self._cols.add(f) for f in finding))
+        else:
+            self._order[index] = self._cols.add(finding)
+
+    def __delitem__(self, index):
+        del self._order[index]
+
+    def __contains__(self, finding):
+        if isinstance(finding, Finding) and finding._cols is self._cols:
+            return finding._rid in self._order
+        return any(row == finding for row in self)
+
+    def insert(self, index, finding):
+        self._order.insert(index, self._cols.add(finding))
+
+    def append(self, finding):
+        self._order.append(self._cols.add(finding))
+
+    def extend(self, findings):
+        for finding in findings:
+            self.append(finding)
+
+    def remove(self, finding):
+        if isinstance(finding, Finding) and finding._cols is self._cols:
+            try:
+                del self._order[self._order.index(finding._rid)]
+                return
+            except ValueError:
+                pass
+        for pos, row in enumerate(self):
+            if row == finding:
+                del self._order[pos]
+                return
+        raise ValueError('achado não está no store')
+
+    def clear(self):
+        self._order = array('I')
+
+    def __repr__(self):
+        return f'<FindingStore {len(self)} achados>'
+
+    # --- Consultas colunares ----------------------------------------------
+    def values(self, key):
+        """Valores de uma coluna na ordem do store (sem materializar achados)."""
+        cols = self._cols
+        if key in cols.strs:
+            col = cols.strs[key]
+            return [_STRINGS[col[rid]] if col[rid] else None for rid in self._order]
+        return [cols.get(rid, key) for rid in self._order]
+
+    def filter(self, predicate=None, **where) -> 'FindingStore':
+        """Visão dos achados que casam com where (igualdade; tuplas/sets = 'in') e predicate."""
+        cols = self._cols
+        order = self._order
+        for key, wanted in where.items():
+            wanted = set(wanted) if isinstance(wanted, (list, tuple, set, frozenset)) else {wanted}
+            if key in cols.strs:
+                col = cols.strs[key]
+                ids = {_IDS[w] for w in wanted if isinstance(w, str) and w in _IDS}
+                order = array('I', (rid for rid in order if col[rid] in ids))
+            else:
+                order = array('I', (rid for rid in order if cols.get(rid, key) in wanted))
+        if predicate is not None:
+            order = array('I', (rid for rid in order if predicate(cols.row(rid))))
+        return self._view(order)
+
+    def group_by(self, key) -> dict:
+        """{valor: visão}, na ordem da primeira ocorrência."""
+        groups = {}
+        for value, rid in zip(self.values(key), self._order):
+            groups.setdefault(value, array('I')).append(rid)
+        return {value: self._view(order) for value, order in groups.items()}
+
+    def counts(self, key) -> Counter:
+        return Counter(self.values(key))
+
+    def summary(self) -> dict:
+        """Mesmo sumário do CheckState (severidade ausente conta como WARNING)."""
+        summary = {'errors': 0, 'warnings': 0, 'critical': 0}
+        for sev, n in self.counts('severity').items():
+            sev = (sev or 'WARNING').upper()
+            if sev == 'CRITICAL':
+                summary['critical'] += n
+            elif sev == 'ERROR':
+                summary['errors'] += n
+            else:
+                summary['warnings'] += n
+        return summary
+
+    def stats(self) -> dict:
+        return {'findings': len(self), 'rows': len(self._cols), 'interned': interned_count(),
+                'materialized': len(self._cols.rows)}
+
+    # --- Serialização -----------------------------------------------------
+    def iter_dicts(self):
+        """Dicts simples direto das colunas (não cria Finding)."""
+        materialize = self._cols.materialize
+        for rid in self._order:
+            yield materialize(rid)
+
+    def to_dicts(self) -> list:
+        return list(self.iter_dicts())
+
+    def to_json(self, summary=None, **json_kwargs) -> str:
+        payload = {'summary': summary if summary is not None else self.summary(), 'findings': self.to_dicts()}
+        return json.dumps(payload, **json_kwargs)
+
+    def to_sarif(self, root=None, tool_name='doxoade') -> dict:
+        """Log SARIF 2.1.0: uma regra por categoria, fingerprint = finding_hash."""
+        cols = self._cols
+        rules, results = {}, []
+        for rid in self._order:
+            rule = cols.get(rid, 'category') or 'UNCATEGORIZED'
+            rules.setdefault(rule, {'id': rule})
+            severity = (cols.get(rid, 'severity') or '').upper()
+            result = {'ruleId': rule, 'level': SARIF_LEVELS.get(severity, 'note'),
+                      'message': {'text': cols.get(rid, 'message') or ''}}
+            file_path = cols.get(rid, 'file')
+            if file_path:
+                uri = file_path
+                if root and os.path.isabs(file_path):
+                    try:
+                        uri = os.path.relpath(file_path, root)
+                    except ValueError:
+                        pass
+                location = {'artifactLocation': {'uri': uri.replace('\\', '/')}}
+                line = cols.get(rid, 'line')
+                if isinstance(line, int) and line > 0:
+                    location['region'] = {'startLine': line}
+                result['locations'] = [{'physicalLocation': location}]
+            f_hash = cols.get(rid, 'finding_hash')
+            if f_hash:
+                result['partialFingerprints'] = {'doxoadeFindingHash/v1': f_hash}
+            results.append(result)
+        driver = {'name': tool_name, 'informationUri': 'https://github.com/olDox0/Doxoade', 'rules': list(rules.values())}
+        return {'$schema': SARIF_SCHEMA, 'version': '2.1.0', 'runs': [{'tool': {'driver': driver}, 'results': results}]}
+
+
+def json_default(obj):
+    """default= para json.dump: stores viram listas de dicts direto das colunas."""
+    if isinstance(obj, FindingStore):
+        return obj.to_dicts()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
@@ -2,8 +2,13 @@
 # doxoade/tools/metalcraft/metal_engine.py
 """
 Nexus Metalcraft Engine v45.0 — Sotéria Integrated Build System.
+- Build por unidade de tradução: cada .c vira um objeto em
+  .doxoade/metalcraft/obj/<alvo>/, compilado em paralelo.
+- Dependências de headers vêm dos depfiles do compilador (-MMD -MF).
+- Relink só quando algum objeto mudou (ou o binário sumiu).
 """
 import os, subprocess, toml, hashlib, json, re, shutil, time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from glob import glob
 from doxoade.tools.vulcan.diagnostic.soteria.scribe import SoteriaScribe
@@ -11,6 +16,40 @@ from doxoade.tools.doxcolors import Fore, Style
 from doxoade.tools.telemetry_tools.logger import chief_heartbeat
 from .metal_toolchain import NexusToolchain
 
+# Flags que só fazem sentido na etapa de link.
+LINK_ONLY_FLAGS = ('-l', '-L', '-Wl,', '-shared', '-static')
+SHARED_TYPES = ['shared_lib', 'shared', 'library', 'dll', 'so']
+
+
+def parse_depfile(text):
+    """Dependências declaradas num depfile Make (-MMD), sem o alvo."""
+    text = text.replace('\\\r\n', ' ').replace('\\\n', ' ')
+    # O alvo termina no primeiro ':' seguido de espaço (o ':' de 'C:/' não conta).
+    match = re.search(r':(?:\s|$)', text)
+    if not match:
+        return []
+    return [tok.replace('\\ ', ' ').replace('$$', '$')
+            for tok in re.findall(r'(?:\\ |\S)+', text[match.end():])]
+
+
+def _file_sig(path, previous=None):
+    """[mtime_ns, size, sha256]; o hash só é refeito quando o stat mudou."""
+    st = os.stat(path)
+    if previous and previous[0] == st.st_mtime_ns and previous[1] == st.st_size:
+        return previous
+    return [st.st_mtime_ns, st.st_size, hashlib.sha256(Path(path).read_bytes()).hexdigest()]
+
+
+def _sig_changed(path, previous):
+    try:
+        return _file_sig(path, previous)[2] != previous[2]
+    except (OSError, TypeError, IndexError):
+        return True
+
+
+def _q(path):
+    return f'"{str(path).replace(chr(92), "/")}"'
+
 
 class NexusMetalEngine:
 
@@ -46,37 +85,90 @@ class NexusMetalEngine:
     # ─────────────────────────────────────────────────────────────
     # CACHE / STALENESS
     # ─────────────────────────────────────────────────────────────
-    def _get_bundle_hash(self, sources):
-        hasher = hashlib.sha256()
-        for src in sorted(sources):
-            if src.exists():
-                hasher.update(src.read_bytes())
-        return hasher.hexdigest()
-
-    def _is_stale(self, target_name, sources, output_path):
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _update_cache(self, target_name, entry):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache = self._load_cache()
+        cache[target_name] = entry
+        tmp = self.cache_path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, self.cache_path)
+
+    def _target_signature(self, t_cfg, use_soteria):
+        """Hash da configuração que afeta os comandos de um alvo."""
+        payload = [t_cfg, self.config.get('compiler', {}),
+                   self.config.get('project', {}).get('type'), bool(use_soteria)]
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _unit_is_fresh(self, src, unit, cmd_hash=None):
+        """Objeto válido: fonte, headers (depfile) e comando inalterados."""
+        if not isinstance(unit, dict) or not Path(unit.get('obj', '')).exists():
+            return False
+        if cmd_hash is not None and unit.get('cmd') != cmd_hash:
+            return False
+        if _sig_changed(src, unit.get('sig')):
+            return False
+        return not any(_sig_changed(dep, sig) for dep, sig in unit.get('deps', {}).items())
+
+    def _is_stale(self, target_name, sources, output_path, signature=None):
         if not output_path.exists():
             return True
-        cache = {}
-        if self.cache_path.exists():
-            try:
-                with open(self.cache_path, 'r') as f:
-                    cache = json.load(f)
-            except Exception:
-                return True
-        return cache.get(target_name) != self._get_bundle_hash(sources)
+        entry = self._load_cache().get(target_name)
+        if not isinstance(entry, dict):
+            return True  # Ausente ou no formato antigo (hash único do pacote).
+        if entry.get('sources') != sorted(str(s) for s in sources):
+            return True
+        if signature is not None and entry.get('signature') != signature:
+            return True
+        units = entry.get('units') or {}
+        return not units or any(not self._unit_is_fresh(src, unit) for src, unit in units.items())
 
-    def _update_cache(self, target_name, sources):
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache = {}
-        if self.cache_path.exists():
+    def _final_output(self, t_name, out_file, is_shared):
+        if is_shared:
+            ext = '.dll' if os.name == 'nt' else '.so'
+        else:
+            ext = '.exe' if os.name == 'nt' else ''
+        return out_file.parent / f'{t_name}{ext}'
+
+    # ─────────────────────────────────────────────────────────────
+    # UNIDADES DE TRADUÇÃO
+    # ─────────────────────────────────────────────────────────────
+    def _compile_unit(self, job):
+        """Compila uma unidade; devolve (job, returncode, stderr, ms)."""
+        t0 = time.perf_counter()
+        res = subprocess.run(job['cmd'], capture_output=True, text=True, shell=True)
+        return job, res.returncode, res.stderr, (time.perf_counter() - t0) * 1000
+
+    def _unit_record(self, job, elapsed_ms):
+        deps = {}
+        try:
+            text = Path(job['dep']).read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            text = ''
+        compiled = os.path.normcase(os.path.abspath(job['compiled']))
+        for dep in parse_depfile(text):
+            full = os.path.abspath(dep)  # Relativos ao cwd do compilador.
+            if os.path.normcase(full) == compiled:
+                continue
             try:
-                with open(self.cache_path, 'r') as f:
-                    cache = json.load(f)
-            except Exception:
-                pass
-        cache[target_name] = self._get_bundle_hash(sources)
-        with open(self.cache_path, 'w') as f:
-            json.dump(cache, f, indent=2)
+                deps[full] = _file_sig(full)
+            except OSError:
+                continue
+        return {'sig': _file_sig(job['src']), 'cmd': job['cmd_hash'], 'obj': str(job['obj']),
+                'deps': deps, 'ms': round(elapsed_ms)}
+
+    def _compile_units(self, jobs):
+        """Compila em paralelo (o trabalho real é do compilador, threads bastam)."""
+        workers = max(1, min(len(jobs), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._compile_unit, jobs))
 
     # ─────────────────────────────────────────────────────────────
     # AUDITORIA ESTÁTICA (SSA)
@@ -279,12 +371,16 @@ class NexusMetalEngine:
                     global_success = False
                     continue
 
-            # d) Staleness Check
-            if not force and not self._is_stale(t_name, final_sources, out_file):
+            # d) Staleness Check (por unidade de tradução)
+            project_type = self.config.get('project', {}).get('type', 'executable').lower()
+            is_shared = project_type in SHARED_TYPES
+            final_out = self._final_output(t_name, out_file, is_shared)
+            signature = self._target_signature(t_cfg, target_use_soteria)
+            if not force and not self._is_stale(t_name, final_sources, final_out, signature):
                 print(f"      {Fore.GREEN}✔ Alvo sincronizado (Cache Hit).{self.RST}")
                 continue
 
-            # e) Vacinação (Scribe)
+            # e) Vacinação (Scribe) — a sombra só é regravada se o conteúdo mudou
             if target_use_soteria:
                 shadow_dir = self.root / ".doxoade" / "metalcraft" / "shadow" / t_name
                 shadow_dir.mkdir(parents=True, exist_ok=True)
@@ -294,7 +390,8 @@ class NexusMetalEngine:
                     dest = shadow_dir / src.name
                     content = src.read_text(encoding='utf-8', errors='ignore')
                     vacinado = self.scribe.instrument_code(content, src.name)
-                    dest.write_text(vacinado, encoding='utf-8')
+                    if not dest.exists() or dest.read_text(encoding='utf-8', errors='ignore') != vacinado:
+                        dest.write_text(vacinado, encoding='utf-8')
                     vacinados.append(dest)
             else:
                 print(f"      {Fore.YELLOW}⚡ [BYPASS] Sotéria desativada.{self.RST}")
@@ -304,10 +401,6 @@ class NexusMetalEngine:
             opt = t_cfg.get('opt', self.config.get('compiler', {}).get('opt', 'O2'))
             flags = t_cfg.get('flags', [])
             
-            # 🔥 LEITURA DO TIPO DE SAÍDA (shared_lib vs executable)
-            project_type = self.config.get('project', {}).get('type', 'executable').lower()
-            is_shared = project_type in ['shared_lib', 'shared', 'library', 'dll', 'so']
-            
             # 🔥 LEITURA DOS CFLAGS CUSTOMIZADOS
             custom_cflags = self.config.get('compiler', {}).get('cflags', [])
             if isinstance(custom_cflags, str):
@@ -360,32 +453,21 @@ class NexusMetalEngine:
             soteria_srcs = []
             soteria_inc_flag = []
             if target_use_soteria:
-                soteria_srcs = [
-                    f'"{str(f).replace(chr(92), "/")}"'
-                    for f in self.scribe.soteria_src.glob("*.c")
-                ]
+                soteria_srcs = sorted(self.scribe.soteria_src.glob("*.c"))
                 soteria_inc_flag = [
                     f'-I"{str(self.scribe.soteria_inc).replace(chr(92), "/")}"'
                 ]
                 print(f"      {Fore.CYAN}🛡️ Sotéria integrada — {len(soteria_srcs)} fontes{self.RST}")
 
-            # 🔥 MONTAGEM DO COMANDO AGORA RESPEITA O TOML
-            cmd = [
-                f'"{self.toolchain.compiler_path}"',
-            ]
-            
-            # 🔥 INJEÇÃO DO -shared (se for shared_lib OU se o usuário colocou no cflags)
-            if is_shared or '-shared' in custom_cflags:
-                cmd.append('-shared')
-                custom_cflags = [f for f in custom_cflags if f != '-shared']
-            
-            cmd.append(f'-{opt}')
-            cmd.append('-g')
-            
-            # 🔥 INJEÇÃO DOS CFLAGS CUSTOMIZADOS
-            cmd.extend(custom_cflags)
-            
-            cmd += python_inc_flag + soteria_inc_flag + inc_flags + [
+            compiler = f'"{self.toolchain.compiler_path}"'
+            link_shared = is_shared or '-shared' in custom_cflags or '-shared' in flags
+            custom_cflags = [f for f in custom_cflags if f != '-shared']
+
+            # 🔥 FLAGS DE COMPILAÇÃO (uma invocação -c por unidade)
+            compile_flags = [f'-{opt}', '-g'] + custom_cflags
+            if link_shared and os.name != 'nt':
+                compile_flags.append('-fPIC')
+            compile_flags += python_inc_flag + soteria_inc_flag + inc_flags + [
                 f'-I"{str(self.root / "include").replace(chr(92), "/")}"'
             ]
 
@@ -393,44 +475,98 @@ class NexusMetalEngine:
             if target_use_soteria:
                 soteria_h = self.scribe.soteria_inc / "soteria.h"
                 if soteria_h.exists():
-                    cmd.append(f'-include "{str(soteria_h).replace(chr(92), "/")}"')
+                    compile_flags.append(f'-include "{str(soteria_h).replace(chr(92), "/")}"')
+            compile_flags += [f for f in flags if not f.startswith(LINK_ONLY_FLAGS)]
+
+            obj_dir = self.root / ".doxoade" / "metalcraft" / "obj" / t_name
+            obj_dir.mkdir(parents=True, exist_ok=True)
+            entry = self._load_cache().get(t_name)
+            old_units = entry.get('units', {}) if isinstance(entry, dict) else {}
+
+            jobs, units = [], {}
+            for src, compiled in list(zip(final_sources, vacinados)) + [(f, f) for f in soteria_srcs]:
+                tag = hashlib.sha1(str(src).encode()).hexdigest()[:8]
+                obj = obj_dir / f"{src.stem}-{tag}.o"
+                dep = obj.with_suffix('.d')
+                cmd = " ".join([compiler] + compile_flags + [
+                    '-c', _q(compiled), '-o', _q(obj), '-MMD', '-MF', _q(dep)])
+                cmd_hash = hashlib.sha256(cmd.encode()).hexdigest()
+                job = {'src': str(src), 'compiled': str(compiled), 'obj': obj,
+                       'dep': dep, 'cmd': cmd, 'cmd_hash': cmd_hash}
+                old = old_units.get(str(src))
+                if not force and self._unit_is_fresh(str(src), old, cmd_hash):
+                    units[str(src)] = old
+                jobs.append(job)
+
+            chief_heartbeat("METAL", "LINKER_CHECK", {
+                "target": t_name, "opt": opt, "soteria": target_use_soteria,
+                "shared": is_shared, "units": len(jobs),
+                "stale_units": len(jobs) - len(units)
+            })
+
+            # f) Compilação paralela das unidades alteradas
+            stale_jobs = [j for j in jobs if j['src'] not in units]
+            failed = False
+            if stale_jobs:
+                print(f"      ⚙️  Compilando {len(stale_jobs)}/{len(jobs)} unidades...")
+            timings = {}
+            for job, code, stderr, ms in self._compile_units(stale_jobs) if stale_jobs else []:
+                name = Path(job['compiled']).name
+                timings[name] = round(ms)
+                if code == 0:
+                    units[job['src']] = self._unit_record(job, ms)
+                    print(f"         {Fore.GREEN}✔{self.RST} {name} {Style.DIM}({ms:.0f} ms){self.RST}")
+                else:
+                    failed = True
+                    print(f"         {Fore.RED}✘ {name} ({ms:.0f} ms):\n{stderr}{self.RST}")
+            if timings:
+                chief_heartbeat("METAL", "UNIT_TIMES", {"target": t_name, "ms": timings})
+
+            if failed:
+                # Unidades bem-sucedidas ficam no cache: a próxima fundição só refaz as falhas.
+                self._update_cache(t_name, {'sources': None, 'signature': signature, 'units': units})
+                print(f"      {Fore.RED}❌ Falha na Metalurgia.{self.RST}")
+                global_success = False
+                continue
 
-            cmd += [f'"{str(v).replace(chr(92), "/")}"' for v in vacinados]
-            cmd += soteria_srcs
+            # g) Link — só quando algum objeto mudou
+            cmd = [compiler]
+            if link_shared:
+                cmd.append('-shared')
+            cmd.append(f'-{opt}')
+            cmd.append('-g')
+            cmd.extend(custom_cflags)
+            cmd += [_q(j['obj']) for j in jobs]
             cmd += flags
-            
-            # 🔥 DEFINIÇÃO DO ARQUIVO DE SAÍDA (extensão correta)
-            if is_shared:
-                ext = '.dll' if os.name == 'nt' else '.so'
-                final_out = out_file.parent / f'{t_name}{ext}'
-            else:
-                ext = '.exe' if os.name == 'nt' else ''
-                final_out = out_file.parent / f'{t_name}{ext}'
-            
             cmd += [
                 f'-o "{str(final_out).replace(chr(92), "/")}"',
-            ] + python_lib_flags + [
-                "-ldbghelp", "-lpsapi", "-lkernel32"
-            ]
-            
+            ] + python_lib_flags
+            if os.name == 'nt':
+                cmd += ["-ldbghelp", "-lpsapi", "-lkernel32"]
+            link_cmd = " ".join(cmd)
+            final_out.parent.mkdir(parents=True, exist_ok=True)
+            link_hash = hashlib.sha256(link_cmd.encode()).hexdigest()
+
             # Atualiza a referência do out_file para o nome correto
             out_file = final_out
+            new_entry = {'sources': sorted(str(s) for s in final_sources), 'signature': signature,
+                         'units': units, 'link': link_hash}
 
-            chief_heartbeat("METAL", "LINKER_CHECK", {
-                "target": t_name, "opt": opt, "soteria": target_use_soteria,
-                "shared": is_shared
-            })
-
+            if (not force and not stale_jobs and out_file.exists()
+                    and isinstance(entry, dict) and entry.get('link') == link_hash):
+                print(f"      {Fore.GREEN}✔ Nenhum objeto alterado — link preservado.{self.RST}")
+                self._update_cache(t_name, new_entry)
+                continue
 
-            res = subprocess.run(" ".join(cmd), capture_output=True,
+            res = subprocess.run(link_cmd, capture_output=True,
                                  text=True, shell=True)
 
             if res.returncode == 0:
                 print(f"      {Fore.GREEN}✅ {t_name} gerado com sucesso.{self.RST}")
-                # g) Validação pós-build do DNA Sotéria
+                # h) Validação pós-build do DNA Sotéria
                 if target_use_soteria:
                     self._validate_soteria_dna(out_file)
-                self._update_cache(t_name, final_sources)
+                self._update_cache(t_name, new_entry)
             else:
                 print(f"      {Fore.RED}❌ Falha na Metalurgia:\n{res.stderr}{self.RST}")
                 global_success = False
@@ -574,7 +710,12 @@ class NexusMetalEngine:
                 })
                 continue
 
-            if not self._is_stale(t_name, final_sources, out_file):
+            is_shared = self.config.get('project', {}).get('type', 'executable').lower() in SHARED_TYPES
+            final_out = self._final_output(t_name, out_file, is_shared)
+            # Mesmo valor resolvido para a assinatura e para o build (build() relê t_cfg['soteria'] com este padrão).
+            target_soteria = t_cfg.get('soteria', True)
+            signature = self._target_signature(t_cfg, target_soteria)
+            if not self._is_stale(t_name, final_sources, final_out, signature):
                 stats['skipped'] += 1
                 stats['details'].append({
                     'name': t_name, 'status': 'skipped',
@@ -589,7 +730,6 @@ class NexusMetalEngine:
                 print(f"   {Fore.CYAN}🔨{self.RST} {t_name}: building...")
 
             t_start = time.perf_counter()
-            target_soteria = t_cfg.get('soteria', True)
 
             try:
                 success = self.build(
@@ -8,12 +8,91 @@ Uso:
     from doxoade.tools.recursion_guard import RecursionGuard
     guard = RecursionGuard()
     findings = guard.analyze_file('path/to/script.py')
+    findings = guard.analyze_project(files, root)   # ciclos entre módulos
+
+Ciclos (recursão indireta) são componentes fortemente conexos (Tarjan iterativo)
+do grafo de chamadas: cada componente é reportado uma única vez, sem limite de
+profundidade de pilha.
 """
 import ast
 import os
+from collections import deque
 from typing import List, Dict, Any, Set, Tuple
 from pathlib import Path
 
+def strongly_connected_components(adj: List[List[int]]) -> List[List[int]]:
+    """Tarjan iterativo sobre listas de adjacência por índice; O(V + E)."""
+    n = len(adj)
+    index, low = [-1] * n, [0] * n
+    on_stack = [False] * n
+    stack, sccs, counter = [], [], 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(adj[root]))]
+        while work:
+            v, it = work[-1]
+            for w in it:
+                if index[w] < 0:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, iter(adj[w])))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work and low[v] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[v]
+                if low[v] == index[v]:
+                    comp = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        comp.append(w)
+                        if w == v:
+                            break
+                    sccs.append(comp)
+    return sccs
+
+def cycle_path(adj: List[List[int]], members: Set[int], start: int) -> List[int]:
+    """Menor ciclo que sai e volta a 'start' sem deixar o componente (BFS)."""
+    parent = {start: None}
+    queue = deque([start])
+    while queue:
+        v = queue.popleft()
+        for w in adj[v]:
+            if w == start:
+                path = []
+                while v is not None:
+                    path.append(v)
+                    v = parent[v]
+                return path[::-1] + [start]
+            if w in members and w not in parent:
+                parent[w] = v
+                queue.append(w)
+    return [start]
+
+def recursive_components(adj: List[List[int]]) -> List[Tuple[List[int], List[int]]]:
+    """[(membros, pontos de entrada)] dos componentes com 2+ funções; entrada = membro chamado de fora."""
+    comps = [c for c in strongly_connected_components(adj) if len(c) > 1]
+    owner = {}
+    for i, comp in enumerate(comps):
+        for v in comp:
+            owner[v] = i
+    entries = [set() for _ in comps]
+    for u, targets in enumerate(adj):
+        for w in targets:
+            if w in owner and owner.get(u) != owner[w]:
+                entries[owner[w]].add(w)
+    return [(comp, sorted(entries[i])) for i, comp in enumerate(comps)]
+
 class RecursionGuard:
     """Motor de Análise Estática de Recursividade."""
     
@@ -54,6 +133,136 @@ class RecursionGuard:
                 
         return self.findings
 
+    def analyze_project(self, files: List[str], root: str = None, table=None) -> List[Dict[str, Any]]:
+        """
+        Ciclos de recursão indireta no projeto inteiro, inclusive entre módulos.
+        Usa a tabela de símbolos persistida (só arquivos alterados são reanalisados)
+        e reporta cada componente recursivo uma vez, com seus pontos de entrada.
+        """
+        from doxoade.probes.symbol_table import SymbolTable, canonical, find_root
+        files = [f for f in files if f.endswith('.py')]
+        root = root or find_root(files)
+        if not root:
+            return []
+        table = table or SymbolTable(root)
+        index = table.refresh(files)
+        table.save()
+        graph = ProjectCallGraph(index, canonical(root))
+        self.findings = []
+        for members, entries in recursive_components(graph.adj):
+            start = entries[0] if entries else min(members)
+            path = cycle_path(graph.adj, set(members), start)
+            file_key, qual = graph.nodes[start]
+            entry = index[file_key]
+            modules = {graph.nodes[v][0] for v in members}
+            entry_names = ', '.join(graph.label(v) for v in entries) or 'nenhuma (sem chamadas de fora do ciclo)'
+            self.findings.append({
+                'file': entry.get('path', file_key),
+                'line': entry['callgraph'][qual]['line'],
+                'category': 'RECURSION-RISK',
+                'severity': 'WARNING',
+                'message': f"Recursão indireta detectada (Ciclo de {len(members)} funções): {' -> '.join(graph.label(v) for v in path)}. Entradas: {entry_names}. Verifique se há caso base.",
+                'meta': {'type': 'indirect_cycle', 'cycle': [graph.label(v) for v in path], 'members': sorted(graph.label(v) for v in members),
+                         'entry_points': [graph.label(v) for v in entries], 'cross_module': len(modules) > 1}
+            })
+        self.findings.sort(key=lambda f: (f['file'], f['line']))
+        return self.findings
+
+class ProjectCallGraph:
+    """
+    Grafo de chamadas do projeto com imports resolvidos.
+    Nós são (arquivo canônico, nome qualificado); arestas seguem f(), self.m(),
+    Classe(), modulo.f() e nomes importados (inclusive reexportados por __init__).
+    """
+
+    def __init__(self, index: Dict[str, Dict], project_root: str):
+        self.index = index
+        self.root = project_root
+        self.nodes, self.ids = [], {}
+        self._modules, self._names = {}, {}
+        for file_key, entry in index.items():
+            for qual in entry.get('callgraph', {}):
+                self.ids[(file_key, qual)] = len(self.nodes)
+                self.nodes.append((file_key, qual))
+        self.adj = [[] for _ in self.nodes]
+        for v, (file_key, qual) in enumerate(self.nodes):
+            funcs = index[file_key]['callgraph']
+            cls = self._enclosing_class(funcs, qual)
+            targets = set()
+            for base, name, _ in funcs[qual]['calls']:
+                target = self._resolve_call(file_key, qual, cls, base, name)
+                if target is not None:
+                    targets.add(target)
+            self.adj[v] = sorted(targets)
+
+    def label(self, v: int) -> str:
+        file_key, qual = self.nodes[v]
+        module = self._names.get(file_key)
+        if module is None:
+            rel = os.path.relpath(file_key, self.root).replace('\\', '/')
+            module = self._names[file_key] = rel[:-3].replace('/', '.') if rel.endswith('.py') else rel
+        return f'{module}.{qual}'
+
+    @staticmethod
+    def _enclosing_class(funcs, qual):
+        parts = qual.split('.')
+        for i in range(len(parts) - 1, 0, -1):
+            prefix = '.'.join(parts[:i])
+            if prefix not in funcs:
+                return prefix
+        return None
+
+    def _module(self, file_key, module, level):
+        key = (file_key, module, level)
+        if key not in self._modules:
+            from doxoade.probes.xref_probe import resolve_module_path
+            self._modules[key] = resolve_module_path(file_key, module, level, self.root, self.index)
+        return self._modules[key]
+
+    def _lookup(self, file_key, name, hops=0):
+        """Função ou construtor 'name' definido (ou reexportado) no topo do módulo."""
+        funcs = self.index[file_key].get('callgraph', {})
+        for qual in (name, f'{name}.__init__'):
+            if qual in funcs:
+                return self.ids[(file_key, qual)]
+        binding = self.index[file_key].get('bindings', {}).get(name)
+        if binding and binding[2] and hops < 4:
+            target = self._module(file_key, binding[0], binding[1])
+            if target and target != file_key:
+                return self._lookup(target, binding[2], hops + 1)
+        return None
+
+    def _resolve_call(self, file_key, qual, cls, base, name):
+        funcs = self.index[file_key]['callgraph']
+        if base == 'self':
+            return self.ids.get((file_key, f'{cls}.{name}')) if f'{cls}.{name}' in funcs else None
+        if base == '':
+            scope = qual
+            while scope:
+                if scope in funcs:
+                    for candidate in (f'{scope}.{name}', f'{scope}.{name}.__init__'):
+                        if candidate in funcs:
+                            return self.ids[(file_key, candidate)]
+                scope = scope.rpartition('.')[0]
+            return self._lookup(file_key, name)
+        if f'{base}.{name}' in funcs and base not in funcs:
+            return self.ids[(file_key, f'{base}.{name}')]
+        binding = self.index[file_key].get('bindings', {}).get(base)
+        if not binding:
+            return None
+        module, level, imported = binding
+        if not imported:
+            target = self._module(file_key, module, level)
+            return self._lookup(target, name) if target else None
+        target = self._module(file_key, f'{module}.{imported}' if module else imported, level)
+        if target:
+            return self._lookup(target, name)
+        # 'from mod import Classe' seguido de Classe.metodo()
+        target = self._module(file_key, module, level)
+        if target and f'{imported}.{name}' in self.index[target].get('callgraph', {}):
+            return self.ids[(target, f'{imported}.{name}')]
+        return None
+
 class _RecursionVisitor(ast.NodeVisitor):
     def __init__(self, filename: str, findings: list):
         self.filename = filename
@@ -172,28 +381,12 @@ class _RecursionVisitor(ast.NodeVisitor):
         return False
 
     def find_cycles(self) -> List[List[str]]:
-        """Algoritmo DFS para encontrar ciclos no grafo de chamadas (Recursão Indireta)."""
-        visited = set()
-        rec_stack = set()
+        """Um ciclo representativo por componente fortemente conexo (Recursão Indireta)."""
+        names = list(self.call_graph)
+        ids = {name: i for i, name in enumerate(names)}
+        adj = [sorted({ids[c] for c in self.call_graph[name] if c in ids}) for name in names]
         cycles = []
-        
-        def dfs(node, path):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-            
-            for neighbor in self.call_graph.get(node, set()):
-                if neighbor not in visited:
-                    dfs(neighbor, path)
-                elif neighbor in rec_stack:
-                    cycle_start = path.index(neighbor)
-                    cycles.append(path[cycle_start:] + [neighbor])
-            
-            path.pop()
-            rec_stack.remove(node)
-            
-        for func in self.call_graph:
-            if func not in visited:
-                dfs(func, [])
-                
-        return cycles
\ No newline at end of file
+        for members, entries in recursive_components(adj):
+            start = entries[0] if entries else min(members)
+            cycles.append([names[i] for i in cycle_path(adj, set(members), start)])
+        return cycles
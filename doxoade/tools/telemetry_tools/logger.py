@@ -40,7 +40,7 @@ def _patched_json_dumps(obj, *args, **kwargs):
 json.dumps = _patched_json_dumps
 
 def chief_heartbeat(subsystem: str, action: str, details: dict):
-    """Registra batimentos cardíacos com vazão otimizada via Alexandria Async Engine."""
+    """Registra batimentos cardíacos com vazão otimizada via Hades Ledger (log segmentado)."""
     try:
         now_time = time.monotonic()
         subsystem_upper = subsystem.upper()
@@ -77,21 +77,17 @@ def chief_heartbeat(subsystem: str, action: str, details: dict):
             
             _HEARTBEAT_CACHE[cache_key] = (now_time, current_hash)
 
-        # 4. Delegação Assíncrona Total (Zero I/O Locking)
-        from doxoade.tools.alexandria.engine import alexandria_write
-        
-        alexandria_write(
-            'INSERT INTO operational_logs (timestamp, subsystem, action, data, pid) VALUES (?, ?, ?, ?, ?)',
-            (datetime.now().isoformat(), subsystem_upper, action_upper,
-             json.dumps(details, ensure_ascii=False, cls=ASTEncoder),  # ✅ Adicione cls=ASTEncoder
-             os.getpid())
-        )
-
-        # 5. Manutenção Programada Silenciosa
-        if os.getpid() % 100 == 0:
-            alexandria_write(
-                'DELETE FROM operational_logs WHERE id NOT IN (SELECT id FROM operational_logs ORDER BY id DESC LIMIT 2000)'
-            )
+        # 4. Ingestão append-only (Hades Ledger): sem SQLite no caminho quente.
+        #    Retenção e rollups acontecem na compactação (segment_log.compact_segments).
+        from doxoade.tools.telemetry_tools.segment_log import append_row
+
+        append_row('operational_logs', {
+            'timestamp': datetime.now().isoformat(),
+            'subsystem': subsystem_upper,
+            'action': action_upper,
+            'data': json.dumps(details, ensure_ascii=False, cls=ASTEncoder),
+            'pid': os.getpid(),
+        })
 
     except Exception as e:
         if os.environ.get('VULCAN_VERBOSE') == '1':
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# doxoade/tools/telemetry_tools/segment_log.py
+"""
+Hades Ledger - Ingestão de telemetria em log segmentado (append-only).
+
+Caminho quente: cada processo anexa registros com prefixo de tamanho
+(uint32 LE + JSON) ao seu próprio segmento em GLOBAL_DATA_DIR/telemetry_segments.
+Nenhum SQLite no caminho quente, nenhuma thread de escrita.
+
+Caminho frio: compact_segments() dobra os segmentos selados no SQLite em
+uma única transação (o gatilho de command_history mantém command_rollup_daily)
+e aplica a retenção por tempo em operational_logs.
+"""
+import os
+import json
+import time
+import atexit
+import base64
+import struct
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from doxoade.tools.core_locator import GLOBAL_DATA_DIR
+
+SEGMENT_DIR = GLOBAL_DATA_DIR / 'telemetry_segments'
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+FLUSH_EVERY = 64
+AUTO_COMPACT_BACKLOG = 32
+DEFAULT_RETENTION_DAYS = 14
+STALE_CLAIM_SECONDS = 600
+# Somente tabelas de telemetria passam pelo ledger; o resto continua no Alexandria.
+LEDGER_COLUMNS = {
+    'operational_logs': {'timestamp', 'subsystem', 'action', 'data', 'pid'},
+    'events': {'timestamp', 'doxoade_version', 'command', 'project_path', 'execution_time_ms', 'status'},
+    'command_history': {'session_uuid', 'timestamp', 'command_name', 'full_command_line', 'working_dir', 'exit_code', 'duration_ms',
+                        'cpu_percent', 'peak_memory_mb', 'io_read_mb', 'io_write_mb', 'line_profile_data', 'system_info', 'compressed_payload'},
+}
+_HEADER = struct.Struct('<I')
+
+def _encode_value(v):
+    if isinstance(v, (bytes, bytearray, memoryview)):
+        return {'__b64__': base64.b64encode(bytes(v)).decode('ascii')}
+    return v
+
+def _decode_value(v):
+    if isinstance(v, dict) and '__b64__' in v:
+        return base64.b64decode(v['__b64__'])
+    return v
+
+class SegmentWriter:
+    """Escritor por processo: um segmento '.open' ativo, selado como '.seg' ao rotacionar."""
+
+    def __init__(self, directory=SEGMENT_DIR, max_bytes=SEGMENT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._fh = None
+        self._path = None
+        self._size = 0
+        self._pending = 0
+
+    def _open_segment(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._path = self.directory / f'seg-{os.getpid()}-{time.time_ns()}.open'
+        self._fh = open(self._path, 'ab')
+        self._size = 0
+
+    def append_row(self, table, row: dict):
+        """Anexa uma linha destinada a 'table'. Custo: um json.dumps e um write bufferizado."""
+        payload = json.dumps({'t': table, 'r': {k: _encode_value(v) for k, v in row.items()}}, ensure_ascii=False, default=str).encode('utf-8')
+        with self._lock:
+            if self._fh is None or self._fh.closed:
+                self._open_segment()
+            self._fh.write(_HEADER.pack(len(payload)))
+            self._fh.write(payload)
+            self._size += _HEADER.size + len(payload)
+            self._pending += 1
+            if self._pending >= FLUSH_EVERY:
+                self._fh.flush()
+                self._pending = 0
+            if self._size >= self.max_bytes:
+                self._seal_locked()
+
+    def flush(self):
+        with self._lock:
+            if self._fh and (not self._fh.closed):
+                self._fh.flush()
+                self._pending = 0
+
+    def _seal_locked(self):
+        if self._fh is None:
+            return
+        self._fh.close()
+        self._fh = None
+        if self._size:
+            os.replace(self._path, self._path.with_suffix('.seg'))
+        else:
+            self._path.unlink(missing_ok=True)
+
+    def seal(self):
+        """Fecha o segmento ativo, tornando-o elegível para compactação."""
+        with self._lock:
+            self._seal_locked()
+
+segment_log = SegmentWriter()
+
+def append_row(table, row: dict):
+    """Fachada de ingestão: nunca propaga erro para o comando chamador."""
+    try:
+        segment_log.append_row(table, row)
+    except Exception as e:
+        if os.environ.get('VULCAN_VERBOSE') == '1':
+            print(f'\x1b[33m [LEDGER-FAIL] {table} -> {e}\x1b[0m')
+
+def iter_records(path):
+    """Lê um segmento; um registro final truncado (crash) é descartado."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    pos, end = 0, len(data)
+    while pos + _HEADER.size <= end:
+        (length,) = _HEADER.unpack_from(data, pos)
+        pos += _HEADER.size
+        if pos + length > end:
+            break
+        try:
+            rec = json.loads(data[pos:pos + length].decode('utf-8'))
+        except ValueError:
+            rec = None
+        pos += length
+        allowed = LEDGER_COLUMNS.get(rec.get('t')) if isinstance(rec, dict) else None
+        if allowed:
+            yield rec['t'], {k: _decode_value(v) for k, v in rec['r'].items() if k in allowed}
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+def pending_segments(directory=SEGMENT_DIR):
+    """Segmentos selados + '.open' órfãos (processo dono já morreu)."""
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+    ready = list(directory.glob('*.seg'))
+    for p in directory.glob('*.open'):
+        try:
+            pid = int(p.name.split('-')[1])
+        except (IndexError, ValueError):
+            continue
+        if pid != os.getpid() and (not _pid_alive(pid)):
+            ready.append(p)
+    now = time.time()
+    for p in directory.glob('*.compacting'):
+        try:
+            if now - p.stat().st_mtime > STALE_CLAIM_SECONDS:
+                ready.append(p)
+        except OSError:
+            continue
+    return sorted(ready, key=lambda p: p.name.split('-')[-1])
+
+def _ensure_retention_index(conn):
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_op_logs_ts ON operational_logs(timestamp)')
+
+def compact_segments(retention_days=None, directory=SEGMENT_DIR) -> dict:
+    """
+    Dobra todos os segmentos pendentes no SQLite (uma transação).
+    Retorna {'segments', 'rows', 'purged'}.
+    """
+    from doxoade.core_database import get_db_connection
+    report = {'segments': 0, 'rows': 0, 'purged': 0}
+    claimed = []
+    for seg in pending_segments(directory):
+        target = seg.with_suffix('.compacting')
+        try:
+            os.replace(seg, target)
+            os.utime(target)
+        except OSError:
+            continue
+        claimed.append(target)
+    if retention_days is None:
+        retention_days = int(os.environ.get('DOXOADE_TELEMETRY_RETENTION_DAYS', DEFAULT_RETENTION_DAYS))
+    conn = None
+    try:
+        batches = {}
+        for seg in claimed:
+            for table, row in iter_records(seg):
+                cols = tuple(sorted(row))
+                batches.setdefault((table, cols), []).append(tuple((row[c] for c in cols)))
+        conn = get_db_connection()
+        _ensure_retention_index(conn)
+        with conn:
+            # O rollup diário (command_rollup_daily) é mantido pelo gatilho de command_history.
+            for (table, cols), rows in batches.items():
+                conn.executemany(f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})", rows)
+                report['rows'] += len(rows)
+            cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+            report['purged'] = conn.execute('DELETE FROM operational_logs WHERE timestamp < ?', (cutoff,)).rowcount
+    except BaseException:
+        # Devolve os segmentos para a fila: nada se perde se o banco estiver ocupado.
+        for seg in claimed:
+            try:
+                os.replace(seg, seg.with_suffix('.seg'))
+            except OSError:
+                pass
+        raise
+    finally:
+        if conn is not None:
+            conn.close()
+    for seg in claimed:
+        seg.unlink(missing_ok=True)
+    report['segments'] = len(claimed)
+    return report
+
+def ensure_compacted():
+    """Compactação sob demanda para leitores (horus view, timeline, telemetry)."""
+    segment_log.flush()
+    segment_log.seal()
+    try:
+        return compact_segments()
+    except Exception:
+        return None
+
+def _seal_at_exit():
+    segment_log.seal()
+    if len(pending_segments()) >= AUTO_COMPACT_BACKLOG:
+        try:
+            compact_segments()
+        except Exception:
+            pass
+
+atexit.register(_seal_at_exit)